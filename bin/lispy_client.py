@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+LisPy Daemon Client - Run a script on a warm interpreter started with --daemon
+
+Only the standard library and lispy.daemon are imported, so the client starts
+in a few milliseconds. Output and the exit code are those of the script. A
+socket owned by another user is refused, so scripts are only sent to your own
+daemon.
+
+Usage:
+    python lispy_interpreter.py --daemon &          # Start the daemon once
+    python lispy_client.py script.lpy [args...]     # Run scripts against it
+    python lispy_client.py --socket PATH script.lpy # Use a non-default socket
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root to Python path so we can import lispy modules
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from lispy import daemon
+
+
+def main():
+    """Main entry point for the LisPy daemon client."""
+    parser = argparse.ArgumentParser(
+        description="Run a LisPy script on a running LisPy daemon"
+    )
+    parser.add_argument("file", help="LisPy file to execute")
+    parser.add_argument(
+        "script_args",
+        nargs=argparse.REMAINDER,
+        help="Arguments passed to the program as *command-line-args*",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help=f"Daemon socket path (default: ${daemon.SOCKET_ENV_VAR} or a private per-user directory)",
+    )
+    args = parser.parse_args()
+
+    if not daemon.daemon_supported():
+        print("Error: the LisPy daemon requires Unix domain sockets.", file=sys.stderr)
+        return 1
+
+    return daemon.run_via_daemon(args.file, args.script_args, args.socket)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
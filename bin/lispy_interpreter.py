@@ -7,13 +7,21 @@ Usage:
     python lispy_interpreter.py                      # Start REPL mode
     python lispy_interpreter.py --help               # Show help
     python lispy_interpreter.py --bdd "tests/bdd_features/**/*.lpy" # Run BDD tests
+    python lispy_interpreter.py --startup-report file.lpy   # Report import times
+    python lispy_interpreter.py --daemon                    # Serve scripts warm
+    python lispy_interpreter.py --save-image app.img setup.lpy  # Save environment
+    python lispy_interpreter.py --load-image app.img main.lpy   # Start from image
 """
 
 import argparse
 import os
 import sys
+import time
 from pathlib import Path
 
+# Taken before any LisPy import so --startup-report covers interpreter startup
+PROCESS_STARTED = time.perf_counter()
+
 # Add the project root to Python path so we can import lispy modules
 project_root = Path(__file__).parent.parent  # Go up one level from bin/ to project root
 sys.path.insert(0, str(project_root))
@@ -21,14 +29,18 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "scripts"))
 
 from lispy_bdd_runner import run_bdd_tests
-from lispy_repl import LispyRepl
 
+from lispy import daemon, image
 from lispy.evaluator import evaluate
 from lispy.exceptions import EvaluationError, LexerError, ParseError
 from lispy.functions import create_global_env
+from lispy.functions.function_registry import get_function_registry
 from lispy.lexer import tokenize
 from lispy.module_system import get_module_loader
 from lispy.parser import parse
+from lispy.types import Vector
+
+COMMAND_LINE_ARGS_SYMBOL = "*command-line-args*"
 
 
 class LispyInterpreter:
@@ -38,14 +50,23 @@ class LispyInterpreter:
         self.env = create_global_env()
         self.module_loader = get_module_loader()
 
+    def load_image(self, image_path: str):
+        """Replace the global environment with the one saved in an image."""
+        self.env = image.load_image(image_path).env
+
+    def save_image(self, image_path: str):
+        """Save the global environment and loaded modules to an image."""
+        image.save_image(self.env, image_path)
+
     def add_load_path(self, path: str):
         """Add a directory to the module load path."""
         abs_path = os.path.abspath(path)
         self.module_loader.add_load_path(abs_path)
 
-    def run_file(self, file_path: str, is_bdd_run: bool = False):
+    def run_file(self, file_path: str, is_bdd_run: bool = False, script_args=()):
         """Execute a LisPy file as the main entry point."""
         file_path = os.path.abspath(file_path)
+        self.env.define(COMMAND_LINE_ARGS_SYMBOL, Vector(script_args))
 
         if not os.path.exists(file_path):
             print(f"Error: File '{file_path}' not found.", file=sys.stderr)
@@ -173,6 +194,23 @@ class LispyInterpreter:
         return result_tokens, pos
 
 
+def print_startup_report(startup_seconds: float):
+    """Print interpreter startup time and per-package built-in import times."""
+    package_times = get_function_registry().get_package_import_times()
+    print("LisPy startup report", file=sys.stderr)
+    print(f"  interpreter ready: {startup_seconds * 1000:8.2f} ms", file=sys.stderr)
+    if not package_times:
+        print("  no built-in packages were imported", file=sys.stderr)
+        return
+    print("  built-in packages imported on first use:", file=sys.stderr)
+    for package, seconds in sorted(
+        package_times.items(), key=lambda item: item[1], reverse=True
+    ):
+        print(f"    {package:<40} {seconds * 1000:8.2f} ms", file=sys.stderr)
+    total = sum(package_times.values())
+    print(f"    {'total':<40} {total * 1000:8.2f} ms", file=sys.stderr)
+
+
 def main():
     """Main entry point for the LisPy interpreter."""
     parser = argparse.ArgumentParser(
@@ -184,11 +222,18 @@ Examples:
   python bin/lispy_interpreter.py                     # Start REPL (default)
   python bin/lispy_interpreter.py main.lpy            # Run main.lpy
   python bin/lispy_interpreter.py examples/demo.lpy   # Run demo from examples/
+  python bin/lispy_interpreter.py --startup-report main.lpy  # Show import times
         """,
     )
 
     parser.add_argument("file", nargs="?", help="LisPy file to execute")
 
+    parser.add_argument(
+        "script_args",
+        nargs=argparse.REMAINDER,
+        help=f"Arguments passed to the program as {COMMAND_LINE_ARGS_SYMBOL}",
+    )
+
     parser.add_argument(
         "--repl",
         action="store_true",
@@ -212,9 +257,45 @@ Examples:
         help='Run BDD tests. Accepts file paths or glob patterns (e.g., "features/**/*.lpy")',
     )
 
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print startup time and import time per built-in package to stderr on exit",
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Serve scripts from a warm interpreter on a Unix socket (see bin/lispy_client.py)",
+    )
+
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help=f"Socket path for --daemon (default: ${daemon.SOCKET_ENV_VAR} or a private per-user directory)",
+    )
+
+    parser.add_argument(
+        "--load-image",
+        metavar="PATH",
+        help="Start from an environment saved with --save-image or save-image",
+    )
+
+    parser.add_argument(
+        "--save-image",
+        metavar="PATH",
+        help="After running the file, save the environment and loaded modules to PATH",
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
+    if args.daemon and (args.file or args.repl or args.bdd):
+        print(
+            "Error: --daemon cannot be combined with a file, --repl or --bdd.",
+            file=sys.stderr,
+        )
+        return 1
     if args.file and args.repl:
         print("Error: Cannot specify both a file and --repl option.", file=sys.stderr)
         return 1
@@ -225,23 +306,70 @@ Examples:
         print("Error: Cannot specify both --repl and --bdd option.", file=sys.stderr)
         return 1
 
+    if args.save_image and not args.file:
+        print("Error: --save-image requires a file to run.", file=sys.stderr)
+        return 1
+
     # Create interpreter instance (used for file execution and BDD)
     interpreter = LispyInterpreter()
+    if args.load_image:
+        try:
+            interpreter.load_image(args.load_image)
+        except EvaluationError as e:
+            print(f"LisPy Error: {e}", file=sys.stderr)
+            return 1
+    startup_seconds = time.perf_counter() - PROCESS_STARTED
 
     # Add any additional include paths
     if args.include_paths:
         for path in args.include_paths:
             interpreter.add_load_path(path)
 
-    # Determine mode: BDD tests, file execution, or REPL
-    if args.bdd:
+    try:
+        return run_mode(args, interpreter)
+    finally:
+        if args.startup_report:
+            print_startup_report(startup_seconds)
+
+
+def run_daemon(args) -> int:
+    """Serve script requests, forking a fresh interpreter for each one."""
+    if not daemon.daemon_supported():
+        print("Error: --daemon requires Unix domain sockets and fork.", file=sys.stderr)
+        return 1
+
+    def run_script(script_path, script_args):
+        interpreter = LispyInterpreter()
+        for path in args.include_paths or []:
+            interpreter.add_load_path(path)
+        return interpreter.run_file(script_path, script_args=script_args)
+
+    daemon.serve(args.socket or daemon.default_socket_path(), run_script)
+    return 0
+
+
+def run_mode(args, interpreter: LispyInterpreter) -> int:
+    """Determine mode: daemon, BDD tests, file execution, or REPL."""
+    if args.daemon:
+        return run_daemon(args)
+    elif args.bdd:
         # Pass the project root as the base_dir for resolving glob patterns
         # This assumes BDD test paths are specified relative to the project root.
         bdd_passed = run_bdd_tests(args.bdd, interpreter, str(project_root))
         return 0 if bdd_passed else 1
     elif args.file:
-        return interpreter.run_file(args.file)
+        exit_code = interpreter.run_file(args.file, script_args=args.script_args)
+        if exit_code == 0 and args.save_image:
+            try:
+                interpreter.save_image(args.save_image)
+            except EvaluationError as e:
+                print(f"LisPy Error: {e}", file=sys.stderr)
+                return 1
+        return exit_code
     else:
+        # The REPL pulls in prompt_toolkit, so only import it when needed
+        from lispy_repl import LispyRepl
+
         # Start REPL (either explicitly requested or default behavior)
         repl_instance = LispyRepl(interpreter.env)
         repl_instance.start_repl()
@@ -0,0 +1,108 @@
+"""
+Byte buffers for LisPy.
+
+A ByteBuffer is an immutable run of bytes inside a source object: a bytes
+object for in-memory data, or a read-only mmap for a file opened with
+mmap-file. It records the source and the start and end offsets of its
+bytes, so slicing only creates a new ByteBuffer over the same source and
+never copies; byte-at and index-of read the source in place, and only decode
+copies the bytes out.
+
+A file-backed buffer pages in only the parts of the file that are read, so a
+lookup in a large binary index file touches a few pages instead of reading
+and decoding the whole file. Closing the buffer (for example at the end of
+with-open) unmaps the file; slices of a closed buffer cannot be read.
+"""
+
+import mmap
+from typing import Optional, Union
+
+Source = Union[bytes, mmap.mmap]
+
+
+class ByteBuffer:
+    """An immutable view of bytes start..end of a bytes object or mmap."""
+
+    __slots__ = ("_source", "_start", "_end")
+
+    def __init__(self, source: Source, start: int = 0, end: Optional[int] = None):
+        self._source = source
+        self._start = start
+        self._end = len(source) if end is None else end
+
+    @classmethod
+    def from_file(cls, path: str) -> "ByteBuffer":
+        """Map the file at path read-only. Raises OSError like open()."""
+        with open(path, "rb") as file:
+            size = file.seek(0, 2)
+            if size == 0:
+                # mmap cannot map an empty file
+                return cls(b"")
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    # --- Access ---
+
+    def byte_at(self, index: int) -> int:
+        """Return the byte at index (negative counts from the end)."""
+        length = self._end - self._start
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+        return self._source[self._start + index]
+
+    def slice(self, start: int, end: Optional[int] = None) -> "ByteBuffer":
+        """Return bytes start..end as a new buffer sharing this one's source.
+
+        Offsets are clamped like Python slices, and negative ones count from
+        the end.
+        """
+        start, end, _ = slice(start, end).indices(self._end - self._start)
+        end = max(start, end)
+        return ByteBuffer(self._source, self._start + start, self._start + end)
+
+    def index_of(self, needle: bytes, start: int = 0) -> int:
+        """Return the offset of the first needle at or after start, or -1."""
+        start, _, _ = slice(start, None).indices(self._end - self._start)
+        found = self._source.find(needle, self._start + start, self._end)
+        return -1 if found < 0 else found - self._start
+
+    def to_bytes(self) -> bytes:
+        """Copy the bytes out."""
+        return self._source[self._start : self._end]
+
+    def decode(self, encoding: str = "utf-8") -> str:
+        return self.to_bytes().decode(encoding)
+
+    def view(self) -> memoryview:
+        """Return a read-only memoryview of the bytes, without copying them."""
+        return memoryview(self._source)[self._start : self._end].toreadonly()
+
+    @property
+    def closed(self) -> bool:
+        source = self._source
+        return isinstance(source, mmap.mmap) and source.closed
+
+    def close(self) -> None:
+        """Unmap the file behind a file-backed buffer; a no-op otherwise."""
+        if isinstance(self._source, mmap.mmap):
+            self._source.close()
+
+    # --- Python protocols ---
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __eq__(self, other):
+        if not isinstance(other, ByteBuffer):
+            return NotImplemented
+        return len(self) == len(other) and self.view() == other.view()
+
+    def __hash__(self):
+        return hash(self.to_bytes())
+
+    def __repr__(self) -> str:
+        return f"#<bytes length={len(self)}>"
@@ -10,6 +10,8 @@ class Function:
     It captures the parameters, body, and the defining environment.
     """
 
+    __slots__ = ("params", "body", "defining_env")
+
     def __init__(
         self, params: List[Symbol], body: List[Any], defining_env: Environment
     ):
@@ -0,0 +1,163 @@
+"""
+Constant pools for LisPy source.
+
+Data modules repeat the same literals many times: strings, keywords such as
+:status, floats, and small vectors and maps like [0 0] or {:unit "ms"}. The
+parser creates a separate object for every occurrence. A ConstantPool hands
+the parser one shared object per distinct literal instead (hash-consing), so
+a module that defines a large lookup table keeps one copy of each repeated
+value alive.
+
+Only immutable literals are pooled:
+  - strings (also passed through sys.intern, so they are shared with every
+    other module and with identifiers in the interpreter)
+  - numbers that CPython does not already cache, i.e. floats and large ints
+  - symbols (every occurrence of a name shares one Symbol)
+  - vectors whose elements are all pooled constants or keywords
+  - map literals whose keys and values are all pooled constants, which are
+    built into a PersistentMap at parse time, as the evaluator would
+    otherwise do on every evaluation
+
+Vectors containing ordinary symbols are left alone, since those are code
+such as parameter lists and let bindings rather than data.
+
+Pools are keyed structurally and by type, so 1, 1.0 and true are never
+merged. The pool counts what it merged and estimates the bytes saved (the
+shallow size of every duplicate it replaced); see stats().
+"""
+
+import sys
+from typing import Any, Dict, Hashable, Optional
+
+from .persistent_map import PersistentMap
+from .types import LispyMapLiteral, Symbol, Vector
+
+_SCALAR_TYPES = (bool, int, float, str, type(None))
+
+
+def _instance_size(value: Any) -> int:
+    """Size of an object plus its attribute dict, if it has one."""
+    attributes = getattr(value, "__dict__", None)
+    extra = sys.getsizeof(attributes) if attributes is not None else 0
+    return sys.getsizeof(value) + extra
+
+
+def _is_keyword(value: Any) -> bool:
+    return isinstance(value, Symbol) and value.name.startswith(":")
+
+
+class ConstantPool:
+    """Deduplicates immutable literals produced by the parser."""
+
+    def __init__(self):
+        self._constants: Dict[Hashable, Any] = {}
+        # Structural key of every pooled object, by id
+        self._keys: Dict[int, Hashable] = {}
+        self._symbols: Dict[str, Symbol] = {}
+        self.literals = 0
+        self.duplicates = 0
+        self.bytes_saved = 0
+
+    # --- Literals from the parser ---
+
+    def string(self, value: str) -> str:
+        key = (str, value)
+        self.literals += 1
+        existing = self._constants.get(key)
+        if existing is not None:
+            self._count_duplicate(sys.getsizeof(value))
+            return existing
+        value = sys.intern(value)
+        self._remember(key, value)
+        return value
+
+    def number(self, value: Any) -> Any:
+        if isinstance(value, float):
+            # hex() keeps 0.0 and -0.0 (and every NaN) apart
+            return self._share((float, value.hex()), value)
+        if -5 <= value <= 256:
+            # CPython already shares small ints
+            return value
+        return self._share((int, value), value)
+
+    def symbol(self, name: str) -> Symbol:
+        self.literals += 1
+        symbol = self._symbols.get(name)
+        if symbol is None:
+            symbol = self._symbols[name] = Symbol(sys.intern(name))
+        else:
+            self._count_duplicate(_instance_size(symbol))
+        return symbol
+
+    def vector(self, vector: Vector) -> Vector:
+        """Return a shared vector equal to vector if all its elements are data."""
+        keys = []
+        for item in vector:
+            key = self._key_of(item)
+            if key is None:
+                return vector
+            keys.append(key)
+        return self._share((Vector, tuple(keys)), vector)
+
+    def map_literal(self, literal: LispyMapLiteral) -> Any:
+        """Return a shared PersistentMap for a map literal of constants.
+
+        Returns literal unchanged if any key or value needs evaluation.
+        """
+        keys = []
+        for key, value in literal.items():
+            key_key = self._key_of(key)
+            value_key = None if _is_keyword(value) else self._key_of(value)
+            if key_key is None or value_key is None:
+                return literal
+            keys.append((key_key, value_key))
+        key = (PersistentMap, tuple(keys))
+        existing = self._constants.get(key)
+        self.literals += 1
+        if existing is not None:
+            self._count_duplicate(sys.getsizeof(literal))
+            return existing
+        constant = PersistentMap(literal)
+        self._remember(key, constant)
+        return constant
+
+    # --- Reporting ---
+
+    def stats(self) -> Dict[str, int]:
+        """Return counts of pooled literals and the estimated bytes saved."""
+        return {
+            "literals": self.literals,
+            "unique": len(self._constants) + len(self._symbols),
+            "duplicates": self.duplicates,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    # --- Internals ---
+
+    def _key_of(self, value: Any) -> Optional[Hashable]:
+        """Return the structural key of a pooled value, or None if it is not one."""
+        if isinstance(value, _SCALAR_TYPES):
+            if isinstance(value, float):
+                return (float, value.hex())
+            return (type(value), value)
+        if _is_keyword(value):
+            return (Symbol, value.name)
+        return self._keys.get(id(value))
+
+    def _share(self, key: Hashable, value: Any) -> Any:
+        self.literals += 1
+        existing = self._constants.get(key)
+        if existing is not None:
+            self._count_duplicate(sys.getsizeof(value))
+            return existing
+        self._remember(key, value)
+        return value
+
+    def _remember(self, key: Hashable, value: Any) -> None:
+        self._constants[key] = value
+        if isinstance(value, (Vector, PersistentMap)):
+            self._keys[id(value)] = key
+
+    def _count_duplicate(self, size: int) -> None:
+        self.duplicates += 1
+        self.bytes_saved += size
@@ -0,0 +1,285 @@
+"""
+Warm interpreter daemon for running short LisPy scripts without startup cost.
+
+The daemon imports every built-in package once, then listens on a Unix domain
+socket. Each request is handled in a forked child process, so every script
+starts from the same pristine, pre-initialized interpreter and cannot affect
+later requests. The child streams the script's stdout and stderr back to the
+client as it runs and finishes with the script's exit code.
+
+This module only imports the standard library at load time so the thin client
+(bin/lispy_client.py) can use it without paying LisPy's startup cost.
+
+Anyone who can connect to the socket runs code as the daemon's user, and
+anyone who can put a socket at its path receives the scripts clients send.
+So the default socket lives in $XDG_RUNTIME_DIR or in a per-user 0700
+directory under the temp directory, the daemon refuses a socket directory
+that other users can write to and makes the socket 0600, and the client
+refuses a socket owned by another user.
+
+Wire protocol:
+    request:  one JSON object terminated by a newline, with the keys
+              "script", "args" and "cwd"
+    response: a sequence of frames, each a one-byte kind, a four-byte
+              big-endian payload length and the payload. Kinds are
+              FRAME_STDOUT and FRAME_STDERR (UTF-8 text) and FRAME_EXIT
+              (the exit code as ASCII digits), which is always last.
+"""
+
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+from typing import BinaryIO, Callable, List, Optional, Sequence
+
+SOCKET_ENV_VAR = "LISPY_DAEMON_SOCKET"
+
+FRAME_STDOUT = b"o"
+FRAME_STDERR = b"e"
+FRAME_EXIT = b"x"
+FRAME_HEADER = struct.Struct(">cI")
+
+EXIT_FAILURE = 1
+EXIT_DAEMON_UNAVAILABLE = 2
+
+ScriptRunner = Callable[[str, List[str]], int]
+
+
+def daemon_supported() -> bool:
+    """Return True if this platform supports Unix sockets and fork."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork")
+
+
+def _user_id() -> int:
+    return os.getuid() if hasattr(os, "getuid") else os.getpid()
+
+
+def default_socket_path() -> str:
+    """Return the socket path from LISPY_DAEMON_SOCKET or a per-user default.
+
+    The default is in $XDG_RUNTIME_DIR when it is set, which only its user
+    can reach, and otherwise in a private lispy-daemon-<uid> directory in
+    the temp directory, which the daemon creates with mode 0700.
+    """
+    configured_path = os.environ.get(SOCKET_ENV_VAR)
+    if configured_path:
+        return configured_path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "lispy-daemon.sock")
+    private_dir = os.path.join(tempfile.gettempdir(), f"lispy-daemon-{_user_id()}")
+    return os.path.join(private_dir, "daemon.sock")
+
+
+def write_frame(stream: BinaryIO, kind: bytes, payload: bytes) -> None:
+    """Write a single response frame."""
+    stream.write(FRAME_HEADER.pack(kind, len(payload)) + payload)
+    stream.flush()
+
+
+def read_frame(stream: BinaryIO):
+    """Read a single response frame. Returns (kind, payload) or None at EOF."""
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    kind, length = FRAME_HEADER.unpack(header)
+    payload = stream.read(length)
+    return kind, payload
+
+
+class FramedTextStream(io.TextIOBase):
+    """Text stream that forwards every write to the client as a frame."""
+
+    def __init__(self, stream: BinaryIO, kind: bytes):
+        self._stream = stream
+        self._kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            write_frame(self._stream, self._kind, text.encode("utf-8"))
+        return len(text)
+
+
+class _ScriptRequestHandler(socketserver.StreamRequestHandler):
+    """Runs one script request. Executes in the forked child process."""
+
+    def handle(self):
+        exit_code = EXIT_FAILURE
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = FramedTextStream(self.wfile, FRAME_STDOUT)
+        sys.stderr = FramedTextStream(self.wfile, FRAME_STDERR)
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            os.chdir(request.get("cwd") or os.getcwd())
+            exit_code = self.server.run_script(
+                request["script"], list(request.get("args", []))
+            )
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else EXIT_FAILURE
+        except Exception as e:
+            print(f"LisPy daemon error: {type(e).__name__} - {e}", file=sys.stderr)
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+            write_frame(self.wfile, FRAME_EXIT, str(exit_code).encode("ascii"))
+
+
+class LispyDaemonServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that forks a pristine interpreter per request."""
+
+    def __init__(self, socket_path: str, run_script: ScriptRunner):
+        self.socket_path = socket_path
+        self.run_script = run_script
+        _prepare_socket_directory(os.path.dirname(os.path.abspath(socket_path)))
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _ScriptRequestHandler)
+
+    def server_bind(self):
+        # Create the socket without group or other permissions, so there is
+        # no moment when another user could connect to it
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def _prepare_socket_directory(directory: str) -> None:
+    """Create the socket's directory as 0700 if needed, and check it is private.
+
+    Raises OSError if the directory is not a directory owned by this user,
+    or if other users can write to it and so replace the socket.
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    status = os.lstat(directory)
+    if not stat.S_ISDIR(status.st_mode) or status.st_uid != _user_id():
+        raise OSError(
+            f"The daemon socket directory {directory} is not a directory owned by you"
+        )
+    if status.st_mode & 0o022:
+        raise OSError(
+            f"The daemon socket directory {directory} is writable by other users; "
+            "use a private directory"
+        )
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a daemon that is no longer running."""
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+    else:
+        raise OSError(f"A LisPy daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+def warm_up_interpreter() -> None:
+    """Import and register every built-in so forked children start warm."""
+    from .functions import load_all_builtins
+
+    load_all_builtins()
+
+
+def _stop_on_terminate(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(socket_path: str, run_script: ScriptRunner) -> None:
+    """Warm up the interpreter and serve script requests until interrupted."""
+    warm_up_interpreter()
+    signal.signal(signal.SIGTERM, _stop_on_terminate)
+    with LispyDaemonServer(socket_path, run_script) as server:
+        print(f"LisPy daemon listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def run_via_daemon(
+    script_path: str,
+    script_args: Sequence[str] = (),
+    socket_path: Optional[str] = None,
+    stdout: Optional[BinaryIO] = None,
+    stderr: Optional[BinaryIO] = None,
+) -> int:
+    """
+    Run a script on a running daemon, streaming its output.
+
+    Returns:
+        The script's exit code, or EXIT_DAEMON_UNAVAILABLE if no daemon answers.
+    """
+    socket_path = socket_path or default_socket_path()
+    stdout = stdout or sys.stdout.buffer
+    stderr = stderr or sys.stderr.buffer
+    request = {
+        "script": os.path.abspath(script_path),
+        "args": list(script_args),
+        "cwd": os.getcwd(),
+    }
+
+    try:
+        owner = os.stat(socket_path).st_uid
+    except OSError:
+        owner = None  # Reported by connect below
+    if owner is not None and owner != _user_id():
+        stderr.write(
+            f"Refusing to use the LisPy daemon socket {socket_path}: "
+            "it is owned by another user\n".encode("utf-8")
+        )
+        stderr.flush()
+        return EXIT_DAEMON_UNAVAILABLE
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError as e:
+        client.close()
+        stderr.write(
+            f"No LisPy daemon at {socket_path} ({e}). "
+            "Start one with: lispy --daemon\n".encode("utf-8")
+        )
+        stderr.flush()
+        return EXIT_DAEMON_UNAVAILABLE
+
+    with client, client.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        return _relay_frames(stream, stdout, stderr)
+
+
+def _relay_frames(stream: BinaryIO, stdout: BinaryIO, stderr: BinaryIO) -> int:
+    """Copy output frames to stdout/stderr until the exit frame arrives."""
+    outputs = {FRAME_STDOUT: stdout, FRAME_STDERR: stderr}
+    while True:
+        frame = read_frame(stream)
+        if frame is None:
+            stderr.write(b"LisPy daemon closed the connection unexpectedly\n")
+            stderr.flush()
+            return EXIT_FAILURE
+        kind, payload = frame
+        if kind == FRAME_EXIT:
+            return int(payload.decode("ascii"))
+        output = outputs.get(kind)
+        if output is not None:
+            output.write(payload)
+            output.flush()
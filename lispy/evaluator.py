@@ -2,10 +2,12 @@
 
 from typing import Any, Callable
 from typing import List as TypingList
+from typing import Optional
 
 from .closure import Function
 from .environment import Environment
 from .exceptions import AssertionFailure, EvaluationError, UserThrownError
+from .persistent_map import PersistentMap
 from .special_forms import special_form_handlers
 from .tail_call import TailCall
 from .types import LispyList, LispyMapLiteral, LispyPromise, Symbol, Vector
@@ -14,20 +16,19 @@ from .types import LispyList, LispyMapLiteral, LispyPromise, Symbol, Vector
 MAX_RECURSION_DEPTH = 100
 
 
-def _execute_user_defined_function(
+def _check_user_defined_call(
     lisp_function: Function,
-    evaluated_args: "TypingList[Any]",  # typing.List for the Python list of args
+    arg_count: int,
     operator_expr: Any,  # For error messages
-    evaluate_fn: Callable,
-    recursion_depth: int = 0,
-) -> Any:
-    """Helper to execute a user-defined Lisp function (Function object) with explicit recur support."""
-    if len(evaluated_args) != len(lisp_function.params):
+    recursion_depth: int,
+) -> None:
+    """Raise if a user-defined function cannot be called with arg_count arguments."""
+    if arg_count != len(lisp_function.params):
         fn_name_str = (
             str(operator_expr) if isinstance(operator_expr, Symbol) else "<fn>"
         )
         raise EvaluationError(
-            f"ArityError: Function '{fn_name_str}' expects {len(lisp_function.params)} arguments, got {len(evaluated_args)}."
+            f"ArityError: Function '{fn_name_str}' expects {len(lisp_function.params)} arguments, got {arg_count}."
         )
 
     # Check recursion depth to enforce recur usage
@@ -40,23 +41,40 @@ def _execute_user_defined_function(
             f"Use 'recur' for tail-recursive calls to avoid stack overflow."
         )
 
+
+def _execute_user_defined_function(
+    lisp_function: Function,
+    args: Any,
+    evaluate_fn: Callable,
+    recursion_depth: int,
+    outer: Optional[Environment] = None,
+) -> Any:
+    """Execute a user-defined function with explicit recur support.
+
+    The arguments must already have passed _check_user_defined_call.
+    The body runs in a new environment whose parent is outer, or the
+    function's defining environment if outer is None.
+    """
     current_function = lisp_function
-    current_args = evaluated_args
+    current_args = args
 
     # Trampoline loop for explicit tail call optimization via recur
     while True:
         # Create a new environment for the function call
-        call_env = Environment(outer=current_function.defining_env)
+        call_env = Environment(
+            outer=current_function.defining_env if outer is None else outer
+        )
+        store = call_env.store
 
         # Bind the current function to a special variable for recur
-        call_env.define("__current_function__", current_function)
+        store["__current_function__"] = current_function
 
         # Store recursion depth for nested calls
-        call_env.define("__recursion_depth__", recursion_depth)
+        store["__recursion_depth__"] = recursion_depth
 
         # Bind arguments to parameters in the new environment
         for param_symbol, arg_value in zip(current_function.params, current_args):
-            call_env.define(param_symbol.name, arg_value)
+            store[param_symbol.name] = arg_value
 
         # Evaluate body expressions sequentially in the call environment
         result = None
@@ -101,6 +119,17 @@ def _execute_builtin_function(
         )
 
 
+def _current_recursion_depth(env: Environment) -> int:
+    """Return the recursion depth of the function call env is in, or 0."""
+    # Walk the scopes directly; a failed lookup would raise at top level
+    while env is not None:
+        store = env.store
+        if "__recursion_depth__" in store:
+            return store["__recursion_depth__"]
+        env = env.outer
+    return 0  # Not in a function call
+
+
 def _apply_procedure(
     procedure: Any,
     evaluated_args: "TypingList[Any]",  # typing.List for the Python list of args
@@ -110,15 +139,12 @@ def _apply_procedure(
 ) -> Any:
     """Applies a procedure (either user-defined Function or built-in Python callable)."""
     if isinstance(procedure, Function):
-        # Get recursion depth from environment, default to 0
-        recursion_depth = 0
-        try:
-            recursion_depth = env.lookup("__recursion_depth__")
-        except EvaluationError:
-            pass  # Not in a function call, start at 0
-
+        recursion_depth = _current_recursion_depth(env) + 1
+        _check_user_defined_call(
+            procedure, len(evaluated_args), operator_expr, recursion_depth
+        )
         return _execute_user_defined_function(
-            procedure, evaluated_args, operator_expr, evaluate_fn, recursion_depth + 1
+            procedure, evaluated_args, evaluate_fn, recursion_depth
         )
     elif callable(procedure):
         # Pass env to _execute_builtin_function
@@ -129,6 +155,110 @@ def _apply_procedure(
         )
 
 
+def make_caller(
+    procedure: Any,
+    env: Environment,
+    arity: Optional[int] = None,
+    outer: Optional[Environment] = None,
+) -> Callable[..., Any]:
+    """Return a Python function that calls a LisPy procedure with positional args.
+
+    This is how built-ins call the functions they are given. A user-defined
+    Function runs through the same trampoline as a call in LisPy code, so
+    recur and the recursion limit work the same way; a built-in is called
+    with the argument list and env. Everything that does not depend on the
+    arguments is done once here rather than on every call: with arity
+    given, a Function's parameter count is checked now and never again.
+    outer replaces the Function's defining environment as the parent of its
+    call environments.
+    """
+    if isinstance(procedure, Function):
+        depth = _current_recursion_depth(env) + 1
+        if arity is None:
+
+            def call(*args: Any) -> Any:
+                _check_user_defined_call(procedure, len(args), procedure, depth)
+                return _execute_user_defined_function(
+                    procedure, args, evaluate, depth, outer
+                )
+
+            return call
+        _check_user_defined_call(procedure, arity, procedure, depth)
+        if len(procedure.body) != 1:
+            return lambda *args: _execute_user_defined_function(
+                procedure, args, evaluate, depth, outer
+            )
+
+        # Fast path for the usual one-expression body: each call builds its
+        # bindings in one dict display, and the trampoline is only entered
+        # when the body ends in recur
+        body_expr = procedure.body[0]
+        scope = procedure.defining_env if outer is None else outer
+        names = [param.name for param in procedure.params]
+
+        def run_tail_call(tail_call: TailCall) -> Any:
+            return _execute_user_defined_function(
+                procedure, tail_call.args, evaluate, depth, outer
+            )
+
+        if arity == 1:
+            (name,) = names
+
+            def call_one(arg: Any) -> Any:
+                call_env = Environment(outer=scope)
+                call_env.store = {
+                    "__current_function__": procedure,
+                    "__recursion_depth__": depth,
+                    name: arg,
+                }
+                result = evaluate(body_expr, call_env)
+                if type(result) is TailCall:
+                    return run_tail_call(result)
+                return result
+
+            return call_one
+
+        if arity == 2:
+            first_name, second_name = names
+
+            def call_two(first: Any, second: Any) -> Any:
+                call_env = Environment(outer=scope)
+                call_env.store = {
+                    "__current_function__": procedure,
+                    "__recursion_depth__": depth,
+                    first_name: first,
+                    second_name: second,
+                }
+                result = evaluate(body_expr, call_env)
+                if type(result) is TailCall:
+                    return run_tail_call(result)
+                return result
+
+            return call_two
+
+        def call_many(*args: Any) -> Any:
+            call_env = Environment(outer=scope)
+            call_env.store = {
+                "__current_function__": procedure,
+                "__recursion_depth__": depth,
+                **dict(zip(names, args)),
+            }
+            result = evaluate(body_expr, call_env)
+            if type(result) is TailCall:
+                return run_tail_call(result)
+            return result
+
+        return call_many
+
+    if callable(procedure):
+        # Errors propagate unwrapped, to be reported by the calling built-in
+        return lambda *args: procedure(list(args), env)
+
+    raise EvaluationError(
+        f"Object '{procedure}' is not a function or a recognized callable procedure."
+    )
+
+
 def _evaluate_list_form_as_call(
     expression: Any, env: Environment, evaluate_fn: Callable
 ) -> Any:
@@ -175,11 +305,10 @@ def _dict_needs_evaluation(dictionary: dict, env: Environment) -> bool:
 
 
 def _evaluate_dict_values(dictionary: dict, env: Environment) -> dict:
-    """Evaluate all values in a dictionary."""
-    evaluated_dict = {}
-    for key, value in dictionary.items():
-        evaluated_dict[key] = evaluate(value, env)
-    return evaluated_dict
+    """Evaluate all values in a dictionary into a persistent map."""
+    return PersistentMap(
+        (key, evaluate(value, env)) for key, value in dictionary.items()
+    )
 
 
 def evaluate(expression: Any, env: Environment) -> Any:
@@ -189,8 +318,8 @@ def evaluate(expression: Any, env: Environment) -> Any:
         if _dict_needs_evaluation(expression, env):
             return _evaluate_dict_values(expression, env)
         else:
-            # Convert to regular dict and return
-            return dict(expression)
+            # Convert to a persistent map and return
+            return PersistentMap(expression)
 
     # Handle runtime dictionaries (already evaluated, keep as-is)
     elif isinstance(expression, dict):
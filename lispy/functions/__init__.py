@@ -2,10 +2,8 @@
 
 from ..environment import Environment
 from ..special_forms import setup_special_form_documentation
-# Import all subpackages to trigger decorator registration
-# This ensures that all @lispy_function decorated functions get registered
-from . import (bdd_assertions, collection, http, io, json, list, logical, map,
-               math, promises, string, type_check, typing, web)
+# Built-in subpackages are imported lazily, on the first lookup of one of their
+# names, using the generated manifest in builtin_manifest.py.
 # Import documentation system
 from .doc import register_documentation
 from .function_registry import get_function_registry
@@ -31,9 +29,9 @@ def create_global_env() -> Environment:
     """Creates and returns the global environment with built-in functions."""
     env = Environment()
 
-    # Get the function registry and register all discovered functions
+    # Bind all built-in names; each package is imported on its first lookup
     registry = get_function_registry()
-    registry.register_functions_in_environment(env)
+    registry.install_lazy_builtins(env)
 
     # Set up documentation registry
     setup_documentation_registry()
@@ -114,10 +112,9 @@ def get_web_unsafe_bdd_forms():
 
 
 def setup_documentation_registry():
-    """Register all documentation functions with their corresponding function names."""
-    # Get the function registry and register all discovered documentation
+    """Register documentation for loaded built-ins and for packages as they load."""
     registry = get_function_registry()
-    registry.register_documentation(register_documentation)
+    registry.register_loaded_documentation(register_documentation)
 
     # Register special form documentation
     setup_special_form_documentation()
@@ -133,6 +130,11 @@ def get_discovered_functions():
     return get_function_registry().get_discovered_functions()
 
 
+def load_all_builtins():
+    """Import every built-in package and register all documentation eagerly."""
+    get_function_registry().register_documentation(register_documentation)
+
+
 __all__ = [
     "create_global_env",
     "create_web_safe_env",
@@ -141,4 +143,5 @@ __all__ = [
     "get_web_unsafe_bdd_forms",
     "global_env",
     "get_discovered_functions",
+    "load_all_builtins",
 ]
@@ -0,0 +1,221 @@
+"""
+Generated manifest of LisPy built-in functions.
+
+Maps each built-in name to the module that defines it, so environments can
+import built-in packages lazily. Do not edit by hand; regenerate with:
+
+    python scripts/generate_builtin_manifest.py
+"""
+
+BUILTIN_MODULES = {
+    "%": "lispy.functions.math.modulo",
+    "*": "lispy.functions.math.multiply",
+    "+": "lispy.functions.math.add",
+    "-": "lispy.functions.math.subtract",
+    "/": "lispy.functions.math.divide",
+    "<": "lispy.functions.logical.less_than",
+    "<=": "lispy.functions.logical.less_than_or_equal",
+    "=": "lispy.functions.math.equals",
+    ">": "lispy.functions.logical.greater_than",
+    ">=": "lispy.functions.logical.greater_than_or_equal",
+    "abs": "lispy.functions.math.abs",
+    "aggregate": "lispy.functions.table.aggregate",
+    "append": "lispy.functions.collection.append",
+    "assert-equal?": "lispy.functions.bdd_assertions.assert_equal_q_fn",
+    "assert-false?": "lispy.functions.bdd_assertions.assert_false_q_fn",
+    "assert-nil?": "lispy.functions.bdd_assertions.assert_nil_q_fn",
+    "assert-not-nil?": "lispy.functions.bdd_assertions.assert_not_nil_q_fn",
+    "assert-true?": "lispy.functions.bdd_assertions.assert_true_q_fn",
+    "assoc": "lispy.functions.map.assoc",
+    "assoc!": "lispy.functions.transient.assoc_bang",
+    "async-filter": "lispy.functions.promises.async_filter",
+    "async-map": "lispy.functions.promises.async_map",
+    "async-reduce": "lispy.functions.promises.async_reduce",
+    "byte-at": "lispy.functions.bytes.byte_at",
+    "bytes": "lispy.functions.bytes.bytes_fn",
+    "car": "lispy.functions.list.car",
+    "cdr": "lispy.functions.list.cdr",
+    "comp": "lispy.functions.transducers.comp",
+    "concat": "lispy.functions.collection.concat",
+    "conj": "lispy.functions.collection.conj",
+    "conj!": "lispy.functions.transient.conj_bang",
+    "cons": "lispy.functions.list.cons",
+    "contains?": "lispy.functions.set.contains_q",
+    "count": "lispy.functions.collection.count",
+    "count-by": "lispy.functions.collection.count_by",
+    "csv-read": "lispy.functions.io.csv_read",
+    "csv-write": "lispy.functions.io.csv_write",
+    "debounce": "lispy.functions.promises.debounce",
+    "decode": "lispy.functions.bytes.decode",
+    "difference": "lispy.functions.set.difference",
+    "disj": "lispy.functions.set.disj",
+    "dissoc": "lispy.functions.map.dissoc",
+    "distinct": "lispy.functions.collection.distinct",
+    "distinct-by": "lispy.functions.collection.distinct_by",
+    "doc": "lispy.functions.doc",
+    "dot": "lispy.functions.numeric.dot",
+    "double-array": "lispy.functions.numeric.double_array",
+    "drop": "lispy.functions.sequence.drop",
+    "empty?": "lispy.functions.collection.empty",
+    "equal?": "lispy.functions.logical.equal_q",
+    "every?": "lispy.functions.collection.every_q",
+    "filter": "lispy.functions.collection.filter",
+    "first": "lispy.functions.collection.first",
+    "format": "lispy.functions.string.format",
+    "frequencies": "lispy.functions.collection.frequencies",
+    "get": "lispy.functions.map.get",
+    "group-by": "lispy.functions.collection.group_by",
+    "hash-map": "lispy.functions.map.hash_map",
+    "hash-set": "lispy.functions.set.hash_set",
+    "http-delete": "lispy.functions.http.delete",
+    "http-get": "lispy.functions.http.get",
+    "http-post": "lispy.functions.http.post",
+    "http-put": "lispy.functions.http.put",
+    "http-request": "lispy.functions.http.request",
+    "index-by": "lispy.functions.collection.index_by",
+    "index-of": "lispy.functions.bytes.index_of",
+    "int-array": "lispy.functions.numeric.int_array",
+    "intersection": "lispy.functions.set.intersection",
+    "into": "lispy.functions.transducers.into",
+    "is-boolean?": "lispy.functions.type_check.is_boolean_q",
+    "is-function?": "lispy.functions.type_check.is_function_q",
+    "is-list?": "lispy.functions.type_check.is_list_q",
+    "is-map?": "lispy.functions.type_check.is_map_q",
+    "is-nil?": "lispy.functions.type_check.is_nil_q",
+    "is-number?": "lispy.functions.type_check.is_number_q",
+    "is-set?": "lispy.functions.type_check.is_set_q",
+    "is-string?": "lispy.functions.type_check.is_string_q",
+    "is-vector?": "lispy.functions.type_check.is_vector_q",
+    "iterate": "lispy.functions.sequence.iterate",
+    "join": "lispy.functions.string.join",
+    "json-decode": "lispy.functions.json.decode",
+    "json-encode": "lispy.functions.json.encode",
+    "json-write": "lispy.functions.json.json_write",
+    "keys": "lispy.functions.map.keys",
+    "lazy-range": "lispy.functions.sequence.lazy_range",
+    "line-seq": "lispy.functions.io.line_seq",
+    "list": "lispy.functions.list.list",
+    "load-image": "lispy.functions.image.load_image",
+    "map": "lispy.functions.collection.map",
+    "max": "lispy.functions.math.max",
+    "merge": "lispy.functions.map.merge",
+    "middleware": "lispy.functions.web.middleware",
+    "min": "lispy.functions.math.min",
+    "mmap-file": "lispy.functions.bytes.mmap_file",
+    "ndjson-read": "lispy.functions.json.ndjson_read",
+    "ndjson-write": "lispy.functions.json.ndjson_write",
+    "not": "lispy.functions.logical.not_fn",
+    "nth": "lispy.functions.collection.nth",
+    "on-complete": "lispy.functions.promises.on_complete",
+    "on-reject": "lispy.functions.promises.on_reject",
+    "open-file": "lispy.functions.io.open_file",
+    "partition": "lispy.functions.collection.partition",
+    "partition-by": "lispy.functions.collection.partition_by",
+    "persistent!": "lispy.functions.transient.persistent_bang",
+    "print": "lispy.functions.io.print",
+    "print-doc": "lispy.functions.print_doc",
+    "println": "lispy.functions.io.println",
+    "promise": "lispy.functions.promises.promise",
+    "promise-all": "lispy.functions.promises.promise_all",
+    "promise-all-settled": "lispy.functions.promises.promise_all_settled",
+    "promise-any": "lispy.functions.promises.promise_any",
+    "promise-race": "lispy.functions.promises.promise_race",
+    "promise-then": "lispy.functions.promises.then",
+    "range": "lispy.functions.collection.range",
+    "re-find": "lispy.functions.regex.re_find",
+    "re-matches": "lispy.functions.regex.re_matches",
+    "re-pattern": "lispy.functions.regex.re_pattern",
+    "re-replace": "lispy.functions.regex.re_replace",
+    "re-seq": "lispy.functions.regex.re_seq",
+    "re-split": "lispy.functions.regex.re_split",
+    "read-chunks": "lispy.functions.io.read_chunks",
+    "read-line": "lispy.functions.io.read_line",
+    "reduce": "lispy.functions.collection.reduce",
+    "reduced": "lispy.functions.transducers.reduced",
+    "reject": "lispy.functions.promises.reject",
+    "repeat": "lispy.functions.sequence.repeat",
+    "resolve": "lispy.functions.promises.resolve",
+    "rest": "lispy.functions.collection.rest",
+    "retry": "lispy.functions.promises.retry",
+    "reverse": "lispy.functions.collection.reverse",
+    "route": "lispy.functions.web.route",
+    "rsubseq": "lispy.functions.sorted.rsubseq",
+    "save-image": "lispy.functions.image.save_image",
+    "sb->str": "lispy.functions.string.sb_to_str",
+    "sb-append!": "lispy.functions.string.sb_append_bang",
+    "select": "lispy.functions.table.select",
+    "sequence": "lispy.functions.transducers.sequence",
+    "slice": "lispy.functions.bytes.slice",
+    "slurp": "lispy.functions.io.slurp",
+    "some": "lispy.functions.collection.some",
+    "sort": "lispy.functions.collection.sort",
+    "sort-by": "lispy.functions.collection.sort_by",
+    "sorted-map": "lispy.functions.sorted.sorted_map",
+    "sorted-map-by": "lispy.functions.sorted.sorted_map_by",
+    "sorted-set": "lispy.functions.sorted.sorted_set",
+    "sorted-set-by": "lispy.functions.sorted.sorted_set_by",
+    "spit": "lispy.functions.io.spit",
+    "split": "lispy.functions.string.split",
+    "start-server": "lispy.functions.web.start_server",
+    "stop-server": "lispy.functions.web.stop_server",
+    "str-join": "lispy.functions.string.str_join",
+    "str-pad": "lispy.functions.string.str_pad",
+    "str-repeat": "lispy.functions.string.str_repeat",
+    "str-replace-all": "lispy.functions.string.str_replace_all",
+    "string-builder": "lispy.functions.string.string_builder",
+    "subseq": "lispy.functions.sorted.subseq",
+    "table-column": "lispy.functions.table.table_column",
+    "table-from-maps": "lispy.functions.table.table_from_maps",
+    "table-rows": "lispy.functions.table.table_rows",
+    "take": "lispy.functions.sequence.take",
+    "take-while": "lispy.functions.sequence.take_while",
+    "throttle": "lispy.functions.promises.throttle",
+    "timeout": "lispy.functions.promises.timeout",
+    "to-bool": "lispy.functions.typing.to_bool",
+    "to-float": "lispy.functions.typing.to_float",
+    "to-int": "lispy.functions.typing.to_int",
+    "to-str": "lispy.functions.typing.to_str",
+    "to-vector": "lispy.functions.numeric.to_vector",
+    "transduce": "lispy.functions.transducers.transduce",
+    "transient": "lispy.functions.transient.transient",
+    "union": "lispy.functions.set.union",
+    "v*": "lispy.functions.numeric.vmul",
+    "v+": "lispy.functions.numeric.vadd",
+    "vals": "lispy.functions.map.vals",
+    "vector": "lispy.functions.list.vector",
+    "vmap": "lispy.functions.numeric.vmap",
+    "vmax": "lispy.functions.numeric.vmax",
+    "vmean": "lispy.functions.numeric.vmean",
+    "vmin": "lispy.functions.numeric.vmin",
+    "vsum": "lispy.functions.numeric.vsum",
+    "web-app": "lispy.functions.web.web_app",
+    "where": "lispy.functions.table.where",
+    "with-timeout": "lispy.functions.promises.with_timeout",
+}
+
+WEB_UNSAFE_BUILTINS = {
+    "csv-read": "File system access",
+    "csv-write": "File system access",
+    "http-delete": "Network access",
+    "http-get": "Network access",
+    "http-post": "Network access",
+    "http-put": "Network access",
+    "http-request": "Network access",
+    "json-write": "File system access",
+    "line-seq": "File system access",
+    "load-image": "File system access - images can contain arbitrary code",
+    "middleware": "Network access",
+    "mmap-file": "File system access",
+    "ndjson-read": "File system access",
+    "ndjson-write": "File system access",
+    "open-file": "File system access",
+    "read-chunks": "File system access",
+    "read-line": "File system access",
+    "route": "Network access",
+    "save-image": "File system access",
+    "slurp": "File system access",
+    "spit": "File system access",
+    "start-server": "Network access",
+    "stop-server": "Network access",
+    "web-app": "Network access",
+}
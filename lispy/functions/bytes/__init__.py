@@ -0,0 +1,25 @@
+"""LisPy Byte Functions - Binary data with zero-copy slicing and memory-mapped files"""
+
+from .byte_at import byte_at, byte_at_documentation
+from .bytes_fn import bytes_documentation, bytes_fn
+from .decode import decode, decode_documentation
+from .index_of import index_of, index_of_documentation
+from .mmap_file import mmap_file, mmap_file_documentation
+from .slice import slice_documentation, slice_fn
+
+__all__ = [
+    # Functions
+    "byte_at",
+    "bytes_fn",
+    "decode",
+    "index_of",
+    "mmap_file",
+    "slice_fn",
+    # Documentation
+    "byte_at_documentation",
+    "bytes_documentation",
+    "decode_documentation",
+    "index_of_documentation",
+    "mmap_file_documentation",
+    "slice_documentation",
+]
@@ -0,0 +1,47 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import check_buffer, check_offset
+
+
+@lispy_function("byte-at")
+def byte_at(args: List[Any], env: Environment) -> int:
+    """Implementation of the (byte-at bytes index) LisPy function.
+    Returns the value of the byte at index.
+    Usage: (byte-at header 0)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'byte-at' expects 2 arguments, got {len(args)}."
+        )
+
+    buffer = check_buffer(args[0], "byte-at")
+    index = check_offset(args[1], "byte-at", "Second")
+    try:
+        return buffer.byte_at(index)
+    except IndexError:
+        raise EvaluationError(
+            f"IndexError: Index {index} is out of bounds for bytes of length {len(buffer)}."
+        )
+
+
+@lispy_documentation("byte-at")
+def byte_at_documentation() -> str:
+    """Returns documentation for the byte-at function."""
+    return """Function: byte-at
+Arguments: (byte-at bytes index)
+Description: Returns the value (0 to 255) of the byte at index.
+
+Examples:
+  (byte-at (bytes "A") 0)           ; => 65
+  (byte-at (bytes [1 2 3]) -1)      ; => 3
+
+Notes:
+  - Negative indexes count from the end
+  - An index out of bounds raises an IndexError
+  - On a mapped file, only the page holding the byte is read
+
+See Also: bytes, slice, index-of"""
@@ -0,0 +1,55 @@
+from typing import Any, List
+
+from lispy.byte_buffer import ByteBuffer
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.types import LispyList, Vector
+
+
+@lispy_function("bytes")
+def bytes_fn(args: List[Any], env: Environment) -> ByteBuffer:
+    """Implementation of the (bytes value) LisPy function.
+    Returns the UTF-8 encoding of a string, or the bytes of a vector of byte values.
+    Usage: (bytes "hello") or (bytes [104 105])
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'bytes' expects 1 argument, got {len(args)}."
+        )
+
+    value = args[0]
+    if isinstance(value, ByteBuffer):
+        return value
+    if isinstance(value, str):
+        return ByteBuffer(value.encode("utf-8"))
+    if isinstance(value, (Vector, LispyList)):
+        try:
+            return ByteBuffer(bytes(value))
+        except (TypeError, ValueError):
+            raise EvaluationError(
+                "ValueError: 'bytes' expects byte values, integers from 0 to 255."
+            )
+    raise EvaluationError(
+        f"TypeError: First argument to 'bytes' must be a string, vector or list, got {type(value)}."
+    )
+
+
+@lispy_documentation("bytes")
+def bytes_documentation() -> str:
+    """Returns documentation for the bytes function."""
+    return """Function: bytes
+Arguments: (bytes value)
+Description: Returns in-memory bytes: the UTF-8 encoding of a string, or the bytes whose values are given in a vector or list.
+
+Examples:
+  (bytes "héllo")               ; => #<bytes length=6>
+  (bytes [0 255 16])            ; => #<bytes length=3>
+  (decode (bytes [104 105]))    ; => "hi"
+
+Notes:
+  - Byte values are integers from 0 to 255
+  - Given bytes, returns them unchanged
+  - Bytes support count, slice, byte-at, index-of and decode
+
+See Also: mmap-file, slice, decode"""
@@ -0,0 +1,52 @@
+import codecs
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.string.utils import check_string
+
+from .utils import check_buffer
+
+
+@lispy_function("decode")
+def decode(args: List[Any], env: Environment) -> str:
+    """Implementation of the (decode bytes [encoding]) LisPy function.
+    Decodes bytes into a string.
+    Usage: (decode (slice data 0 64)) or (decode data "latin-1")
+    """
+    if len(args) not in (1, 2):
+        raise EvaluationError(
+            f"SyntaxError: 'decode' expects 1 or 2 arguments, got {len(args)}."
+        )
+
+    buffer = check_buffer(args[0], "decode")
+    encoding = check_string(args[1], "decode", "Second") if len(args) == 2 else "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        raise EvaluationError(f"ValueError: Unknown encoding '{encoding}' in 'decode'.")
+    try:
+        return buffer.decode(encoding)
+    except UnicodeDecodeError as e:
+        raise EvaluationError(f"UnicodeError: Cannot decode bytes as {encoding}: {e}.")
+
+
+@lispy_documentation("decode")
+def decode_documentation() -> str:
+    """Returns documentation for the decode function."""
+    return """Function: decode
+Arguments: (decode bytes [encoding])
+Description: Returns the string encoded by bytes, in UTF-8 or the given encoding.
+
+Examples:
+  (decode (bytes [104 105]))               ; => "hi"
+  (decode (bytes [233]) "latin-1")         ; => "é"
+  (decode (slice (mmap-file "x.bin") 0 4))  ; decodes only four bytes
+
+Notes:
+  - Only the given bytes are copied and decoded; slice first to decode part
+    of a large buffer
+  - Invalid input raises a UnicodeError
+
+See Also: bytes, slice"""
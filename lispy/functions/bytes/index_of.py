@@ -0,0 +1,45 @@
+from typing import Any, List, Optional
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import check_buffer, check_offset, to_byte_string
+
+
+@lispy_function("index-of")
+def index_of(args: List[Any], env: Environment) -> Optional[int]:
+    """Implementation of the (index-of bytes needle [from]) LisPy function.
+    Returns the offset of the first occurrence of needle, or nil.
+    Usage: (index-of data "\\n" 100)
+    """
+    if len(args) not in (2, 3):
+        raise EvaluationError(
+            f"SyntaxError: 'index-of' expects 2 or 3 arguments, got {len(args)}."
+        )
+
+    buffer = check_buffer(args[0], "index-of")
+    needle = to_byte_string(args[1], "index-of", "Second")
+    start = check_offset(args[2], "index-of", "Third") if len(args) == 3 else 0
+    found = buffer.index_of(needle, start)
+    return None if found < 0 else found
+
+
+@lispy_documentation("index-of")
+def index_of_documentation() -> str:
+    """Returns documentation for the index-of function."""
+    return """Function: index-of
+Arguments: (index-of bytes needle [from])
+Description: Returns the offset of the first occurrence of needle in bytes at or after from (0 by default), or nil if there is none.
+
+Examples:
+  (index-of (bytes "a,b,c") ",")          ; => 1
+  (index-of (bytes "a,b,c") "," 2)        ; => 3
+  (index-of (bytes [1 2 3]) 2)            ; => 1
+  (index-of (bytes "abc") "z")            ; => nil
+
+Notes:
+  - needle is bytes, a string (matched as UTF-8) or a byte value 0-255
+  - The search runs in place, without copying bytes or decoding them
+
+See Also: slice, byte-at, decode"""
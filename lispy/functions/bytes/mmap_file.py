@@ -0,0 +1,59 @@
+from typing import Any, List
+
+from lispy.byte_buffer import ByteBuffer
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+
+@lispy_function("mmap-file", web_safe=False, reason="File system access")
+def mmap_file(args: List[Any], env: Environment) -> ByteBuffer:
+    """Implementation of the (mmap-file filename) LisPy function.
+    Maps a file into memory read-only and returns its bytes without reading them.
+    Usage: (with-open [index (mmap-file "data.idx")] ...)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'mmap-file' expects 1 argument, got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: First argument to 'mmap-file' must be a string, got {type(filename)}."
+        )
+    try:
+        return ByteBuffer.from_file(filename)
+    except FileNotFoundError:
+        raise EvaluationError(f"FileNotFoundError: File '{filename}' does not exist.")
+    except (IsADirectoryError, NotADirectoryError):
+        raise EvaluationError(f"FileError: '{filename}' is not a regular file.")
+    except PermissionError:
+        raise EvaluationError(
+            f"PermissionError: Permission denied reading file '{filename}'."
+        )
+    except (OSError, ValueError) as e:
+        raise EvaluationError(f"OSError: Cannot map file '{filename}': {e}.")
+
+
+@lispy_documentation("mmap-file")
+def mmap_file_documentation() -> str:
+    """Returns documentation for the mmap-file function."""
+    return """Function: mmap-file
+Arguments: (mmap-file filename)
+Description: Maps a file into memory read-only and returns its bytes; only the pages that are read are loaded from disk.
+
+Examples:
+  (with-open [index (mmap-file "records.idx")]
+    (decode (slice index 4096 4160)))          ; reads one 64-byte record
+  (with-open [data (mmap-file "dump.bin")]
+    (index-of data "MAGIC"))                   ; searches without a copy
+
+Notes:
+  - Use inside with-open, which unmaps the file when its body finishes;
+    the bytes (and slices of them) cannot be read afterwards
+  - Nothing is read or decoded up front, so the file may be far larger
+    than memory
+  - Not available in web-safe environments
+
+See Also: bytes, slice, byte-at, index-of, decode, with-open"""
@@ -0,0 +1,44 @@
+from typing import Any, List
+
+from lispy.byte_buffer import ByteBuffer
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import check_buffer, check_offset
+
+
+@lispy_function("slice")
+def slice_fn(args: List[Any], env: Environment) -> ByteBuffer:
+    """Implementation of the (slice bytes start [end]) LisPy function.
+    Returns bytes start..end without copying them.
+    Usage: (slice data 16 32)
+    """
+    if len(args) not in (2, 3):
+        raise EvaluationError(
+            f"SyntaxError: 'slice' expects 2 or 3 arguments, got {len(args)}."
+        )
+
+    buffer = check_buffer(args[0], "slice")
+    start = check_offset(args[1], "slice", "Second")
+    end = check_offset(args[2], "slice", "Third") if len(args) == 3 else None
+    return buffer.slice(start, end)
+
+
+@lispy_documentation("slice")
+def slice_documentation() -> str:
+    """Returns documentation for the slice function."""
+    return """Function: slice
+Arguments: (slice bytes start [end])
+Description: Returns the bytes from offset start up to (not including) end, or to the end, sharing memory with the original.
+
+Examples:
+  (decode (slice (bytes "hello world") 6))       ; => "world"
+  (decode (slice (bytes "hello world") 0 5))     ; => "hello"
+  (count (slice (bytes "hello") -3))            ; => 3
+
+Notes:
+  - No bytes are copied, so slicing a mapped file is O(1)
+  - Negative offsets count from the end; offsets out of range are clamped
+
+See Also: bytes, mmap-file, byte-at, decode"""
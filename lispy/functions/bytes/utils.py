@@ -0,0 +1,43 @@
+"""
+Shared helpers for the LisPy byte buffer functions.
+"""
+
+from typing import Any
+
+from lispy.byte_buffer import ByteBuffer
+from lispy.exceptions import EvaluationError
+
+
+def check_buffer(value: Any, function_name: str, position: str = "First") -> ByteBuffer:
+    """Raise unless value is a byte buffer that can still be read."""
+    if not isinstance(value, ByteBuffer):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be bytes, got {type(value)}."
+        )
+    if value.closed:
+        raise EvaluationError(
+            f"IOError: '{function_name}' got bytes of a file that was closed; use them inside with-open."
+        )
+    return value
+
+
+def check_offset(value: Any, function_name: str, position: str) -> int:
+    """Raise a TypeError unless value is an integer offset."""
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be an integer, got {type(value)}."
+        )
+    return value
+
+
+def to_byte_string(value: Any, function_name: str, position: str) -> bytes:
+    """Return bytes, a string (as UTF-8) or a single byte value as Python bytes."""
+    if isinstance(value, ByteBuffer):
+        return check_buffer(value, function_name, position).to_bytes()
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 255:
+        return bytes((value,))
+    raise EvaluationError(
+        f"TypeError: {position} argument to '{function_name}' must be bytes, a string or a byte value 0-255, got {value!r}."
+    )
@@ -6,18 +6,27 @@ from .append import append, append_documentation
 from .concat import concat, concat_documentation
 from .conj import conj, conj_documentation
 from .count import count, count_documentation
+from .count_by import count_by, count_by_documentation
+from .distinct import distinct, distinct_documentation
+from .distinct_by import distinct_by, distinct_by_documentation
 from .empty import empty_q, empty_q_documentation
 from .every_q import every_q, every_q_documentation
 from .filter import filter, filter_documentation
 from .first import first, first_documentation
+from .frequencies import frequencies, frequencies_documentation
+from .group_by import group_by, group_by_documentation
+from .index_by import index_by, index_by_documentation
 from .map import map, map_documentation
 from .nth import nth, nth_documentation
+from .partition import partition, partition_documentation
+from .partition_by import partition_by, partition_by_documentation
 from .range import range, range_documentation
 from .reduce import reduce, reduce_documentation
 from .rest import rest, rest_documentation
 from .reverse import reverse, reverse_documentation
 from .some import some, some_documentation
 from .sort import sort, sort_documentation
+from .sort_by import sort_by, sort_by_documentation
 
 __all__ = [
     # Converted functions (new names)
@@ -49,8 +58,26 @@ __all__ = [
     "range",
     "some",
     "sort",
+    "group_by",
+    "sort_by",
+    "distinct",
+    "frequencies",
+    "count_by",
+    "index_by",
+    "distinct_by",
+    "partition",
+    "partition_by",
     "every_q_documentation",
     "range_documentation",
     "some_documentation",
     "sort_documentation",
+    "group_by_documentation",
+    "sort_by_documentation",
+    "distinct_documentation",
+    "frequencies_documentation",
+    "count_by_documentation",
+    "index_by_documentation",
+    "distinct_by_documentation",
+    "partition_documentation",
+    "partition_by_documentation",
 ]
@@ -3,15 +3,20 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.set.utils import set_element
+from lispy.persistent_list import EMPTY_LIST, persistent_list
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import persistent_vector
 from lispy.types import LispyList, Vector
 
 
 @lispy_function("conj")
 def conj(args: List[Any], env: Environment):
     """Implementation of the (conj coll item ...) LisPy function.
-    Adds item(s) to a collection (list or vector).
+    Adds item(s) to a collection (list, vector or set).
     - For lists, items are prepended (like cons), effectively reversing the order of added items.
-    - For vectors, items are appended.
+    - For vectors, items are appended. The result is a PersistentVector that
+      shares structure with the input, so each append is O(log32 n).
     - If the first argument is nil, it's treated as an empty list.
     Returns a new collection of the same type.
     Usage: (conj collection item1 [item2 ...])
@@ -26,19 +31,22 @@ def conj(args: List[Any], env: Environment):
 
     if collection is None:  # Treat nil as an empty list
         # For (conj nil item1 item2), result is (item2 item1)
-        return LispyList(list(reversed(items_to_add)))
-    elif isinstance(collection, LispyList):
-        # Prepend items to a new list. items_to_add are prepended in order,
-        # so reverse them to get the desired (item_n ... item1 orig_item1 ...)
-        new_list_content = list(reversed(items_to_add)) + list(collection)
-        return LispyList(new_list_content)
+        collection = EMPTY_LIST
+    if isinstance(collection, LispyList):
+        # Prepend items in order, giving (item_n ... item1 orig_item1 ...).
+        # The original list is shared as the tail of the result.
+        new_list = persistent_list(collection)
+        for item in items_to_add:
+            new_list = new_list.cons(item)
+        return new_list
     elif isinstance(collection, Vector):
-        # Append items to a new vector
-        new_vector_content = list(collection) + list(items_to_add)
-        return Vector(new_vector_content)
+        # Append items to a persistent vector, sharing the original's structure
+        return persistent_vector(collection).conj_all(items_to_add)
+    elif isinstance(collection, PersistentSet):
+        return collection.conj_all(set_element(item, "conj") for item in items_to_add)
     else:
         raise EvaluationError(
-            f"TypeError: 'conj' expects a list, vector, or nil as the first argument, got {type(collection)}."
+            f"TypeError: 'conj' expects a list, vector, set, or nil as the first argument, got {type(collection)}."
         )
 
 
@@ -60,16 +68,23 @@ Examples:
   (conj [1] 2 3)                ; => [1 2 3] (items added in order)
   (conj [] 1 2 3)               ; => [1 2 3]
   
+  ; Sets - items already present are ignored:
+  (conj (hash-set 1 2) 2 3)     ; => #{1 2 3}
+
   ; Nil treated as empty list:
   (conj nil 1)                  ; => (1)
   (conj nil 1 2 3)              ; => (3 2 1)
 
 Notes:
   - Requires at least 2 arguments (collection and one item)
-  - First argument must be a list, vector, or nil
-  - For lists: items are prepended, reversing order of multiple items
+  - First argument must be a list, vector, set, or nil
+  - For lists: items are prepended, reversing order of multiple items;
+    the original list becomes the shared tail of the result
   - For vectors: items are appended in order
+  - For sets: items are added once, in O(log32 n) each
   - Nil is treated as an empty list
   - Returns new collection, original is not modified
+  - Appending to a vector is O(log32 n): the new vector shares structure
+    with the old one, so building a vector with conj in a loop is linear
   - Essential for building collections incrementally
   - Behavior mirrors Clojure's conj function"""
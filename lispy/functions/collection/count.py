@@ -1,9 +1,16 @@
 # lispy_project/lispy/functions/count.py
 from typing import Any, List
 
+from lispy.byte_buffer import ByteBuffer
 from lispy.environment import Environment  # Added Environment import
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.numeric_array import NumericArray
+from lispy.persistent_map import TransientMap
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import TransientVector
+from lispy.table import Table
 from lispy.types import Vector  # For type checking
 
 
@@ -19,8 +26,25 @@ def count(args: List[Any], env: Environment) -> int:  # Added env parameter
 
     if arg is None:  # nil
         return 0
-    elif isinstance(arg, (list, Vector, str, dict)):
+    elif isinstance(
+        arg,
+        (
+            list,
+            Vector,
+            str,
+            dict,
+            PersistentSet,
+            TransientVector,
+            TransientMap,
+            NumericArray,
+            Table,
+            ByteBuffer,
+        ),
+    ):
         return len(arg)
+    elif isinstance(arg, LazySeq):
+        # Realizes the whole sequence
+        return sum(len(chunk) for chunk in arg.chunks())
     else:
         type_name = type(arg).__name__
         # Special handling for Function type name for clarity in error
@@ -47,10 +71,14 @@ Examples:
   (count (list))            ; => 0
   (count [])                ; => 0
   (count nil)               ; => 0
+  (count (transient [1 2])) ; => 2
+  (count (hash-set 1 2 1))  ; => 2
 
 Notes:
   - Requires exactly one argument
-  - Works with lists, vectors, maps, strings, and nil
+  - Works with lists, vectors, maps, sets, strings, transients, lazy
+    sequences, numeric arrays, tables (counting rows), and nil
+  - Counting a lazy sequence realizes all of it (never returns if infinite)
   - For maps, counts key-value pairs
   - For strings, counts characters
   - nil always returns 0
@@ -0,0 +1,49 @@
+from collections import Counter
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import PersistentMap
+
+from .utils import check_collection, key_function
+
+
+@lispy_function("count-by")
+def count_by(args: List[Any], env: Environment) -> PersistentMap:
+    """Implementation of the (count-by collection key) LisPy function.
+    Returns a map from each key to the number of items with that key.
+    Usage: (count-by collection key-fn)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'count-by' expects 2 arguments, got {len(args)}."
+        )
+
+    items = check_collection(args[0], "count-by")
+    key_fn = key_function(args[1], env, "count-by")
+    counts = Counter(
+        map_key(key_fn(item), "Keys in 'count-by' must be") for item in items
+    )
+    return PersistentMap(counts)
+
+
+@lispy_documentation("count-by")
+def count_by_documentation() -> str:
+    """Returns documentation for the count-by function."""
+    return """Function: count-by
+Arguments: (count-by collection key)
+Description: Returns a map from each key to the number of items of collection with that key.
+
+Examples:
+  (count-by [1 2 3 4 5] (fn [x] (% x 2)))   ; => {1 3 0 2}
+  (count-by requests ':status)              ; => {200 2 404 1}
+
+Notes:
+  - key is a function of one argument, or a keyword to count maps by a field
+  - Same as (frequencies (map collection key)) without building the
+    intermediate vector, or a group-by that only keeps the sizes
+  - Keys appear in the order they first occur
+
+See Also: frequencies, group-by"""
@@ -0,0 +1,72 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.set.utils import set_element
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_list import PersistentList
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import PersistentVector
+from lispy.transducers import distincting, transduced
+from lispy.types import LispyList, Vector
+
+
+def _key(item: Any) -> Any:
+    return set_element(item, "distinct")
+
+
+@lispy_function("distinct")
+def distinct(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (distinct collection) LisPy function.
+    Returns the collection without repeated items, keeping first occurrences.
+    With no arguments, (distinct) returns a transducer.
+    """
+    if len(args) > 1:
+        raise EvaluationError(
+            f"SyntaxError: 'distinct' expects 0 or 1 arguments, got {len(args)}."
+        )
+    if not args:
+        return distincting(_key)
+
+    collection = args[0]
+    if collection is None or isinstance(collection, PersistentSet):
+        return collection
+    if not isinstance(collection, (Vector, LispyList, LazySeq)):
+        raise EvaluationError(
+            f"TypeError: Argument to 'distinct' must be a vector, list, lazy sequence, set, or nil, got {type(collection)}."
+        )
+
+    items = transduced(distincting(_key), iter(collection))
+    if isinstance(collection, LazySeq):
+        return LazySeq.from_iterable(items)
+    if isinstance(collection, Vector):
+        return PersistentVector(items)
+    return PersistentList(items)
+
+
+@lispy_documentation("distinct")
+def distinct_documentation() -> str:
+    """Returns documentation for the distinct function."""
+    return """Function: distinct
+Arguments: (distinct collection) or (distinct)
+Description: Returns the collection with repeated items removed, keeping the first occurrence of each.
+With no arguments, returns a transducer for transduce, into and sequence.
+
+Examples:
+  (distinct [1 2 1 3 2])                ; => [1 2 3]
+  (distinct '(:a :b :a))                ; => (:a :b)
+  (distinct [[1 2] [1 2] [3]])          ; => [[1 2] [3]] (compared by value)
+  (take (distinct (lazy-range)) 3)      ; => (0 1 2)
+  (into [] (distinct) [3 3 1])          ; => [3 1] (transducer)
+
+Notes:
+  - Items seen so far are kept in a hash set, so distinct is O(n) rather
+    than the O(n^2) of comparing every pair
+  - Returns the same collection type: vector, list, or lazy sequence; a
+    lazy sequence stays lazy and works on infinite sequences
+  - A set is already distinct and is returned as it is
+  - Items must be hashable: symbols, strings, numbers, booleans, nil, or
+    collections of them
+
+See Also: hash-set, filter"""
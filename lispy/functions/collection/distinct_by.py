@@ -0,0 +1,67 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.map.utils import map_key
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_list import PersistentList
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import PersistentVector
+from lispy.transducers import distincting, transduced
+from lispy.types import Vector
+
+from .utils import check_collection, key_function
+
+
+@lispy_function("distinct-by")
+def distinct_by(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (distinct-by collection key) LisPy function.
+    Returns the collection without items whose key was already seen.
+    Usage: (distinct-by collection key-fn)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'distinct-by' expects 2 arguments, got {len(args)}."
+        )
+
+    collection = args[0]
+    check_collection(collection, "distinct-by")
+    key_fn = key_function(args[1], env, "distinct-by")
+    if collection is None:
+        return None
+
+    def item_key(item: Any) -> Any:
+        return map_key(key_fn(item), "Keys in 'distinct-by' must be")
+
+    items = transduced(distincting(item_key), iter(collection))
+    if isinstance(collection, LazySeq):
+        return LazySeq.from_iterable(items)
+    if isinstance(collection, PersistentSet):
+        return collection.empty().conj_all(items)
+    if isinstance(collection, Vector):
+        return PersistentVector(items)
+    return PersistentList(items)
+
+
+@lispy_documentation("distinct-by")
+def distinct_by_documentation() -> str:
+    """Returns documentation for the distinct-by function."""
+    return """Function: distinct-by
+Arguments: (distinct-by collection key)
+Description: Returns the collection with every item removed whose key equals the key of an earlier item.
+
+Examples:
+  (distinct-by ["apple" "avocado" "banana"] first)   ; => ["apple" "banana"]
+  (distinct-by requests ':path)                      ; first request per path
+  (distinct-by [1 -1 2 -2] (fn [x] (abs x)))         ; => [1 2]
+
+Notes:
+  - key is a function of one argument, or a keyword to compare maps by a field
+  - key is called once per item; the keys seen are kept in a hash set
+  - Returns the same collection type: vector, list, set, or lazy sequence; a
+    lazy sequence stays lazy
+  - Keys must be hashable: symbols, strings, numbers, booleans, nil, or
+    collections of them
+
+See Also: distinct, index-by"""
@@ -3,6 +3,8 @@ from typing import Any, List
 from lispy.environment import Environment  # Added Environment import
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_set import PersistentSet
 from lispy.types import Vector  # For type checking
 
 
@@ -18,8 +20,10 @@ def empty_q(args: List[Any], env: Environment) -> bool:  # Added env parameter
 
     if arg is None:  # nil
         return True
-    elif isinstance(arg, (list, Vector, str, dict)):
+    elif isinstance(arg, (list, Vector, str, dict, PersistentSet)):
         return not bool(arg)  # len(arg) == 0 works for these types
+    elif isinstance(arg, LazySeq):
+        return arg.is_empty()  # Realizes at most the first chunk
     else:
         type_name = type(arg).__name__
         # Special handling for Function type name for clarity in error
@@ -46,11 +50,12 @@ Examples:
   (empty? {:a 1})               ; => false
   (empty? "")                   ; => true
   (empty? "hello")              ; => false
+  (empty? (hash-set))           ; => true
   (empty? nil)                  ; => true
 
 Notes:
   - Requires exactly one argument
-  - Works with lists, vectors, maps, strings, and nil
+  - Works with lists, vectors, maps, sets, strings, lazy sequences, and nil
   - Returns true for empty collections/strings or nil
   - Returns false for non-empty collections/strings
   - nil is considered empty (returns true)
@@ -1,40 +1,13 @@
-from typing import Any, Callable, List
+from typing import Any, List
 
 from lispy.closure import Function
 from lispy.environment import Environment
-from lispy.evaluator import evaluate
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyList, Vector
 
 
-def _call_predicate(
-    predicate: Any, item: Any, env: Environment, evaluate_fn: Callable
-) -> Any:
-    """Helper to call the predicate (user-defined or built-in) on an item."""
-    if isinstance(predicate, Function):
-        # User-defined function
-        if len(predicate.params) != 1:
-            raise EvaluationError(
-                f"TypeError: Predicate function expects 1 argument, got {len(predicate.params)}."
-            )
-
-        call_env = Environment(outer=predicate.defining_env)
-        call_env.define(predicate.params[0].name, item)
-
-        result = None
-        for expr_in_body in predicate.body:
-            result = evaluate_fn(expr_in_body, call_env)
-        return result
-    elif callable(predicate):
-        # Built-in Python function
-        return predicate([item], env)
-    else:
-        raise EvaluationError(
-            f"TypeError: Second argument to 'every?' must be a function, got {type(predicate)}."
-        )
-
-
 @lispy_function("every?")
 def every_q(args: List[Any], env: Environment) -> bool:
     """Implementation of the (every? collection predicate) LisPy function.
@@ -78,9 +51,15 @@ def every_q(args: List[Any], env: Environment) -> bool:
     if not collection:
         return True
 
+    if isinstance(predicate, Function) and len(predicate.params) != 1:
+        raise EvaluationError(
+            f"TypeError: Predicate function expects 1 argument, got {len(predicate.params)}."
+        )
+    call = make_caller(predicate, env, arity=1)
+
     # Apply predicate to each element, return False on first falsy result
     for item in collection:
-        result = _call_predicate(predicate, item, env, evaluate)
+        result = call(item)
         # In LisPy, False and None are falsy, everything else is truthy
         if result is False or result is None:
             return False
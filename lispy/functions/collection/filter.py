@@ -1,59 +1,40 @@
-from typing import Any, Callable, List
+from typing import Any, List
 
 from lispy.closure import Function  # For user-defined procedures
 from lispy.environment import Environment
-from lispy.evaluator import \
-    evaluate  # For evaluating user-defined function bodies
+from lispy.evaluator import make_caller
 from lispy.exceptions import ArityError, EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import EMPTY_VECTOR
+from lispy.transducers import filtering
 from lispy.types import LispyList, Vector
 
 
-def _call_predicate(
-    predicate: Any, item: Any, env: Environment, evaluate_fn: Callable
-) -> Any:
-    """Helper to call the predicate (user-defined or built-in)."""
-    if isinstance(predicate, Function):
-        # User-defined function
-        if len(predicate.params) != 1:
-            # This specific check might be redundant if arity is checked before iteration starts,
-            # but good for safety if called directly.
-            raise ArityError(
-                f"Predicate {predicate} expects 1 argument, got different setup."
-            )
-
-        call_env = Environment(outer=predicate.defining_env)
-        call_env.define(predicate.params[0].name, item)
-
-        result = None
-        for expr_in_body in predicate.body:
-            result = evaluate_fn(expr_in_body, call_env)
-        return result
-    elif callable(predicate):
-        # Built-in Python function
-        # Built-ins expect a list of args and the env.
-        return predicate([item], env)  # Pass current env to built-in predicate
-    else:
-        # Should have been caught by earlier type checks
+@lispy_function("filter")
+def filter(args: List[Any], env: Environment):
+    """Implementation of the (filter collection predicate) LisPy function.
+    With only a predicate, (filter predicate) returns a transducer.
+    """
+    if len(args) not in (1, 2):
         raise EvaluationError(
-            f"InternalError: Invalid predicate type in _call_predicate: {type(predicate)}"
+            f"SyntaxError: 'filter' expects 1 or 2 arguments, got {len(args)}."
         )
 
+    collection = args[0] if len(args) == 2 else None
+    predicate = args[-1]
 
-@lispy_function("filter")
-def filter(args: List[Any], env: Environment):
-    """Implementation of the (filter collection predicate) LisPy function."""
-    if len(args) != 2:
+    if len(args) == 1 and not callable(predicate):
         raise EvaluationError(
-            f"SyntaxError: 'filter' expects 2 arguments, got {len(args)}."
+            f"TypeError: 'filter' with one argument expects a procedure to build a transducer, got {type(predicate)}."
         )
 
-    collection = args[0]
-    predicate = args[1]
-
-    if not isinstance(collection, (LispyList, Vector)):
+    if len(args) == 2 and not isinstance(
+        collection, (LispyList, Vector, LazySeq, PersistentSet)
+    ):
         raise EvaluationError(
-            f"TypeError: First argument to 'filter' must be a list or vector, got {type(collection)}."
+            f"TypeError: First argument to 'filter' must be a list, vector, set, or lazy sequence, got {type(collection)}."
         )
 
     is_user_defined_fn = isinstance(predicate, Function)
@@ -78,15 +59,46 @@ def filter(args: List[Any], env: Environment):
         # The built-in itself should raise an ArityError if it receives an args_list of unexpected length.
         pass  # Trusting the built-in to handle its own arg count from the list it receives.
 
-    filtered_items = []
+    call = make_caller(predicate, env, arity=expected_arity)
+
+    if len(args) == 1:
+
+        def keep(item):
+            predicate_result = call(item)
+            return predicate_result is not False and predicate_result is not None
+
+        return filtering(keep)
+
+    if isinstance(collection, LazySeq):
+        # Lazy in, lazy out: the predicate runs as the result is consumed
+        def kept_items(items):
+            for item in items:
+                predicate_result = call(item)
+                if predicate_result is not False and predicate_result is not None:
+                    yield item
+
+        return LazySeq.from_iterable(kept_items(iter(collection)))
+
+    if isinstance(collection, PersistentSet):
+        kept = []
+        for item in collection:
+            predicate_result = call(item)
+            if predicate_result is not False and predicate_result is not None:
+                kept.append(item)
+        return collection.empty().conj_all(kept)
+
+    # Vectors are built in a transient; lists are collected then wrapped
+    is_vector = isinstance(collection, Vector)
+    filtered_items = EMPTY_VECTOR.transient() if is_vector else []
+    keep = filtered_items.conj if is_vector else filtered_items.append
     for item in collection:
         # In LisPy, False and None are falsy, everything else is truthy.
-        predicate_result = _call_predicate(predicate, item, env, evaluate)
+        predicate_result = call(item)
         if predicate_result is not False and predicate_result is not None:
-            filtered_items.append(item)
+            keep(item)
 
-    if isinstance(collection, Vector):
-        return Vector(filtered_items)
+    if is_vector:
+        return filtered_items.persistent()
     else:  # LispyList
         return LispyList(filtered_items)
 
@@ -95,8 +107,9 @@ def filter(args: List[Any], env: Environment):
 def filter_documentation() -> str:
     """Returns documentation for the filter function."""
     return """Function: filter
-Arguments: (filter collection predicate)
+Arguments: (filter collection predicate) or (filter predicate)
 Description: Returns a new collection containing only elements that satisfy the predicate.
+With only a predicate, returns a transducer for transduce, into and sequence.
 
 Examples:
   (filter [1 2 3 4 5] (fn [x] (> x 3)))     ; => [4 5]
@@ -105,11 +118,15 @@ Examples:
   (filter [1 2 3] (fn [x] (= (% x 2) 0)))   ; => [2] (even numbers)
   (filter [] is-number?)                    ; => []
   (filter '(-1 0 1 2) (fn [x] (> x 0)))     ; => (1 2)
+  (into [] (filter is-number?) ["a" 1 2])   ; => [1 2] (transducer)
 
 Notes:
-  - Collection must be a list or vector
+  - Collection must be a list, vector, set, or lazy sequence
   - Predicate must be a function that takes 1 argument
-  - Returns same collection type as input (vector -> vector, list -> list)
+  - Returns same collection type as input (vector -> vector, list -> list,
+    set -> set)
+  - A lazy sequence gives a lazy sequence; the predicate runs only as the
+    result is consumed, 32 items at a time
   - Predicate should return truthy/falsy values
   - False and nil are considered falsy, everything else is truthy
   - Original collection is not modified
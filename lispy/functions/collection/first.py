@@ -3,9 +3,12 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_sorted_map import PersistentSortedMap
 from lispy.types import LispyList, Vector
 
-EXPECTED_TYPES_MSG = "a list, vector, string, or nil"
+EXPECTED_TYPES_MSG = "a list, vector, lazy sequence, set, sorted map, string, or nil"
 
 
 @lispy_function("first")
@@ -23,10 +26,21 @@ def first(args: List[Any], env: Environment):
 
     if collection is None:
         return None
+    if isinstance(collection, LazySeq):
+        # Realizes only the first chunk
+        return collection.first()
     if isinstance(collection, (LispyList, Vector, str)):
         if not collection:  # Empty list, vector, or string
             return None
         return collection[0]
+    if isinstance(collection, PersistentSet):
+        # The least element of a sorted set; any element of a hash set
+        return next(iter(collection), None)
+    if isinstance(collection, PersistentSortedMap):
+        # The entry with the least key, as a [key value] vector like subseq
+        for entry in collection.entries():
+            return Vector(entry)
+        return None
     else:
         raise EvaluationError(
             f"TypeError: 'first' expects {EXPECTED_TYPES_MSG}, got {type(collection)}."
@@ -49,10 +63,18 @@ Examples:
   (first "")                ; => nil
   (first nil)               ; => nil
   (first '((1 2) 3))        ; => (1 2)
+  (first (sorted-set 3 1 2)) ; => 1
+  (first (sorted-map 2 ':b 1 ':a)) ; => [1 :a]
 
 Notes:
   - Requires exactly one argument
-  - Works with lists, vectors, strings, and nil
+  - Works with lists, vectors, lazy sequences, sets, sorted maps, strings,
+    and nil
+  - On a sorted set or sorted map it returns the least element or entry in
+    O(log n), so a sorted set serves as a priority queue; sorted map entries
+    are [key value] vectors
+  - A hash set has no order, so its first element is arbitrary
+  - On a lazy sequence only the first chunk is realized
   - Returns nil for empty collections or nil input
   - Alternative to car function for lists
   - For strings, returns first character as string
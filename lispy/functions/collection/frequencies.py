@@ -0,0 +1,51 @@
+from collections import Counter
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import PersistentMap
+
+from .utils import check_collection
+
+
+@lispy_function("frequencies")
+def frequencies(args: List[Any], env: Environment) -> PersistentMap:
+    """Implementation of the (frequencies collection) LisPy function.
+    Returns a map from each distinct item to the number of times it occurs.
+    Usage: (frequencies collection)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'frequencies' expects 1 argument, got {len(args)}."
+        )
+
+    items = check_collection(args[0], "frequencies")
+    # Counter does the counting in C, in one pass
+    counts = Counter(
+        map_key(item, "Items in 'frequencies' must be") for item in items
+    )
+    return PersistentMap(counts)
+
+
+@lispy_documentation("frequencies")
+def frequencies_documentation() -> str:
+    """Returns documentation for the frequencies function."""
+    return """Function: frequencies
+Arguments: (frequencies collection)
+Description: Returns a map from each distinct item of collection to the number of times it occurs.
+
+Examples:
+  (frequencies [:a :b :a :c :a])        ; => {:a 3 :b 1 :c 1}
+  (frequencies [])                      ; => {}
+  (frequencies [[1 2] [1 2] [3]])       ; => {[1 2] 2 [3] 1} (compared by value)
+
+Notes:
+  - Collection is a vector, list, set, lazy sequence, or nil
+  - Counts are kept in one hash table while the collection is walked once
+  - Keys appear in the order they first occur
+  - Items must be hashable: symbols, strings, numbers, booleans, nil, or
+    collections of them
+
+See Also: count-by, group-by, distinct"""
@@ -0,0 +1,76 @@
+from typing import Any, Dict, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.map.utils import map_key
+from lispy.functions.table.utils import check_column, check_table
+from lispy.persistent_map import PersistentMap, persistent_map
+from lispy.persistent_vector import PersistentVector
+from lispy.table import Table
+
+from .utils import check_collection, key_function
+
+
+@lispy_function("group-by")
+def group_by(args: List[Any], env: Environment) -> PersistentMap:
+    """Implementation of the (group-by collection key) LisPy function.
+    Groups the items of a collection by a key computed once per item, or
+    splits a table into one table per distinct value of column.
+    Usage: (group-by collection key-fn) or (group-by table column)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'group-by' expects 2 arguments, got {len(args)}."
+        )
+
+    if isinstance(args[0], Table):
+        table, column = args
+        check_table(table, "group-by", "First")
+        check_column(table, column, "group-by")
+        return persistent_map(table.group_by(column))
+
+    items = check_collection(args[0], "group-by")
+    key_fn = key_function(args[1], env, "group-by")
+
+    # One pass, appending to a Python list per group
+    groups: Dict[Any, List[Any]] = {}
+    for item in items:
+        group_key = map_key(key_fn(item), "Keys in 'group-by' must be")
+        group = groups.get(group_key)
+        if group is None:
+            groups[group_key] = [item]
+        else:
+            group.append(item)
+    return PersistentMap(
+        {group_key: PersistentVector(group) for group_key, group in groups.items()}
+    )
+
+
+@lispy_documentation("group-by")
+def group_by_documentation() -> str:
+    """Returns documentation for the group-by function."""
+    return """Function: group-by
+Arguments: (group-by collection key) or (group-by table column)
+Description: Returns a map from each key to the vector of items with that key, or from each distinct value of column to the table of rows with that value.
+
+Examples:
+  (group-by [1 2 3 4 5] (fn [x] (% x 2)))   ; => {1 [1 3 5] 0 [2 4]}
+  (group-by requests ':status)              ; => {200 [{...} {...}] 404 [{...}]}
+  (group-by logs ':status)
+  ; => {200 #<table rows=2 columns=[:status :bytes :path]>
+  ;     404 #<table rows=1 columns=[:status :bytes :path]>}
+  (aggregate (group-by logs ':status) {:n [:count]})
+  ; => {200 {:n 2} 404 {:n 1}}
+
+Notes:
+  - key is a function of one argument, or a keyword to group maps by a field
+  - Collection is a vector, list, set, lazy sequence, or nil; key is called
+    once per item and the groups are built in one pass, without the
+    intermediate maps of a reduce with assoc
+  - Items keep their order within each group
+  - On a table, groups are found in one pass over the column, then every
+    column is split by row indices
+  - Groups appear in the order their keys first occur
+
+See Also: count-by, index-by, frequencies, partition-by, aggregate"""
@@ -0,0 +1,48 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import PersistentMap
+
+from .utils import check_collection, key_function
+
+
+@lispy_function("index-by")
+def index_by(args: List[Any], env: Environment) -> PersistentMap:
+    """Implementation of the (index-by collection key) LisPy function.
+    Returns a map from each item's key to the item, the last item winning.
+    Usage: (index-by collection key-fn)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'index-by' expects 2 arguments, got {len(args)}."
+        )
+
+    items = check_collection(args[0], "index-by")
+    key_fn = key_function(args[1], env, "index-by")
+    index = {
+        map_key(key_fn(item), "Keys in 'index-by' must be"): item for item in items
+    }
+    return PersistentMap(index)
+
+
+@lispy_documentation("index-by")
+def index_by_documentation() -> str:
+    """Returns documentation for the index-by function."""
+    return """Function: index-by
+Arguments: (index-by collection key)
+Description: Returns a map from the key of each item of collection to the item.
+
+Examples:
+  (index-by [{:id 1 :name "a"} {:id 2 :name "b"}] ':id)
+  ; => {1 {:id 1 :name "a"} 2 {:id 2 :name "b"}}
+  (index-by ["apple" "kiwi"] count)     ; => {5 "apple" 4 "kiwi"}
+
+Notes:
+  - key is a function of one argument, or a keyword to index maps by a field
+  - When several items have the same key, the last one is kept
+  - Keys appear in the order they first occur
+
+See Also: group-by, count-by"""
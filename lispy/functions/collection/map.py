@@ -1,10 +1,11 @@
 from lispy.closure import \
     Function  # Import Function for user-defined procedures
-from lispy.environment import Environment  # Added import for Environment
-from lispy.evaluator import \
-    evaluate  # For evaluating user-defined function bodies
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_vector import EMPTY_VECTOR
+from lispy.transducers import mapping
 from lispy.types import Vector
 
 
@@ -12,20 +13,27 @@ from lispy.types import Vector
 def map(args, env):
     """Implementation of the (map vector procedure) LisPy function.
     Applies procedure to each element of vector and returns a new vector of the results.
-    Usage: (map vector procedure)
+    Given a lazy sequence, returns a lazy sequence of the results instead.
+    Given only a procedure, returns a transducer.
+    Usage: (map vector procedure) or (map procedure)
     """
-    if len(args) != 2:
+    if len(args) not in (1, 2):
         raise EvaluationError(
-            f"SyntaxError: 'map' expects 2 arguments, got {len(args)}."
+            f"SyntaxError: 'map' expects 1 or 2 arguments, got {len(args)}."
         )
 
-    vec_arg = args[0]
-    proc_arg = args[1]
+    vec_arg = args[0] if len(args) == 2 else None
+    proc_arg = args[-1]
+
+    if len(args) == 1 and not callable(proc_arg):
+        raise EvaluationError(
+            f"TypeError: 'map' with one argument expects a procedure to build a transducer, got {type(proc_arg)}."
+        )
 
     # Validate vec_arg type
-    if not isinstance(vec_arg, Vector):
+    if len(args) == 2 and not isinstance(vec_arg, (Vector, LazySeq)):
         raise EvaluationError(
-            f"TypeError: First argument to 'map' must be a vector, got {type(vec_arg)}."
+            f"TypeError: First argument to 'map' must be a vector or lazy sequence, got {type(vec_arg)}."
         )
 
     # Validate proc_arg type
@@ -49,53 +57,29 @@ def map(args, env):
             )
     # For built-in functions, arity errors will be caught during their execution if they don't match.
 
-    result_vector_elements = []
+    apply_procedure = make_caller(proc_arg, env, arity=1)
+
+    if len(args) == 1:
+        return mapping(apply_procedure)
+
+    if isinstance(vec_arg, LazySeq):
+        # Lazy in, lazy out: the procedure runs as the result is consumed
+        return LazySeq.from_iterable(apply_procedure(item) for item in vec_arg)
+
+    # Results are appended to a transient vector and frozen at the end
+    result_vector_elements = EMPTY_VECTOR.transient()
     for item in vec_arg:  # vec_arg is already a LispyVector of evaluated items
-        call_result = None
-        if is_user_defined_fn:
-            # Proc is a user-defined Function (closure)
-            param_symbol = proc_arg.params[0]  # The single parameter Symbol
-            # Create a new environment for the function call, extending its defining environment
-            call_env = Environment(
-                outer=proc_arg.defining_env
-            )  # Changed to use Environment constructor
-            call_env.define(
-                param_symbol.name, item
-            )  # Define the parameter in the new environment
-
-            # Execute the function body: evaluate all expressions, result of the last one is returned
-            for expr_in_body in proc_arg.body:
-                call_result = evaluate(expr_in_body, call_env)
-            result_vector_elements.append(call_result)
-
-        elif is_builtin_fn:
-            # Proc is a built-in Python callable
-            # Built-ins in this LisPy expect a list of evaluated args and the current env
-            try:
-                call_result = proc_arg(
-                    [item], env
-                )  # Pass the item as a single-element list
-                result_vector_elements.append(call_result)
-            except EvaluationError as e:
-                # Re-raise evaluation errors from the built-in, possibly adding context
-                raise EvaluationError(
-                    f"Error during 'map' applying built-in procedure to '{item}': {e}"
-                )
-            except Exception as e:
-                # Catch other potential Python exceptions from the built-in's execution
-                raise EvaluationError(
-                    f"Unexpected error during 'map' applying built-in procedure to '{item}': {type(e).__name__} - {e}"
-                )
-
-    return Vector(result_vector_elements)
+        result_vector_elements.conj(apply_procedure(item))
+    return result_vector_elements.persistent()
 
 
 @lispy_documentation("map")
 def map_documentation() -> str:
     """Returns documentation for the map function."""
     return """Function: map
-Arguments: (map vector function)
+Arguments: (map vector function) or (map function)
 Description: Applies function to each element of vector, returning a new vector of results.
+With only a function, returns a transducer for transduce, into and sequence.
 
 Examples:
   (map [1 2 3] (fn [x] (* x 2)))        ; => [2 4 6]
@@ -104,11 +88,15 @@ Examples:
   (map [] (fn [x] x))                   ; => []
   (map [1 -2 3] abs)                    ; => [1 2 3]
   (map [true false] (fn [b] (not b)))   ; => [false true]
+  (into [] (map (fn [x] (* x 2))) [1 2 3])  ; => [2 4 6] (transducer)
 
 Notes:
-  - First argument must be a vector (not lists - use filter for lists)
+  - First argument must be a vector (not lists - use filter for lists) or a
+    lazy sequence
+  - Mapping over a lazy sequence returns a lazy sequence; the function runs
+    only as the result is consumed, 32 items at a time
   - Function must take exactly 1 argument
-  - Returns a new vector, does not modify original
+  - Returns a new persistent vector, does not modify original
   - Function is applied to each element in order
   - Result vector has same length as input vector
   - Can use built-in functions or user-defined functions
@@ -0,0 +1,103 @@
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_vector import PersistentVector
+from lispy.types import LispyList, Vector
+
+from .utils import check_collection
+
+_POSITIONS = {1: "Second", 2: "Third"}
+
+
+def _check_size(value: Any, index: int) -> int:
+    if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+        raise EvaluationError(
+            f"TypeError: {_POSITIONS[index]} argument to 'partition' must be a positive integer, got {value!r}."
+        )
+    return value
+
+
+def _chunks(
+    items: Iterable[Any], size: int, step: int, pad: Optional[List[Any]]
+) -> Iterator[PersistentVector]:
+    """Yield the full chunks of size items starting every step items."""
+    window: List[Any] = []
+    skip = 0
+    for item in items:
+        if skip:
+            skip -= 1
+            continue
+        window.append(item)
+        if len(window) == size:
+            yield PersistentVector(window)
+            if step >= size:
+                window = []
+                skip = step - size
+            else:
+                window = window[step:]
+    if pad is not None and window:
+        # The last, short chunk is completed from pad, as far as pad goes
+        yield PersistentVector(window + pad[: size - len(window)])
+
+
+@lispy_function("partition")
+def partition(
+    args: List[Any], env: Environment
+) -> Union[PersistentVector, LazySeq]:
+    """Implementation of the (partition collection n [step [pad]]) LisPy function.
+    Splits a collection into vectors of n items, starting a new one every
+    step items.
+    Usage: (partition collection n), (partition collection n step) or
+    (partition collection n step pad)
+    """
+    if len(args) not in (2, 3, 4):
+        raise EvaluationError(
+            f"SyntaxError: 'partition' expects 2 to 4 arguments, got {len(args)}."
+        )
+
+    collection = args[0]
+    items = check_collection(collection, "partition")
+    size = _check_size(args[1], 1)
+    step = _check_size(args[2], 2) if len(args) >= 3 else size
+
+    pad = None
+    if len(args) == 4:
+        if not isinstance(args[3], (Vector, LispyList)) and args[3] is not None:
+            raise EvaluationError(
+                f"TypeError: Fourth argument to 'partition' must be a vector, list, or nil, got {type(args[3])}."
+            )
+        pad = list(args[3] or ())
+
+    chunks = _chunks(items, size, step, pad)
+    if isinstance(collection, LazySeq):
+        # Lazy in, lazy out: works on infinite sequences
+        return LazySeq.from_iterable(chunks)
+    return PersistentVector(chunks)
+
+
+@lispy_documentation("partition")
+def partition_documentation() -> str:
+    """Returns documentation for the partition function."""
+    return """Function: partition
+Arguments: (partition collection n [step [pad]])
+Description: Returns the items of collection in vectors of n items, starting a new vector every step items (default n).
+
+Examples:
+  (partition [1 2 3 4 5 6 7] 3)         ; => [[1 2 3] [4 5 6]]
+  (partition [1 2 3 4 5] 2 1)           ; => [[1 2] [2 3] [3 4] [4 5]]
+  (partition [1 2 3 4 5] 2 3)           ; => [[1 2] [4 5]]
+  (partition [1 2 3 4 5 6 7] 3 3 [0 0]) ; => [[1 2 3] [4 5 6] [7 0 0]]
+  (take (partition (lazy-range) 2) 2)   ; => ([0 1] [2 3])
+
+Notes:
+  - A last chunk with fewer than n items is dropped, unless pad is given:
+    then it is filled up from pad, and may still be short if pad runs out
+  - step smaller than n gives overlapping windows; larger skips items
+  - Collection is a vector, list, set, lazy sequence, or nil; the result is
+    a vector of vectors, or a lazy sequence of vectors for a lazy sequence
+  - Each item is visited once, with no intermediate collections
+
+See Also: partition-by, group-by, take"""
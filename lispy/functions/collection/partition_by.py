@@ -0,0 +1,57 @@
+from itertools import groupby
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_vector import PersistentVector
+
+from .utils import check_collection, key_function
+
+
+@lispy_function("partition-by")
+def partition_by(
+    args: List[Any], env: Environment
+) -> Union[PersistentVector, LazySeq]:
+    """Implementation of the (partition-by collection key) LisPy function.
+    Splits a collection into vectors of consecutive items with equal keys.
+    Usage: (partition-by collection key-fn)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'partition-by' expects 2 arguments, got {len(args)}."
+        )
+
+    collection = args[0]
+    items = check_collection(collection, "partition-by")
+    key_fn = key_function(args[1], env, "partition-by")
+
+    # groupby starts a new run whenever the key changes, calling key once per item
+    runs = (PersistentVector(run) for _, run in groupby(items, key_fn))
+    if isinstance(collection, LazySeq):
+        return LazySeq.from_iterable(runs)
+    return PersistentVector(runs)
+
+
+@lispy_documentation("partition-by")
+def partition_by_documentation() -> str:
+    """Returns documentation for the partition-by function."""
+    return """Function: partition-by
+Arguments: (partition-by collection key)
+Description: Splits collection into vectors of consecutive items, starting a new vector each time the key of an item differs from the previous one.
+
+Examples:
+  (partition-by [1 1 2 3 3 1] (fn [x] x))          ; => [[1 1] [2] [3 3] [1]]
+  (partition-by [1 3 4 6 7] (fn [x] (% x 2)))      ; => [[1 3] [4 6] [7]]
+  (partition-by events ':session)                  ; one vector per session
+
+Notes:
+  - key is a function of one argument, or a keyword to split maps by a field
+  - Only neighbours are compared: equal keys far apart start separate runs
+    (use group-by to gather them)
+  - key is called once per item, in a single pass
+  - A lazy sequence gives a lazy sequence of vectors; anything else gives a
+    vector of vectors
+
+See Also: partition, group-by"""
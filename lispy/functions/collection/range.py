@@ -1,8 +1,10 @@
+import builtins
 from typing import Any, List
 
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_vector import EMPTY_VECTOR
 from lispy.types import Vector
 
 
@@ -49,20 +51,10 @@ def range(args: List[Any], env: Environment) -> Vector:
     if step == 0:
         raise EvaluationError("ValueError: 'range' step argument must not be zero.")
 
-    # Generate the sequence
-    result = []
-    current = start
-
-    if step > 0:
-        while current < end:
-            result.append(current)
-            current += step
-    else:  # step < 0
-        while current > end:
-            result.append(current)
-            current += step
-
-    return Vector(result)
+    # Generate the sequence into a transient vector a leaf at a time,
+    # then freeze it
+    numbers = builtins.range(start, end, step)
+    return EMPTY_VECTOR.transient().conj_all(numbers).persistent()
 
 
 @lispy_documentation("range")
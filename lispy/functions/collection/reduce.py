@@ -1,45 +1,17 @@
-from typing import Any, Callable, List
+from typing import Any, List
 
 from lispy.closure import Function  # For user-defined procedures
 from lispy.environment import Environment
-from lispy.evaluator import evaluate
+from lispy.evaluator import make_caller
 from lispy.exceptions import ArityError, EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_sorted_map import PersistentSortedMap
+from lispy.transducers import Reduced
 from lispy.types import LispyList, Vector
 
 
-def _call_reducing_procedure(
-    proc: Any, acc: Any, item: Any, env: Environment, evaluate_fn: Callable
-) -> Any:
-    """Helper to call the reducing procedure (user-defined or built-in)."""
-    if isinstance(proc, Function):
-        # User-defined function
-        if len(proc.params) != 2:
-            # This specific check might be redundant if arity is checked before iteration starts,
-            # but good for safety if called directly.
-            raise ArityError(
-                f"Reducing procedure {proc} expects 2 arguments, got different setup."
-            )
-
-        call_env = Environment(outer=proc.defining_env)
-        call_env.define(proc.params[0].name, acc)
-        call_env.define(proc.params[1].name, item)
-
-        result = None
-        for expr_in_body in proc.body:
-            result = evaluate_fn(expr_in_body, call_env)
-        return result
-    elif callable(proc):
-        # Built-in Python function
-        # Built-ins expect a list of args and the env.
-        return proc([acc, item], env)  # Pass current env to built-in reducer
-    else:
-        # Should have been caught by earlier type checks
-        raise EvaluationError(
-            f"InternalError: Invalid procedure type in _call_reducing_procedure: {type(proc)}"
-        )
-
-
 @lispy_function("reduce")
 def reduce(args: List[Any], env: Environment):
     """Implementation of the (reduce collection procedure [initial-value]) LisPy function."""
@@ -52,9 +24,11 @@ def reduce(args: List[Any], env: Environment):
     collection = args[0]
     procedure = args[1]
 
-    if not isinstance(collection, (LispyList, Vector)):
+    if not isinstance(
+        collection, (LispyList, Vector, LazySeq, PersistentSet, PersistentSortedMap)
+    ):
         raise EvaluationError(
-            f"TypeError: First argument to 'reduce' must be a list or vector, got {type(collection)}."
+            f"TypeError: First argument to 'reduce' must be a list, vector, lazy sequence, set, or sorted map, got {type(collection)}."
         )
 
     is_user_defined_fn = isinstance(procedure, Function)
@@ -87,23 +61,29 @@ def reduce(args: List[Any], env: Environment):
                 "ValueError: reduce() of empty sequence with no initial value."
             )
 
-    # Determine initial accumulator and iterable sequence
+    # Determine initial accumulator; iterate the collection itself so lazy
+    # sequences are consumed chunk by chunk and nothing is copied. Neither
+    # this frame nor the argument list keeps the head of a lazy sequence, so
+    # chunks already reduced (say, lines of a file) can be freed.
+    if isinstance(collection, PersistentSortedMap):
+        # Entries are reduced as [key value] vectors, in key order
+        sequence_to_iterate = (Vector(entry) for entry in collection.entries())
+    else:
+        sequence_to_iterate = iter(collection)
+    del collection
+    args[0] = None
     if num_args == 3:
         accumulator = args[2]
-        sequence_to_iterate = list(collection)
-    else:  # No initial_value provided
-        if len(collection) == 1:
-            return collection[
-                0
-            ]  # Single item in collection, no initial value, return item itself
-        accumulator = collection[0]
-        sequence_to_iterate = list(collection)[1:]
+    else:  # No initial_value provided, start from the first item
+        accumulator = next(sequence_to_iterate)
 
     # Perform the reduction
+    call = make_caller(procedure, env, arity=expected_arity)
     for item in sequence_to_iterate:
-        accumulator = _call_reducing_procedure(
-            procedure, accumulator, item, env, evaluate
-        )
+        accumulator = call(accumulator, item)
+        if isinstance(accumulator, Reduced):
+            # (reduced value) stops the reduction early
+            return accumulator.value
 
     return accumulator
 
@@ -123,13 +103,18 @@ Examples:
   (reduce [5] + 10)                     ; => 15 (single element)
   (reduce [] + 42)                      ; => 42 (empty with initial)
   (reduce [1 2 3] (fn [acc x] (cons x acc)) '()) ; => (3 2 1) (reverse)
+  (reduce (sorted-set 3 1 2) (fn [acc x] (conj acc x)) []) ; => [1 2 3]
 
 Notes:
-  - Collection must be a list or vector
+  - Collection must be a list, vector, lazy sequence, set, or sorted map
+  - Sorted sets and sorted maps are reduced in order, sorted map entries as
+    [key value] vectors; hash sets in no particular order
+  - Lazy sequences are consumed chunk by chunk without building a vector
   - Function must take exactly 2 arguments (accumulator, current-element)
   - With initial-value: starts with initial, processes all elements
   - Without initial-value: uses first element as initial, processes rest
   - Empty collection without initial-value raises error
   - Empty collection with initial-value returns initial-value
   - Single element without initial-value returns that element
-  - Function is called left-to-right through the collection"""
+  - Function is called left-to-right through the collection
+  - Returning (reduced value) from function stops early with value"""
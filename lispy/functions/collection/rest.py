@@ -3,6 +3,11 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_list import persistent_list
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_sorted_map import PersistentSortedMap
+from lispy.persistent_vector import PersistentVector
 from lispy.types import LispyList, Vector
 
 
@@ -21,22 +26,31 @@ def rest(args: List[Any], env: Environment):
     collection = args[0]
 
     if isinstance(collection, LispyList):
-        if len(collection) <= 1:
-            return LispyList([])
-        else:
-            return LispyList(collection[1:])
+        # Walking a list with repeated rest calls shares cons cells, not copies
+        return persistent_list(collection).rest()
+    elif isinstance(collection, (PersistentVector, LazySeq)):
+        return collection.rest()
     elif isinstance(collection, Vector):
         if len(collection) <= 1:
             return Vector([])
         else:
             return Vector(collection[1:])
+    elif isinstance(collection, PersistentSet):
+        # A lazy sequence of the other elements, in order for a sorted set
+        items = iter(collection)
+        next(items, None)
+        return LazySeq.from_iterable(items)
+    elif isinstance(collection, PersistentSortedMap):
+        entries = collection.entries()
+        next(entries, None)
+        return LazySeq.from_iterable(Vector(entry) for entry in entries)
     elif collection is None:  # (rest nil) should probably return nil or an empty list
         return LispyList(
             []
         )  # Consistent with (first nil) behavior, (rest nil) is '() for Clojure
     else:
         raise EvaluationError(
-            f"TypeError: 'rest' expects a list, vector, or nil, got {type(collection)}."
+            f"TypeError: 'rest' expects a list, vector, lazy sequence, set, sorted map, or nil, got {type(collection)}."
         )  # Updated error message
 
 
@@ -55,12 +69,19 @@ Examples:
   (rest (list))             ; => ()
   (rest [])                 ; => []
   (rest nil)                ; => ()
+  (rest (sorted-set 3 1 2)) ; => (2 3)
 
 Notes:
   - Requires exactly one argument
-  - Works with lists, vectors, and nil (but not strings)
+  - Works with lists, vectors, lazy sequences, sets, sorted maps, and nil
+    (but not strings)
+  - On a set or sorted map, returns a lazy sequence of the other elements
+    or [key value] entries, in order for the sorted types
   - Returns same collection type as input
   - Returns empty collection for single-element or empty inputs
   - Alternative to cdr function for lists
   - For nil input, returns empty list
-  - Preserves original collection type (list vs vector)"""
+  - Preserves original collection type (list vs vector)
+  - On vectors built with conj or map, rest shares structure and is O(1)
+  - On lists, rest returns the shared tail and is O(1) after the first call
+  - On a lazy sequence, rest is lazy and shares the realized elements"""
@@ -1,64 +1,30 @@
-from typing import Any, Callable, List
+from functools import cmp_to_key
+from typing import Any, List
 
 from lispy.closure import Function
 from lispy.environment import Environment
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sorted.utils import BUILTIN_ORDERS
 from lispy.types import Vector
 
 
-def _call_comparison_function(
-    compare_fn: Any, a: Any, b: Any, env: Environment, evaluate_fn: Callable
-) -> int:
-    """Helper to call a user-defined comparison function."""
-    if isinstance(compare_fn, Function):
-        # User-defined function
-        if len(compare_fn.params) != 2:
-            raise EvaluationError(
-                f"Comparison function {compare_fn} expects 2 arguments, got {len(compare_fn.params)}."
-            )
-
-        call_env = Environment(outer=compare_fn.defining_env)
-        call_env.define(compare_fn.params[0].name, a)
-        call_env.define(compare_fn.params[1].name, b)
-
-        result = None
-        for expr_in_body in compare_fn.body:
-            result = evaluate_fn(expr_in_body, call_env)
-
-        # Convert boolean or numeric result to comparison format
-        if isinstance(result, bool):
-            return -1 if result else 1  # true means a < b
-        elif isinstance(result, (int, float)):
-            if result < 0:
-                return -1
-            elif result > 0:
-                return 1
-            else:
-                return 0
-        else:
-            raise EvaluationError(
-                f"Comparison function must return a number or boolean, got {type(result)}."
-            )
-
-    elif callable(compare_fn):
-        # Built-in Python function
-        result = compare_fn([a, b], env)
-        if isinstance(result, bool):
-            return -1 if result else 1
-        elif isinstance(result, (int, float)):
-            if result < 0:
-                return -1
-            elif result > 0:
-                return 1
-            else:
-                return 0
+def _comparison_order(result: Any) -> int:
+    """Convert a comparison function's boolean or numeric result to -1, 0 or 1."""
+    if isinstance(result, bool):
+        return -1 if result else 1  # true means a < b
+    elif isinstance(result, (int, float)):
+        if result < 0:
+            return -1
+        elif result > 0:
+            return 1
         else:
-            raise EvaluationError(
-                f"Comparison function must return a number or boolean, got {type(result)}."
-            )
+            return 0
     else:
-        raise EvaluationError(f"Invalid comparison function type: {type(compare_fn)}")
+        raise EvaluationError(
+            f"Comparison function must return a number or boolean, got {type(result)}."
+        )
 
 
 @lispy_function("sort")
@@ -91,6 +57,7 @@ def sort(args: List[Any], env: Environment):
     # Create a copy of the vector elements to avoid mutating the original
     elements = list(vector)
 
+    sorted_natively = False
     if compare_fn is None:
         # Use Python's default sorting - it handles mixed types well
         try:
@@ -98,7 +65,16 @@ def sort(args: List[Any], env: Environment):
         except TypeError:
             # If direct comparison fails, sort by string representation
             elements.sort(key=str)
-    else:
+        sorted_natively = True
+    elif callable(compare_fn) and compare_fn in BUILTIN_ORDERS:
+        # <, <=, > and >= become Python's native sort, reversed for > and >=
+        try:
+            elements = sorted(elements, reverse=BUILTIN_ORDERS[compare_fn])
+            sorted_natively = True
+        except TypeError:
+            pass  # Call the builtin below, which reports what it cannot compare
+
+    if not sorted_natively:
         # Validate comparison function
         is_user_defined_fn = isinstance(compare_fn, Function)
         is_python_callable = callable(compare_fn) and not is_user_defined_fn
@@ -114,17 +90,9 @@ def sort(args: List[Any], env: Environment):
                 f"Comparison function {compare_fn} passed to 'sort' expects 2 arguments, got {len(compare_fn.params)}."
             )
 
-        # Import evaluate function for comparison calls
-        from lispy.evaluator import evaluate
-
         # Sort using the custom comparison function
-        def compare_wrapper(a, b):
-            return _call_comparison_function(compare_fn, a, b, env, evaluate)
-
-        # Use functools.cmp_to_key for Python 3 compatibility
-        from functools import cmp_to_key
-
-        elements.sort(key=cmp_to_key(compare_wrapper))
+        call = make_caller(compare_fn, env, arity=2)
+        elements.sort(key=cmp_to_key(lambda a, b: _comparison_order(call(a, b))))
 
     return Vector(elements)
 
@@ -158,5 +126,9 @@ Notes:
     * Positive number if first > second
     * Boolean where true means first < second
   - Comparison function must have exactly 2 parameters
+  - Passing <, <=, > or >= sorts natively without calling the function
+  - To sort by a computed key, sort-by calls the key function once per element
   - Handles mixed numeric types (int/float) gracefully
-  - Uses string representation fallback for incomparable types"""
+  - Uses string representation fallback for incomparable types
+
+See Also: sort-by, sorted-set"""
@@ -0,0 +1,133 @@
+from functools import cmp_to_key
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import (get_registered_function,
+                                        lispy_documentation, lispy_function)
+from lispy.functions.sequence.utils import SEQUENCE_TYPES
+from lispy.functions.sorted.utils import BUILTIN_ORDERS, make_comparator
+from lispy.functions.table.utils import check_column, check_table
+from lispy.persistent_sorted_map import natural_compare
+from lispy.persistent_vector import PersistentVector
+from lispy.table import Table
+from lispy.types import LispyList
+
+from .utils import key_function
+
+
+@lispy_function("sort-by")
+def sort_by(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (sort-by collection key [comparator]) LisPy function.
+    Sorts a collection by a key computed once per element, or the rows of a
+    table by one column.
+    Usage: (sort-by coll key-fn), (sort-by coll key-fn >) or (sort-by table column)
+    """
+    if len(args) not in (2, 3):
+        raise EvaluationError(
+            f"SyntaxError: 'sort-by' expects 2 or 3 arguments, got {len(args)}."
+        )
+
+    if isinstance(args[0], Table):
+        return _sort_table(args)
+
+    collection, key = args[0], args[1]
+    if collection is not None and not isinstance(collection, SEQUENCE_TYPES):
+        raise EvaluationError(
+            f"TypeError: First argument to 'sort-by' must be a vector, list, lazy sequence, table, or nil, got {type(collection)}."
+        )
+    items = list(collection) if collection is not None else []
+
+    # Decorate: compute every key exactly once
+    key_fn = key_function(key, env, "sort-by")
+    keys = [key_fn(item) for item in items]
+
+    # Sort the positions by their keys, then undecorate
+    comparator = args[2] if len(args) == 3 else None
+    positions = range(len(items))
+    if comparator is None:
+        order = _natural_order(keys, descending=False)
+    elif callable(comparator) and comparator in BUILTIN_ORDERS:
+        # < and > become a native sort, reversed for >
+        order = _natural_order(keys, BUILTIN_ORDERS[comparator])
+    else:
+        compare = make_comparator(comparator, env, "sort-by")
+        order = sorted(
+            positions, key=cmp_to_key(lambda i, j: compare(keys[i], keys[j]))
+        )
+    result = [items[i] for i in order]
+
+    if isinstance(collection, LispyList):
+        return LispyList(result)
+    return PersistentVector(result)
+
+
+def _natural_order(keys: List[Any], descending: bool) -> List[int]:
+    """Return the positions of keys in ascending (or descending) order, stably."""
+    positions = range(len(keys))
+    try:
+        # Python's native sort compares the keys directly
+        return sorted(positions, key=keys.__getitem__, reverse=descending)
+    except TypeError:
+        pass
+    try:
+        # Keywords (compared by name) and other keys Python cannot order
+        return sorted(
+            positions,
+            key=cmp_to_key(lambda i, j: natural_compare(keys[i], keys[j])),
+            reverse=descending,
+        )
+    except TypeError:
+        raise EvaluationError(
+            f"TypeError: 'sort-by' cannot order keys of types {sorted({type(k).__name__ for k in keys})}."
+        )
+
+
+def _sort_table(args: List[Any]) -> Table:
+    table, column = args[0], args[1]
+    check_table(table, "sort-by", "First")
+    check_column(table, column, "sort-by")
+
+    descending = False
+    if len(args) == 3:
+        comparator = args[2]
+        if comparator is get_registered_function(">"):
+            descending = True
+        elif comparator is not get_registered_function("<"):
+            raise EvaluationError(
+                "TypeError: Third argument to 'sort-by' on a table must be < or >."
+            )
+
+    try:
+        return table.sort_by(column, descending)
+    except TypeError:
+        raise EvaluationError(
+            f"TypeError: 'sort-by' cannot order the values of column {column}."
+        )
+
+
+@lispy_documentation("sort-by")
+def sort_by_documentation() -> str:
+    """Returns documentation for the sort-by function."""
+    return """Function: sort-by
+Arguments: (sort-by collection key [comparator]) or (sort-by table column [comparator])
+Description: Returns the elements of collection sorted by (key element), or a table with the rows sorted by the values of column.
+
+Examples:
+  (sort-by ["ccc" "a" "bb"] count)              ; => ["a" "bb" "ccc"]
+  (sort-by [{:age 40} {:age 30}] ':age)         ; => [{:age 30} {:age 40}]
+  (sort-by [3 -1 2] (fn [x] (abs x)) >)         ; => [3 2 -1]
+  (sort-by logs ':bytes)        ; smallest responses first
+  (sort-by logs ':bytes >)      ; largest responses first
+
+Notes:
+  - key is a function of one argument, or a keyword to sort maps by a field
+  - key is called exactly once per element, then the keys are sorted natively
+  - Comparator is < (ascending, the default), >, or a function taking the
+    same forms as in sort; < and > never call back into LisPy
+  - The sort is stable: elements with equal keys keep their order
+  - A list gives a list; vectors, lazy sequences and nil give a vector
+  - On a table, comparator is < or >; numeric columns are sorted natively,
+    then every column is reordered by the resulting row indices
+
+See Also: sort, group-by, table-from-maps"""
@@ -0,0 +1,52 @@
+"""
+Shared helpers for the LisPy collection functions.
+"""
+
+from typing import Any, Callable, Iterable
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.sequence.utils import check_procedure
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_set import PersistentSet
+from lispy.types import LispyList, Symbol, Vector
+
+COLLECTION_TYPES = (Vector, LispyList, LazySeq, PersistentSet)
+
+
+def check_collection(collection: Any, function_name: str) -> Iterable[Any]:
+    """Return the items of a vector, list, set or lazy sequence (nil has none).
+
+    Raises a TypeError for anything else.
+    """
+    if collection is None:
+        return ()
+    if not isinstance(collection, COLLECTION_TYPES):
+        raise EvaluationError(
+            f"TypeError: First argument to '{function_name}' must be a vector, list, set, lazy sequence, or nil, got {type(collection)}."
+        )
+    return collection
+
+
+def key_function(
+    key: Any, env: Environment, function_name: str
+) -> Callable[[Any], Any]:
+    """Return a Python function computing the key of an item.
+
+    A keyword key reads that field of each item, which must be a map;
+    anything else must be a procedure of one argument, passed second.
+    """
+    if isinstance(key, Symbol) and key.name.startswith(":"):
+
+        def field(item: Any) -> Any:
+            if not isinstance(item, dict):
+                raise EvaluationError(
+                    f"TypeError: '{function_name}' with a keyword key expects maps, got {type(item)}."
+                )
+            return item.get(key)
+
+        return field
+
+    check_procedure(key, function_name, "Second", 1)
+    return make_caller(key, env, arity=1)
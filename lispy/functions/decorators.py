@@ -82,6 +82,11 @@ def get_registered_functions() -> Dict[str, Callable]:
     return _lispy_functions.copy()
 
 
+def get_registered_function(name: str) -> Optional[Callable]:
+    """Get a single function registered via @lispy_function, or None."""
+    return _lispy_functions.get(name)
+
+
 def get_registered_documentation() -> Dict[str, Callable]:
     """Get all documentation registered via @lispy_documentation decorator."""
     return _lispy_documentation.copy()
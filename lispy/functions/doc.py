@@ -4,6 +4,7 @@ from ..environment import Environment
 from ..exceptions import EvaluationError
 from ..types import Symbol
 from .decorators import lispy_documentation, lispy_function
+from .function_registry import get_function_registry
 
 # Documentation registry - maps function names to their documentation functions
 DOCUMENTATION_REGISTRY = {}
@@ -31,7 +32,10 @@ def doc(args: List[Any], env: Environment) -> str:
     # If it's a Symbol, use its name directly (for special forms and quoted functions)
     if isinstance(func_arg, Symbol):
         function_name = func_arg.name
-    # If it's a callable (built-in function), try to find its name
+    # Built-ins carry the name they were registered under
+    elif getattr(func_arg, "_lispy_name", None):
+        function_name = func_arg._lispy_name
+    # If it's another callable, try to find the name it is bound to
     elif callable(func_arg):
         # Look through the environment to find the name bound to this function
         for name, value in env.store.items():
@@ -57,6 +61,11 @@ def doc(args: List[Any], env: Environment) -> str:
             "Make sure to pass a function reference like +, abs, etc. or a symbol like 'and, 'or, etc."
         )
 
+    # Built-in packages are imported lazily, so their documentation may not be
+    # registered until asked for
+    if function_name not in DOCUMENTATION_REGISTRY:
+        get_function_registry().load_documentation_for(function_name)
+
     # Look up documentation in registry
     if function_name in DOCUMENTATION_REGISTRY:
         doc_function = DOCUMENTATION_REGISTRY[function_name]
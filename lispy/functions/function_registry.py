@@ -2,13 +2,20 @@
 Auto-discovery system for LisPy built-in functions.
 Automatically scans function modules and registers them with their documentation.
 Uses decorator-based registration for clean function discovery.
+
+Environments resolve built-ins lazily through the generated manifest in
+builtin_manifest.py, so a function's package is only imported the first time
+one of its names is looked up. Full discovery is still available for tooling.
 """
 
 import importlib
 import os
-from typing import Any, Dict, Set, Tuple
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 from ..environment import Environment
+from .builtin_manifest import BUILTIN_MODULES, WEB_UNSAFE_BUILTINS
 
 
 class FunctionDiscovery:
@@ -93,15 +100,114 @@ class FunctionDiscovery:
         return item.endswith(".py") and item != "__init__.py"
 
 
+class LazyBuiltinStore(dict):
+    """
+    Environment store whose built-in bindings are imported on first lookup.
+
+    Names listed in the manifest count as present (for `in`, `keys()` and
+    iteration) before their module is imported. Reading a pending name imports
+    its package and caches the function in the store. Defining or deleting a
+    name drops its pending manifest entry.
+    """
+
+    def __init__(self, registry: "FunctionRegistry", manifest: Dict[str, str]):
+        super().__init__()
+        self._registry = registry
+        self._pending: Dict[str, str] = dict(manifest)
+
+    def __missing__(self, name: str) -> Any:
+        if name not in self._pending:
+            raise KeyError(name)
+        function = self._registry.resolve_builtin(name)
+        del self._pending[name]
+        dict.__setitem__(self, name, function)
+        return function
+
+    def __contains__(self, name: object) -> bool:
+        return dict.__contains__(self, name) or name in self._pending
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._pending.pop(name, None)
+        dict.__setitem__(self, name, value)
+
+    def __delitem__(self, name: str) -> None:
+        if name in self._pending:
+            del self._pending[name]
+        else:
+            dict.__delitem__(self, name)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from dict.keys(self)
+        yield from list(self._pending)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def keys(self) -> List[str]:
+        return list(self)
+
+    def items(self):
+        self._resolve_pending()
+        return dict.items(self)
+
+    def values(self):
+        self._resolve_pending()
+        return dict.values(self)
+
+    def update(self, *args, **kwargs) -> None:
+        """Bind names through __setitem__; only copies another lazy store's loaded bindings."""
+        for other in args:
+            if isinstance(other, LazyBuiltinStore):
+                other = dict(dict.items(other))
+            for name, value in dict(other).items():
+                self[name] = value
+        for name, value in kwargs.items():
+            self[name] = value
+
+    def __reduce__(self):
+        # Loaded bindings are pickled as dict items after the store itself is
+        # memoized, so closures that refer back to this store pickle cleanly.
+        return (
+            _rebuild_lazy_builtin_store,
+            (sorted(self._pending),),
+            None,
+            None,
+            iter(dict.items(self)),
+        )
+
+    def _resolve_pending(self) -> None:
+        for name in list(self._pending):
+            self[name]
+
+
+def _rebuild_lazy_builtin_store(pending_names: List[str]) -> LazyBuiltinStore:
+    """Recreate a pickled lazy store against the current registry and manifest."""
+    registry = get_function_registry()
+    manifest = {
+        name: registry.manifest[name]
+        for name in pending_names
+        if name in registry.manifest
+    }
+    return LazyBuiltinStore(registry, manifest)
+
+
 class FunctionRegistry:
     """Coordinates function discovery and handles registration."""
 
-    def __init__(self):
+    def __init__(self, manifest: Dict[str, str] = None):
         self.discovery = FunctionDiscovery()
         self.functions: Dict[str, Any] = {}
         self.documentation: Dict[str, Any] = {}
         self.web_unsafe: Dict[str, str] = {}
         self._initialized = False
+        self.manifest: Dict[str, str] = (
+            BUILTIN_MODULES if manifest is None else manifest
+        )
+        self.package_import_times: Dict[str, float] = {}
+        self._documentation_sinks: List[Any] = []
 
     def _ensure_initialized(self):
         """Ensure the registry has been initialized with discovered functions."""
@@ -123,12 +229,73 @@ class FunctionRegistry:
         for lispy_name, function in self.functions.items():
             env.define(lispy_name, function)
 
+    def install_lazy_builtins(self, env: Environment):
+        """Bind every manifest name in env, deferring imports until first lookup."""
+        lazy_store = LazyBuiltinStore(self, self.manifest)
+        lazy_store.update(env.store)
+        env.store = lazy_store
+
+    def resolve_builtin(self, lispy_name: str) -> Any:
+        """Import the package that provides lispy_name and return the function."""
+        from .decorators import get_registered_function
+
+        self._import_builtin_package(self.manifest[lispy_name])
+        function = get_registered_function(lispy_name)
+        if function is None:
+            raise KeyError(
+                f"Built-in '{lispy_name}' is listed in the manifest but was not "
+                f"registered by {self.manifest[lispy_name]}; regenerate the manifest "
+                "with scripts/generate_builtin_manifest.py"
+            )
+        return function
+
+    def load_documentation_for(self, lispy_name: str) -> bool:
+        """Import the package documenting lispy_name. Returns False if unknown."""
+        if lispy_name not in self.manifest:
+            return False
+        self._import_builtin_package(self.manifest[lispy_name])
+        return True
+
+    def _import_builtin_package(self, module_name: str):
+        """Import a built-in module, timing its package's first import."""
+        package_name = module_name.rsplit(".", 1)[0]
+        if module_name in sys.modules:
+            return
+
+        already_imported = package_name in sys.modules
+        started = time.perf_counter()
+        importlib.import_module(module_name)
+        if not already_imported:
+            self.package_import_times[package_name] = time.perf_counter() - started
+        self._publish_documentation()
+
+    def get_package_import_times(self) -> Dict[str, float]:
+        """Return seconds spent importing each lazily loaded built-in package."""
+        return dict(self.package_import_times)
+
     def register_documentation(self, register_doc_function):
         """Register all discovered documentation."""
         self._ensure_initialized()
         for lispy_name, doc_func_or_string in self.documentation.items():
             register_doc_function(lispy_name, doc_func_or_string)
 
+    def register_loaded_documentation(self, register_doc_function):
+        """
+        Register documentation for already imported built-ins, and keep
+        registering documentation as further packages are imported lazily.
+        """
+        if register_doc_function not in self._documentation_sinks:
+            self._documentation_sinks.append(register_doc_function)
+        self._publish_documentation()
+
+    def _publish_documentation(self):
+        from .decorators import get_registered_documentation
+
+        documentation = get_registered_documentation()
+        for register_doc_function in self._documentation_sinks:
+            for lispy_name, doc_func_or_string in documentation.items():
+                register_doc_function(lispy_name, doc_func_or_string)
+
     def get_function_count(self) -> int:
         """Return the number of discovered functions."""
         self._ensure_initialized()
@@ -146,10 +313,27 @@ class FunctionRegistry:
 
     def get_web_unsafe_functions(self) -> dict:
         """Return functions marked as web-unsafe with their reasons."""
-        self._ensure_initialized()
+        if not self._initialized:
+            return dict(WEB_UNSAFE_BUILTINS)
         return self.web_unsafe.copy()
 
 
+def build_builtin_manifest() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Run full discovery and map every built-in name to its defining module.
+
+    Returns:
+        Tuple of (name -> module path, web-unsafe name -> reason)
+    """
+    discovery = FunctionDiscovery()
+    functions, documentation, web_unsafe = discovery.discover_in_package(
+        os.path.dirname(__file__), "lispy.functions"
+    )
+    modules = {name: doc.__module__ for name, doc in documentation.items()}
+    modules.update({name: func.__module__ for name, func in functions.items()})
+    return dict(sorted(modules.items())), dict(sorted(web_unsafe.items()))
+
+
 # Global registry instance
 _function_registry = None
 
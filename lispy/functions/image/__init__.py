@@ -0,0 +1,13 @@
+"""LisPy Image Functions - Save and restore interpreter environments"""
+
+from .load_image import load_image, load_image_documentation
+from .save_image import save_image, save_image_documentation
+
+__all__ = [
+    # Functions
+    "load_image",
+    "save_image",
+    # Documentation
+    "load_image_documentation",
+    "save_image_documentation",
+]
@@ -0,0 +1,52 @@
+from typing import Any, List
+
+from lispy import image
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+
+@lispy_function(
+    "load-image",
+    web_safe=False,
+    reason="File system access - images can contain arbitrary code",
+)
+def load_image(args: List[Any], env: Environment) -> None:
+    """Restores global definitions and modules from an image file. (load-image filename)"""
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'load-image' expects 1 argument (filename), got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: 'load-image' filename must be a string, got {type(filename).__name__}."
+        )
+
+    image.restore_image_into(env, filename)
+    return None
+
+
+@lispy_documentation("load-image")
+def load_image_documentation() -> str:
+    """Returns documentation for the load-image function."""
+    return """Function: load-image
+Arguments: (load-image filename)
+Description: Restores global definitions and loaded modules from an image file.
+
+Examples:
+  (load-image "tables.img")             ; => nil
+  (get lookup-table :key)               ; Definitions from the image are available
+
+Notes:
+  - Requires exactly one argument (the filename as a string)
+  - Images are created with save-image or lispy --save-image
+  - Definitions from the image are added to the global environment,
+    replacing existing definitions with the same name
+  - Functions from the image see later global definitions
+  - Modules saved in the image are not re-read when imported again
+  - Much faster than re-evaluating the source that built the image
+  - Only load images you trust: an image can contain arbitrary code
+  - Same as running: lispy --load-image filename program.lpy
+  - Always returns nil"""
@@ -0,0 +1,53 @@
+from typing import Any, List
+
+from lispy import image
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+
+@lispy_function("save-image", web_safe=False, reason="File system access")
+def save_image(args: List[Any], env: Environment) -> None:
+    """Saves the global environment and loaded modules to a file. (save-image filename)"""
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'save-image' expects 1 argument (filename), got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: 'save-image' filename must be a string, got {type(filename).__name__}."
+        )
+
+    image.save_image(env, filename)
+    return None
+
+
+@lispy_documentation("save-image")
+def save_image_documentation() -> str:
+    """Returns documentation for the save-image function."""
+    return """Function: save-image
+Arguments: (save-image filename)
+Description: Saves the global environment and all loaded modules to an image file.
+
+Examples:
+  (define lookup-table (build-table))   ; Expensive to compute
+  (save-image "tables.img")             ; => nil, writes tables.img
+
+  ; Later, in another process:
+  (load-image "tables.img")
+  (get lookup-table :key)
+
+Notes:
+  - Requires exactly one argument (the filename as a string)
+  - Saves every global definition, including functions and their closures
+  - Also saves the cache of modules loaded with import
+  - Built-in functions are saved by reference, not by value
+  - Pending promises, functions returned by built-ins such as throttle,
+    lazy sequences, open files and byte buffers from mmap-file cannot be
+    saved and raise an error
+  - The image is written to a temporary file and then moved into place,
+    so a failed save leaves an existing image file unchanged
+  - Same as running: lispy --save-image filename program.lpy
+  - Always returns nil"""
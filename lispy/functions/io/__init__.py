@@ -1,21 +1,36 @@
 """LisPy I/O Functions"""
 
+from .csv_read import csv_read, csv_read_documentation
+from .csv_write import csv_write, csv_write_documentation
+from .line_seq import line_seq, line_seq_documentation
+from .open_file import open_file, open_file_documentation
 from .print import print_documentation, print_fn
 from .println import println, println_documentation
+from .read_chunks import read_chunks, read_chunks_documentation
 from .read_line import read_line, read_line_documentation
 from .slurp import slurp, slurp_documentation
 from .spit import spit, spit_documentation
 
 __all__ = [
     # Functions
+    "csv_read",
+    "csv_write",
+    "line_seq",
+    "open_file",
     "print_fn",
     "println",
+    "read_chunks",
     "read_line",
     "slurp",
     "spit",
     # Documentation
+    "csv_read_documentation",
+    "csv_write_documentation",
+    "line_seq_documentation",
+    "open_file_documentation",
     "print_documentation",
     "println_documentation",
+    "read_chunks_documentation",
     "read_line_documentation",
     "slurp_documentation",
     "spit_documentation",
@@ -0,0 +1,177 @@
+import csv
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_map import PersistentMap
+from lispy.persistent_vector import PersistentVector
+from lispy.types import LispyList, Symbol, Vector
+
+from .utils import (check_file, column_key, csv_format, read_guarded,
+                    read_options)
+
+OPTIONS = ("header", "columns", "types", "delimiter")
+
+
+def _parse_bool(text: str) -> bool:
+    lowered = text.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    raise ValueError(text)
+
+
+PARSERS = {"int": int, "float": float, "bool": _parse_bool, "str": str}
+
+# (field index, parser, column as written in :types)
+Converter = Tuple[int, Callable[[str], Any], Any]
+
+
+def _parser(spec: Any, env: Environment) -> Callable[[str], Any]:
+    """Return the parser for a :types entry: a type keyword or a function."""
+    # Imported here so loading the io builtins does not load these packages
+    from lispy.evaluator import make_caller
+    from lispy.functions.sequence.utils import check_procedure
+
+    if isinstance(spec, Symbol) and spec.name[1:] in PARSERS:
+        return PARSERS[spec.name[1:]]
+    if isinstance(spec, Symbol) or not callable(spec):
+        raise EvaluationError(
+            f"TypeError: A type in the :types of 'csv-read' must be :int, :float, :bool, :str or a function, got {spec}."
+        )
+    check_procedure(spec, "csv-read", "Type", 1)
+    return make_caller(spec, env, arity=1)
+
+
+def _converters(types: Any, keys: Optional[List[Any]], env: Environment) -> List[Converter]:
+    """Resolve :types against the columns: names for map rows, indexes for vectors."""
+    converters = []
+    for column, spec in types.items():
+        if keys is None:
+            index = column if isinstance(column, int) and not isinstance(column, bool) else -1
+            if index < 0:
+                raise EvaluationError(
+                    f"ValueError: 'csv-read' without a header types columns by index, got {column}."
+                )
+        else:
+            try:
+                index = keys.index(column_key(column))
+            except ValueError:
+                raise EvaluationError(
+                    f"ValueError: 'csv-read' got a type for unknown column {column}."
+                )
+        converters.append((index, _parser(spec, env), column))
+    return converters
+
+
+def _read_rows(file: Any, options: dict, env: Environment) -> Iterator[Any]:
+    """Yield the rows of file as vectors, or as maps once the keys are known."""
+    reader = csv.reader(file, **csv_format(options, "csv-read"))
+    keys = options.get("columns")
+    if keys is not None:
+        keys = [column_key(name) for name in keys]
+    try:
+        if options.get("header"):
+            names = next(reader, None)
+            if names is None:
+                return
+            if keys is None:
+                keys = [column_key(name) for name in names]
+        converters = _converters(options.get("types") or {}, keys, env)
+
+        for fields in reader:
+            if not fields:
+                continue
+            for index, parse, column in converters:
+                if index >= len(fields):
+                    continue
+                text = fields[index]
+                if text == "":
+                    fields[index] = None
+                    continue
+                try:
+                    fields[index] = parse(text)
+                except ValueError:
+                    raise EvaluationError(
+                        f"ValueError: 'csv-read' cannot parse {text!r} in column {column} on line {reader.line_num}."
+                    )
+            if keys is None:
+                yield PersistentVector(fields)
+            elif len(fields) == len(keys):
+                yield PersistentMap(zip(keys, fields))
+            else:
+                raise EvaluationError(
+                    f"ValueError: 'csv-read' found {len(fields)} fields on line {reader.line_num}, expected {len(keys)}."
+                )
+    except csv.Error as e:
+        raise EvaluationError(
+            f"ValueError: Malformed CSV in '{file.name}' on line {reader.line_num}: {e}."
+        )
+
+
+@lispy_function("csv-read", web_safe=False, reason="File system access")
+def csv_read(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (csv-read file [options]) LisPy function.
+    Returns a lazy sequence of the rows of a CSV file opened with open-file.
+    Usage: (with-open [f (open-file "users.csv")] (doseq [row (csv-read f {:header true})] ...))
+    """
+    if len(args) not in (1, 2):
+        raise EvaluationError(
+            f"SyntaxError: 'csv-read' expects 1 or 2 arguments, got {len(args)}."
+        )
+
+    file = check_file(args[0], "csv-read")
+    options = read_options(args[1], "csv-read", "Second", OPTIONS) if len(args) == 2 else {}
+    csv_format(options, "csv-read")
+    columns = options.get("columns")
+    if columns is not None and not isinstance(columns, (Vector, LispyList)):
+        raise EvaluationError(
+            f"TypeError: The :columns of 'csv-read' must be a vector of names, got {type(columns)}."
+        )
+    types = options.get("types")
+    if types is not None and not isinstance(types, dict):
+        raise EvaluationError(
+            f"TypeError: The :types of 'csv-read' must be a map, got {type(types)}."
+        )
+    return LazySeq(lambda: read_guarded(_read_rows(file, options, env), file))
+
+
+@lispy_documentation("csv-read")
+def csv_read_documentation() -> str:
+    """Returns documentation for the csv-read function."""
+    return """Function: csv-read
+Arguments: (csv-read file [options])
+Description: Returns a lazy sequence of the rows of a CSV file opened with open-file: vectors of strings, or maps when the file has a header or columns are named.
+
+Options:
+  :header     true if the first row names the columns; rows become maps
+              from each name, as a keyword, to its field
+  :columns    vector of column names to use as map keys instead
+  :types      map from column (a name, or an index for vector rows) to
+              :int, :float, :bool, :str or a function of the field's text
+  :delimiter  field separator, default ","
+
+Examples:
+  (with-open [f (open-file "users.csv")]
+    (to-vector (csv-read f)))
+  ; => [["name" "age"] ["ada" "36"] ["alan" "41"]]
+  (with-open [f (open-file "users.csv")]
+    (reduce (csv-read f {:header true :types {:age ':int}})
+            (fn [total row] (+ total (get row ':age)))
+            0))                                   ; => 77
+  (with-open [f (open-file "data.tsv")]
+    (first (csv-read f {:delimiter "\\t" :columns [:id :score]
+                        :types {:score ':float}})))
+
+Notes:
+  - Rows are parsed by Python's csv module from the file's buffer as the
+    sequence is consumed, so only a chunk of rows is held in memory; quoted
+    fields may contain delimiters, quotes and newlines
+  - The sequence must be consumed inside with-open
+  - Blank lines are skipped; an empty typed field becomes nil
+  - A map row with the wrong number of fields raises a ValueError
+
+See Also: csv-write, open-file, with-open, line-seq"""
@@ -0,0 +1,124 @@
+import csv
+from typing import Any, Callable, Iterator, List, Optional
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.types import LispyList, Symbol, Vector
+
+from .utils import column_key, csv_format, open_text_output, read_options
+
+OPTIONS = ("header", "columns", "delimiter")
+
+
+def _column_name(column: Any, field: Callable[[Any], str]) -> str:
+    if isinstance(column, Symbol) and column.name.startswith(":"):
+        return column.name[1:]
+    return field(column)
+
+
+def _write_rows(
+    writer: Any, rows: Iterator[Any], columns: Optional[List[Any]], header: Any
+) -> int:
+    """Write rows one at a time and return how many were written."""
+    from lispy.functions.string.utils import display_string
+
+    def field(value: Any) -> str:
+        return "" if value is None else display_string(value)
+
+    keys = None
+    written = 0
+    for row in rows:
+        if written == 0:
+            if isinstance(row, dict):
+                keys = [column_key(c) for c in columns] if columns is not None else list(row)
+            if header is not False and (keys is not None or columns is not None):
+                writer.writerow([_column_name(column, field) for column in keys or columns])
+        if keys is not None and isinstance(row, dict):
+            writer.writerow([field(row.get(key)) for key in keys])
+        elif keys is None and isinstance(row, (Vector, LispyList)):
+            writer.writerow([field(value) for value in row])
+        else:
+            expected = "a map" if keys is not None else "a vector or list"
+            raise EvaluationError(
+                f"TypeError: Row {written + 1} passed to 'csv-write' must be {expected}, like the first row, got {type(row)}."
+            )
+        written += 1
+
+    if written == 0 and columns is not None and header is not False:
+        writer.writerow([_column_name(column, field) for column in columns])
+    return written
+
+
+@lispy_function("csv-write", web_safe=False, reason="File system access")
+def csv_write(args: List[Any], env: Environment) -> int:
+    """Implementation of the (csv-write filename rows [options]) LisPy function.
+    Writes rows to a CSV file one at a time and returns the number written.
+    Usage: (csv-write "out.csv" (map rows summarize) {:columns [:id :total]})
+    """
+    # Imported here so loading the io builtins does not load these packages
+    from lispy.functions.collection.utils import check_collection
+
+    if len(args) not in (2, 3):
+        raise EvaluationError(
+            f"SyntaxError: 'csv-write' expects 2 or 3 arguments, got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: First argument to 'csv-write' must be a string, got {type(filename)}."
+        )
+    if args[1] is not None:
+        check_collection(args[1], "csv-write")
+    options = read_options(args[2], "csv-write", "Third", OPTIONS) if len(args) == 3 else {}
+    dialect = csv_format(options, "csv-write")
+    columns = options.get("columns")
+    if columns is not None and not isinstance(columns, (Vector, LispyList)):
+        raise EvaluationError(
+            f"TypeError: The :columns of 'csv-write' must be a vector of names, got {type(columns)}."
+        )
+
+    # Drop the reference to the head so a lazy sequence of rows streams
+    rows = iter(args[1] or ())
+    args[1] = None
+
+    with open_text_output(filename, newline="") as file:
+        writer = csv.writer(file, **dialect)
+        return _write_rows(writer, rows, columns, options.get("header"))
+
+
+@lispy_documentation("csv-write")
+def csv_write_documentation() -> str:
+    """Returns documentation for the csv-write function."""
+    return """Function: csv-write
+Arguments: (csv-write filename rows [options])
+Description: Writes rows, vectors or maps, to a CSV file one at a time, and returns the number of rows written.
+
+Options:
+  :columns    vector of columns to write, in order; for map rows this
+              picks and orders the keys, for vector rows it is the header
+  :header     false to leave out the header row
+  :delimiter  field separator, default ","
+
+Examples:
+  (csv-write "users.csv" [{:name "ada" :age 36} {:name "alan" :age 41}])
+  ; => 2, writing name,age then ada,36 and alan,41
+  (csv-write "ids.csv" [[1 "a"] [2 "b"]] {:columns ["id" "code"]})
+  (with-open [in (open-file "big.csv")]
+    (csv-write "big-errors.csv"
+               (filter (csv-read in {:header true})
+                       (fn [row] (equal? (get row ':level) "ERROR")))))
+
+Notes:
+  - Rows are written as they are taken from rows, so a lazy sequence of
+    any length streams through in constant memory
+  - Map rows take their columns from :columns or the first row's keys; a
+    missing key is written as an empty field, and other keys are ignored
+  - The header of map rows names each keyword without its colon
+  - Fields are written like to-str, except that nil is an empty field;
+    fields are quoted where needed
+  - The file is replaced if it exists
+  - Not available in web-safe environments
+
+See Also: csv-read, spit"""
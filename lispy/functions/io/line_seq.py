@@ -0,0 +1,53 @@
+from typing import Any, Iterator, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+from .utils import check_file, read_guarded
+
+
+def _lines(file: Any) -> Iterator[str]:
+    # A generator, so a closed file is not touched until read_guarded reads it
+    for line in file:
+        yield line[:-1] if line[-1:] == "\n" else line
+
+
+@lispy_function("line-seq", web_safe=False, reason="File system access")
+def line_seq(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (line-seq file) LisPy function.
+    Returns a lazy sequence of the remaining lines of an open file.
+    Usage: (with-open [f (open-file "app.log")] (doseq [line (line-seq f)] ...))
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'line-seq' expects 1 argument, got {len(args)}."
+        )
+
+    file = check_file(args[0], "line-seq")
+    return LazySeq(lambda: read_guarded(_lines(file), file))
+
+
+@lispy_documentation("line-seq")
+def line_seq_documentation() -> str:
+    """Returns documentation for the line-seq function."""
+    return """Function: line-seq
+Arguments: (line-seq file)
+Description: Returns a lazy sequence of the lines of a file opened with open-file, without their line endings.
+
+Examples:
+  (with-open [f (open-file "app.log")]
+    (doseq [line (line-seq f)]
+      (when (re-find line "ERROR") (println line))))
+  (with-open [f (open-file "app.log")]
+    (transduce (line-seq f) (filter (fn [line] (re-find line " 5\\\\d\\\\d "))) conj []))
+
+Notes:
+  - Lines are read from the file's buffer as the sequence is consumed, so
+    only a chunk of lines is held in memory at a time
+  - The sequence must be consumed inside with-open; reading it after the
+    file is closed raises an IOError
+  - Reading a file a second time needs a new open-file
+
+See Also: open-file, with-open, read-chunks"""
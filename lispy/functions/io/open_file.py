@@ -0,0 +1,50 @@
+import io
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import open_text_file
+
+
+@lispy_function("open-file", web_safe=False, reason="File system access")
+def open_file(args: List[Any], env: Environment) -> io.TextIOWrapper:
+    """Implementation of the (open-file filename) LisPy function.
+    Opens a text file for buffered reading, for use with with-open.
+    Usage: (with-open [f (open-file "app.log")] ...)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'open-file' expects 1 argument, got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: First argument to 'open-file' must be a string, got {type(filename)}."
+        )
+    return open_text_file(filename)
+
+
+@lispy_documentation("open-file")
+def open_file_documentation() -> str:
+    """Returns documentation for the open-file function."""
+    return """Function: open-file
+Arguments: (open-file filename)
+Description: Opens a UTF-8 text file for buffered reading and returns the open file, for line-seq and read-chunks.
+
+Examples:
+  (with-open [f (open-file "app.log")]
+    (count (filter (line-seq f) (fn [line] (re-find line "ERROR")))))
+  (with-open [f (open-file "big.txt")]
+    (reduce (read-chunks f 65536) (fn [n chunk] (+ n (count chunk))) 0))
+
+Notes:
+  - Open files inside with-open, which closes them when its body finishes,
+    even if the body throws
+  - Raises the same errors as slurp for missing files, directories and
+    unreadable files
+  - Not available in web-safe environments
+
+See Also: with-open, line-seq, read-chunks, slurp"""
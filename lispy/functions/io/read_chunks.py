@@ -0,0 +1,49 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+from .utils import check_file, read_guarded
+
+
+@lispy_function("read-chunks", web_safe=False, reason="File system access")
+def read_chunks(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (read-chunks file size) LisPy function.
+    Returns a lazy sequence of blocks of up to size characters of an open file.
+    Usage: (with-open [f (open-file "big.txt")] (read-chunks f 65536))
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'read-chunks' expects 2 arguments, got {len(args)}."
+        )
+
+    file = check_file(args[0], "read-chunks")
+    size = args[1]
+    if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+        raise EvaluationError(
+            f"TypeError: Second argument to 'read-chunks' must be a positive integer, got {size!r}."
+        )
+    chunks = iter(lambda: file.read(size), "")
+    return LazySeq(lambda: read_guarded(chunks, file))
+
+
+@lispy_documentation("read-chunks")
+def read_chunks_documentation() -> str:
+    """Returns documentation for the read-chunks function."""
+    return """Function: read-chunks
+Arguments: (read-chunks file size)
+Description: Returns a lazy sequence of the remaining text of a file opened with open-file, in blocks of size characters (the last block may be shorter).
+
+Examples:
+  (with-open [f (open-file "big.txt")]
+    (reduce (read-chunks f 65536) (fn [n chunk] (+ n (count chunk))) 0))
+
+Notes:
+  - size must be a positive integer
+  - Blocks are read as the sequence is consumed; lines may be split across
+    blocks, use line-seq to read by line
+  - The sequence must be consumed inside with-open
+
+See Also: open-file, with-open, line-seq"""
@@ -1,10 +1,11 @@
-import os
 from typing import Any, List
 
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 
+from .utils import open_text_file
+
 
 @lispy_function("slurp", web_safe=False, reason="File system access")
 def slurp(args: List[Any], env: Environment) -> str:
@@ -26,42 +27,20 @@ def slurp(args: List[Any], env: Environment) -> str:
 
     filename = filename_arg
 
-    try:
-        # Check if file exists
-        if not os.path.exists(filename):
+    with open_text_file(filename) as file:
+        try:
+            return file.read()
+        except UnicodeDecodeError as e:
             raise EvaluationError(
-                "FileNotFoundError: File '{}' does not exist.".format(filename)
+                "UnicodeError: Cannot decode file '{}' as UTF-8: {}.".format(
+                    filename, str(e)
+                )
             )
-
-        # Check if it's actually a file (not a directory)
-        if not os.path.isfile(filename):
+        except OSError as e:
             raise EvaluationError(
-                "FileError: '{}' is not a regular file.".format(filename)
+                "OSError: Error reading file '{}': {}.".format(filename, str(e))
             )
 
-        # Read the file contents
-        with open(filename, "r", encoding="utf-8") as file:
-            return file.read()
-
-    except PermissionError:
-        raise EvaluationError(
-            "PermissionError: Permission denied reading file '{}'.".format(filename)
-        )
-    except UnicodeDecodeError as e:
-        raise EvaluationError(
-            "UnicodeError: Cannot decode file '{}' as UTF-8: {}.".format(
-                filename, str(e)
-            )
-        )
-    except OSError as e:
-        raise EvaluationError(
-            "OSError: Error reading file '{}': {}.".format(filename, str(e))
-        )
-    except Exception as e:
-        raise EvaluationError(
-            "Error: Unexpected error reading file '{}': {}.".format(filename, str(e))
-        )
-
 
 @lispy_documentation("slurp")
 def slurp_documentation() -> str:
@@ -93,4 +72,5 @@ Notes:
   - Relative paths are resolved from current working directory
   - Essential for file processing and configuration reading
   - Pairs well with split function for line-by-line processing
-  - Memory usage scales with file size (entire file loaded at once)"""
+  - Memory usage scales with file size (entire file loaded at once); use
+    line-seq or read-chunks inside with-open to stream large files"""
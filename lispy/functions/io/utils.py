@@ -0,0 +1,115 @@
+"""
+Shared helpers for the LisPy file functions.
+"""
+
+import io
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from lispy.exceptions import EvaluationError
+from lispy.types import Symbol
+
+
+def open_text_file(filename: str) -> io.TextIOWrapper:
+    """Open filename for reading as UTF-8 text.
+
+    The file is opened directly rather than checked with os.path first, so a
+    read costs one system call instead of three; the usual failures become
+    LisPy errors.
+    """
+    try:
+        return open(filename, "r", encoding="utf-8")
+    except FileNotFoundError:
+        raise EvaluationError(f"FileNotFoundError: File '{filename}' does not exist.")
+    except (IsADirectoryError, NotADirectoryError):
+        raise EvaluationError(f"FileError: '{filename}' is not a regular file.")
+    except PermissionError:
+        raise EvaluationError(
+            f"PermissionError: Permission denied reading file '{filename}'."
+        )
+    except OSError as e:
+        raise EvaluationError(f"OSError: Error reading file '{filename}': {e}.")
+
+
+def open_text_output(filename: str, newline: Optional[str] = None) -> io.TextIOWrapper:
+    """Open filename for writing as UTF-8 text, replacing it if it exists."""
+    try:
+        return open(filename, "w", encoding="utf-8", newline=newline)
+    except PermissionError:
+        raise EvaluationError(
+            f"PermissionError: Permission denied writing to file '{filename}'."
+        )
+    except (IsADirectoryError, NotADirectoryError):
+        raise EvaluationError(f"FileError: '{filename}' is not a regular file.")
+    except FileNotFoundError:
+        raise EvaluationError(
+            f"FileNotFoundError: Directory of '{filename}' does not exist."
+        )
+    except OSError as e:
+        raise EvaluationError(f"OSError: Error writing to file '{filename}': {e}.")
+
+
+def check_file(file: Any, function_name: str) -> io.TextIOBase:
+    """Raise a TypeError unless file is a file opened by open-file."""
+    if not isinstance(file, io.TextIOBase):
+        raise EvaluationError(
+            f"TypeError: First argument to '{function_name}' must be a file from open-file, got {type(file)}."
+        )
+    return file
+
+
+def read_guarded(items: Iterator[Any], file: io.TextIOBase) -> Iterator[Any]:
+    """Yield from items, which read file, turning read failures into LisPy errors.
+
+    A lazy sequence over a file is read as it is consumed, so these errors
+    surface wherever that happens, possibly after with-open closed the file.
+    """
+    try:
+        yield from items
+    except UnicodeDecodeError as e:
+        raise EvaluationError(
+            f"UnicodeError: Cannot decode file '{file.name}' as UTF-8: {e}."
+        )
+    except ValueError:
+        if not file.closed:
+            raise
+        raise EvaluationError(
+            f"IOError: File '{file.name}' was read after it was closed; consume its lines inside with-open."
+        )
+
+
+def read_options(
+    options: Any, function_name: str, position: str, known: Iterable[str]
+) -> Dict[str, Any]:
+    """Return an options map such as {:header true} as {"header": True}.
+
+    Raises a TypeError unless options is a map with keyword keys, and a
+    ValueError for an option not in known.
+    """
+    if not isinstance(options, dict):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a map of options, got {type(options)}."
+        )
+    result = {}
+    for key, value in options.items():
+        name = key.name[1:] if isinstance(key, Symbol) and key.name.startswith(":") else None
+        if name not in known:
+            raise EvaluationError(
+                f"ValueError: Unknown option {key} for '{function_name}'; expected one of {' '.join(':' + k for k in known)}."
+            )
+        result[name] = value
+    return result
+
+
+def csv_format(options: Dict[str, Any], function_name: str) -> Dict[str, str]:
+    """Return the csv module format parameters for the :delimiter option."""
+    delimiter = options.get("delimiter", ",")
+    if not isinstance(delimiter, str) or len(delimiter) != 1:
+        raise EvaluationError(
+            f"ValueError: The :delimiter of '{function_name}' must be a one-character string, got {delimiter!r}."
+        )
+    return {"delimiter": delimiter}
+
+
+def column_key(name: Any) -> Any:
+    """Return the map key for a CSV column: a keyword for a string name."""
+    return Symbol(":" + name) if isinstance(name, str) else name
@@ -4,10 +4,19 @@ JSON encoding and decoding functions for LisPy.
 
 from .decode import json_decode, json_decode_documentation
 from .encode import json_encode, json_encode_documentation
+from .json_write import json_write, json_write_documentation
+from .ndjson_read import ndjson_read, ndjson_read_documentation
+from .ndjson_write import ndjson_write, ndjson_write_documentation
 
 __all__ = [
     "json_encode",
     "json_encode_documentation",
     "json_decode",
     "json_decode_documentation",
+    "json_write",
+    "json_write_documentation",
+    "ndjson_read",
+    "ndjson_read_documentation",
+    "ndjson_write",
+    "ndjson_write_documentation",
 ]
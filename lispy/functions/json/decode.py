@@ -8,7 +8,8 @@ import json
 
 from lispy.exceptions import LisPyError
 from lispy.functions.decorators import lispy_documentation, lispy_function
-from lispy.types import Symbol, Vector
+
+from .utils import from_json
 
 
 class JSONDecodeError(LisPyError):
@@ -49,7 +50,7 @@ def json_decode(args, env):
         parsed_data = json.loads(json_string)
 
         # Convert to LisPy data structures
-        return _convert_from_json(parsed_data)
+        return from_json(parsed_data)
 
     except json.JSONDecodeError as e:
         raise JSONDecodeError(f"Invalid JSON: {str(e)}")
@@ -57,39 +58,6 @@ def json_decode(args, env):
         raise JSONDecodeError(f"JSON decode error: {str(e)}")
 
 
-def _convert_from_json(value):
-    """
-    Convert JSON-parsed Python values to LisPy data structures.
-
-    Args:
-        value: Value from json.loads()
-
-    Returns:
-        LisPy-compatible value with appropriate types
-    """
-    if isinstance(value, dict):
-        # Convert objects to LisPy maps with Symbol keys
-        result = {}
-        for k, v in value.items():
-            # Convert string keys to keyword symbols
-            if isinstance(k, str):
-                key_symbol = Symbol(f":{k}")
-            else:
-                key_symbol = Symbol(f":{str(k)}")
-
-            result[key_symbol] = _convert_from_json(v)
-        return result
-
-    elif isinstance(value, list):
-        # Convert arrays to LisPy vectors
-        converted_items = [_convert_from_json(item) for item in value]
-        return Vector(converted_items)
-
-    else:
-        # Primitives (str, int, float, bool, None) are already compatible
-        return value
-
-
 # Documentation
 @lispy_documentation("json-decode")
 def json_decode_documentation():
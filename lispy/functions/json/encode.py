@@ -4,11 +4,10 @@ JSON encoding function for LisPy.
 Converts LisPy data structures to JSON strings.
 """
 
-import json
-
 from lispy.exceptions import LisPyError
 from lispy.functions.decorators import lispy_documentation, lispy_function
-from lispy.types import LispyList, Symbol, Vector
+
+from .utils import encode
 
 
 class JSONEncodeError(LisPyError):
@@ -37,67 +36,14 @@ def json_encode(args, env):
             f"json-encode expects exactly 1 argument, got {len(args)}"
         )
 
-    data = args[0]
-
     try:
-        # Convert LisPy data to JSON-compatible format
-        json_compatible = _convert_for_json(data)
-
-        # Encode as JSON string
-        return json.dumps(json_compatible)
+        # Convert LisPy data while encoding, without an intermediate copy
+        return encode(args[0])
 
     except (TypeError, ValueError) as e:
         raise JSONEncodeError(f"Cannot encode as JSON: {str(e)}")
 
 
-def _convert_for_json(value):
-    """
-    Convert LisPy values to JSON-compatible Python values.
-
-    Args:
-        value: Value to convert
-
-    Returns:
-        JSON-compatible value (dict, list, str, int, float, bool, None)
-    """
-    if isinstance(value, Symbol):
-        # Convert symbols to strings (removing leading colon if present)
-        symbol_name = value.name
-        return symbol_name[1:] if symbol_name.startswith(":") else symbol_name
-
-    elif isinstance(value, (list, Vector, LispyList)):
-        # Recursively convert list/vector elements
-        return [_convert_for_json(item) for item in value]
-
-    elif isinstance(value, dict):
-        # Recursively convert dictionary values and normalize keys
-        result = {}
-        for k, v in value.items():
-            # Convert keys to strings
-            if isinstance(k, Symbol):
-                str_key = k.name
-                if str_key.startswith(":"):
-                    str_key = str_key[1:]
-            else:
-                str_key = str(k)
-
-            result[str_key] = _convert_for_json(v)
-        return result
-
-    elif value is None:
-        # None becomes JSON null
-        return None
-
-    elif isinstance(value, (int, float, bool, str)):
-        # Primitives are already JSON-compatible
-        return value
-
-    else:
-        # For other types, convert to string representation
-        # This includes functions, promises, etc.
-        return str(value)
-
-
 # Documentation
 @lispy_documentation("json-encode")
 def json_encode_documentation():
@@ -120,6 +66,7 @@ Supported Data Types:
   - Strings       → strings ("hello")
   - Symbols       → strings (removes leading colon from keywords)
   - Vectors/Lists → arrays ([1, 2, 3])
+  - Lazy seqs/Sets → arrays
   - Maps          → objects ({"key": "value"})
   - Nested data   → recursively converted
 
@@ -131,21 +78,25 @@ Examples:
   (json-encode "hello")    ; → "\\"hello\\""
   
   ; Collections
-  (json-encode [1 2 3])            ; → "[1,2,3]"
-  (json-encode {:name "Alice"})     ; → "{\\"name\\":\\"Alice\\"}"
+  (json-encode [1 2 3])            ; → "[1, 2, 3]"
+  (json-encode {:name "Alice"})     ; → "{\\"name\\": \\"Alice\\"}"
   
   ; Nested structures
   (json-encode {:users [{:name "Alice" :age 30}
                         {:name "Bob" :age 25}]})
   
   ; Keywords become strings (colon removed)
-  (json-encode {:status :success})  ; → "{\\"status\\":\\"success\\"}"
+  (json-encode {:status :success})  ; → "{\\"status\\": \\"success\\"}"
 
 Notes:
   - Symbols/keywords have leading colons removed
   - Functions and other non-JSON types become string representations
   - Circular references will cause infinite recursion
-  - Output is compact (no pretty-printing)
+  - Output is on one line (no pretty-printing)
+  - Data is converted as it is encoded, without first copying it into
+    JSON-compatible structures
+  - Use json-write to stream a large document to a file, and ndjson-write
+    for a sequence of records
 
-See also: json-decode for the reverse operation
+See also: json-decode for the reverse operation, json-write, ndjson-write
 """
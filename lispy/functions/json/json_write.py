@@ -0,0 +1,58 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.io.utils import open_text_output
+
+from .encode import JSONEncodeError
+from .utils import iter_encode
+
+
+@lispy_function("json-write", web_safe=False, reason="File system access")
+def json_write(args: List[Any], env: Environment) -> None:
+    """Implementation of the (json-write filename data) LisPy function.
+    Writes data to a file as JSON, piece by piece as it is encoded.
+    Usage: (json-write "report.json" {:rows rows})
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'json-write' expects 2 arguments, got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: First argument to 'json-write' must be a string, got {type(filename)}."
+        )
+    pieces = iter_encode(args[1])
+    args[1] = None
+
+    with open_text_output(filename) as file:
+        try:
+            for piece in pieces:
+                file.write(piece)
+        except (TypeError, ValueError) as e:
+            raise JSONEncodeError(f"Cannot encode as JSON: {str(e)}")
+    return None
+
+
+@lispy_documentation("json-write")
+def json_write_documentation() -> str:
+    """Returns documentation for the json-write function."""
+    return """Function: json-write
+Arguments: (json-write filename data)
+Description: Writes data to a file as JSON, encoded as by json-encode.
+
+Examples:
+  (json-write "report.json" {:generated "2024-01-01" :rows rows})
+  (json-write "squares.json" (map (range 1000000) (fn [n] (* n n))))
+
+Notes:
+  - The JSON text is written in pieces as it is encoded, so neither the
+    text nor a JSON-compatible copy of the data is held in memory; a lazy
+    sequence is written as an array while it is realized
+  - The file is replaced if it exists
+  - Not available in web-safe environments
+
+See Also: json-encode, ndjson-write, spit"""
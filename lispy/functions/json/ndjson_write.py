@@ -0,0 +1,73 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.io.utils import open_text_output
+
+from .encode import JSONEncodeError
+from .utils import encode
+
+
+@lispy_function("ndjson-write", web_safe=False, reason="File system access")
+def ndjson_write(args: List[Any], env: Environment) -> int:
+    """Implementation of the (ndjson-write filename records) LisPy function.
+    Writes each record as one line of JSON and returns the number written.
+    Usage: (ndjson-write "events.ndjson" events)
+    """
+    # Imported here so loading the json builtins does not load this package
+    from lispy.functions.collection.utils import check_collection
+
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'ndjson-write' expects 2 arguments, got {len(args)}."
+        )
+
+    filename = args[0]
+    if not isinstance(filename, str):
+        raise EvaluationError(
+            f"TypeError: First argument to 'ndjson-write' must be a string, got {type(filename)}."
+        )
+    if args[1] is not None:
+        check_collection(args[1], "ndjson-write")
+
+    # Drop the reference to the head so a lazy sequence of records streams
+    records = iter(args[1] or ())
+    args[1] = None
+
+    written = 0
+    with open_text_output(filename) as file:
+        try:
+            for record in records:
+                file.write(encode(record))
+                file.write("\n")
+                written += 1
+        except (TypeError, ValueError) as e:
+            raise JSONEncodeError(f"Cannot encode record {written + 1} as JSON: {str(e)}")
+    return written
+
+
+@lispy_documentation("ndjson-write")
+def ndjson_write_documentation() -> str:
+    """Returns documentation for the ndjson-write function."""
+    return """Function: ndjson-write
+Arguments: (ndjson-write filename records)
+Description: Writes each record to a file as one line of JSON (newline-delimited JSON), and returns the number of records written.
+
+Examples:
+  (ndjson-write "users.ndjson" [{:name "ada"} {:name "alan"}])   ; => 2
+  (with-open [in (open-file "events.ndjson")]
+    (ndjson-write "errors.ndjson"
+                  (filter (ndjson-read in)
+                          (fn [event] (equal? (get event ':level) "error")))))
+
+Notes:
+  - Records are encoded and written one at a time as they are taken from
+    records, so a lazy sequence of any length streams through in
+    constant memory
+  - Records are encoded as by json-encode, which never puts a newline
+    inside a record
+  - The file is replaced if it exists
+  - Not available in web-safe environments
+
+See Also: ndjson-read, json-write, json-encode"""
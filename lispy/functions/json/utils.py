@@ -0,0 +1,177 @@
+"""
+Shared helpers for the LisPy JSON functions.
+
+iter_encode walks LisPy data and yields the JSON text in chunks, converting
+keywords, vectors, lists, lazy sequences and maps as it reaches them, so no
+JSON-compatible copy of the data is built first. The chunks can be joined
+into a string or written to a file as they are produced.
+
+The json module's own encoders cannot do this with a default hook: LisPy
+maps and vectors subclass dict and list but keep their items elsewhere, and
+the encoders read dict and list subclasses directly without calling
+default. Strings are still escaped by the json module's C routine.
+"""
+
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_map import EMPTY_MAP
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import EMPTY_VECTOR
+from lispy.types import LispyList, Symbol, Vector
+
+ARRAY_TYPES = (list, Vector, LispyList, LazySeq, PersistentSet)
+
+INFINITY = float("inf")
+
+# Pieces are gathered into chunks of about this many characters
+CHUNK_SIZE = 65536
+
+KEY_CACHE_SIZE = 4096
+
+
+def _float(value: float) -> str:
+    # The same spellings as json.dumps
+    if value != value:
+        return "NaN"
+    if value == INFINITY:
+        return "Infinity"
+    if value == -INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key(key: Any) -> str:
+    if isinstance(key, Symbol):
+        name = key.name
+        return name[1:] if name.startswith(":") else name
+    return key if isinstance(key, str) else str(key)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _encoded_key(key: Any) -> str:
+    # Maps of records repeat the same keys, so each is encoded once
+    return encode_basestring_ascii(_key(key)) + ": "
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _encoded_symbol(symbol: Symbol) -> str:
+    return encode_basestring_ascii(_key(symbol))
+
+
+# Encoders for the exact types of common scalars, tried before _scalar
+_FAST: Dict[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _float,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+    Symbol: _encoded_symbol,
+}
+
+CONTAINER_TYPES = (dict,) + ARRAY_TYPES
+
+
+def _scalar(value: Any) -> Optional[str]:
+    """Return the JSON text of a non-container value, or None for a container."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _float(value)
+    if isinstance(value, Symbol):
+        return encode_basestring_ascii(_key(value))
+    if isinstance(value, CONTAINER_TYPES):
+        return None
+    # Functions, promises and other values are encoded as their text
+    return encode_basestring_ascii(str(value))
+
+
+def iter_encode(value: Any, indent: Optional[int] = None) -> Iterator[str]:
+    """Yield the JSON text of value in chunks of about CHUNK_SIZE characters.
+
+    The output matches json.dumps with the same indent.
+    """
+    text = _scalar(value)
+    if text is not None:
+        yield text
+        return
+    chunk: List[str] = []
+    size = 0
+    for piece in _iter_container(value, indent, 0):
+        chunk.append(piece)
+        size += len(piece)
+        if size >= CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def _iter_container(value: Any, indent: Optional[int], level: int) -> Iterator[str]:
+    """Yield the pieces of a map or array: one per run of scalars."""
+    if indent is None:
+        newline = ""
+        separator = ", "
+    else:
+        newline = "\n" + " " * (indent * (level + 1))
+        separator = "," + newline
+    is_map = isinstance(value, dict)
+    opening, closing = ("{", "}") if is_map else ("[", "]")
+
+    parts: List[str] = [opening]
+    empty = True
+    for item in value.items() if is_map else value:
+        parts.append(newline if empty else separator)
+        empty = False
+        if is_map:
+            key, item = item
+            parts.append(_encoded_key(key))
+        fast = _FAST.get(type(item))
+        if fast is not None:
+            parts.append(fast(item))
+        elif isinstance(item, CONTAINER_TYPES):
+            yield "".join(parts)
+            parts = []
+            yield from _iter_container(item, indent, level + 1)
+        else:
+            parts.append(_scalar(item))
+    if not empty and indent is not None:
+        parts.append("\n" + " " * (indent * level))
+    parts.append(closing)
+    yield "".join(parts)
+
+
+def encode(value: Any, indent: Optional[int] = None) -> str:
+    """Return the JSON text of value."""
+    return "".join(iter_encode(value, indent))
+
+
+def from_json(value: Any) -> Any:
+    """Convert a value from json.loads to LisPy data.
+
+    Objects become maps with keyword keys and arrays become vectors, each
+    built in a transient.
+    """
+    if isinstance(value, dict):
+        result = EMPTY_MAP.transient()
+        for k, v in value.items():
+            result.assoc(Symbol(f":{k}"), from_json(v))
+        return result.persistent()
+    if isinstance(value, list):
+        result = EMPTY_VECTOR.transient()
+        for item in value:
+            result.conj(from_json(item))
+        return result.persistent()
+    # Primitives (str, int, float, bool, None) are already compatible
+    return value
@@ -3,6 +3,8 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_list import persistent_list
+from lispy.types import Vector
 
 
 @lispy_function("cdr")
@@ -23,7 +25,10 @@ def cdr(args: List[Any], env: Environment) -> List[Any]:
     if not list_arg:  # Empty list
         raise EvaluationError("RuntimeError: 'cdr' cannot operate on an empty list.")
 
-    return list_arg[1:]
+    if isinstance(list_arg, Vector):
+        return list_arg[1:]
+
+    return persistent_list(list_arg).rest()
 
 
 @lispy_documentation("cdr")
@@ -45,5 +50,6 @@ Notes:
   - Cannot operate on empty lists - raises an error
   - Classic Lisp function name (Contents of Decrement Register)
   - For a single-element list, returns an empty list
+  - O(1) on lists built with list, cons or cdr: the tail is shared, not copied
   - Use with 'car' to process lists recursively
   - Expects exactly one argument which must be a non-empty list"""
@@ -3,11 +3,16 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_list import persistent_list
 
 
 @lispy_function("cons")
 def cons(args: List[Any], env: Environment) -> List[Any]:
-    """Prepends an item to a list. (cons item list)"""
+    """Prepends an item to a list. (cons item list)
+    The result shares the list as its tail, so cons is O(1) on lists built
+    with list, cons or rest.
+    """
     if len(args) != 2:
         raise EvaluationError(
             f"SyntaxError: 'cons' expects 2 arguments (item list), got {len(args)}."
@@ -16,12 +21,16 @@ def cons(args: List[Any], env: Environment) -> List[Any]:
     item = args[0]
     list_arg = args[1]
 
+    if isinstance(list_arg, LazySeq):
+        # Consing onto a lazy sequence must not realize it
+        return list_arg.cons(item)
+
     if not isinstance(list_arg, list):
         raise EvaluationError(
             f"TypeError: 'cons' expects its second argument to be a list, got {type(list_arg).__name__}."
         )
 
-    return [item] + list_arg
+    return persistent_list(list_arg).cons(item)
 
 
 @lispy_documentation("cons")
@@ -42,6 +51,8 @@ Notes:
   - Classic Lisp construct operation
   - Requires exactly two arguments
   - First argument can be any type
-  - Second argument must be a list
+  - Second argument must be a list or lazy sequence
+  - Consing onto a lazy sequence returns a lazy sequence without realizing it
   - Creates a new list without modifying the original
+  - O(1): the new list shares the original as its tail
   - Use with car/cdr for list processing patterns"""
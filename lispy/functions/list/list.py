@@ -2,6 +2,7 @@ from typing import Any, List
 
 from lispy.environment import Environment
 from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_list import PersistentList
 from lispy.types import LispyList
 
 
@@ -9,7 +10,7 @@ from lispy.types import LispyList
 def list_fn(args: List[Any], env: Environment) -> LispyList:
     """Constructs a list from its arguments. (list item1 item2 ...)"""
     # args is already the list of evaluated arguments
-    return LispyList(args)  # Return a LispyList instead of regular Python list
+    return PersistentList(args)  # A LispyList made of shared cons cells
 
 
 @lispy_documentation("list")
@@ -30,6 +31,6 @@ Examples:
 Notes:
   - Accepts zero or more arguments of any type
   - Arguments are evaluated before list creation
-  - Creates mutable lists (can be modified with cons, etc.)
+  - Creates immutable lists; cons, rest and cdr share structure and are O(1)
   - Use with car/cdr for list processing
   - Empty list is represented as ()"""
@@ -3,7 +3,9 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
-from lispy.types import Symbol, Vector
+from lispy.hashing import hashes_differ
+from lispy.persistent_set import PersistentSet
+from lispy.types import LispyList, Symbol, Vector
 
 
 @lispy_function("equal?")
@@ -33,6 +35,31 @@ def _are_equal(a: Any, b: Any) -> bool:
     if a is None or b is None:
         return False
 
+    # Persistent collections cache their hash once it has been computed, and
+    # collections with different hashes cannot be equal
+    if hashes_differ(a, b):
+        return False
+
+    # Vector comparison (order matters). Persistent vectors built by conj/map
+    # and vector literals are the same LisPy type.
+    if isinstance(a, Vector) and isinstance(b, Vector):
+        if len(a) != len(b):
+            return False
+        return all(_are_equal(x, y) for x, y in zip(a, b))
+
+    # List comparison (order matters). Cons lists built by list/cons/rest
+    # and quoted list literals are the same LisPy type.
+    if isinstance(a, LispyList) and isinstance(b, LispyList):
+        if len(a) != len(b):
+            return False
+        return all(_are_equal(x, y) for x, y in zip(a, b))
+
+    # Maps compare by entries and sets by elements, whether hashed or sorted
+    if isinstance(a, dict) and isinstance(b, dict):
+        return _maps_equal(a, b)
+    if isinstance(a, PersistentSet) and isinstance(b, PersistentSet):
+        return a == b
+
     # Check if types are different (strict type checking)
     if type(a) != type(b):
         # Special case: numbers (int and float can be equal, but not bool)
@@ -53,15 +80,6 @@ def _are_equal(a: Any, b: Any) -> bool:
     if isinstance(a, Symbol):
         return a == b
 
-    # Vector comparison (order matters)
-    if isinstance(a, Vector):
-        if len(a) != len(b):
-            return False
-        for i in range(len(a)):
-            if not _are_equal(a[i], b[i]):
-                return False
-        return True
-
     # List comparison (order matters)
     if isinstance(a, list):
         if len(a) != len(b):
@@ -71,22 +89,23 @@ def _are_equal(a: Any, b: Any) -> bool:
                 return False
         return True
 
-    # Map/dict comparison (order doesn't matter)
-    if isinstance(a, dict):
-        if len(a) != len(b):
-            return False
+    # For any other types, fall back to Python's equality
+    return a == b
 
-        # Check all keys and values
-        for key in a:
-            if key not in b:
-                return False
-            if not _are_equal(a[key], b[key]):
-                return False
 
-        return True
+def _maps_equal(a: dict, b: dict) -> bool:
+    """Map/dict comparison (order doesn't matter)."""
+    if len(a) != len(b):
+        return False
 
-    # For any other types, fall back to Python's equality
-    return a == b
+    # Check all keys and values
+    for key in a:
+        if key not in b:
+            return False
+        if not _are_equal(a[key], b[key]):
+            return False
+
+    return True
 
 
 @lispy_documentation("equal?")
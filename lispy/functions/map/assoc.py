@@ -3,13 +3,18 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
-from lispy.types import Symbol
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import EMPTY_MAP, persistent_map
+from lispy.persistent_sorted_map import PersistentSortedMap
+from lispy.persistent_vector import persistent_vector
+from lispy.types import Vector
 
 
 @lispy_function("assoc")
 def assoc(args: List[Any], env: Environment):
     """Implementation of the (assoc map key val ...) LisPy function.
     Associates key-value pairs with a map, returning a new map.
+    On a vector, keys are indexes and a new persistent vector is returned.
     Usage: (assoc map key1 value1 [key2 value2 ...])
     """
     if len(args) < 3:
@@ -25,29 +30,50 @@ def assoc(args: List[Any], env: Environment):
             f"SyntaxError: 'assoc' requires an even number of key/value arguments after the map, got {len(kv_pairs)}."
         )
 
+    if isinstance(original_map, Vector):
+        return _assoc_vector(original_map, kv_pairs)
+
     if not (isinstance(original_map, dict) or original_map is None):
         raise EvaluationError(
-            f"TypeError: First argument to 'assoc' must be a map or nil, got {type(original_map)}."
+            f"TypeError: First argument to 'assoc' must be a map, vector, or nil, got {type(original_map)}."
         )
 
-    # Create a new map based on the original, or an empty map if original_map is None
-    new_map = dict(original_map) if original_map is not None else {}
+    # Share structure with the original map, or start from an empty map if it is None
+    if original_map is None:
+        new_map = EMPTY_MAP
+    elif isinstance(original_map, PersistentSortedMap):
+        new_map = original_map  # Stays sorted
+    else:
+        new_map = persistent_map(original_map)
 
     for i in range(0, len(kv_pairs), 2):
         key = kv_pairs[i]
         value = kv_pairs[i + 1]
 
-        # Keys can be symbols, strings, numbers, booleans, or nil
-        if not isinstance(key, (Symbol, str, int, float, bool, type(None))):
-            raise EvaluationError(
-                f"TypeError: Map keys in 'assoc' must be symbols, strings, numbers, booleans, or nil, got {type(key)}."
-            )
-
-        new_map[key] = value
+        # Keys can be symbols, strings, numbers, booleans, nil, or collections
+        key = map_key(key, "Map keys in 'assoc' must be")
+        new_map = new_map.assoc(key, value)
 
     return new_map
 
 
+def _assoc_vector(vector: Vector, kv_pairs: List[Any]) -> Vector:
+    """Replace elements of a vector by index, sharing structure with the original."""
+    result = persistent_vector(vector)
+    for i in range(0, len(kv_pairs), 2):
+        index = kv_pairs[i]
+        if not isinstance(index, int) or isinstance(index, bool):
+            raise EvaluationError(
+                f"TypeError: Vector index in 'assoc' must be an integer, got {type(index)}."
+            )
+        if not 0 <= index <= len(result):
+            raise EvaluationError(
+                f"IndexError: {index} out of bounds for 'assoc' on vector of size {len(result)}."
+            )
+        result = result.assoc(index, kv_pairs[i + 1])
+    return result
+
+
 @lispy_documentation("assoc")
 def assoc_doc() -> str:
     """Returns documentation for the assoc function."""
@@ -61,12 +87,22 @@ Examples:
   (assoc {:a 1} ':a 10)         ; => {:a 10} (updates existing)
   (assoc {} ':x 1 ':y 2 ':z 3)  ; => {:x 1 :y 2 :z 3}
   (assoc nil ':a 1)             ; => {:a 1} (nil treated as empty map)
+  (assoc [1 2 3] 1 :x)          ; => [1 :x 3] (vector index)
+  (assoc [1 2] 2 3)             ; => [1 2 3] (index = length appends)
+  (assoc {} [0 0] "origin")     ; => {[0 0] "origin"} (collection key)
 
 Notes:
-  - First argument must be a map or nil
+  - First argument must be a map, vector, or nil
+  - For vectors, keys are indexes from 0 up to the vector's length
+  - Updating a vector is O(log32 n) and shares structure with the original
   - Requires at least 3 arguments (map, key, value)
   - Additional key-value pairs can be provided
-  - Keys must be symbols (like ':a, ':name, etc.)
+  - Keys must be symbols (like ':a, ':name, etc.), strings, numbers,
+    booleans, nil, or vectors, lists and maps made of such values
+  - Collection keys are stored as persistent collections, which compute
+    their hash once and cache it
   - Values can be any type
   - Returns a new map, does not modify original
+  - The new map shares structure with the original, so each key costs
+    O(log32 n) instead of a copy of the whole map
   - Later keys override earlier keys in same call"""
@@ -3,7 +3,9 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
-from lispy.types import Symbol
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import persistent_map
+from lispy.persistent_sorted_map import PersistentSortedMap
 
 
 @lispy_function("dissoc")
@@ -27,18 +29,14 @@ def dissoc(args: List[Any], env: Environment):
             f"TypeError: First argument to 'dissoc' must be a map or nil, got {type(target_map)}."
         )
 
-    if not keys:
-        return target_map.copy()
-
-    new_map = target_map.copy()
+    if isinstance(target_map, PersistentSortedMap):
+        new_map = target_map  # Stays sorted
+    else:
+        new_map = persistent_map(target_map)
     for key_to_remove in keys:
-        # Keys can be symbols, strings, numbers, booleans, or nil
-        if not isinstance(key_to_remove, (Symbol, str, int, float, bool, type(None))):
-            raise EvaluationError(
-                f"TypeError: Keys to 'dissoc' must be symbols, strings, numbers, booleans, or nil, got {type(key_to_remove)}."
-            )
-        if key_to_remove in new_map:
-            del new_map[key_to_remove]
+        # Keys can be symbols, strings, numbers, booleans, nil, or collections
+        key_to_remove = map_key(key_to_remove, "Keys to 'dissoc' must be")
+        new_map = new_map.dissoc(key_to_remove)
     return new_map
 
 
@@ -61,7 +59,7 @@ Notes:
   - Requires at least 1 argument (the map)
   - First argument must be a map or nil
   - All key arguments must be symbols
-  - If no keys provided, returns copy of original map
+  - If no keys provided, returns the original map unchanged
   - Missing keys are silently ignored
   - nil maps return nil
   - Returns new map, original is not modified
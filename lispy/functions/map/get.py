@@ -2,9 +2,10 @@ from typing import Any, List
 
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
-from lispy.types import Symbol, Vector
+from lispy.types import Vector
 
 from ..decorators import lispy_documentation, lispy_function
+from .utils import map_key
 
 
 @lispy_function("get")
@@ -41,11 +42,8 @@ def get(args: List[Any], env: Environment):
                 f"IndexError: {key} out of bounds for vector of size {len(collection)}."
             )
     elif isinstance(collection, dict):  # Assuming maps are Python dicts
-        # Keys can be symbols, strings, numbers, booleans, or nil
-        if not isinstance(key, (Symbol, str, int, float, bool, type(None))):
-            raise EvaluationError(
-                f"TypeError: Map key must be a symbol, string, number, boolean, or nil, got {type(key)}."
-            )
+        # Keys can be symbols, strings, numbers, booleans, nil, or collections
+        key = map_key(key, "Map key must be one of")
 
         if key in collection:
             return collection[key]
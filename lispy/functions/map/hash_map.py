@@ -3,7 +3,8 @@ from typing import Any, List
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
-from lispy.types import Symbol
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import PersistentMap
 
 
 @lispy_function("hash-map")
@@ -17,17 +18,14 @@ def hash_map(args: List[Any], env: Environment):
             f"SyntaxError: 'hash-map' requires an even number of arguments (key-value pairs), got {len(args)}."
         )
 
-    new_map = {}
+    pairs = []
     for i in range(0, len(args), 2):
         key = args[i]
         value = args[i + 1]
-        # Keys can be symbols, strings, numbers, booleans, or nil
-        if not isinstance(key, (Symbol, str, int, float, bool, type(None))):
-            raise EvaluationError(
-                f"TypeError: 'hash-map' keys must be symbols, strings, numbers, booleans, or nil, got {type(key)}."
-            )
-        new_map[key] = value
-    return new_map
+        # Keys can be symbols, strings, numbers, booleans, nil, or collections
+        key = map_key(key, "'hash-map' keys must be")
+        pairs.append((key, value))
+    return PersistentMap(pairs)
 
 
 @lispy_documentation("hash-map")
@@ -42,10 +40,12 @@ Examples:
   (hash-map ':a 1 ':b 2)        ; => {:a 1 :b 2}
   (hash-map ':name "LisPy" ':version 1.0) ; => {:name "LisPy" :version 1.0}
   (hash-map ':x (+ 1 2) ':y (* 3 4))     ; => {:x 3 :y 12}
+  (hash-map [1 2] ':pair)       ; => {[1 2] :pair}
   
 Notes:
   - Requires an even number of arguments (key-value pairs)
-  - Keys must be symbols (like ':a, ':name, etc.)
+  - Keys must be symbols (like ':a, ':name, etc.), strings, numbers,
+    booleans, nil, or vectors, lists and maps made of such values
   - Values can be any type
   - Arguments are evaluated before map creation
   - Returns a new mutable hash map
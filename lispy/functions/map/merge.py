@@ -2,6 +2,8 @@ from typing import Any, List
 
 from lispy.environment import Environment
 from lispy.exceptions import EvaluationError
+from lispy.persistent_map import EMPTY_MAP, persistent_map
+from lispy.persistent_sorted_map import PersistentSortedMap
 
 from ..decorators import lispy_documentation, lispy_function
 
@@ -26,7 +28,7 @@ def merge(args: List[Any], env: Environment):
     """
     if len(args) == 0:
         # Empty merge returns empty hash map
-        return {}
+        return EMPTY_MAP
 
     # Validate all arguments are hash maps
     for i, arg in enumerate(args):
@@ -35,10 +37,13 @@ def merge(args: List[Any], env: Environment):
                 f"TypeError: 'merge' arguments must be hash maps, got {type(arg)} at position {i}."
             )
 
-    # Merge all maps, with later ones overriding earlier ones
-    result_map = {}
-    for hash_map in args:
-        result_map.update(hash_map)
+    # Merge all maps into the first, with later ones overriding earlier ones.
+    # The result shares structure with the first map, and is sorted if it is.
+    result_map = args[0]
+    if not isinstance(result_map, PersistentSortedMap):
+        result_map = persistent_map(result_map)
+    for hash_map in args[1:]:
+        result_map = result_map.assoc_all(hash_map.items())
 
     return result_map
 
@@ -61,7 +66,8 @@ Examples:
 Notes:
   - Accepts zero or more hash map arguments
   - All arguments must be hash maps
-  - Returns a new hash map, does not modify originals
+  - Returns a new hash map that shares structure with the first map,
+    so merging a few keys into a large map does not copy it
   - Later maps override earlier maps for duplicate keys
   - Empty merge returns empty map {}
   - Empty maps are ignored in the merge"""
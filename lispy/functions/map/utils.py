@@ -0,0 +1,44 @@
+"""
+Shared helpers for the LisPy map functions.
+"""
+
+from typing import Any
+
+from lispy.exceptions import EvaluationError
+from lispy.persistent_list import persistent_list
+from lispy.persistent_map import persistent_map
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import persistent_vector
+from lispy.types import LispyList, Symbol, Vector
+
+SCALAR_KEY_TYPES = (Symbol, str, int, float, bool, type(None))
+
+
+def map_key(key: Any, requirement: str) -> Any:
+    """Return key in the form it is stored in a map.
+
+    Scalars and sets are returned as they are. Vectors, lists and maps are
+    returned as their persistent versions, which cache their hash. requirement starts the
+    error message raised for anything else, e.g. "Map keys in 'assoc' must be".
+    """
+    if isinstance(key, SCALAR_KEY_TYPES):
+        return key
+    if isinstance(key, Vector):
+        frozen = persistent_vector(key)
+    elif isinstance(key, LispyList):
+        frozen = persistent_list(key)
+    elif isinstance(key, dict):
+        frozen = persistent_map(key)
+    elif isinstance(key, PersistentSet):
+        frozen = key
+    else:
+        frozen = None
+    if frozen is not None:
+        try:
+            hash(frozen)
+            return frozen
+        except TypeError:
+            pass  # An element cannot be hashed
+    raise EvaluationError(
+        f"TypeError: {requirement} symbols, strings, numbers, booleans, nil, or collections of them, got {type(key)}."
+    )
@@ -0,0 +1,40 @@
+"""LisPy Numeric Array Functions - Typed arrays with vectorized arithmetic"""
+
+from .dot import dot, dot_documentation
+from .double_array import double_array, double_array_documentation
+from .int_array import int_array, int_array_documentation
+from .to_vector import to_vector, to_vector_documentation
+from .vadd import vadd, vadd_documentation
+from .vmap import vmap, vmap_documentation
+from .vmax import vmax, vmax_documentation
+from .vmean import vmean, vmean_documentation
+from .vmin import vmin, vmin_documentation
+from .vmul import vmul, vmul_documentation
+from .vsum import vsum, vsum_documentation
+
+__all__ = [
+    # Functions
+    "dot",
+    "double_array",
+    "int_array",
+    "to_vector",
+    "vadd",
+    "vmap",
+    "vmax",
+    "vmean",
+    "vmin",
+    "vmul",
+    "vsum",
+    # Documentation
+    "dot_documentation",
+    "double_array_documentation",
+    "int_array_documentation",
+    "to_vector_documentation",
+    "vadd_documentation",
+    "vmap_documentation",
+    "vmax_documentation",
+    "vmean_documentation",
+    "vmin_documentation",
+    "vmul_documentation",
+    "vsum_documentation",
+]
@@ -0,0 +1,184 @@
+"""
+Compiles simple arithmetic LisPy functions into Python callables.
+
+vmap and where apply a LisPy fn to every element of a numeric array. When the
+fn body only combines its parameter, numbers and numeric variables with the
+built-in + - * / and abs (and, for predicates, one comparison), it is compiled
+once into nested operator calls. The result is called per element from a
+C-level map, or once with the whole array when NumPy is installed, instead of
+evaluating the body per element. Anything else returns None and the caller
+falls back to calling the fn.
+"""
+
+import operator
+from functools import reduce
+from typing import Any, Callable, List, Optional, Tuple
+
+from lispy.closure import Function
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import get_registered_function
+from lispy.types import LispyList, Symbol
+
+from .utils import is_number
+
+_COMPARISONS = {
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "=": operator.eq,
+}
+
+# Compiled expressions take the element (or, with NumPy, the whole array) and
+# return the result, paired with whether the result is a float.
+Compiled = Tuple[Callable[[Any], Any], bool]
+
+
+class _NotArithmetic(Exception):
+    """The function body is not simple arithmetic and must be called per element."""
+
+
+class _Constant:
+    """A compiled expression that ignores the element."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __call__(self, x: Any) -> Any:
+        return self.value
+
+
+def _identity(x):
+    return x
+
+
+def _fold(op: Callable[[Any, Any], Any], parts: List[Callable]) -> Callable:
+    if len(parts) == 2:
+        left, right = parts
+        # The common (op x constant) shapes skip a call per element
+        if left is _identity and isinstance(right, _Constant):
+            constant = right.value
+            return lambda x: op(x, constant)
+        if right is _identity and isinstance(left, _Constant):
+            constant = left.value
+            return lambda x: op(constant, x)
+        return lambda x: op(left(x), right(x))
+
+    def folded(x):
+        return reduce(op, [part(x) for part in parts])
+
+    return folded
+
+
+def _compile_call(name: str, args: List[Compiled]) -> Compiled:
+    parts = [part for part, _ in args]
+    is_float = any(part_is_float for _, part_is_float in args)
+    if name in ("+", "*"):
+        if not args:
+            return _Constant(0 if name == "+" else 1), False
+        if len(args) == 1:
+            return args[0]
+        return _fold(operator.add if name == "+" else operator.mul, parts), is_float
+    if name == "-" and args:
+        if len(args) == 1:
+            only = parts[0]
+            return (lambda x: -only(x)), is_float
+        return _fold(operator.sub, parts), is_float
+    if name == "/" and len(args) >= 2:
+        return _fold(operator.truediv, parts), True
+    if name == "abs" and len(args) == 1:
+        only = parts[0]
+        return (lambda x: abs(only(x))), is_float
+    raise _NotArithmetic()
+
+
+def _resolve_builtin(name: str, param: str, env: Environment) -> None:
+    """Raise _NotArithmetic unless name refers to the built-in of that name."""
+    if name == param:
+        raise _NotArithmetic()
+    try:
+        operator_fn = env.lookup(name)
+    except EvaluationError:
+        raise _NotArithmetic()
+    # Only the real built-ins, not user functions shadowing their names
+    if operator_fn is not get_registered_function(name):
+        raise _NotArithmetic()
+
+
+def _compile_expression(
+    expr: Any, param: str, env: Environment, input_is_float: bool
+) -> Compiled:
+    if isinstance(expr, Symbol):
+        if expr.name == param:
+            return _identity, input_is_float
+        # A free variable is resolved once, when the fn is compiled
+        try:
+            expr = env.lookup(expr.name)
+        except EvaluationError:
+            raise _NotArithmetic()
+        if not is_number(expr):
+            raise _NotArithmetic()
+    if is_number(expr):
+        return _Constant(expr), isinstance(expr, float)
+    if isinstance(expr, LispyList) and expr and isinstance(expr[0], Symbol):
+        name = expr[0].name
+        _resolve_builtin(name, param, env)
+        args = [
+            _compile_expression(arg, param, env, input_is_float) for arg in expr[1:]
+        ]
+        return _compile_call(name, args)
+    raise _NotArithmetic()
+
+
+def _compile_comparison(
+    expr: Any, param: str, env: Environment, input_is_float: bool
+) -> Callable[[Any], Any]:
+    if not (isinstance(expr, LispyList) and len(expr) == 3):
+        raise _NotArithmetic()
+    head = expr[0]
+    if not isinstance(head, Symbol) or head.name not in _COMPARISONS:
+        raise _NotArithmetic()
+    _resolve_builtin(head.name, param, env)
+    compare = _COMPARISONS[head.name]
+    left, _ = _compile_expression(expr[1], param, env, input_is_float)
+    right, _ = _compile_expression(expr[2], param, env, input_is_float)
+    return _fold(compare, [left, right])
+
+
+def _body(procedure: Any) -> Optional[Tuple[Any, str, Environment]]:
+    if (
+        not isinstance(procedure, Function)
+        or len(procedure.params) != 1
+        or len(procedure.body) != 1
+    ):
+        return None
+    return procedure.body[0], procedure.params[0].name, procedure.defining_env
+
+
+def compile_arithmetic(procedure: Any, input_is_float: bool) -> Optional[Compiled]:
+    """Compile a one-parameter fn whose body only uses + - * / abs on its
+    parameter, numbers and numeric free variables. Returns None otherwise."""
+    body = _body(procedure)
+    if body is None:
+        return None
+    try:
+        return _compile_expression(*body, input_is_float)
+    except _NotArithmetic:
+        return None
+
+
+def compile_predicate(
+    procedure: Any, input_is_float: bool
+) -> Optional[Callable[[Any], Any]]:
+    """Compile a one-parameter fn whose body is a single comparison
+    (< > <= >= =) of two such arithmetic expressions. Returns None otherwise."""
+    body = _body(procedure)
+    if body is None:
+        return None
+    try:
+        return _compile_comparison(*body, input_is_float)
+    except _NotArithmetic:
+        return None
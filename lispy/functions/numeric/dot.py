@@ -0,0 +1,40 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import array_operation, check_array
+
+
+@lispy_function("dot")
+def dot(args: List[Any], env: Environment) -> Union[int, float]:
+    """Implementation of the (dot a b) LisPy function.
+    Returns the dot product of two numeric arrays of the same length.
+    Usage: (dot a b)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'dot' expects 2 arguments, got {len(args)}."
+        )
+    check_array(args[0], "dot", "First")
+    check_array(args[1], "dot", "Second")
+    return array_operation("dot", args[0].dot, args[1])
+
+
+@lispy_documentation("dot")
+def dot_documentation() -> str:
+    """Returns documentation for the dot function."""
+    return """Function: dot
+Arguments: (dot a b)
+Description: Returns the dot product (sum of elementwise products) of two numeric arrays.
+
+Examples:
+  (dot (int-array [1 2 3]) (int-array [4 5 6]))     ; => 32
+  (dot (double-array [0.5 1]) (int-array [2 3]))    ; => 4.0
+
+Notes:
+  - Both arrays must have the same length
+  - Equivalent to (vsum (v* a b)) without building the intermediate array
+
+See Also: v*, vsum"""
@@ -0,0 +1,38 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.numeric_array import NumericArray
+
+from .utils import build_array
+
+
+@lispy_function("double-array")
+def double_array(args: List[Any], env: Environment) -> NumericArray:
+    """Implementation of the (double-array size-or-collection) LisPy function.
+    Creates a typed array of 64-bit floats.
+    Usage: (double-array [1 2 3]) or (double-array 10)
+    """
+    return build_array(args, "double", "double-array")
+
+
+@lispy_documentation("double-array")
+def double_array_documentation() -> str:
+    """Returns documentation for the double-array function."""
+    return """Function: double-array
+Arguments: (double-array collection) or (double-array size)
+Description: Creates a typed array of 64-bit floating-point numbers for fast vectorized arithmetic.
+
+Examples:
+  (double-array [1 2.5 3])              ; => #<double-array [1.0 2.5 3.0]>
+  (double-array 3)                      ; => #<double-array [0.0 0.0 0.0]>
+  (vsum (double-array (lazy-range 5)))  ; => 10.0
+
+Notes:
+  - Collection may be a vector, list, lazy sequence, numeric array or nil
+  - Every element must be a number; integers are converted to floats
+  - Arrays are immutable; v+, v*, vmap and friends return new arrays
+  - Uses NumPy when it is installed, Python's array module otherwise
+  - to-vector converts an array back into a vector
+
+See Also: int-array, v+, v*, vsum, vmean, vmin, vmax, dot, vmap, to-vector"""
@@ -0,0 +1,36 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.numeric_array import NumericArray
+
+from .utils import build_array
+
+
+@lispy_function("int-array")
+def int_array(args: List[Any], env: Environment) -> NumericArray:
+    """Implementation of the (int-array size-or-collection) LisPy function.
+    Creates a typed array of 64-bit integers.
+    Usage: (int-array [1 2 3]) or (int-array 10)
+    """
+    return build_array(args, "int", "int-array")
+
+
+@lispy_documentation("int-array")
+def int_array_documentation() -> str:
+    """Returns documentation for the int-array function."""
+    return """Function: int-array
+Arguments: (int-array collection) or (int-array size)
+Description: Creates a typed array of 64-bit integers for fast vectorized arithmetic.
+
+Examples:
+  (int-array [1 2 3])                   ; => #<int-array [1 2 3]>
+  (int-array 2)                         ; => #<int-array [0 0]>
+  (vsum (int-array (range 0 100 1)))    ; => 4950
+
+Notes:
+  - Collection may be a vector, list, lazy sequence, numeric array or nil
+  - Every element must be an integer that fits in 64 bits
+  - Arithmetic with a double array or a float gives a double array
+
+See Also: double-array, v+, v*, vsum, dot, vmap, to-vector"""
@@ -0,0 +1,55 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+from lispy.numeric_array import NumericArray
+from lispy.persistent_vector import (EMPTY_VECTOR, PersistentVector,
+                                     persistent_vector)
+from lispy.types import LispyList, Vector
+
+
+@lispy_function("to-vector")
+def to_vector(args: List[Any], env: Environment) -> PersistentVector:
+    """Implementation of the (to-vector collection) LisPy function.
+    Converts a numeric array, list or lazy sequence into a vector.
+    Usage: (to-vector collection)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'to-vector' expects 1 argument, got {len(args)}."
+        )
+
+    source = args[0]
+    if isinstance(source, NumericArray):
+        return persistent_vector(source.to_list())
+    if source is None:
+        return EMPTY_VECTOR
+    if isinstance(source, (Vector, LispyList, LazySeq)):
+        return persistent_vector(source)
+    raise EvaluationError(
+        f"TypeError: 'to-vector' expects a numeric array, vector, list, lazy sequence, or nil, got {type(source)}."
+    )
+
+
+@lispy_documentation("to-vector")
+def to_vector_documentation() -> str:
+    """Returns documentation for the to-vector function."""
+    return """Function: to-vector
+Arguments: (to-vector collection)
+Description: Converts a numeric array, list or lazy sequence into a vector.
+
+Examples:
+  (to-vector (int-array [1 2 3]))       ; => [1 2 3]
+  (to-vector (v* (int-array [1 2]) 2))  ; => [2 4]
+  (to-vector '(1 2))                    ; => [1 2]
+  (to-vector (take (lazy-range) 3))     ; => [0 1 2]
+  (to-vector nil)                       ; => []
+
+Notes:
+  - A numeric array is copied into the vector in one native step
+  - A vector is returned as is
+  - A lazy sequence is fully realized
+
+See Also: double-array, int-array"""
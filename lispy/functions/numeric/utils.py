@@ -0,0 +1,74 @@
+"""
+Shared helpers for the LisPy numeric array functions.
+"""
+
+from numbers import Number
+from typing import Any
+
+from lispy.exceptions import EvaluationError
+from lispy.lazy_seq import LazySeq
+from lispy.numeric_array import NumericArray
+from lispy.types import LispyList, Vector
+
+
+def is_number(value: Any) -> bool:
+    """True for ints and floats, but not booleans."""
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+def check_array(value: Any, function_name: str, position: str) -> None:
+    """Raise a TypeError unless value is a numeric array."""
+    if not isinstance(value, NumericArray):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a numeric array, got {type(value)}."
+        )
+
+
+def build_array(args: list, kind: str, function_name: str) -> NumericArray:
+    """Build a numeric array of kind from a size or a collection of numbers."""
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: '{function_name}' expects 1 argument, got {len(args)}."
+        )
+
+    source = args[0]
+    if is_number(source) and isinstance(source, int):
+        if source < 0:
+            raise EvaluationError(
+                f"ValueError: Size passed to '{function_name}' must be non-negative, got {source}."
+            )
+        source = [0] * source
+    elif source is None:
+        source = ()
+    elif not isinstance(source, (Vector, LispyList, LazySeq, NumericArray)):
+        raise EvaluationError(
+            f"TypeError: '{function_name}' expects a size or a vector, list, lazy sequence, or numeric array, got {type(source)}."
+        )
+
+    try:
+        return NumericArray.from_values(source, kind)
+    except TypeError:
+        expected = "numbers" if kind == "double" else "integers"
+        raise EvaluationError(
+            f"TypeError: '{function_name}' expects a collection of {expected}."
+        )
+    except OverflowError:
+        raise EvaluationError(
+            f"OverflowError: Value passed to '{function_name}' does not fit in a 64-bit integer."
+        )
+
+
+def array_operation(function_name: str, operation, *operands) -> Any:
+    """Run a NumericArray operation, turning its Python errors into EvaluationErrors."""
+    try:
+        return operation(*operands)
+    except ValueError as e:
+        raise EvaluationError(f"ValueError: '{function_name}' failed: {e}.")
+    except OverflowError:
+        raise EvaluationError(
+            f"OverflowError: Result of '{function_name}' does not fit in a 64-bit integer."
+        )
+    except (ZeroDivisionError, FloatingPointError):
+        raise EvaluationError(
+            f"ZeroDivisionError: Division by zero in '{function_name}'."
+        )
@@ -0,0 +1,56 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.numeric_array import NumericArray
+
+from .utils import array_operation, check_array, is_number
+
+
+def elementwise(args: List[Any], env: Environment, name: str, method: str):
+    """Shared implementation of v+ and v*: array with array, or array with number."""
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: '{name}' expects 2 arguments, got {len(args)}."
+        )
+
+    left, right = args
+    if is_number(left):
+        # Both operations are commutative
+        left, right = right, left
+    check_array(left, name, "First")
+    if not isinstance(right, NumericArray) and not is_number(right):
+        raise EvaluationError(
+            f"TypeError: Second argument to '{name}' must be a numeric array or a number, got {type(right)}."
+        )
+    return array_operation(name, getattr(left, method), right)
+
+
+@lispy_function("v+")
+def vadd(args: List[Any], env: Environment) -> NumericArray:
+    """Implementation of the (v+ a b) LisPy function.
+    Adds two numeric arrays elementwise, or a number to every element.
+    Usage: (v+ array other)
+    """
+    return elementwise(args, env, "v+", "add")
+
+
+@lispy_documentation("v+")
+def vadd_documentation() -> str:
+    """Returns documentation for the v+ function."""
+    return """Function: v+
+Arguments: (v+ array other)
+Description: Adds two numeric arrays elementwise, or adds a number to every element.
+
+Examples:
+  (v+ (int-array [1 2 3]) (int-array [10 20 30]))   ; => #<int-array [11 22 33]>
+  (v+ (double-array [1 2]) 0.5)                     ; => #<double-array [1.5 2.5]>
+  (v+ 1 (int-array [1 2]))                          ; => #<int-array [2 3]>
+
+Notes:
+  - Both arrays must have the same length
+  - The result is a double array if either operand is a double array or a float
+  - The whole operation runs in one native loop
+
+See Also: v*, vsum, vmap"""
@@ -0,0 +1,68 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import check_procedure
+from lispy.numeric_array import NumericArray
+
+from .arithmetic import compile_arithmetic
+from .utils import array_operation, check_array, is_number
+
+
+@lispy_function("vmap")
+def vmap(args: List[Any], env: Environment) -> NumericArray:
+    """Implementation of the (vmap array fn) LisPy function.
+    Applies fn to every element of a numeric array. Simple arithmetic
+    functions are compiled and run vectorized.
+    Usage: (vmap array fn)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'vmap' expects 2 arguments, got {len(args)}."
+        )
+
+    array_arg, procedure = args
+    check_array(array_arg, "vmap", "First")
+    check_procedure(procedure, "vmap", "Second", 1)
+
+    compiled = compile_arithmetic(procedure, array_arg.kind == "double")
+    if compiled is not None:
+        function, is_float = compiled
+        kind = "double" if is_float else "int"
+        return array_operation("vmap", array_arg.map_vectorized, function, kind)
+
+    call = make_caller(procedure, env, arity=1)
+    results = [call(item) for item in array_arg]
+    for result in results:
+        if not is_number(result):
+            raise EvaluationError(
+                f"TypeError: Function passed to 'vmap' must return numbers, got {type(result)}."
+            )
+    kind = "double" if any(isinstance(result, float) for result in results) else "int"
+    return array_operation("vmap", NumericArray.from_values, results, kind)
+
+
+@lispy_documentation("vmap")
+def vmap_documentation() -> str:
+    """Returns documentation for the vmap function."""
+    return """Function: vmap
+Arguments: (vmap array function)
+Description: Applies function to every element of a numeric array and returns a new numeric array.
+
+Examples:
+  (vmap (int-array [1 2 3]) (fn [x] (+ (* x x) 1)))     ; => #<int-array [2 5 10]>
+  (vmap (int-array [1 2]) (fn [x] (/ x 2)))             ; => #<double-array [0.5 1.0]>
+  (define scale 10)
+  (vmap (double-array [1 2]) (fn [x] (* x scale)))      ; => #<double-array [10.0 20.0]>
+
+Notes:
+  - A function whose body is arithmetic (+ - * / abs) on its parameter, numbers
+    and numeric variables is compiled once and run without calling LisPy per
+    element; with NumPy installed it runs as whole-array operations
+  - Any other function is called once per element and must return numbers
+  - The result is a double array if any result is a float
+  - Division by zero raises an error in both cases
+
+See Also: v+, v*, map"""
@@ -0,0 +1,38 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import array_operation, check_array
+
+
+@lispy_function("vmax")
+def vmax(args: List[Any], env: Environment) -> Union[int, float]:
+    """Implementation of the (vmax array) LisPy function.
+    Returns the largest element of a numeric array.
+    Usage: (vmax array)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'vmax' expects 1 argument, got {len(args)}."
+        )
+    check_array(args[0], "vmax", "First")
+    return array_operation("vmax", args[0].max)
+
+
+@lispy_documentation("vmax")
+def vmax_documentation() -> str:
+    """Returns documentation for the vmax function."""
+    return """Function: vmax
+Arguments: (vmax array)
+Description: Returns the largest element of a numeric array.
+
+Examples:
+  (vmax (int-array [3 1 2]))              ; => 3
+  (vmax (double-array [2.5 -1]))          ; => 2.5
+
+Notes:
+  - Raises an error for an empty array
+
+See Also: vmin, vmean"""
@@ -0,0 +1,39 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import array_operation, check_array
+
+
+@lispy_function("vmean")
+def vmean(args: List[Any], env: Environment) -> float:
+    """Implementation of the (vmean array) LisPy function.
+    Returns the arithmetic mean of a numeric array.
+    Usage: (vmean array)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'vmean' expects 1 argument, got {len(args)}."
+        )
+    check_array(args[0], "vmean", "First")
+    return array_operation("vmean", args[0].mean)
+
+
+@lispy_documentation("vmean")
+def vmean_documentation() -> str:
+    """Returns documentation for the vmean function."""
+    return """Function: vmean
+Arguments: (vmean array)
+Description: Returns the arithmetic mean of the elements of a numeric array.
+
+Examples:
+  (vmean (int-array [1 2 3 4]))           ; => 2.5
+  (vmean (double-array [2 4]))            ; => 3.0
+
+Notes:
+  - Always returns a float
+  - Raises an error for an empty array
+
+See Also: vsum, vmin, vmax"""
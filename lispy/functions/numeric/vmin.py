@@ -0,0 +1,38 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import array_operation, check_array
+
+
+@lispy_function("vmin")
+def vmin(args: List[Any], env: Environment) -> Union[int, float]:
+    """Implementation of the (vmin array) LisPy function.
+    Returns the smallest element of a numeric array.
+    Usage: (vmin array)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'vmin' expects 1 argument, got {len(args)}."
+        )
+    check_array(args[0], "vmin", "First")
+    return array_operation("vmin", args[0].min)
+
+
+@lispy_documentation("vmin")
+def vmin_documentation() -> str:
+    """Returns documentation for the vmin function."""
+    return """Function: vmin
+Arguments: (vmin array)
+Description: Returns the smallest element of a numeric array.
+
+Examples:
+  (vmin (int-array [3 1 2]))              ; => 1
+  (vmin (double-array [2.5 -1]))          ; => -1.0
+
+Notes:
+  - Raises an error for an empty array
+
+See Also: vmax, vmean"""
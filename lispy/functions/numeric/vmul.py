@@ -0,0 +1,34 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.numeric_array import NumericArray
+
+from .vadd import elementwise
+
+
+@lispy_function("v*")
+def vmul(args: List[Any], env: Environment) -> NumericArray:
+    """Implementation of the (v* a b) LisPy function.
+    Multiplies two numeric arrays elementwise, or every element by a number.
+    Usage: (v* array other)
+    """
+    return elementwise(args, env, "v*", "multiply")
+
+
+@lispy_documentation("v*")
+def vmul_documentation() -> str:
+    """Returns documentation for the v* function."""
+    return """Function: v*
+Arguments: (v* array other)
+Description: Multiplies two numeric arrays elementwise, or multiplies every element by a number.
+
+Examples:
+  (v* (int-array [1 2 3]) (int-array [4 5 6]))      ; => #<int-array [4 10 18]>
+  (v* (double-array [1 2]) 10)                      ; => #<double-array [10.0 20.0]>
+
+Notes:
+  - Both arrays must have the same length
+  - The result is a double array if either operand is a double array or a float
+
+See Also: v+, dot, vmap"""
@@ -0,0 +1,40 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import array_operation, check_array
+
+
+@lispy_function("vsum")
+def vsum(args: List[Any], env: Environment) -> Union[int, float]:
+    """Implementation of the (vsum array) LisPy function.
+    Returns the sum of the elements of a numeric array.
+    Usage: (vsum array)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'vsum' expects 1 argument, got {len(args)}."
+        )
+    check_array(args[0], "vsum", "First")
+    return array_operation("vsum", args[0].sum)
+
+
+@lispy_documentation("vsum")
+def vsum_documentation() -> str:
+    """Returns documentation for the vsum function."""
+    return """Function: vsum
+Arguments: (vsum array)
+Description: Returns the sum of the elements of a numeric array in a single native loop.
+
+Examples:
+  (vsum (int-array [1 2 3]))              ; => 6
+  (vsum (double-array [0.5 0.25]))       ; => 0.75
+  (vsum (int-array []))                   ; => 0
+
+Notes:
+  - An int array sums to an integer, a double array to a float
+  - Much faster than (reduce vec + 0) on large data
+
+See Also: vmean, dot"""
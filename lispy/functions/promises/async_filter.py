@@ -1,6 +1,7 @@
 import threading
 
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise, List, Vector
@@ -37,6 +38,12 @@ def async_filter(args, env):
             "TypeError: 'async-filter' expects a function as second argument."
         )
 
+    if is_user_defined_fn and len(predicate.params) != 1:
+        raise EvaluationError(
+            f"ArityError: Function passed to 'async-filter' expects 1 argument, got {len(predicate.params)}."
+        )
+    call = make_caller(predicate, env, arity=1)
+
     # Handle empty collection
     if len(collection) == 0:
         promise = LispyPromise()
@@ -51,28 +58,7 @@ def async_filter(args, env):
         all_sync = True  # Track if all results are synchronous
 
         for element in collection:
-            # Call the predicate function
-            if is_user_defined_fn:
-                # User-defined function - need to handle environment and parameters
-                from lispy.environment import Environment
-                from lispy.evaluator import evaluate
-
-                if len(predicate.params) != 1:
-                    raise EvaluationError(
-                        f"ArityError: Function passed to 'async-filter' expects 1 argument, got {len(predicate.params)}."
-                    )
-
-                param_symbol = predicate.params[0]
-                call_env = Environment(outer=predicate.defining_env)
-                call_env.define(param_symbol.name, element)
-
-                # Execute function body
-                result = None
-                for expr_in_body in predicate.body:
-                    result = evaluate(expr_in_body, call_env)
-            else:
-                # Built-in function
-                result = predicate([element], env)
+            result = call(element)
 
             # Check if result is a promise
             if isinstance(result, LispyPromise):
@@ -14,6 +14,7 @@ Usage: (async-map collection callback)
 import threading
 
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise, List, Vector
@@ -44,6 +45,12 @@ def async_map(args, env):
             "TypeError: 'async-map' expects a function as second argument."
         )
 
+    if is_user_defined_fn and len(callback.params) != 1:
+        raise EvaluationError(
+            f"ArityError: Function passed to 'async-map' expects 1 argument, got {len(callback.params)}."
+        )
+    call = make_caller(callback, env, arity=1)
+
     # Handle empty collection
     if len(collection) == 0:
         promise = LispyPromise()
@@ -58,28 +65,7 @@ def async_map(args, env):
         all_sync = True  # Track if all results are synchronous
 
         for element in collection:
-            # Call the callback function
-            if is_user_defined_fn:
-                # User-defined function - need to handle environment and parameters
-                from lispy.environment import Environment
-                from lispy.evaluator import evaluate
-
-                if len(callback.params) != 1:
-                    raise EvaluationError(
-                        f"ArityError: Function passed to 'async-map' expects 1 argument, got {len(callback.params)}."
-                    )
-
-                param_symbol = callback.params[0]
-                call_env = Environment(outer=callback.defining_env)
-                call_env.define(param_symbol.name, element)
-
-                # Execute function body
-                result = None
-                for expr_in_body in callback.body:
-                    result = evaluate(expr_in_body, call_env)
-            else:
-                # Built-in function
-                result = callback([element], env)
+            result = call(element)
 
             # Check if result is a promise
             if isinstance(result, LispyPromise):
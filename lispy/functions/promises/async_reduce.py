@@ -13,6 +13,7 @@ Usage: (async-reduce collection reducer initial-value)
 import threading
 
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise, List, Vector
@@ -55,6 +56,8 @@ def async_reduce(args, env):
             f"ArityError: Function passed to 'async-reduce' expects 2 arguments, got {len(reducer.params)}."
         )
 
+    call = make_caller(reducer, env, arity=2)
+
     # Handle empty collection - return initial value immediately
     if len(collection) == 0:
         promise = LispyPromise()
@@ -71,24 +74,7 @@ def async_reduce(args, env):
 
             for element in collection:
                 # Call the reducer function with accumulator and current element
-                if is_user_defined_fn:
-                    # User-defined function - need to handle environment and parameters
-                    from lispy.environment import Environment
-                    from lispy.evaluator import evaluate
-
-                    acc_param = reducer.params[0]
-                    curr_param = reducer.params[1]
-                    call_env = Environment(outer=reducer.defining_env)
-                    call_env.define(acc_param.name, accumulator)
-                    call_env.define(curr_param.name, element)
-
-                    # Execute function body
-                    result = None
-                    for expr_in_body in reducer.body:
-                        result = evaluate(expr_in_body, call_env)
-                else:
-                    # Built-in function
-                    result = reducer([accumulator, element], env)
+                result = call(accumulator, element)
 
                 # Handle async result
                 if isinstance(result, LispyPromise):
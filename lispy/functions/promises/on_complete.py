@@ -1,4 +1,5 @@
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError, PromiseError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise
@@ -33,27 +34,11 @@ def on_complete(args, env):
                 f"TypeError: 'on-complete' callback must take exactly 1 argument, got {len(cleanup_callback.params)}."
             )
 
-    # Create wrapper function that handles LisPy function calls
+    # The cleanup callback is called with the original promise
+    call_cleanup = make_caller(cleanup_callback, env, arity=1)
+
     def lispy_cleanup_callback():
-        if isinstance(cleanup_callback, Function):
-            # User-defined LisPy function
-            from lispy.environment import Environment
-            from lispy.evaluator import evaluate
-
-            # Create environment for function call
-            call_env = Environment(outer=cleanup_callback.defining_env)
-
-            # Bind the parameter (already validated to be exactly one parameter)
-            call_env.define(cleanup_callback.params[0].name, promise)
-
-            # Execute function body
-            result = None
-            for expr in cleanup_callback.body:
-                result = evaluate(expr, call_env)
-            return result
-        else:
-            # Built-in function - call with promise as argument
-            return cleanup_callback([promise], env)
+        return call_cleanup(promise)
 
     # Create a new promise that mimics the original but adds cleanup
     new_promise = LispyPromise()
@@ -74,7 +59,7 @@ def on_complete(args, env):
 
     # Register our completion handler
     if promise.state == "pending":
-        promise.callbacks.append(handle_completion)
+        promise.add_callback(handle_completion)
     else:
         # Promise already settled, execute immediately
         handle_completion()
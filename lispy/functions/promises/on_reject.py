@@ -1,4 +1,5 @@
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise
@@ -33,28 +34,8 @@ def on_reject(args, env):
                 f"TypeError: 'on-reject' callback must take exactly 1 argument, got {len(error_callback.params)}."
             )
 
-    # Create wrapper function that handles LisPy function calls
-    def lispy_error_callback(error):
-        if isinstance(error_callback, Function):
-            # User-defined LisPy function
-            from lispy.environment import Environment
-            from lispy.evaluator import evaluate
-
-            # Create environment for function call
-            call_env = Environment(outer=error_callback.defining_env)
-
-            # Bind the parameter (already validated to be exactly one parameter)
-
-            call_env.define(error_callback.params[0].name, error)
-
-            # Execute function body
-            result = None
-            for expr in error_callback.body:
-                result = evaluate(expr, call_env)
-            return result
-        else:
-            # Built-in function
-            return error_callback([error], env)
+    # Call the callback through a caller built once for every rejection
+    lispy_error_callback = make_caller(error_callback, env, arity=1)
 
     # Use the promise's catch method with our wrapper
     return promise.catch(lispy_error_callback)
@@ -2,7 +2,7 @@ from typing import Any, List
 
 from lispy.closure import Function
 from lispy.environment import Environment
-from lispy.evaluator import evaluate
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise
@@ -40,20 +40,7 @@ def promise(args: List[Any], env: Environment) -> LispyPromise:
         )
 
     # Create a promise that executes the thunk
-    def executor():
-        if is_user_defined_fn:
-            # Call user-defined function
-            call_env = Environment(outer=thunk.defining_env)
-            # No parameters to bind since it's a zero-argument function
-
-            # Execute the function body
-            result = None
-            for expr_in_body in thunk.body:
-                result = evaluate(expr_in_body, call_env)
-            return result
-        else:
-            # Call built-in function
-            return thunk([], env)
+    executor = make_caller(thunk, env, arity=0)
 
     return LispyPromise(executor)
 
@@ -2,8 +2,7 @@ import threading
 import time
 
 from lispy.closure import Function
-from lispy.environment import Environment
-from lispy.evaluator import evaluate
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise
@@ -90,21 +89,7 @@ def retry(args, env):
     # Create promise for the retry operation
     retry_promise = LispyPromise()
 
-    def execute_operation():
-        """Execute the operation and return result or raise exception."""
-        if is_user_defined_fn:
-            # Call user-defined function
-            call_env = Environment(outer=operation.defining_env)
-            # No parameters to bind since it's a zero-argument function
-
-            # Execute the function body
-            result = None
-            for expr in operation.body:
-                result = evaluate(expr, call_env)
-            return result
-        else:
-            # Call built-in function
-            return operation([], env)
+    execute_operation = make_caller(operation, env, arity=0)
 
     def retry_loop():
         """Main retry logic running in background thread."""
@@ -1,4 +1,5 @@
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 from lispy.types import LispyPromise
@@ -58,28 +59,8 @@ def promise_then(args, env):
                 f"TypeError: 'promise-then' callback must take exactly 1 argument, got {len(callback.params)}."
             )
 
-    # Create wrapper function that handles LisPy function calls
-    def lispy_callback(value):
-        if isinstance(callback, Function):
-            # User-defined LisPy function
-            from lispy.environment import Environment
-            from lispy.evaluator import evaluate
-
-            # Create environment for function call
-            call_env = Environment(outer=callback.defining_env)
-
-            # Bind the parameter (already validated to be exactly one parameter)
-
-            call_env.define(callback.params[0].name, value)
-
-            # Execute function body
-            result = None
-            for expr in callback.body:
-                result = evaluate(expr, call_env)
-            return result
-        else:
-            # Built-in function
-            return callback([value], env)
+    # Call the callback through a caller built once for every resolution
+    lispy_callback = make_caller(callback, env, arity=1)
 
     # Use the promise's then method with our wrapper
     return promise.then(lispy_callback)
@@ -2,6 +2,7 @@ import threading
 import time
 
 from lispy.closure import Function
+from lispy.evaluator import make_caller
 from lispy.exceptions import EvaluationError, PromiseError
 from lispy.functions.decorators import lispy_documentation, lispy_function
 
@@ -41,8 +42,6 @@ def throttle(args, env):
     rate = args[1]
 
     # Validate function argument
-    from lispy.evaluator import evaluate
-
     is_user_defined_fn = isinstance(fn, Function)
     is_builtin_fn = callable(fn) and not is_user_defined_fn
 
@@ -62,6 +61,8 @@ def throttle(args, env):
             f"ValueError: 'throttle' rate must be non-negative, got {rate}."
         )
 
+    call = make_caller(fn, env)
+
     # State for the throttled function
     state = {"last_execution_time": 0, "lock": threading.Lock()}
 
@@ -79,31 +80,11 @@ def throttle(args, env):
 
                 # Execute the original function
                 try:
-                    if is_user_defined_fn:
-                        # Call user-defined function
-                        from lispy.environment import Environment
-
-                        # Validate argument count
-                        if len(inner_args) != len(fn.params):
-                            raise PromiseError(
-                                f"Throttled function expects {len(fn.params)} arguments, got {len(inner_args)}."
-                            )
-
-                        # Create new environment for function execution using the function's defining environment
-                        call_env = Environment(outer=fn.defining_env)
-
-                        # Bind parameters to arguments
-                        for param, arg in zip(fn.params, inner_args):
-                            call_env.define(param.name, arg)
-
-                        # Execute function body
-                        result = None
-                        for expr in fn.body:
-                            result = evaluate(expr, call_env)
-                        return result
-                    else:
-                        # Call built-in function
-                        return fn(inner_args, inner_env)
+                    if is_user_defined_fn and len(inner_args) != len(fn.params):
+                        raise PromiseError(
+                            f"Throttled function expects {len(fn.params)} arguments, got {len(inner_args)}."
+                        )
+                    return call(*inner_args)
                 except Exception as e:
                     # Re-raise as PromiseError to maintain error context
                     raise PromiseError(f"Throttled function execution failed: {e}")
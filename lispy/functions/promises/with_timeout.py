@@ -89,14 +89,14 @@ def with_timeout(args, env):
 
     # Set up handlers for both promises
     if promise.state == "pending":
-        promise.callbacks.append(handle_original_resolution)
+        promise.add_callback(handle_original_resolution)
     else:
         # Promise already settled
         handle_original_resolution()
         return result_promise
 
     if timeout_promise.state == "pending":
-        timeout_promise.callbacks.append(handle_timeout_resolution)
+        timeout_promise.add_callback(handle_timeout_resolution)
     else:
         # Timeout already occurred (shouldn't happen with our implementation)
         handle_timeout_resolution()
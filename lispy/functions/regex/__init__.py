@@ -0,0 +1,25 @@
+"""LisPy Regex Functions - Regular expressions with a shared compiled-pattern cache"""
+
+from .re_find import re_find, re_find_documentation
+from .re_matches import re_matches, re_matches_documentation
+from .re_pattern import re_pattern, re_pattern_documentation
+from .re_replace import re_replace, re_replace_documentation
+from .re_seq import re_seq, re_seq_documentation
+from .re_split import re_split, re_split_documentation
+
+__all__ = [
+    # Functions
+    "re_find",
+    "re_matches",
+    "re_pattern",
+    "re_replace",
+    "re_seq",
+    "re_split",
+    # Documentation
+    "re_find_documentation",
+    "re_matches_documentation",
+    "re_pattern_documentation",
+    "re_replace_documentation",
+    "re_seq_documentation",
+    "re_split_documentation",
+]
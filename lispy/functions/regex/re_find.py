@@ -0,0 +1,43 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.string.utils import check_string
+
+from .utils import compile_pattern, match_value
+
+
+@lispy_function("re-find")
+def re_find(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (re-find string pattern) LisPy function.
+    Returns the first match of pattern anywhere in string, or nil.
+    Usage: (re-find "took 35ms" "\\\\d+")
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 're-find' expects 2 arguments, got {len(args)}."
+        )
+    string = check_string(args[0], "re-find", "First")
+    match = compile_pattern(args[1], "re-find", "Second").search(string)
+    return None if match is None else match_value(match)
+
+
+@lispy_documentation("re-find")
+def re_find_documentation() -> str:
+    """Returns documentation for the re-find function."""
+    return """Function: re-find
+Arguments: (re-find string pattern)
+Description: Returns the first match of pattern anywhere in string, or nil if there is none.
+
+Examples:
+  (re-find "took 35ms" "\\\\d+")                ; => "35"
+  (re-find "took 35ms" "(\\\\d+)(ms|s)")        ; => ["35ms" "35" "ms"]
+  (re-find "no digits" "\\\\d+")                ; => nil
+
+Notes:
+  - pattern is a string or a pattern from re-pattern
+  - Without groups the match is the matched text; with groups it is a vector
+    of the matched text followed by each group (nil if a group did not match)
+
+See Also: re-matches, re-seq, re-pattern"""
@@ -0,0 +1,43 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.string.utils import check_string
+
+from .utils import compile_pattern, match_value
+
+
+@lispy_function("re-matches")
+def re_matches(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (re-matches string pattern) LisPy function.
+    Returns the match of pattern against the whole of string, or nil.
+    Usage: (re-matches "2024-01-31" "(\\\\d+)-(\\\\d+)-(\\\\d+)")
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 're-matches' expects 2 arguments, got {len(args)}."
+        )
+    string = check_string(args[0], "re-matches", "First")
+    match = compile_pattern(args[1], "re-matches", "Second").fullmatch(string)
+    return None if match is None else match_value(match)
+
+
+@lispy_documentation("re-matches")
+def re_matches_documentation() -> str:
+    """Returns documentation for the re-matches function."""
+    return """Function: re-matches
+Arguments: (re-matches string pattern)
+Description: Returns the match of pattern against the whole of string, or nil if pattern does not match all of it.
+
+Examples:
+  (re-matches "2024" "\\\\d+")                         ; => "2024"
+  (re-matches "2024-01" "\\\\d+")                      ; => nil
+  (re-matches "2024-01-31" "(\\\\d+)-(\\\\d+)-(\\\\d+)")  ; => ["2024-01-31" "2024" "01" "31"]
+
+Notes:
+  - pattern is a string or a pattern from re-pattern
+  - Matches are returned as in re-find
+  - Use re-find to match anywhere in string
+
+See Also: re-find, re-seq, re-pattern"""
@@ -0,0 +1,44 @@
+import re
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import compile_pattern
+
+
+@lispy_function("re-pattern")
+def re_pattern(args: List[Any], env: Environment) -> re.Pattern:
+    """Implementation of the (re-pattern source) LisPy function.
+    Compiles a regular expression once, for reuse by the other regex functions.
+    Usage: (re-pattern "\\\\d+")
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 're-pattern' expects 1 argument, got {len(args)}."
+        )
+    return compile_pattern(args[0], "re-pattern", "First")
+
+
+@lispy_documentation("re-pattern")
+def re_pattern_documentation() -> str:
+    """Returns documentation for the re-pattern function."""
+    return """Function: re-pattern
+Arguments: (re-pattern source)
+Description: Compiles the regular expression source into a pattern that re-find, re-matches, re-seq, re-replace and re-split accept in place of a string.
+
+Examples:
+  (define status-line (re-pattern "^(\\\\S+) (\\\\d{3})$"))
+  (re-matches "GET 200" status-line)      ; => ["GET 200" "GET" "200"]
+  (re-pattern "[a-z")                     ; => ValueError: Invalid regular expression
+
+Notes:
+  - Uses Python regular expression syntax; backslashes are doubled inside
+    LisPy strings, so the regex \\d is written "\\\\d"
+  - Given a pattern, returns it unchanged
+  - The regex functions also accept pattern strings, compiling each distinct
+    string once through a shared LRU cache of recent patterns; re-pattern
+    skips even the cache lookup and keeps the pattern alive for good
+
+See Also: re-find, re-matches, re-seq, re-replace, re-split"""
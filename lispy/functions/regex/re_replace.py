@@ -0,0 +1,71 @@
+import re
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import check_procedure
+from lispy.functions.string.utils import check_string
+
+from .utils import compile_pattern, match_value
+
+
+@lispy_function("re-replace")
+def re_replace(args: List[Any], env: Environment) -> str:
+    """Implementation of the (re-replace string pattern replacement) LisPy function.
+    Replaces every match of pattern in string with a template string or the
+    result of calling a function on the match.
+    Usage: (re-replace "a1b2" "\\\\d" "#") or (re-replace s "\\\\d+" (fn [m] ...))
+    """
+    if len(args) != 3:
+        raise EvaluationError(
+            f"SyntaxError: 're-replace' expects 3 arguments, got {len(args)}."
+        )
+    string = check_string(args[0], "re-replace", "First")
+    pattern = compile_pattern(args[1], "re-replace", "Second")
+    replacement = args[2]
+
+    if isinstance(replacement, str):
+        try:
+            return pattern.sub(replacement, string)
+        except re.error as error:
+            raise EvaluationError(
+                f"ValueError: Invalid replacement {replacement!r} in 're-replace': {error}."
+            )
+
+    check_procedure(replacement, "re-replace", "Third", 1)
+    call = make_caller(replacement, env, arity=1)
+
+    def substitute(match: re.Match) -> str:
+        result = call(match_value(match))
+        if not isinstance(result, str):
+            raise EvaluationError(
+                f"TypeError: Replacement function in 're-replace' must return a string, got {type(result)}."
+            )
+        return result
+
+    return pattern.sub(substitute, string)
+
+
+@lispy_documentation("re-replace")
+def re_replace_documentation() -> str:
+    """Returns documentation for the re-replace function."""
+    return """Function: re-replace
+Arguments: (re-replace string pattern replacement)
+Description: Returns string with every match of pattern replaced, either by a template string or by the result of calling a function on the match.
+
+Examples:
+  (re-replace "a1b22" "\\\\d+" "#")                    ; => "a#b#"
+  (re-replace "2024-01-31" "(\\\\d+)-(\\\\d+)-(\\\\d+)" "\\\\3/\\\\2/\\\\1")
+  ; => "31/01/2024"
+  (re-replace "a1b22" "\\\\d+" (fn [m] (to-str (* 2 (to-int m)))))
+  ; => "a2b44"
+
+Notes:
+  - pattern is a string or a pattern from re-pattern
+  - In a template, \\\\1 (written "\\\\\\\\1") inserts group 1 and \\\\g<name> a named group
+  - A replacement function receives each match as in re-find and must
+    return a string
+
+See Also: re-find, re-seq, re-split, re-pattern"""
@@ -0,0 +1,46 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.string.utils import check_string
+from lispy.lazy_seq import LazySeq
+
+from .utils import compile_pattern, match_value
+
+
+@lispy_function("re-seq")
+def re_seq(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (re-seq string pattern) LisPy function.
+    Returns a lazy sequence of the successive matches of pattern in string.
+    Usage: (re-seq "a1 b22 c333" "\\\\d+")
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 're-seq' expects 2 arguments, got {len(args)}."
+        )
+    string = check_string(args[0], "re-seq", "First")
+    pattern = compile_pattern(args[1], "re-seq", "Second")
+    return LazySeq(lambda: map(match_value, pattern.finditer(string)))
+
+
+@lispy_documentation("re-seq")
+def re_seq_documentation() -> str:
+    """Returns documentation for the re-seq function."""
+    return """Function: re-seq
+Arguments: (re-seq string pattern)
+Description: Returns a lazy sequence of the successive non-overlapping matches of pattern in string.
+
+Examples:
+  (re-seq "a1 b22 c333" "\\\\d+")           ; => ("1" "22" "333")
+  (re-seq "a=1 b=2" "(\\\\w)=(\\\\d)")       ; => (["a=1" "a" "1"] ["b=2" "b" "2"])
+  (first (re-seq big-log "ERROR .*"))      ; scans only up to the first chunk of matches
+  (re-seq "abc" "\\\\d")                    ; => ()
+
+Notes:
+  - pattern is a string or a pattern from re-pattern
+  - Matches are returned as in re-find
+  - The string is scanned as the sequence is consumed, a chunk of matches
+    at a time, so take and first stop scanning early
+
+See Also: re-find, re-split, re-pattern"""
@@ -0,0 +1,44 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.string.utils import check_string
+from lispy.persistent_vector import PersistentVector
+
+from .utils import compile_pattern
+
+
+@lispy_function("re-split")
+def re_split(args: List[Any], env: Environment) -> PersistentVector:
+    """Implementation of the (re-split string pattern) LisPy function.
+    Splits string around the matches of pattern.
+    Usage: (re-split "a, b,c" ",\\\\s*")
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 're-split' expects 2 arguments, got {len(args)}."
+        )
+    string = check_string(args[0], "re-split", "First")
+    pattern = compile_pattern(args[1], "re-split", "Second")
+    return PersistentVector(pattern.split(string))
+
+
+@lispy_documentation("re-split")
+def re_split_documentation() -> str:
+    """Returns documentation for the re-split function."""
+    return """Function: re-split
+Arguments: (re-split string pattern)
+Description: Splits string around the matches of pattern and returns a vector of the pieces.
+
+Examples:
+  (re-split "a, b,c" ",\\\\s*")              ; => ["a" "b" "c"]
+  (re-split "GET  /index   200" "\\\\s+")     ; => ["GET" "/index" "200"]
+  (re-split "1+2-3" "([+-])")               ; => ["1" "+" "2" "-" "3"]
+
+Notes:
+  - pattern is a string or a pattern from re-pattern
+  - Groups in pattern are kept in the result between the pieces
+  - Like split, a string with no match gives a vector of the whole string
+
+See Also: split, re-seq, re-replace, re-pattern"""
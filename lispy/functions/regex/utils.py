@@ -0,0 +1,54 @@
+"""
+Shared helpers for the LisPy regex functions.
+
+Patterns given as strings are compiled through a bounded LRU cache keyed by
+the pattern string, so a handler that calls (re-find line "...") on every
+request compiles each distinct pattern once. re-pattern returns the compiled
+pattern itself, which every regex function also accepts.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from lispy.exceptions import EvaluationError
+from lispy.persistent_vector import PersistentVector
+
+PATTERN_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile(source: str) -> re.Pattern:
+    return re.compile(source)
+
+
+def compile_pattern(pattern: Any, function_name: str, position: str) -> re.Pattern:
+    """Return the compiled form of a pattern string or compiled pattern.
+
+    Raises a TypeError for anything else and a ValueError for an invalid
+    regular expression.
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    if not isinstance(pattern, str):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a string or pattern, got {type(pattern)}."
+        )
+    try:
+        return _compile(pattern)
+    except re.error as error:
+        raise EvaluationError(
+            f"ValueError: Invalid regular expression {pattern!r} in '{function_name}': {error}."
+        )
+
+
+def match_value(match: re.Match) -> Any:
+    """Return the LisPy value of a match.
+
+    That is the matched text for a pattern without groups, otherwise a vector
+    of the matched text followed by each group (nil for a group that did not
+    take part in the match).
+    """
+    if match.re.groups == 0:
+        return match.group(0)
+    return PersistentVector([match.group(0), *match.groups()])
@@ -0,0 +1,25 @@
+"""LisPy Sequence Functions - Lazy, chunk-realized sequences"""
+
+from .drop import drop, drop_documentation
+from .iterate import iterate, iterate_documentation
+from .lazy_range import lazy_range, lazy_range_documentation
+from .repeat import repeat, repeat_documentation
+from .take import take, take_documentation
+from .take_while import take_while, take_while_documentation
+
+__all__ = [
+    # Functions
+    "drop",
+    "iterate",
+    "lazy_range",
+    "repeat",
+    "take",
+    "take_while",
+    # Documentation
+    "drop_documentation",
+    "iterate_documentation",
+    "lazy_range_documentation",
+    "repeat_documentation",
+    "take_documentation",
+    "take_while_documentation",
+]
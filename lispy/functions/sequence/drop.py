@@ -0,0 +1,52 @@
+from itertools import islice
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import EMPTY_SEQ, LazySeq, lazy_seq
+
+from .utils import check_sequence
+
+
+@lispy_function("drop")
+def drop(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (drop collection n) LisPy function.
+    Returns a lazy sequence of all but the first n items of collection.
+    Usage: (drop collection n)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'drop' expects 2 arguments, got {len(args)}."
+        )
+
+    collection, count = args
+    check_sequence(collection, "drop", "First")
+    if not isinstance(count, int) or isinstance(count, bool):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'drop' must be an integer, got {type(count)}."
+        )
+
+    if collection is None:
+        return EMPTY_SEQ
+    if count <= 0:
+        return lazy_seq(collection)
+    return LazySeq(lambda: islice(collection, count, None))
+
+
+@lispy_documentation("drop")
+def drop_documentation() -> str:
+    """Returns documentation for the drop function."""
+    return """Function: drop
+Arguments: (drop collection n)
+Description: Returns a lazy sequence of all but the first n items of collection.
+
+Examples:
+  (drop [1 2 3 4 5] 2)                     ; => (3 4 5)
+  (take (drop (lazy-range) 10) 3)          ; => (10 11 12)
+  (drop [1 2] 5)                           ; => ()
+
+Notes:
+  - Works on lazy sequences, vectors, lists and nil
+  - Items are skipped only when the result is first consumed
+  - A count of 0 or less returns the whole collection as a sequence"""
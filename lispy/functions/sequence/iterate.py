@@ -0,0 +1,51 @@
+from typing import Any, Iterator, List
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+from .utils import check_procedure
+
+
+@lispy_function("iterate")
+def iterate(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (iterate f x) LisPy function.
+    Returns the infinite lazy sequence x, (f x), (f (f x)), ...
+    Usage: (iterate function initial-value)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'iterate' expects 2 arguments, got {len(args)}."
+        )
+
+    procedure, initial = args
+    check_procedure(procedure, "iterate", "First", 1)
+    call = make_caller(procedure, env, arity=1)
+
+    def values() -> Iterator[Any]:
+        value = initial
+        while True:
+            yield value
+            value = call(value)
+
+    return LazySeq.from_iterable(values())
+
+
+@lispy_documentation("iterate")
+def iterate_documentation() -> str:
+    """Returns documentation for the iterate function."""
+    return """Function: iterate
+Arguments: (iterate function initial-value)
+Description: Returns the infinite lazy sequence initial-value, (f initial-value), (f (f initial-value)), ...
+
+Examples:
+  (take (iterate (fn [x] (* x 2)) 1) 5)    ; => (1 2 4 8 16)
+  (first (drop (iterate (fn [x] (+ x 3)) 0) 4))  ; => 12
+
+Notes:
+  - Function must take exactly 1 argument
+  - The sequence is infinite; limit it with take or take-while
+  - Values are computed 32 at a time as the sequence is consumed
+  - Function should be free of side effects"""
@@ -0,0 +1,76 @@
+import itertools
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+
+@lispy_function("lazy-range")
+def lazy_range(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (lazy-range ...) LisPy function.
+
+    Lazy counterpart of range: numbers are produced 32 at a time as the
+    sequence is consumed, and with no arguments the sequence is infinite.
+
+    Args:
+        args: 0-3 integer arguments:
+            - (lazy-range): 0, 1, 2, ... forever
+            - (lazy-range end): 0 to end-1
+            - (lazy-range start end): start to end-1
+            - (lazy-range start end step): start to end-1 with step
+        env: The current environment
+
+    Returns:
+        LazySeq: A lazy sequence of the numbers
+
+    Raises:
+        EvaluationError: If more than 3 arguments or invalid argument types
+    """
+    if len(args) > 3:
+        raise EvaluationError(
+            f"SyntaxError: 'lazy-range' expects 0-3 arguments, got {len(args)}."
+        )
+
+    for i, arg in enumerate(args):
+        if not isinstance(arg, int):
+            raise EvaluationError(
+                f"TypeError: Argument {i + 1} to 'lazy-range' must be an integer, got {type(arg).__name__}: '{arg}'"
+            )
+
+    if not args:
+        return LazySeq.from_iterable(itertools.count())
+    if len(args) == 1:
+        start, end, step = 0, args[0], 1
+    elif len(args) == 2:
+        start, end, step = args[0], args[1], 1
+    else:
+        start, end, step = args
+
+    if step == 0:
+        raise EvaluationError("ValueError: 'lazy-range' step argument must not be zero.")
+
+    return LazySeq.from_iterable(range(start, end, step))
+
+
+@lispy_documentation("lazy-range")
+def lazy_range_documentation() -> str:
+    """Returns documentation for the lazy-range function."""
+    return """Function: lazy-range
+Arguments: (lazy-range) or (lazy-range end) or (lazy-range start end) or (lazy-range start end step)
+Description: Returns a lazy sequence of numbers, realized 32 at a time as it is consumed.
+
+Examples:
+  (take (lazy-range) 3)                    ; => (0 1 2) (infinite sequence)
+  (lazy-range 5)                           ; => (0 1 2 3 4)
+  (lazy-range 2 8 2)                       ; => (2 4 6)
+  (first (filter (map (lazy-range 1000000) (fn [x] (* x x)))
+                 (fn [x] (> x 50))))       ; => 64 (computes one chunk only)
+
+Notes:
+  - Lazy counterpart of range, with the same argument rules
+  - With no arguments the sequence never ends; use take or take-while
+  - Nothing is computed until the sequence is consumed
+  - map and filter over a lazy sequence return lazy sequences
+  - first, rest, doseq and reduce consume lazy sequences directly"""
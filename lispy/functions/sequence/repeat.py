@@ -0,0 +1,45 @@
+import itertools
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+
+@lispy_function("repeat")
+def repeat(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (repeat [n] x) LisPy function.
+    Returns a lazy sequence of x, infinite or n items long.
+    Usage: (repeat x) or (repeat n x)
+    """
+    if len(args) == 1:
+        return LazySeq.from_iterable(itertools.repeat(args[0]))
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'repeat' expects 1 or 2 arguments, got {len(args)}."
+        )
+
+    times, value = args
+    if not isinstance(times, int) or isinstance(times, bool):
+        raise EvaluationError(
+            f"TypeError: First argument to 'repeat' must be an integer when 2 arguments are given, got {type(times)}."
+        )
+    return LazySeq.from_iterable(itertools.repeat(value, max(times, 0)))
+
+
+@lispy_documentation("repeat")
+def repeat_documentation() -> str:
+    """Returns documentation for the repeat function."""
+    return """Function: repeat
+Arguments: (repeat value) or (repeat n value)
+Description: Returns a lazy sequence that repeats value, forever or n times.
+
+Examples:
+  (repeat 3 "x")                ; => ("x" "x" "x")
+  (take (repeat 0) 4)           ; => (0 0 0 0)
+  (repeat 0 "x")                ; => ()
+
+Notes:
+  - With one argument the sequence is infinite; limit it with take
+  - A negative count gives an empty sequence"""
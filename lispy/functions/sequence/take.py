@@ -0,0 +1,60 @@
+from itertools import islice
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import EMPTY_SEQ, LazySeq
+from lispy.transducers import Transducer, taking
+
+from .utils import check_sequence
+
+
+@lispy_function("take")
+def take(args: List[Any], env: Environment) -> Union[LazySeq, Transducer]:
+    """Implementation of the (take collection n) LisPy function.
+    Returns a lazy sequence of the first n items of collection.
+    With only a count, (take n) returns a transducer.
+    Usage: (take collection n) or (take n)
+    """
+    if len(args) not in (1, 2):
+        raise EvaluationError(
+            f"SyntaxError: 'take' expects 1 or 2 arguments, got {len(args)}."
+        )
+
+    count = args[-1]
+    if not isinstance(count, int) or isinstance(count, bool):
+        position = "Second argument" if len(args) == 2 else "Argument"
+        raise EvaluationError(
+            f"TypeError: {position} to 'take' must be an integer, got {type(count)}."
+        )
+    if len(args) == 1:
+        return taking(count)
+
+    collection = args[0]
+    check_sequence(collection, "take", "First")
+
+    if collection is None or count <= 0:
+        return EMPTY_SEQ
+    return LazySeq(lambda: islice(collection, count))
+
+
+@lispy_documentation("take")
+def take_documentation() -> str:
+    """Returns documentation for the take function."""
+    return """Function: take
+Arguments: (take collection n) or (take n)
+Description: Returns a lazy sequence of the first n items of collection.
+With only a count, returns a transducer that stops after n items.
+
+Examples:
+  (take [1 2 3 4 5] 2)                     ; => (1 2)
+  (take (lazy-range) 3)                    ; => (0 1 2)
+  (take (iterate (fn [x] (* x 2)) 1) 4)    ; => (1 2 4 8)
+  (take [1 2] 10)                          ; => (1 2)
+  (into [] (take 2) (lazy-range))          ; => [0 1] (transducer)
+
+Notes:
+  - Works on lazy sequences, vectors, lists and nil
+  - Only the items taken are ever realized from the source
+  - A count of 0 or less gives an empty sequence"""
@@ -0,0 +1,53 @@
+from itertools import takewhile
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import EMPTY_SEQ, LazySeq
+
+from .utils import check_procedure, check_sequence, is_truthy
+
+
+@lispy_function("take-while")
+def take_while(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (take-while collection predicate) LisPy function.
+    Returns a lazy sequence of the leading items of collection for which
+    predicate is truthy.
+    Usage: (take-while collection predicate)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'take-while' expects 2 arguments, got {len(args)}."
+        )
+
+    collection, predicate = args
+    check_sequence(collection, "take-while", "First")
+    check_procedure(predicate, "take-while", "Second", 1)
+    call = make_caller(predicate, env, arity=1)
+
+    if collection is None:
+        return EMPTY_SEQ
+    return LazySeq(
+        lambda: takewhile(lambda item: is_truthy(call(item)), collection)
+    )
+
+
+@lispy_documentation("take-while")
+def take_while_documentation() -> str:
+    """Returns documentation for the take-while function."""
+    return """Function: take-while
+Arguments: (take-while collection predicate)
+Description: Returns a lazy sequence of the leading items for which predicate is truthy.
+
+Examples:
+  (take-while [1 2 3 10 4] (fn [x] (< x 5)))         ; => (1 2 3)
+  (take-while (lazy-range) (fn [x] (< x 4)))         ; => (0 1 2 3)
+  (take-while (iterate (fn [x] (* x 2)) 1)
+              (fn [x] (< x 100)))                    ; => (1 2 4 8 16 32 64)
+
+Notes:
+  - Stops at the first item for which predicate returns false or nil
+  - Works on lazy sequences (including infinite ones), vectors and lists
+  - Predicate must take exactly 1 argument"""
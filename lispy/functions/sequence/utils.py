@@ -0,0 +1,52 @@
+"""
+Shared helpers for the LisPy lazy sequence functions.
+"""
+
+from typing import Any, List
+
+from lispy.closure import Function
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.lazy_seq import LazySeq
+from lispy.types import LispyList, Vector
+
+SEQUENCE_TYPES = (LazySeq, Vector, LispyList)
+
+
+def check_sequence(collection: Any, function_name: str, position: str) -> None:
+    """Raise a TypeError unless collection is a lazy sequence, vector, list or nil."""
+    if collection is not None and not isinstance(collection, SEQUENCE_TYPES):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a lazy sequence, vector, list, or nil, got {type(collection)}."
+        )
+
+
+def check_procedure(
+    procedure: Any, function_name: str, position: str, arity: int
+) -> None:
+    """Raise unless procedure is a built-in or a user function taking arity arguments."""
+    if isinstance(procedure, Function):
+        if len(procedure.params) != arity:
+            plural = "argument" if arity == 1 else "arguments"
+            raise EvaluationError(
+                f"ArityError: Procedure {procedure!r} passed to '{function_name}' expects {arity} {plural}, got {len(procedure.params)}."
+            )
+    elif not callable(procedure):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a procedure, got {type(procedure)}."
+        )
+
+
+def call_procedure(procedure: Any, args: List[Any], env: Environment) -> Any:
+    """Call a user-defined Function or a built-in with already evaluated args.
+
+    For a procedure called once per item, build its caller once with
+    make_caller instead.
+    """
+    return make_caller(procedure, env)(*args)
+
+
+def is_truthy(value: Any) -> bool:
+    """LisPy truthiness: only false and nil are falsy."""
+    return value is not False and value is not None
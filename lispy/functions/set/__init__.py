@@ -0,0 +1,25 @@
+"""LisPy Set Functions - Hash sets and set algebra"""
+
+from .contains_q import contains_q, contains_q_documentation
+from .difference import difference, difference_documentation
+from .disj import disj, disj_documentation
+from .hash_set import hash_set, hash_set_documentation
+from .intersection import intersection, intersection_documentation
+from .union import union, union_documentation
+
+__all__ = [
+    # Functions
+    "contains_q",
+    "difference",
+    "disj",
+    "hash_set",
+    "intersection",
+    "union",
+    # Documentation
+    "contains_q_documentation",
+    "difference_documentation",
+    "disj_documentation",
+    "hash_set_documentation",
+    "intersection_documentation",
+    "union_documentation",
+]
@@ -0,0 +1,53 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import PersistentSet
+
+
+@lispy_function("contains?")
+def contains_q(args: List[Any], env: Environment) -> bool:
+    """Implementation of the (contains? collection item) LisPy function.
+    Tests set membership, or whether a map has a key.
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'contains?' expects 2 arguments, got {len(args)}."
+        )
+
+    collection, item = args
+    if collection is None:
+        return False
+    if not isinstance(collection, (PersistentSet, dict)):
+        raise EvaluationError(
+            f"TypeError: First argument to 'contains?' must be a set, map, or nil, got {type(collection)}."
+        )
+    try:
+        return item in collection
+    except TypeError:  # An unhashable item cannot be a member or key
+        return False
+
+
+@lispy_documentation("contains?")
+def contains_q_documentation() -> str:
+    """Returns documentation for the contains? function."""
+    return """Function: contains?
+Arguments: (contains? collection item)
+Description: Tests whether a set contains item, or whether a map has item as a key.
+
+Examples:
+  (contains? (hash-set 1 2 3) 2)        ; => true
+  (contains? (hash-set 1 2 3) 5)        ; => false
+  (contains? (hash-set [1 2]) [1 2])    ; => true (compared by value)
+  (contains? {:a 1} ':a)                ; => true
+  (contains? {:a nil} ':a)              ; => true (the key exists)
+  (contains? nil 1)                     ; => false
+
+Notes:
+  - First argument must be a set, map, or nil
+  - Lookups are hashed, so each test is O(1) on average instead of the
+    O(n) scan of some over a vector
+  - To test whether a vector holds a value, build a set once and test that
+
+See Also: hash-set, get, some"""
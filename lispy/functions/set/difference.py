@@ -0,0 +1,46 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import PersistentSet
+
+from .utils import check_set
+
+
+@lispy_function("difference")
+def difference(args: List[Any], env: Environment) -> PersistentSet:
+    """Implementation of the (difference set ...) LisPy function.
+    Returns the elements of the first set that are in none of the others.
+    """
+    if len(args) < 1:
+        raise EvaluationError(
+            f"SyntaxError: 'difference' expects at least 1 argument, got {len(args)}."
+        )
+
+    result = check_set(args[0], "difference", "First argument")
+    for position, value in enumerate(args[1:], 2):
+        result = result.difference(
+            check_set(value, "difference", f"Argument {position}")
+        )
+    return result
+
+
+@lispy_documentation("difference")
+def difference_documentation() -> str:
+    """Returns documentation for the difference function."""
+    return """Function: difference
+Arguments: (difference set1 set2 ...)
+Description: Returns the elements of set1 that are not in any of the other sets.
+
+Examples:
+  (difference (hash-set 1 2 3) (hash-set 2))            ; => #{1 3}
+  (difference (hash-set 1 2 3) (hash-set 1) (hash-set 3)) ; => #{2}
+  (difference (hash-set 1 2))                           ; => #{1 2}
+
+Notes:
+  - Requires at least one argument; arguments must be sets or nil
+  - Removing a few elements from a large set shares the rest of its
+    structure with the original
+
+See Also: union, intersection, disj"""
@@ -0,0 +1,45 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import PersistentSet
+
+from .utils import check_set, set_element
+
+
+@lispy_function("disj")
+def disj(args: List[Any], env: Environment) -> PersistentSet:
+    """Implementation of the (disj set item ...) LisPy function.
+    Returns a set without the given items.
+    """
+    if len(args) < 1:
+        raise EvaluationError(
+            f"SyntaxError: 'disj' expects at least 1 argument, got {len(args)}."
+        )
+
+    result = check_set(args[0], "disj", "First argument")
+    for item in args[1:]:
+        result = result.disj(set_element(item, "disj"))
+    return result
+
+
+@lispy_documentation("disj")
+def disj_documentation() -> str:
+    """Returns documentation for the disj function."""
+    return """Function: disj
+Arguments: (disj set item1 item2 ...)
+Description: Returns a set without the given items.
+
+Examples:
+  (disj (hash-set 1 2 3) 2)     ; => #{1 3}
+  (disj (hash-set 1 2 3) 1 3)   ; => #{2}
+  (disj (hash-set 1 2) 5)       ; => #{1 2} (missing items are ignored)
+  (disj nil 1)                  ; => #{}
+
+Notes:
+  - First argument must be a set or nil (the empty set)
+  - Each removal is O(log32 n) and shares structure with the original
+  - The original set is not modified
+
+See Also: conj, hash-set, difference"""
@@ -0,0 +1,41 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import EMPTY_SET, PersistentSet
+
+from .utils import set_element
+
+
+@lispy_function("hash-set")
+def hash_set(args: List[Any], env: Environment) -> PersistentSet:
+    """Implementation of the (hash-set item ...) LisPy function.
+    Returns a set of the arguments. Duplicates are kept once.
+    """
+    return EMPTY_SET.conj_all(set_element(item, "hash-set") for item in args)
+
+
+@lispy_documentation("hash-set")
+def hash_set_documentation() -> str:
+    """Returns documentation for the hash-set function."""
+    return """Function: hash-set
+Arguments: (hash-set item1 item2 ...)
+Description: Creates a set of the given items.
+
+Examples:
+  (hash-set)                    ; => #{}
+  (hash-set 1 2 3)              ; => #{1 2 3}
+  (hash-set 1 2 1 2)            ; => #{1 2} (duplicates kept once)
+  (hash-set ':a "b" [1 2])      ; => #{:a "b" [1 2]}
+  (into (hash-set) [3 1 3])     ; => #{3 1} (set from a collection)
+
+Notes:
+  - Membership tests with contains? are hash lookups, not scans
+  - Elements can be symbols, strings, numbers, booleans, nil, or vectors,
+    lists, maps and sets of them; collections are compared by value
+  - Sets iterate and print in the order their elements were first added
+  - Sets are immutable: conj and disj return new sets that share structure
+    with the original
+  - count, empty?, filter, doseq and into work on sets
+
+See Also: contains?, conj, disj, union, intersection, difference, distinct"""
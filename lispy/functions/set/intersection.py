@@ -0,0 +1,50 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import PersistentSet
+
+from .utils import check_set
+
+
+@lispy_function("intersection")
+def intersection(args: List[Any], env: Environment) -> PersistentSet:
+    """Implementation of the (intersection set ...) LisPy function.
+    Returns the set of elements that are in every set.
+    """
+    if len(args) < 1:
+        raise EvaluationError(
+            f"SyntaxError: 'intersection' expects at least 1 argument, got {len(args)}."
+        )
+
+    sets = [
+        check_set(value, "intersection", f"Argument {position}")
+        for position, value in enumerate(args, 1)
+    ]
+    # Walk the smallest set and probe the others
+    sets.sort(key=len)
+    result = sets[0]
+    for other in sets[1:]:
+        result = result.intersection(other)
+    return result
+
+
+@lispy_documentation("intersection")
+def intersection_documentation() -> str:
+    """Returns documentation for the intersection function."""
+    return """Function: intersection
+Arguments: (intersection set1 set2 ...)
+Description: Returns a set of the elements that are in every one of the sets.
+
+Examples:
+  (intersection (hash-set 1 2 3) (hash-set 2 3 4))  ; => #{2 3}
+  (intersection (hash-set 1 2) (hash-set 3))        ; => #{}
+  (intersection (hash-set 1 2) (hash-set 2) (hash-set 2 5)) ; => #{2}
+
+Notes:
+  - Requires at least one argument; arguments must be sets or nil
+  - The smallest set is walked and each element is looked up in the
+    others, so the cost depends on the smallest set
+
+See Also: union, difference, hash-set"""
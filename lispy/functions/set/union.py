@@ -0,0 +1,39 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import EMPTY_SET, PersistentSet
+
+from .utils import check_set
+
+
+@lispy_function("union")
+def union(args: List[Any], env: Environment) -> PersistentSet:
+    """Implementation of the (union set ...) LisPy function.
+    Returns the set of elements that are in any of the sets.
+    """
+    result = EMPTY_SET
+    for position, value in enumerate(args, 1):
+        result = result.union(check_set(value, "union", f"Argument {position}"))
+    return result
+
+
+@lispy_documentation("union")
+def union_documentation() -> str:
+    """Returns documentation for the union function."""
+    return """Function: union
+Arguments: (union set1 set2 ...)
+Description: Returns a set of the elements that are in any of the sets.
+
+Examples:
+  (union (hash-set 1 2) (hash-set 2 3))         ; => #{1 2 3}
+  (union (hash-set 1) (hash-set 2) (hash-set 3)) ; => #{1 2 3}
+  (union (hash-set 1 2))                        ; => #{1 2}
+  (union)                                       ; => #{}
+
+Notes:
+  - Arguments must be sets or nil (the empty set)
+  - The elements of the smaller set are added to the larger one, so the
+    cost depends on the smaller set
+
+See Also: intersection, difference, hash-set"""
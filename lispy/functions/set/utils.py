@@ -0,0 +1,25 @@
+"""
+Shared helpers for the LisPy set functions.
+"""
+
+from typing import Any
+
+from lispy.exceptions import EvaluationError
+from lispy.functions.map.utils import map_key
+from lispy.persistent_set import EMPTY_SET, PersistentSet
+
+
+def set_element(item: Any, function_name: str) -> Any:
+    """Return item in the form it is stored in a set, or raise a TypeError."""
+    return map_key(item, f"Set elements in '{function_name}' must be")
+
+
+def check_set(value: Any, function_name: str, position: str) -> PersistentSet:
+    """Return value as a set (nil is the empty set), or raise a TypeError."""
+    if value is None:
+        return EMPTY_SET
+    if not isinstance(value, PersistentSet):
+        raise EvaluationError(
+            f"TypeError: {position} to '{function_name}' must be a set or nil, got {type(value)}."
+        )
+    return value
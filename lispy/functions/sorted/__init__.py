@@ -0,0 +1,25 @@
+"""LisPy Sorted Collection Functions - Sorted maps, sorted sets and range queries"""
+
+from .rsubseq import rsubseq, rsubseq_documentation
+from .sorted_map import sorted_map, sorted_map_documentation
+from .sorted_map_by import sorted_map_by, sorted_map_by_documentation
+from .sorted_set import sorted_set, sorted_set_documentation
+from .sorted_set_by import sorted_set_by, sorted_set_by_documentation
+from .subseq import subseq, subseq_documentation
+
+__all__ = [
+    # Functions
+    "rsubseq",
+    "sorted_map",
+    "sorted_map_by",
+    "sorted_set",
+    "sorted_set_by",
+    "subseq",
+    # Documentation
+    "rsubseq_documentation",
+    "sorted_map_by_documentation",
+    "sorted_map_documentation",
+    "sorted_set_by_documentation",
+    "sorted_set_documentation",
+    "subseq_documentation",
+]
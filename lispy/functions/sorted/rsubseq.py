@@ -0,0 +1,38 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+from .utils import sorted_range
+
+
+@lispy_function("rsubseq")
+def rsubseq(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (rsubseq sorted test key) and
+    (rsubseq sorted start-test start-key end-test end-key) LisPy functions.
+    Returns the entries of a sorted collection within a key range, in reverse order.
+    """
+    return sorted_range(args, "rsubseq", reverse=True)
+
+
+@lispy_documentation("rsubseq")
+def rsubseq_documentation() -> str:
+    """Returns documentation for the rsubseq function."""
+    return """Function: rsubseq
+Arguments: (rsubseq sorted test key) or (rsubseq sorted start-test start-key end-test end-key)
+Description: Returns a lazy sequence of the entries of a sorted map or sorted set whose keys pass the tests, in descending order.
+
+Examples:
+  (define s (sorted-set 1 5 10 15 20))
+  (rsubseq s < 15)                      ; => (10 5 1)
+  (rsubseq s >= 5 <= 15)                ; => (15 10 5)
+  (first (rsubseq s <= 12))             ; => 10 (last key at or before 12)
+  (rsubseq (sorted-map 1 ':a 2 ':b 3 ':c) > 1)  ; => ([3 :c] [2 :b])
+
+Notes:
+  - Takes the same tests as subseq
+  - Finding the end of the range is O(log n); only the returned entries
+    are visited
+
+See Also: subseq, sorted-map, sorted-set"""
@@ -0,0 +1,39 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_sorted_map import PersistentSortedMap
+
+from .utils import build_sorted_map
+
+
+@lispy_function("sorted-map")
+def sorted_map(args: List[Any], env: Environment) -> PersistentSortedMap:
+    """Implementation of the (sorted-map key val ...) LisPy function.
+    Returns a map whose keys are kept in natural order.
+    """
+    return build_sorted_map(args, None, "sorted-map")
+
+
+@lispy_documentation("sorted-map")
+def sorted_map_documentation() -> str:
+    """Returns documentation for the sorted-map function."""
+    return """Function: sorted-map
+Arguments: (sorted-map key1 value1 key2 value2 ...)
+Description: Creates a map whose keys are kept in sorted order.
+
+Examples:
+  (sorted-map 3 "c" 1 "a" 2 "b")        ; => {1 "a" 2 "b" 3 "c"}
+  (sorted-map ':b 2 ':a 1)              ; => {:a 1 :b 2} (keywords by name)
+  (keys (sorted-map 10 ':x 5 ':y))      ; => [5 10]
+  (assoc (sorted-map 1 ':a) 0 ':z)      ; => {0 :z 1 :a}
+  (subseq (sorted-map 1 ':a 2 ':b 3 ':c) > 1)  ; => ([2 :b] [3 :c])
+
+Notes:
+  - Keys must be comparable with each other: numbers, strings, or keywords
+  - get, assoc, dissoc, contains?, keys, vals, merge and into keep the order
+  - assoc, dissoc and get are O(log n); nothing is re-sorted on update
+  - Use subseq and rsubseq for range queries
+  - Sorted maps are equal to hash maps with the same entries
+
+See Also: sorted-map-by, sorted-set, subseq, rsubseq, hash-map"""
@@ -0,0 +1,42 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_sorted_map import PersistentSortedMap
+
+from .utils import build_sorted_map, make_comparator
+
+
+@lispy_function("sorted-map-by")
+def sorted_map_by(args: List[Any], env: Environment) -> PersistentSortedMap:
+    """Implementation of the (sorted-map-by compare-fn key val ...) LisPy function.
+    Returns a map whose keys are kept in the order given by compare-fn.
+    """
+    if not args:
+        raise EvaluationError(
+            "SyntaxError: 'sorted-map-by' expects at least 1 argument, got 0."
+        )
+    compare = make_comparator(args[0], env, "sorted-map-by")
+    return build_sorted_map(args[1:], compare, "sorted-map-by")
+
+
+@lispy_documentation("sorted-map-by")
+def sorted_map_by_documentation() -> str:
+    """Returns documentation for the sorted-map-by function."""
+    return """Function: sorted-map-by
+Arguments: (sorted-map-by compare-fn key1 value1 key2 value2 ...)
+Description: Creates a map whose keys are kept in the order given by compare-fn.
+
+Examples:
+  (sorted-map-by > 1 ':a 3 ':c 2 ':b)   ; => {3 :c 2 :b 1 :a}
+  (sorted-map-by (fn [a b] (- (count a) (count b))) "ccc" 3 "a" 1)
+                                        ; => {"a" 1 "ccc" 3}
+
+Notes:
+  - compare-fn takes the same forms as in sort: it returns a number
+    (negative, zero, positive) or a boolean meaning first sorts before second
+  - Keys that compare equal are the same key
+  - Passing <, <=, > or >= uses natural order directly, without calling the function
+
+See Also: sorted-map, sorted-set-by, sort"""
@@ -0,0 +1,37 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_sorted_set import PersistentSortedSet
+
+from .utils import build_sorted_set
+
+
+@lispy_function("sorted-set")
+def sorted_set(args: List[Any], env: Environment) -> PersistentSortedSet:
+    """Implementation of the (sorted-set item ...) LisPy function.
+    Returns a set whose elements are kept in natural order.
+    """
+    return build_sorted_set(args, None, "sorted-set")
+
+
+@lispy_documentation("sorted-set")
+def sorted_set_documentation() -> str:
+    """Returns documentation for the sorted-set function."""
+    return """Function: sorted-set
+Arguments: (sorted-set item1 item2 ...)
+Description: Creates a set whose elements are kept in sorted order.
+
+Examples:
+  (sorted-set 3 1 2 1)                  ; => #{1 2 3}
+  (conj (sorted-set 5 1) 3)             ; => #{1 3 5}
+  (into (sorted-set) [9 4 7])           ; => #{4 7 9}
+  (subseq (sorted-set 1 5 10 15) >= 5 < 15)  ; => (5 10)
+
+Notes:
+  - Elements must be comparable with each other: numbers, strings, or keywords
+  - A sorted set is a set: contains?, conj, disj, union and the other set
+    functions work on it, and it equals a hash set with the same elements
+  - conj, disj and contains? are O(log n); nothing is re-sorted on update
+
+See Also: sorted-set-by, sorted-map, subseq, rsubseq, hash-set"""
@@ -0,0 +1,40 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_sorted_set import PersistentSortedSet
+
+from .utils import build_sorted_set, make_comparator
+
+
+@lispy_function("sorted-set-by")
+def sorted_set_by(args: List[Any], env: Environment) -> PersistentSortedSet:
+    """Implementation of the (sorted-set-by compare-fn item ...) LisPy function.
+    Returns a set whose elements are kept in the order given by compare-fn.
+    """
+    if not args:
+        raise EvaluationError(
+            "SyntaxError: 'sorted-set-by' expects at least 1 argument, got 0."
+        )
+    compare = make_comparator(args[0], env, "sorted-set-by")
+    return build_sorted_set(args[1:], compare, "sorted-set-by")
+
+
+@lispy_documentation("sorted-set-by")
+def sorted_set_by_documentation() -> str:
+    """Returns documentation for the sorted-set-by function."""
+    return """Function: sorted-set-by
+Arguments: (sorted-set-by compare-fn item1 item2 ...)
+Description: Creates a set whose elements are kept in the order given by compare-fn.
+
+Examples:
+  (sorted-set-by > 1 3 2)               ; => #{3 2 1}
+  (sorted-set-by (fn [a b] (< (abs a) (abs b))) -3 1 2)  ; => #{1 2 -3}
+
+Notes:
+  - compare-fn takes the same forms as in sort: it returns a number
+    (negative, zero, positive) or a boolean meaning first sorts before second
+  - Elements that compare equal are the same element
+
+See Also: sorted-set, sorted-map-by, sort"""
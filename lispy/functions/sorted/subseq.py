@@ -0,0 +1,43 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.lazy_seq import LazySeq
+
+from .utils import sorted_range
+
+
+@lispy_function("subseq")
+def subseq(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (subseq sorted test key) and
+    (subseq sorted start-test start-key end-test end-key) LisPy functions.
+    Returns the entries of a sorted collection within a key range, in order.
+    """
+    return sorted_range(args, "subseq", reverse=False)
+
+
+@lispy_documentation("subseq")
+def subseq_documentation() -> str:
+    """Returns documentation for the subseq function."""
+    return """Function: subseq
+Arguments: (subseq sorted test key) or (subseq sorted start-test start-key end-test end-key)
+Description: Returns a lazy sequence of the entries of a sorted map or sorted set whose keys pass the tests, in ascending order.
+
+Examples:
+  (define s (sorted-set 1 5 10 15 20))
+  (subseq s > 5)                        ; => (10 15 20)
+  (subseq s <= 10)                      ; => (1 5 10)
+  (subseq s >= 5 < 15)                  ; => (5 10)
+  (subseq (sorted-map 1 ':a 2 ':b 3 ':c) >= 2)  ; => ([2 :b] [3 :c])
+  (first (subseq s > 12))               ; => 15 (next key after 12)
+
+Notes:
+  - test is one of <, <=, > or >=; with two tests, start-test is > or >=
+    and end-test is < or <=
+  - Tests follow the collection's own order, so on a collection sorted with
+    > the test > means "after"
+  - Finding the start of the range is O(log n); only the returned entries
+    are visited
+  - Sorted map entries are returned as [key value] vectors
+
+See Also: rsubseq, sorted-map, sorted-set"""
@@ -0,0 +1,166 @@
+"""
+Shared helpers for the LisPy sorted collection functions.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.logical.greater_than import greater_than
+from lispy.functions.logical.greater_than_or_equal import greater_than_or_equal
+from lispy.functions.logical.less_than import less_than
+from lispy.functions.logical.less_than_or_equal import less_than_or_equal
+from lispy.functions.map.utils import map_key
+from lispy.functions.sequence.utils import check_procedure
+from lispy.functions.set.utils import set_element
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_sorted_map import (Bound, Comparator,
+                                         PersistentSortedMap, natural_compare,
+                                         reverse_compare)
+from lispy.persistent_sorted_set import PersistentSortedSet
+from lispy.types import Vector
+
+# Built-in comparison functions that mean natural order (False) or its
+# reverse (True); these are compared in Python without calling the builtin
+BUILTIN_ORDERS = {
+    less_than: False,
+    less_than_or_equal: False,
+    greater_than: True,
+    greater_than_or_equal: True,
+}
+
+
+class ProcedureComparator:
+    """A comparator that calls a LisPy comparison function.
+
+    A class rather than a closure so that sorted collections ordered by a
+    user function can be saved in an image: it pickles as its procedure and
+    environment. The caller is built on the first comparison, since while an
+    image loads the environment may not be restored yet.
+    """
+
+    __slots__ = ("procedure", "env", "function_name", "_call")
+
+    def __init__(self, procedure: Any, env: Environment, function_name: str):
+        self.procedure = procedure
+        self.env = env
+        self.function_name = function_name
+        self._call: Optional[Callable[..., Any]] = None
+
+    def __call__(self, a: Any, b: Any) -> int:
+        call = self._call
+        if call is None:
+            call = self._call = make_caller(self.procedure, self.env, arity=2)
+        result = call(a, b)
+        if isinstance(result, bool):
+            if result:
+                return -1
+            return 1 if call(b, a) is True else 0
+        if isinstance(result, (int, float)):
+            return (result > 0) - (result < 0)
+        raise EvaluationError(
+            f"TypeError: Comparison function passed to '{self.function_name}' must return a number or boolean, got {type(result)}."
+        )
+
+    def __reduce__(self):
+        return (ProcedureComparator, (self.procedure, self.env, self.function_name))
+
+
+def make_comparator(
+    compare_fn: Any, env: Environment, function_name: str
+) -> Comparator:
+    """Return a Python comparator for a LisPy comparison function.
+
+    Accepts the same functions as sort: one returning a number (negative,
+    zero or positive) or a boolean meaning "first sorts before second". For
+    a boolean function two keys are equal when neither sorts before the other.
+    """
+    if callable(compare_fn) and compare_fn in BUILTIN_ORDERS:
+        return reverse_compare if BUILTIN_ORDERS[compare_fn] else natural_compare
+    check_procedure(compare_fn, function_name, "First", 2)
+    return ProcedureComparator(compare_fn, env, function_name)
+
+
+def build_sorted_map(
+    kv_pairs: List[Any], compare: Comparator, function_name: str
+) -> PersistentSortedMap:
+    """Return a sorted map of the key/value arguments of function_name."""
+    if len(kv_pairs) % 2 != 0:
+        raise EvaluationError(
+            f"SyntaxError: '{function_name}' requires an even number of key/value arguments, got {len(kv_pairs)}."
+        )
+    requirement = f"Map keys in '{function_name}' must be"
+    entries = [
+        (map_key(kv_pairs[i], requirement), kv_pairs[i + 1])
+        for i in range(0, len(kv_pairs), 2)
+    ]
+    try:
+        return PersistentSortedMap(entries, compare)
+    except TypeError as e:
+        raise EvaluationError(
+            f"TypeError: Keys of '{function_name}' must be comparable with each other: {e}."
+        )
+
+
+def build_sorted_set(
+    items: List[Any], compare: Comparator, function_name: str
+) -> PersistentSortedSet:
+    """Return a sorted set of the item arguments of function_name."""
+    elements = [set_element(item, function_name) for item in items]
+    try:
+        return PersistentSortedSet(elements, compare)
+    except TypeError as e:
+        raise EvaluationError(
+            f"TypeError: Elements of '{function_name}' must be comparable with each other: {e}."
+        )
+
+
+def range_bounds(args: List[Any], function_name: str) -> Tuple[Bound, Bound]:
+    """Return the (lower, upper) bounds for the test/key arguments of subseq.
+
+    args is either [test key] with test one of <, <=, > or >=, or
+    [start-test start-key end-test end-key] with start-test > or >= and
+    end-test < or <=.
+    """
+    if len(args) == 2:
+        test, key = args
+        if test is greater_than or test is greater_than_or_equal:
+            return (key, test is greater_than_or_equal), None
+        if test is less_than or test is less_than_or_equal:
+            return None, (key, test is less_than_or_equal)
+        raise EvaluationError(
+            f"TypeError: Test passed to '{function_name}' must be <, <=, > or >=, got {test!r}."
+        )
+    start_test, start_key, end_test, end_key = args
+    if not (start_test is greater_than or start_test is greater_than_or_equal):
+        raise EvaluationError(
+            f"TypeError: Start test passed to '{function_name}' must be > or >=, got {start_test!r}."
+        )
+    if not (end_test is less_than or end_test is less_than_or_equal):
+        raise EvaluationError(
+            f"TypeError: End test passed to '{function_name}' must be < or <=, got {end_test!r}."
+        )
+    return (
+        (start_key, start_test is greater_than_or_equal),
+        (end_key, end_test is less_than_or_equal),
+    )
+
+
+def sorted_range(args: List[Any], function_name: str, reverse: bool) -> LazySeq:
+    """Shared implementation of subseq and rsubseq."""
+    if len(args) not in (3, 5):
+        raise EvaluationError(
+            f"SyntaxError: '{function_name}' expects 3 or 5 arguments, got {len(args)}."
+        )
+    collection = args[0]
+    lower, upper = range_bounds(args[1:], function_name)
+    if isinstance(collection, PersistentSortedMap):
+        # Map entries are returned as [key value] vectors
+        entries = collection.entries(lower, upper, reverse)
+        return LazySeq.from_iterable(Vector(entry) for entry in entries)
+    if isinstance(collection, PersistentSortedSet):
+        return LazySeq.from_iterable(collection.elements(lower, upper, reverse))
+    raise EvaluationError(
+        f"TypeError: First argument to '{function_name}' must be a sorted map or sorted set, got {type(collection)}."
+    )
@@ -2,14 +2,38 @@
 
 # The functions are now automatically registered via decorators
 # Import them to trigger the decorator registration
+from .format import format_documentation, format_fn
 from .join import join_documentation, join_fn
+from .sb_append_bang import sb_append_bang, sb_append_bang_documentation
+from .sb_to_str import sb_to_str, sb_to_str_documentation
 from .split import split_documentation, split_fn
+from .str_join import str_join, str_join_documentation
+from .str_pad import str_pad, str_pad_documentation
+from .str_repeat import str_repeat, str_repeat_documentation
+from .str_replace_all import str_replace_all, str_replace_all_documentation
+from .string_builder import string_builder, string_builder_documentation
 
 __all__ = [
     # Functions (new names)
+    "format_fn",
     "join_fn",
+    "sb_append_bang",
+    "sb_to_str",
     "split_fn",
+    "str_join",
+    "str_pad",
+    "str_repeat",
+    "str_replace_all",
+    "string_builder",
     # Documentation (new names)
+    "format_documentation",
     "join_documentation",
+    "sb_append_bang_documentation",
+    "sb_to_str_documentation",
     "split_documentation",
+    "str_join_documentation",
+    "str_pad_documentation",
+    "str_repeat_documentation",
+    "str_replace_all_documentation",
+    "string_builder_documentation",
 ]
@@ -0,0 +1,120 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Any, List, Optional, Tuple
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import check_string, display_string
+
+TEMPLATE_CACHE_SIZE = 256
+
+_FORMATTER = Formatter()
+
+# (literal text, argument index or None, format spec)
+Piece = Tuple[str, Optional[int], str]
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def parse_template(template: str) -> Tuple[Tuple[Piece, ...], int]:
+    """Parse template once into its pieces and the number of arguments it uses.
+
+    Raises ValueError for a malformed template.
+    """
+    pieces = []
+    next_index = 0
+    numbering = None
+    needed = 0
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if field is None:
+            pieces.append((literal, None, ""))
+            continue
+        if conversion is not None:
+            raise ValueError(f"conversion !{conversion} is not supported")
+        if field == "":
+            if numbering == "manual":
+                raise ValueError("cannot mix {} and {0} fields")
+            numbering = "automatic"
+            index = next_index
+            next_index += 1
+        elif field.isdigit():
+            if numbering == "automatic":
+                raise ValueError("cannot mix {} and {0} fields")
+            numbering = "manual"
+            index = int(field)
+        else:
+            raise ValueError(f"field {{{field}}} must be empty or a number")
+        needed = max(needed, index + 1)
+        pieces.append((literal, index, spec))
+    return tuple(pieces), needed
+
+
+def _format_value(value: Any, spec: str) -> str:
+    if not spec:
+        return display_string(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return format(value, spec)
+    return format(display_string(value), spec)
+
+
+@lispy_function("format")
+def format_fn(args: List[Any], env: Environment) -> str:
+    """Implementation of the (format template value ...) LisPy function.
+    Fills the {} fields of template with the values, parsing each distinct
+    template once.
+    Usage: (format "{} took {:.1f}ms" path elapsed)
+    """
+    if len(args) < 1:
+        raise EvaluationError(
+            f"SyntaxError: 'format' expects at least 1 argument, got {len(args)}."
+        )
+
+    template = check_string(args[0], "format", "First")
+    try:
+        pieces, needed = parse_template(template)
+    except ValueError as error:
+        raise EvaluationError(
+            f"ValueError: Invalid template {template!r} in 'format': {error}."
+        )
+    values = args[1:]
+    if len(values) < needed:
+        raise EvaluationError(
+            f"IndexError: Template {template!r} in 'format' needs {needed} values, got {len(values)}."
+        )
+
+    parts = []
+    try:
+        for literal, index, spec in pieces:
+            if literal:
+                parts.append(literal)
+            if index is not None:
+                parts.append(_format_value(values[index], spec))
+    except ValueError as error:
+        raise EvaluationError(f"ValueError: 'format' could not format a value: {error}.")
+    return "".join(parts)
+
+
+@lispy_documentation("format")
+def format_documentation() -> str:
+    """Returns documentation for the format function."""
+    return """Function: format
+Arguments: (format template value1 value2 ...)
+Description: Returns template with each {} field replaced by the text of the next value, or each {n} field by value n (counting from 0).
+
+Examples:
+  (format "{} scored {}" "ada" 42)          ; => "ada scored 42"
+  (format "{1}/{0}" "a" "b")                ; => "b/a"
+  (format "{:.2f}ms" 3.14159)               ; => "3.14ms"
+  (format "[{:>5}]" 42)                     ; => "[   42]"
+  (format "{{literal}} {}" nil)             ; => "{literal} nil"
+
+Notes:
+  - Values are converted as by to-str
+  - A field may carry a Python format spec after a colon, such as :.2f,
+    :>8 or :08d; numbers are formatted as numbers, other values as text
+  - Write {{ and }} for literal braces
+  - Each distinct template is parsed once and the parse is cached, so
+    formatting in a loop only fills in the values
+
+See Also: str-pad, str-join, to-str"""
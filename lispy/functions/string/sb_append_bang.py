@@ -0,0 +1,50 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.string_builder import StringBuilder
+
+from .utils import display_string
+
+
+@lispy_function("sb-append!")
+def sb_append_bang(args: List[Any], env: Environment) -> StringBuilder:
+    """Implementation of the (sb-append! builder value ...) LisPy function.
+    Appends the text of values to a string builder in place and returns it.
+    Usage: (sb-append! sb "<li>" name "</li>")
+    """
+    if len(args) < 1:
+        raise EvaluationError(
+            f"SyntaxError: 'sb-append!' expects at least 1 argument, got {len(args)}."
+        )
+
+    builder = args[0]
+    if not isinstance(builder, StringBuilder):
+        raise EvaluationError(
+            f"TypeError: First argument to 'sb-append!' must be a string builder, got {type(builder)}."
+        )
+    if len(args) == 2:
+        return builder.append(display_string(args[1]))
+    return builder.extend(map(display_string, args[1:]))
+
+
+@lispy_documentation("sb-append!")
+def sb_append_bang_documentation() -> str:
+    """Returns documentation for the sb-append! function."""
+    return """Function: sb-append!
+Arguments: (sb-append! builder value1 value2 ...)
+Description: Appends the text of each value to a string builder in place and returns the builder.
+
+Examples:
+  (sb->str (sb-append! (string-builder) "a" 1 nil))     ; => "a1nil"
+  (define sb (string-builder))
+  (sb-append! sb "<td>" (get row ':name) "</td>")
+
+Notes:
+  - First argument must be a string builder created with (string-builder)
+  - Values are converted as by to-str
+  - Each call costs time proportional to the text appended, not to the
+    length of the whole builder
+
+See Also: string-builder, sb->str"""
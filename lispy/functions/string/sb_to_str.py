@@ -0,0 +1,44 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.string_builder import StringBuilder
+
+
+@lispy_function("sb->str")
+def sb_to_str(args: List[Any], env: Environment) -> str:
+    """Implementation of the (sb->str builder) LisPy function.
+    Returns the text collected by a string builder.
+    Usage: (sb->str sb)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'sb->str' expects 1 argument, got {len(args)}."
+        )
+
+    builder = args[0]
+    if not isinstance(builder, StringBuilder):
+        raise EvaluationError(
+            f"TypeError: First argument to 'sb->str' must be a string builder, got {type(builder)}."
+        )
+    return builder.to_string()
+
+
+@lispy_documentation("sb->str")
+def sb_to_str_documentation() -> str:
+    """Returns documentation for the sb->str function."""
+    return """Function: sb->str
+Arguments: (sb->str builder)
+Description: Returns the text collected so far by a string builder.
+
+Examples:
+  (sb->str (sb-append! (string-builder "a") "b" "c"))   ; => "abc"
+  (sb->str (string-builder))                           ; => ""
+
+Notes:
+  - The builder can still be appended to afterwards
+  - The pieces are joined once; calling sb->str again without appending
+    returns the same string without joining again
+
+See Also: string-builder, sb-append!"""
@@ -0,0 +1,45 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.collection.utils import check_collection
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import check_string, display_string
+
+
+@lispy_function("str-join")
+def str_join(args: List[Any], env: Environment) -> str:
+    """Implementation of the (str-join collection [separator]) LisPy function.
+    Joins the text of every item of a collection in one pass.
+    Usage: (str-join (map rows render-row) "\\n")
+    """
+    if len(args) not in (1, 2):
+        raise EvaluationError(
+            f"SyntaxError: 'str-join' expects 1 or 2 arguments, got {len(args)}."
+        )
+
+    items = check_collection(args[0], "str-join")
+    separator = check_string(args[1], "str-join", "Second") if len(args) == 2 else ""
+    return separator.join(map(display_string, items))
+
+
+@lispy_documentation("str-join")
+def str_join_documentation() -> str:
+    """Returns documentation for the str-join function."""
+    return """Function: str-join
+Arguments: (str-join collection [separator])
+Description: Returns the text of every item of collection joined by separator (the empty string by default).
+
+Examples:
+  (str-join ["a" "b" "c"] ", ")               ; => "a, b, c"
+  (str-join [1 nil true])                    ; => "1niltrue"
+  (str-join (take (lazy-range) 5) "-")       ; => "0-1-2-3-4"
+  (str-join nil ",")                         ; => ""
+
+Notes:
+  - Collection is a vector, list, set, lazy sequence, or nil
+  - Items are converted as by to-str; unlike join they need not be strings
+  - A lazy sequence is consumed in one pass, without building a vector first
+
+See Also: join, string-builder, str-repeat"""
@@ -0,0 +1,65 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.types import Symbol
+
+from .utils import check_string, display_string
+
+SIDES = {Symbol(":start"), Symbol(":end")}
+
+
+@lispy_function("str-pad")
+def str_pad(args: List[Any], env: Environment) -> str:
+    """Implementation of the (str-pad value width [fill [side]]) LisPy function.
+    Pads the text of value to width characters.
+    Usage: (str-pad 42 6 "0") or (str-pad "name" 10 " " ':end)
+    """
+    if len(args) not in (2, 3, 4):
+        raise EvaluationError(
+            f"SyntaxError: 'str-pad' expects 2 to 4 arguments, got {len(args)}."
+        )
+
+    text = display_string(args[0])
+    width = args[1]
+    if not isinstance(width, int) or isinstance(width, bool):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'str-pad' must be an integer, got {type(width)}."
+        )
+    fill = check_string(args[2], "str-pad", "Third") if len(args) > 2 else " "
+    if len(fill) != 1:
+        raise EvaluationError(
+            f"ValueError: Third argument to 'str-pad' must be a single character, got {fill!r}."
+        )
+    side = args[3] if len(args) == 4 else Symbol(":start")
+    if side not in SIDES:
+        raise EvaluationError(
+            f"ValueError: Fourth argument to 'str-pad' must be ':start or ':end, got {side}."
+        )
+
+    if side == Symbol(":start"):
+        return text.rjust(width, fill)
+    return text.ljust(width, fill)
+
+
+@lispy_documentation("str-pad")
+def str_pad_documentation() -> str:
+    """Returns documentation for the str-pad function."""
+    return """Function: str-pad
+Arguments: (str-pad value width [fill [side]])
+Description: Returns the text of value padded with fill to at least width characters, at the start (the default) or the end.
+
+Examples:
+  (str-pad 42 6)                  ; => "    42"
+  (str-pad 42 6 "0")              ; => "000042"
+  (str-pad "name" 8 "." ':end)    ; => "name...."
+  (str-pad "too long" 3)          ; => "too long"
+
+Notes:
+  - value is converted as by to-str
+  - fill is a single character, a space by default
+  - side is ':start (right-aligns the text) or ':end (left-aligns it)
+  - Text already at least width long is returned unchanged
+
+See Also: str-repeat, format"""
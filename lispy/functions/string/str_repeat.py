@@ -0,0 +1,45 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+
+from .utils import check_string
+
+
+@lispy_function("str-repeat")
+def str_repeat(args: List[Any], env: Environment) -> str:
+    """Implementation of the (str-repeat string count) LisPy function.
+    Returns string repeated count times.
+    Usage: (str-repeat "-" 40)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'str-repeat' expects 2 arguments, got {len(args)}."
+        )
+
+    string = check_string(args[0], "str-repeat", "First")
+    count = args[1]
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise EvaluationError(
+            f"TypeError: Second argument to 'str-repeat' must be a non-negative integer, got {count!r}."
+        )
+    return string * count
+
+
+@lispy_documentation("str-repeat")
+def str_repeat_documentation() -> str:
+    """Returns documentation for the str-repeat function."""
+    return """Function: str-repeat
+Arguments: (str-repeat string count)
+Description: Returns string repeated count times.
+
+Examples:
+  (str-repeat "-" 5)      ; => "-----"
+  (str-repeat "ab" 3)     ; => "ababab"
+  (str-repeat "x" 0)      ; => ""
+
+Notes:
+  - count must be a non-negative integer
+
+See Also: str-pad, str-join"""
@@ -0,0 +1,74 @@
+import re
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.regex.utils import compile_pattern
+
+from .utils import check_string
+
+
+@lispy_function("str-replace-all")
+def str_replace_all(args: List[Any], env: Environment) -> str:
+    """Implementation of the (str-replace-all string match replacement) LisPy function.
+    Replaces every occurrence of a literal substring, or of every key of a
+    map of replacements in one pass.
+    Usage: (str-replace-all s "\\t" " ") or (str-replace-all s {"<" "&lt;" ...})
+    """
+    if len(args) == 3:
+        string = check_string(args[0], "str-replace-all", "First")
+        match = check_string(args[1], "str-replace-all", "Second")
+        replacement = check_string(args[2], "str-replace-all", "Third")
+        if not match:
+            raise EvaluationError(
+                "ValueError: Second argument to 'str-replace-all' must not be empty."
+            )
+        return string.replace(match, replacement)
+
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'str-replace-all' expects 2 or 3 arguments, got {len(args)}."
+        )
+
+    string = check_string(args[0], "str-replace-all", "First")
+    replacements = args[1]
+    if not isinstance(replacements, dict):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'str-replace-all' must be a string or map, got {type(replacements)}."
+        )
+    if not replacements:
+        return string
+    for match, replacement in replacements.items():
+        if not isinstance(match, str) or not isinstance(replacement, str) or not match:
+            raise EvaluationError(
+                f"TypeError: Replacements in 'str-replace-all' must map non-empty strings to strings, got {match!r} to {replacement!r}."
+            )
+
+    # Longest match first, so "&&" wins over "&"; the alternation is compiled
+    # once per distinct set of keys through the regex pattern cache
+    keys = sorted(replacements, key=len, reverse=True)
+    pattern = compile_pattern("|".join(map(re.escape, keys)), "str-replace-all", "Second")
+    return pattern.sub(lambda found: replacements[found.group(0)], string)
+
+
+@lispy_documentation("str-replace-all")
+def str_replace_all_documentation() -> str:
+    """Returns documentation for the str-replace-all function."""
+    return """Function: str-replace-all
+Arguments: (str-replace-all string match replacement) or (str-replace-all string replacements)
+Description: Returns string with every occurrence of match replaced by replacement, or of every key of the map replacements by its value.
+
+Examples:
+  (str-replace-all "a-b-c" "-" "+")                          ; => "a+b+c"
+  (str-replace-all "<a & b>" {"<" "&lt;" ">" "&gt;" "&" "&amp;"})
+  ; => "&lt;a &amp; b&gt;"
+  (str-replace-all "ab" {"a" "b" "b" "a"})                   ; => "ba"
+
+Notes:
+  - match and the keys of replacements are literal text, not patterns; use
+    re-replace for regular expressions
+  - With a map, the string is scanned once and replaced text is never
+    replaced again; where keys overlap, the longest one wins
+
+See Also: re-replace, split, str-join"""
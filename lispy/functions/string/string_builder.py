@@ -0,0 +1,39 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.string_builder import StringBuilder
+
+from .utils import display_string
+
+
+@lispy_function("string-builder")
+def string_builder(args: List[Any], env: Environment) -> StringBuilder:
+    """Implementation of the (string-builder [value ...]) LisPy function.
+    Returns a new string builder holding the text of the given values.
+    Usage: (string-builder) or (string-builder "<ul>")
+    """
+    return StringBuilder(map(display_string, args))
+
+
+@lispy_documentation("string-builder")
+def string_builder_documentation() -> str:
+    """Returns documentation for the string-builder function."""
+    return """Function: string-builder
+Arguments: (string-builder value1 value2 ...)
+Description: Returns a new, mutable string builder holding the text of the given values, for building a large string in linear time.
+
+Examples:
+  (define sb (string-builder "<ul>"))
+  (reduce items (fn [sb item] (sb-append! sb "<li>" item "</li>")) sb)
+  (sb->str (sb-append! sb "</ul>"))     ; => "<ul><li>...</li></ul>"
+  (string-builder)                      ; => #<string-builder length=0>
+
+Notes:
+  - Values are converted as by to-str, so strings are added unchanged
+  - Appending with sb-append! adds to the builder in place; sb->str joins
+    the pieces once, instead of copying the whole string at every step the
+    way repeated append or join in a reduce does
+  - A string builder can be returned directly as a response :body
+
+See Also: sb-append!, sb->str, str-join"""
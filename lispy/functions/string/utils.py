@@ -0,0 +1,24 @@
+"""
+Shared helpers for the LisPy string functions.
+"""
+
+from typing import Any
+
+from lispy.exceptions import EvaluationError
+from lispy.functions.typing.to_str import to_str
+
+
+def display_string(value: Any) -> str:
+    """Return value as text, the way to-str and print show it."""
+    if type(value) is str:
+        return value
+    return to_str([value], None)
+
+
+def check_string(value: Any, function_name: str, position: str) -> str:
+    """Raise a TypeError unless value is a string."""
+    if not isinstance(value, str):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a string, got {type(value)}."
+        )
+    return value
@@ -0,0 +1,25 @@
+"""LisPy Table Functions - Columnar tables with vectorized filtering and aggregation"""
+
+from .aggregate import aggregate, aggregate_documentation
+from .select import select, select_documentation
+from .table_column import table_column, table_column_documentation
+from .table_from_maps import table_from_maps, table_from_maps_documentation
+from .table_rows import table_rows, table_rows_documentation
+from .where import where, where_documentation
+
+__all__ = [
+    # Functions
+    "aggregate",
+    "select",
+    "table_column",
+    "table_from_maps",
+    "table_rows",
+    "where",
+    # Documentation
+    "aggregate_documentation",
+    "select_documentation",
+    "table_column_documentation",
+    "table_from_maps_documentation",
+    "table_rows_documentation",
+    "where_documentation",
+]
@@ -0,0 +1,102 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_map import PersistentMap, persistent_map
+from lispy.table import AGGREGATIONS, Table
+from lispy.types import LispyList, Vector
+
+from .utils import check_column, option_name
+
+
+def _parse_specs(specs: Any, table: Table) -> List[tuple]:
+    if not isinstance(specs, dict):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'aggregate' must be a map of result names to [operation column], got {type(specs)}."
+        )
+    parsed = []
+    for result_name, spec in specs.items():
+        if not isinstance(spec, (Vector, LispyList)) or not 1 <= len(spec) <= 2:
+            raise EvaluationError(
+                f"TypeError: Aggregation {result_name} must be [operation column] or [:count], got {spec!r}."
+            )
+        operation = option_name(spec[0])
+        if operation not in AGGREGATIONS:
+            raise EvaluationError(
+                f"ValueError: Unknown aggregation {spec[0]}; expected one of :{' :'.join(AGGREGATIONS)}."
+            )
+        column = spec[1] if len(spec) == 2 else None
+        if operation != "count":
+            if column is None:
+                raise EvaluationError(
+                    f"SyntaxError: Aggregation {result_name} with {spec[0]} needs a column."
+                )
+            check_column(table, column, "aggregate")
+        parsed.append((result_name, operation, column))
+    return parsed
+
+
+def _aggregate_table(table: Table, specs: List[tuple]) -> PersistentMap:
+    results = {}
+    for result_name, operation, column in specs:
+        try:
+            results[result_name] = table.aggregate(operation, column)
+        except (ValueError, TypeError) as e:
+            raise EvaluationError(f"TypeError: 'aggregate' failed: {e}.")
+    return persistent_map(results)
+
+
+@lispy_function("aggregate")
+def aggregate(args: List[Any], env: Environment) -> PersistentMap:
+    """Implementation of the (aggregate table-or-groups specs) LisPy function.
+    Computes count, sum, mean, min and max over table columns, for a table
+    or for every table of a group-by result.
+    Usage: (aggregate table {result [operation column] ...})
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'aggregate' expects 2 arguments, got {len(args)}."
+        )
+
+    source, specs = args
+    if isinstance(source, Table):
+        return _aggregate_table(source, _parse_specs(specs, source))
+    if isinstance(source, dict) and all(
+        isinstance(group, Table) for group in source.values()
+    ):
+        groups = list(source.items())
+        if not groups:
+            return persistent_map({})
+        parsed = _parse_specs(specs, groups[0][1])
+        return persistent_map(
+            {key: _aggregate_table(group, parsed) for key, group in groups}
+        )
+    raise EvaluationError(
+        f"TypeError: First argument to 'aggregate' must be a table or a map of tables from group-by, got {type(source)}."
+    )
+
+
+@lispy_documentation("aggregate")
+def aggregate_documentation() -> str:
+    """Returns documentation for the aggregate function."""
+    return """Function: aggregate
+Arguments: (aggregate table-or-groups specs)
+Description: Computes summaries of table columns, for one table or for each group of a group-by.
+
+Examples:
+  (aggregate logs {:requests [:count] :total [:sum :bytes]})
+  ; => {:requests 3 :total 2560}
+
+  (aggregate (group-by logs ':status) {:n [:count] :avg [:mean :bytes]})
+  ; => {200 {:n 2 :avg 1280.0} 404 {:n 1 :avg 0.0}}
+
+Notes:
+  - Specs map each result name to [operation column]; [:count] needs no column
+  - Operations: :count, :sum, :mean, :min, :max
+  - :sum and :mean need a numeric column; they run over the column's typed
+    array in a single native pass
+  - :mean, :min and :max of an empty table are nil
+  - Given a group-by result, returns a map from each group key to its results
+
+See Also: group-by, table-from-maps, vsum, vmean"""
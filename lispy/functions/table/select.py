@@ -0,0 +1,48 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.table import Table
+from lispy.types import LispyList, Vector
+
+from .utils import check_column, check_table
+
+
+@lispy_function("select")
+def select(args: List[Any], env: Environment) -> Table:
+    """Implementation of the (select table columns) LisPy function.
+    Returns a table with only the given columns.
+    Usage: (select table [column ...])
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'select' expects 2 arguments, got {len(args)}."
+        )
+
+    table, columns = args
+    check_table(table, "select", "First")
+    if not isinstance(columns, (Vector, LispyList)):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'select' must be a vector or list of column names, got {type(columns)}."
+        )
+    for column in columns:
+        check_column(table, column, "select")
+    return table.select(columns)
+
+
+@lispy_documentation("select")
+def select_documentation() -> str:
+    """Returns documentation for the select function."""
+    return """Function: select
+Arguments: (select table columns)
+Description: Returns a table with only the given columns, in the given order.
+
+Examples:
+  (select logs [:path :status])   ; => #<table rows=3 columns=[:path :status]>
+
+Notes:
+  - Columns are shared with the original table, not copied
+  - Naming a column the table does not have is an error
+
+See Also: table-from-maps, where, table-column"""
@@ -0,0 +1,49 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.numeric_array import NumericArray
+from lispy.persistent_vector import persistent_vector
+
+from .utils import check_column, check_table
+
+
+@lispy_function("table-column")
+def table_column(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (table-column table column) LisPy function.
+    Returns one column of a table.
+    Usage: (table-column table column)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'table-column' expects 2 arguments, got {len(args)}."
+        )
+
+    table, column = args
+    check_table(table, "table-column", "First")
+    check_column(table, column, "table-column")
+    values = table.column(column)
+    if isinstance(values, NumericArray):
+        return values
+    return persistent_vector(values)
+
+
+@lispy_documentation("table-column")
+def table_column_documentation() -> str:
+    """Returns documentation for the table-column function."""
+    return """Function: table-column
+Arguments: (table-column table column)
+Description: Returns the values of one column of a table.
+
+Examples:
+  (table-column logs ':bytes)               ; => #<int-array [512 0 2048]>
+  (vmax (table-column logs ':bytes))        ; => 2048
+  (table-column logs ':path)                ; => ["/" "/x" "/"]
+
+Notes:
+  - Numeric columns are returned as their int or double array, ready for
+    v+, v*, vsum and the other array functions
+  - Other columns are returned as a vector
+
+See Also: table-from-maps, select, to-vector"""
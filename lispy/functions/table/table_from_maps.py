@@ -0,0 +1,54 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import check_sequence
+from lispy.table import Table
+
+
+@lispy_function("table-from-maps")
+def table_from_maps(args: List[Any], env: Environment) -> Table:
+    """Implementation of the (table-from-maps rows) LisPy function.
+    Builds a columnar table from a collection of maps.
+    Usage: (table-from-maps rows)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'table-from-maps' expects 1 argument, got {len(args)}."
+        )
+
+    rows = args[0]
+    check_sequence(rows, "table-from-maps", "First")
+    rows = list(rows or ())
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise EvaluationError(
+                f"TypeError: Row {index} passed to 'table-from-maps' must be a map, got {type(row)}."
+            )
+    return Table.from_rows(rows)
+
+
+@lispy_documentation("table-from-maps")
+def table_from_maps_documentation() -> str:
+    """Returns documentation for the table-from-maps function."""
+    return """Function: table-from-maps
+Arguments: (table-from-maps rows)
+Description: Builds a columnar table from a vector, list or lazy sequence of maps.
+
+Examples:
+  (define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                                 {:status 404 :bytes 0 :path "/x"}
+                                 {:status 200 :bytes 2048 :path "/"}]))
+  logs                        ; => #<table rows=3 columns=[:status :bytes :path]>
+  (count logs)                ; => 3
+
+Notes:
+  - Each column is stored once: integer columns as int arrays, numeric columns
+    as double arrays, anything else as a plain column
+  - The columns are the keys of all rows, in the order they first appear
+  - A key missing from a row gives nil in that row
+  - Tables are immutable; select, where, sort-by and group-by return new ones
+  - table-rows and table-column get the data back out
+
+See Also: select, where, group-by, aggregate, sort-by, table-rows, table-column"""
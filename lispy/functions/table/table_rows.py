@@ -0,0 +1,39 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_map import persistent_map
+from lispy.persistent_vector import PersistentVector, persistent_vector
+
+from .utils import check_table
+
+
+@lispy_function("table-rows")
+def table_rows(args: List[Any], env: Environment) -> PersistentVector:
+    """Implementation of the (table-rows table) LisPy function.
+    Converts a table back into a vector of maps.
+    Usage: (table-rows table)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'table-rows' expects 1 argument, got {len(args)}."
+        )
+    check_table(args[0], "table-rows", "First")
+    return persistent_vector([persistent_map(row) for row in args[0].rows()])
+
+
+@lispy_documentation("table-rows")
+def table_rows_documentation() -> str:
+    """Returns documentation for the table-rows function."""
+    return """Function: table-rows
+Arguments: (table-rows table)
+Description: Converts a table into a vector of maps, one per row.
+
+Examples:
+  (table-rows (select logs [:status]))   ; => [{:status 200} {:status 404} {:status 200}]
+
+Notes:
+  - Every row has every column; missing values are nil
+
+See Also: table-from-maps, table-column"""
@@ -0,0 +1,36 @@
+"""
+Shared helpers for the LisPy table functions.
+"""
+
+from typing import Any
+
+from lispy.exceptions import EvaluationError
+from lispy.table import Table
+from lispy.types import Symbol
+
+
+def check_table(value: Any, function_name: str, position: str) -> None:
+    """Raise a TypeError unless value is a table."""
+    if not isinstance(value, Table):
+        raise EvaluationError(
+            f"TypeError: {position} argument to '{function_name}' must be a table, got {type(value)}."
+        )
+
+
+def check_column(table: Table, column: Any, function_name: str) -> None:
+    """Raise a ValueError unless table has a column called column."""
+    try:
+        known = table.has_column(column)
+    except TypeError:
+        known = False
+    if not known:
+        raise EvaluationError(
+            f"ValueError: '{function_name}' got unknown column {column}; the table has columns {' '.join(map(str, table.column_names()))}."
+        )
+
+
+def option_name(value: Any) -> Any:
+    """Return the name of a keyword option such as :sum, or value unchanged."""
+    if isinstance(value, Symbol) and value.name.startswith(":"):
+        return value.name[1:]
+    return value
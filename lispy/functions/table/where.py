@@ -0,0 +1,60 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.numeric.arithmetic import compile_predicate
+from lispy.functions.numeric.utils import array_operation
+from lispy.functions.sequence.utils import check_procedure, is_truthy
+from lispy.numeric_array import NumericArray
+from lispy.table import Table
+
+from .utils import check_column, check_table
+
+
+@lispy_function("where")
+def where(args: List[Any], env: Environment) -> Table:
+    """Implementation of the (where table column pred) LisPy function.
+    Returns the rows whose value in column satisfies pred.
+    Usage: (where table column pred)
+    """
+    if len(args) != 3:
+        raise EvaluationError(
+            f"SyntaxError: 'where' expects 3 arguments, got {len(args)}."
+        )
+
+    table, column, predicate = args
+    check_table(table, "where", "First")
+    check_column(table, column, "where")
+    check_procedure(predicate, "where", "Third", 1)
+
+    values = table.column(column)
+    if isinstance(values, NumericArray):
+        compiled = compile_predicate(predicate, values.kind == "double")
+        if compiled is not None:
+            mask = array_operation("where", values.mask, compiled)
+            return table.compress(mask)
+    call = make_caller(predicate, env, arity=1)
+    return table.where(column, lambda value: is_truthy(call(value)))
+
+
+@lispy_documentation("where")
+def where_documentation() -> str:
+    """Returns documentation for the where function."""
+    return """Function: where
+Arguments: (where table column predicate)
+Description: Returns a table of the rows whose value in column satisfies predicate.
+
+Examples:
+  (where logs ':status (fn [s] (>= s 400)))        ; rows with an error status
+  (where logs ':path (fn [p] (= (count p) 1)))     ; predicate on a text column
+
+Notes:
+  - Predicate receives the value of column only, never a whole row
+  - On a numeric column, a predicate that is one comparison (< > <= >= =)
+    of arithmetic on its parameter is compiled and runs over the whole
+    column at once (vectorized with NumPy)
+  - Other predicates are called once per row
+
+See Also: table-from-maps, select, filter"""
@@ -0,0 +1,22 @@
+"""LisPy Transducer Functions - Single-pass composed collection pipelines"""
+
+from .comp import comp, comp_documentation
+from .into import into, into_documentation
+from .reduced import reduced, reduced_documentation
+from .sequence import sequence, sequence_documentation
+from .transduce import transduce, transduce_documentation
+
+__all__ = [
+    # Functions
+    "comp",
+    "into",
+    "reduced",
+    "sequence",
+    "transduce",
+    # Documentation
+    "comp_documentation",
+    "into_documentation",
+    "reduced_documentation",
+    "sequence_documentation",
+    "transduce_documentation",
+]
@@ -0,0 +1,64 @@
+from typing import Any, Callable, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import call_procedure
+from lispy.transducers import IDENTITY, Transducer
+
+
+@lispy_function("comp")
+def comp(args: List[Any], env: Environment) -> Union[Transducer, Callable]:
+    """Implementation of the (comp f g ...) LisPy function.
+    Composes transducers, or composes functions right to left.
+    Usage: (comp f g ...)
+    """
+    if not args:
+        return IDENTITY
+
+    if all(isinstance(arg, Transducer) for arg in args):
+        # Items flow through the transducers left to right
+        result = args[-1]
+        for transducer in reversed(args[:-1]):
+            result = transducer.compose(result)
+        return result
+
+    for i, arg in enumerate(args):
+        if isinstance(arg, Transducer) or not callable(arg):
+            raise EvaluationError(
+                f"TypeError: Argument {i + 1} to 'comp' must be a procedure when composing functions, got {type(arg)}."
+            )
+
+    procedures = list(reversed(args))
+
+    def composed(call_args: List[Any], call_env: Environment) -> Any:
+        # The rightmost function gets the arguments, the rest get one value
+        result = call_procedure(procedures[0], call_args, call_env)
+        for procedure in procedures[1:]:
+            result = call_procedure(procedure, [result], call_env)
+        return result
+
+    return composed
+
+
+@lispy_documentation("comp")
+def comp_documentation() -> str:
+    """Returns documentation for the comp function."""
+    return """Function: comp
+Arguments: (comp f g ...)
+Description: Composes transducers into one transducer, or functions into one function.
+
+Examples:
+  ; Transducers - items flow left to right
+  (define xf (comp (filter (fn [x] (> x 1))) (map (fn [x] (* x 10)))))
+  (into [] xf [1 2 3])                  ; => [20 30]
+
+  ; Functions - applied right to left
+  ((comp abs (fn [x] (- x 10))) 3)      ; => 7
+
+Notes:
+  - With transducers, the first transducer sees each item first
+  - With functions, (comp f g) is (fn [x] (f (g x))); the rightmost function
+    receives all the arguments
+  - Transducers and plain functions cannot be mixed
+  - (comp) with no arguments is the identity transducer"""
@@ -0,0 +1,108 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import check_sequence
+from lispy.functions.set.utils import set_element
+from lispy.persistent_list import EMPTY_LIST, persistent_list
+from lispy.persistent_map import persistent_map
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_sorted_map import PersistentSortedMap
+from lispy.persistent_vector import persistent_vector
+from lispy.transducers import IDENTITY, Reducer, Transducer, transduce
+from lispy.types import LispyList, Vector
+
+
+def _map_entry(item: Any) -> Any:
+    if not isinstance(item, (list, tuple)) or len(item) != 2:
+        raise EvaluationError(
+            f"TypeError: 'into' a map expects [key value] pairs, got {item!r}."
+        )
+    return item
+
+
+@lispy_function("into")
+def into(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (into to [xform] from) LisPy function.
+    Adds every item of from, optionally passed through a transducer, to the
+    collection to. Vectors and maps are filled through a transient.
+    Usage: (into to from) or (into to xform from)
+    """
+    if len(args) not in (2, 3):
+        raise EvaluationError(
+            f"SyntaxError: 'into' expects 2 or 3 arguments, got {len(args)}."
+        )
+
+    target = args[0]
+    source = args[-1]
+    xform = args[1] if len(args) == 3 else IDENTITY
+    if not isinstance(xform, Transducer):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'into' must be a transducer, got {type(xform)}."
+        )
+    if isinstance(source, dict):
+        source = [Vector(entry) for entry in source.items()]
+    elif not isinstance(source, PersistentSet):
+        check_sequence(source, "into", "Last")
+    source = source or ()
+
+    if isinstance(target, Vector):
+        result = persistent_vector(target).transient()
+        return transduce(
+            xform, Reducer(lambda acc, item: acc.conj(item)), result, source
+        ).persistent()
+    if isinstance(target, PersistentSortedMap):
+        return transduce(
+            xform,
+            Reducer(lambda acc, item: acc.assoc(*_map_entry(item))),
+            target,
+            source,
+        )
+    if isinstance(target, dict):
+        result = persistent_map(target).transient()
+        return transduce(
+            xform,
+            Reducer(lambda acc, item: acc.assoc(*_map_entry(item))),
+            result,
+            source,
+        ).persistent()
+    if isinstance(target, PersistentSet):
+        return transduce(
+            xform,
+            Reducer(lambda acc, item: acc.conj(set_element(item, "into"))),
+            target,
+            source,
+        )
+    if target is None or isinstance(target, LispyList):
+        # Like conj, items are added to the front of a list
+        result = EMPTY_LIST if target is None else persistent_list(target)
+        return transduce(
+            xform, Reducer(lambda acc, item: acc.cons(item)), result, source
+        )
+    raise EvaluationError(
+        f"TypeError: First argument to 'into' must be a vector, map, set, list, or nil, got {type(target)}."
+    )
+
+
+@lispy_documentation("into")
+def into_documentation() -> str:
+    """Returns documentation for the into function."""
+    return """Function: into
+Arguments: (into to from) or (into to xform from)
+Description: Adds every item of from to the collection to, optionally through a transducer.
+
+Examples:
+  (into [1] [2 3])                              ; => [1 2 3]
+  (into [] (map (fn [x] (* x 2))) [1 2 3])      ; => [2 4 6]
+  (into [] (take 3) (lazy-range))               ; => [0 1 2]
+  (into {} [[:a 1] [:b 2]])                     ; => {:a 1 :b 2}
+  (into '() [1 2 3])                            ; => (3 2 1)
+  (into (hash-set) [1 2 1])                     ; => #{1 2}
+
+Notes:
+  - Vectors and maps are built in a transient, so into is linear
+  - Items are added as by conj: appended to vectors, prepended to lists
+  - Adding to a map takes [key value] pairs; a map source gives its entries
+  - With a transducer, everything happens in a single pass
+  - The original collection is not modified"""
@@ -0,0 +1,38 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.transducers import Reduced
+
+
+@lispy_function("reduced")
+def reduced(args: List[Any], env: Environment) -> Reduced:
+    """Implementation of the (reduced value) LisPy function.
+    Wraps value so that reduce and transduce stop and return it.
+    Usage: (reduced value)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'reduced' expects 1 argument, got {len(args)}."
+        )
+    return Reduced(args[0])
+
+
+@lispy_documentation("reduced")
+def reduced_documentation() -> str:
+    """Returns documentation for the reduced function."""
+    return """Function: reduced
+Arguments: (reduced value)
+Description: Wraps value so that the surrounding reduce or transduce stops early and returns it.
+
+Examples:
+  (reduce [1 2 3 4 5] (fn [acc x] (if (> acc 5) (reduced acc) (+ acc x))) 0)
+  ; => 6 (stops once the sum passes 5)
+  (transduce (lazy-range) (map (fn [x] x))
+             (fn [acc x] (if (= x 3) (reduced acc) (+ acc x))) 0)
+  ; => 3 (stops an infinite input)
+
+Notes:
+  - Return it from the reducing function passed to reduce or transduce
+  - The remaining items are never visited, so infinite inputs are fine"""
@@ -0,0 +1,47 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import check_sequence
+from lispy.lazy_seq import EMPTY_SEQ, LazySeq
+from lispy.transducers import Transducer, transduced
+
+
+@lispy_function("sequence")
+def sequence(args: List[Any], env: Environment) -> LazySeq:
+    """Implementation of the (sequence collection xform) LisPy function.
+    Returns a lazy sequence of the items of collection passed through the
+    transducer xform.
+    Usage: (sequence collection xform)
+    """
+    if len(args) != 2:
+        raise EvaluationError(
+            f"SyntaxError: 'sequence' expects 2 arguments, got {len(args)}."
+        )
+
+    collection, xform = args
+    check_sequence(collection, "sequence", "First")
+    if not isinstance(xform, Transducer):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'sequence' must be a transducer, got {type(xform)}."
+        )
+    if collection is None:
+        return EMPTY_SEQ
+    return LazySeq.from_iterable(transduced(xform, iter(collection)))
+
+
+@lispy_documentation("sequence")
+def sequence_documentation() -> str:
+    """Returns documentation for the sequence function."""
+    return """Function: sequence
+Arguments: (sequence collection xform)
+Description: Returns a lazy sequence of the items of collection passed through the transducer xform.
+
+Examples:
+  (sequence [1 2 3] (map (fn [x] (* x 2))))                ; => (2 4 6)
+  (take (sequence (lazy-range) (filter (fn [x] (> x 5)))) 2) ; => (6 7)
+
+Notes:
+  - Items are transformed in a single pass as the result is consumed
+  - Works on infinite lazy sequences"""
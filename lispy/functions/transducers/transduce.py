@@ -0,0 +1,64 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.evaluator import make_caller
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.sequence.utils import (call_procedure, check_procedure,
+                                            check_sequence)
+from lispy.transducers import Reducer, Transducer
+from lispy.transducers import transduce as run_transduce
+
+
+@lispy_function("transduce")
+def transduce(args: List[Any], env: Environment) -> Any:
+    """Implementation of the (transduce collection xform f [init]) LisPy function.
+    Reduces collection with f after passing every item through the transducer
+    xform, in a single pass.
+    Usage: (transduce collection xform f [init])
+    """
+    if len(args) not in (3, 4):
+        raise EvaluationError(
+            f"SyntaxError: 'transduce' expects 3 or 4 arguments, got {len(args)}."
+        )
+
+    collection, xform, procedure = args[:3]
+    check_sequence(collection, "transduce", "First")
+    if not isinstance(xform, Transducer):
+        raise EvaluationError(
+            f"TypeError: Second argument to 'transduce' must be a transducer, got {type(xform)}."
+        )
+    check_procedure(procedure, "transduce", "Third", 2)
+
+    # Without an initial value, like (+) the function supplies its own
+    init = args[3] if len(args) == 4 else call_procedure(procedure, [], env)
+    reducer = Reducer(make_caller(procedure, env, arity=2))
+    # Keep no reference to the head of a lazy collection, so the chunks
+    # already reduced can be freed while a long sequence streams through
+    items = iter(collection or ())
+    del collection
+    args[0] = None
+    return run_transduce(xform, reducer, init, items)
+
+
+@lispy_documentation("transduce")
+def transduce_documentation() -> str:
+    """Returns documentation for the transduce function."""
+    return """Function: transduce
+Arguments: (transduce collection xform function [initial-value])
+Description: Reduces collection with function after passing each item through the transducer xform, in one pass.
+
+Examples:
+  (transduce [1 2 3 4] (filter (fn [x] (> x 1))) + 0)          ; => 9
+  (transduce [1 2 3] (comp (map (fn [x] (* x x)))
+                           (filter (fn [x] (> x 1)))) + 0)     ; => 13
+  (transduce (lazy-range) (take 5) + 0)                       ; => 10
+  (transduce [1 2 3] (map (fn [x] (* x 2))) +)                ; => 12
+
+Notes:
+  - No intermediate collections are built between the steps of xform
+  - Function takes (accumulator item), as with reduce
+  - Without initial-value, function is called with no arguments to get one
+    (so + gives 0 and * gives 1)
+  - (take n) and (reduced value) stop early, even on infinite sequences
+  - Collection may be a vector, list, lazy sequence or nil"""
@@ -0,0 +1,19 @@
+"""LisPy Transient Functions - Mutable, single-owner collections for batch building"""
+
+from .assoc_bang import assoc_bang, assoc_bang_documentation
+from .conj_bang import conj_bang, conj_bang_documentation
+from .persistent_bang import persistent_bang, persistent_bang_documentation
+from .transient import transient, transient_documentation
+
+__all__ = [
+    # Functions
+    "assoc_bang",
+    "conj_bang",
+    "persistent_bang",
+    "transient",
+    # Documentation
+    "assoc_bang_documentation",
+    "conj_bang_documentation",
+    "persistent_bang_documentation",
+    "transient_documentation",
+]
@@ -0,0 +1,79 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.functions.map.utils import map_key
+from lispy.persistent_map import TransientMap
+from lispy.persistent_vector import TransientVector
+
+
+@lispy_function("assoc!")
+def assoc_bang(
+    args: List[Any], env: Environment
+) -> Union[TransientVector, TransientMap]:
+    """Implementation of the (assoc! transient key val ...) LisPy function.
+    Associates key-value pairs with a transient map, or replaces elements of a
+    transient vector by index, in place. Returns the transient.
+    Usage: (assoc! transient key1 value1 [key2 value2 ...])
+    """
+    if len(args) < 3:
+        raise EvaluationError(
+            f"SyntaxError: 'assoc!' expects at least 3 arguments (transient, key, value), got {len(args)}."
+        )
+
+    target = args[0]
+    kv_pairs = args[1:]
+
+    if len(kv_pairs) % 2 != 0:
+        raise EvaluationError(
+            f"SyntaxError: 'assoc!' requires an even number of key/value arguments after the transient, got {len(kv_pairs)}."
+        )
+
+    if isinstance(target, TransientVector):
+        for i in range(0, len(kv_pairs), 2):
+            index = kv_pairs[i]
+            if not isinstance(index, int) or isinstance(index, bool):
+                raise EvaluationError(
+                    f"TypeError: Vector index in 'assoc!' must be an integer, got {type(index)}."
+                )
+            if not 0 <= index <= len(target):
+                raise EvaluationError(
+                    f"IndexError: {index} out of bounds for 'assoc!' on vector of size {len(target)}."
+                )
+            target.assoc(index, kv_pairs[i + 1])
+        return target
+
+    if isinstance(target, TransientMap):
+        for i in range(0, len(kv_pairs), 2):
+            key = kv_pairs[i]
+            key = map_key(key, "Map keys in 'assoc!' must be")
+            target.assoc(key, kv_pairs[i + 1])
+        return target
+
+    raise EvaluationError(
+        f"TypeError: First argument to 'assoc!' must be a transient map or vector, got {type(target)}."
+    )
+
+
+@lispy_documentation("assoc!")
+def assoc_bang_documentation() -> str:
+    """Returns documentation for the assoc! function."""
+    return """Function: assoc!
+Arguments: (assoc! transient key1 value1 [key2 value2 ...])
+Description: Associates key-value pairs with a transient map or vector in place and returns the transient.
+
+Examples:
+  (persistent! (assoc! (transient {}) ':a 1 ':b 2))   ; => {:a 1 :b 2}
+  (persistent! (assoc! (transient {:a 1}) ':a 10))    ; => {:a 10}
+  (persistent! (assoc! (transient [1 2 3]) 1 ':x))    ; => [1 :x 3]
+  (persistent! (assoc! (transient [1 2]) 2 3))        ; => [1 2 3]
+
+Notes:
+  - First argument must be a transient created with (transient ...)
+  - For vectors, keys are indexes from 0 up to the vector's length
+  - Map keys must be symbols, strings, numbers, booleans, nil, or collections of them
+  - Each update is O(1) amortized for small maps and in place for the
+    trie nodes the transient already owns
+  - Returns the transient itself; always use the returned value
+  - Raises an error if the transient was already frozen with persistent!"""
@@ -0,0 +1,43 @@
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_vector import TransientVector
+
+
+@lispy_function("conj!")
+def conj_bang(args: List[Any], env: Environment) -> TransientVector:
+    """Implementation of the (conj! transient item ...) LisPy function.
+    Appends items to a transient vector in place and returns the transient.
+    Usage: (conj! transient item1 [item2 ...])
+    """
+    if len(args) < 2:
+        raise EvaluationError(
+            f"SyntaxError: 'conj!' expects at least 2 arguments (transient and item(s)), got {len(args)}."
+        )
+
+    target = args[0]
+    if not isinstance(target, TransientVector):
+        raise EvaluationError(
+            f"TypeError: 'conj!' expects a transient vector as the first argument, got {type(target)}."
+        )
+    return target.conj_all(args[1:])
+
+
+@lispy_documentation("conj!")
+def conj_bang_documentation() -> str:
+    """Returns documentation for the conj! function."""
+    return """Function: conj!
+Arguments: (conj! transient item1 item2 ...)
+Description: Appends items to a transient vector in place and returns the transient.
+
+Examples:
+  (persistent! (conj! (transient []) 1 2 3))    ; => [1 2 3]
+  (persistent! (conj! (transient [1]) 2))       ; => [1 2]
+
+Notes:
+  - First argument must be a transient vector created with (transient ...)
+  - Each append is O(1) amortized; no structure is copied per item
+  - Returns the transient itself; always use the returned value
+  - Raises an error if the transient was already frozen with persistent!"""
@@ -0,0 +1,48 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_map import PersistentMap, TransientMap
+from lispy.persistent_vector import PersistentVector, TransientVector
+
+
+@lispy_function("persistent!")
+def persistent_bang(
+    args: List[Any], env: Environment
+) -> Union[PersistentVector, PersistentMap]:
+    """Implementation of the (persistent! transient) LisPy function.
+    Freezes a transient back into an immutable vector or map. The transient
+    cannot be used afterwards.
+    Usage: (persistent! transient)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'persistent!' expects 1 argument, got {len(args)}."
+        )
+
+    target = args[0]
+    if not isinstance(target, (TransientVector, TransientMap)):
+        raise EvaluationError(
+            f"TypeError: 'persistent!' expects a transient vector or map, got {type(target)}."
+        )
+    return target.persistent()
+
+
+@lispy_documentation("persistent!")
+def persistent_bang_documentation() -> str:
+    """Returns documentation for the persistent! function."""
+    return """Function: persistent!
+Arguments: (persistent! transient)
+Description: Freezes a transient into an immutable vector or map.
+
+Examples:
+  (persistent! (transient [1 2 3]))             ; => [1 2 3]
+  (persistent! (conj! (transient []) 1))        ; => [1]
+  (persistent! (assoc! (transient {}) ':a 1))   ; => {:a 1}
+
+Notes:
+  - Freezing is O(1) for vectors and large maps: no elements are copied
+  - After persistent!, any use of the transient (conj!, assoc!, count,
+    persistent!) raises a TransientError
+  - The result is an ordinary persistent vector or map"""
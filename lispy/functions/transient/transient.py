@@ -0,0 +1,58 @@
+from typing import Any, List, Union
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_map import TransientMap, persistent_map
+from lispy.persistent_vector import TransientVector, persistent_vector
+from lispy.types import Vector
+
+
+@lispy_function("transient")
+def transient(
+    args: List[Any], env: Environment
+) -> Union[TransientVector, TransientMap]:
+    """Implementation of the (transient collection) LisPy function.
+    Returns a mutable, single-owner copy of a vector or map that shares the
+    original's structure until it is edited.
+    Usage: (transient collection)
+    """
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'transient' expects 1 argument, got {len(args)}."
+        )
+
+    collection = args[0]
+    if isinstance(collection, Vector):
+        return persistent_vector(collection).transient()
+    if isinstance(collection, dict):
+        return persistent_map(collection).transient()
+    raise EvaluationError(
+        f"TypeError: 'transient' expects a vector or map, got {type(collection)}."
+    )
+
+
+@lispy_documentation("transient")
+def transient_documentation() -> str:
+    """Returns documentation for the transient function."""
+    return """Function: transient
+Arguments: (transient collection)
+Description: Returns a mutable, single-owner version of a vector or map for batch building.
+
+Examples:
+  (persistent! (conj! (transient [1 2]) 3))     ; => [1 2 3]
+  (persistent! (assoc! (transient {}) ':a 1))   ; => {:a 1}
+
+  ; Build a large vector in place, then freeze it
+  (define build (fn [t n]
+    (if (= n 0) (persistent! t) (build (conj! t n) (- n 1)))))
+  (build (transient []) 3)                      ; => [3 2 1]
+
+Notes:
+  - Accepts vectors and maps
+  - Creating a transient is O(1): it shares the original's structure and
+    copies a node only the first time it edits it
+  - Edit a transient with conj! and assoc!, then freeze it with persistent!
+  - The original collection is never modified
+  - A transient must not be shared; use it only until persistent! is called
+  - count works on transients"""
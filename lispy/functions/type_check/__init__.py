@@ -8,6 +8,7 @@ from .is_list_q import is_list_q, is_list_q_documentation
 from .is_map_q import is_map_q, is_map_q_documentation
 from .is_nil_q import is_nil_q, is_nil_q_documentation
 from .is_number_q import is_number_q, is_number_q_documentation
+from .is_set_q import is_set_q, is_set_q_documentation
 from .is_string_q import is_string_q, is_string_q_documentation
 from .is_vector_q import is_vector_q, is_vector_q_documentation
 
@@ -20,6 +21,7 @@ __all__ = [
     "is_nil_q",
     "is_number_q",
     "is_string_q",
+    "is_set_q",
     "is_vector_q",
     # Documentation (new names)
     "is_boolean_q_documentation",
@@ -29,5 +31,6 @@ __all__ = [
     "is_nil_q_documentation",
     "is_number_q_documentation",
     "is_string_q_documentation",
+    "is_set_q_documentation",
     "is_vector_q_documentation",
 ]
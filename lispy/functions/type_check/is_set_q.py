@@ -0,0 +1,39 @@
+# lispy_project/lispy/functions/type_check/is_set_q.py
+from typing import Any, List
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions.decorators import lispy_documentation, lispy_function
+from lispy.persistent_set import PersistentSet
+
+
+@lispy_function("is-set?")
+def is_set_q(args: List[Any], env: Environment) -> bool:
+    """Returns true if the argument is a set, false otherwise. (is-set? value)"""
+    if len(args) != 1:
+        raise EvaluationError(
+            f"SyntaxError: 'is-set?' expects 1 argument, got {len(args)}."
+        )
+
+    arg = args[0]
+    return isinstance(arg, PersistentSet)
+
+
+@lispy_documentation("is-set?")
+def is_set_q_documentation() -> str:
+    """Returns documentation for the is-set? function."""
+    return """Function: is-set?
+Arguments: (is-set? value)
+Description: Tests whether a value is a set.
+
+Examples:
+  (is-set? (hash-set 1 2))  ; => true
+  (is-set? (hash-set))      ; => true
+  (is-set? [1 2])           ; => false (vector)
+  (is-set? {:a 1})          ; => false (map)
+  (is-set? nil)             ; => false
+
+Notes:
+  - Returns true for sets built with hash-set, conj, disj, into and the
+    set algebra functions
+  - Requires exactly one argument"""
@@ -162,7 +162,8 @@ Handler Function:
      :path "/users/123"
      :query-params {:page "1"}
      :headers {:content-type "application/json"}
-     :body "{...}"
+     :body "{...}"            ; nil if the body is not UTF-8
+     :body-bytes #<bytes ...> ; Raw body, for binary uploads
      :json {...}              ; Parsed JSON if applicable
      :params {:id "123"}      ; URL parameters
      :remote-addr "127.0.0.1"}
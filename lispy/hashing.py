@@ -0,0 +1,39 @@
+"""
+Structural hashing for LisPy collections.
+
+Two collections that compare equal must hash equal, so these hashes follow
+Python equality: a sequence hashes from its elements in order, so a vector
+and a list with the same elements hash the same (they compare equal with ==),
+and a map hashes from its entries regardless of order. Numbers that compare
+equal, such as 1 and 1.0, hash equal as usual.
+
+Hashing a collection hashes every element, so it raises TypeError when an
+element is unhashable (a mutable dict, for example). The persistent
+collections are immutable, so they compute their hash once and cache it;
+after that, two collections with different cached hashes are known to be
+different without comparing their elements.
+"""
+
+from typing import Any, Iterable, Mapping
+
+
+def hash_sequence(items: Iterable[Any]) -> int:
+    """Return an order-sensitive hash of items."""
+    return hash(tuple(items))
+
+
+def hash_mapping(mapping: Mapping[Any, Any]) -> int:
+    """Return an order-independent hash of the entries of mapping."""
+    return hash(frozenset(mapping.items()))
+
+
+def hashes_differ(a: Any, b: Any) -> bool:
+    """True if a and b both have a cached hash and the hashes differ.
+
+    This is the O(1) "definitely different" check; False means unknown.
+    """
+    hash_a = getattr(a, "_hash", None)
+    if hash_a is None:
+        return False
+    hash_b = getattr(b, "_hash", None)
+    return hash_b is not None and hash_a != hash_b
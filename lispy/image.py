@@ -0,0 +1,115 @@
+"""
+Interpreter images: save a global environment to a file and restore it later.
+
+An image holds an Environment graph (user-defined Functions and their
+closures, vectors, maps and any other bindings) together with the module
+loader's cache of loaded modules. Restoring an image skips re-evaluating the
+source that built it.
+
+Built-in functions are stored by reference and re-resolved on load. Values
+that only exist at runtime, such as pending promises, Python closures
+returned by built-ins, lazy sequences, open files and memory-mapped byte
+buffers, cannot be saved.
+
+Images are pickle files: only load images you created or otherwise trust.
+"""
+
+import os
+import pickle
+import tempfile
+from typing import Any, Dict
+
+from .environment import Environment
+from .exceptions import EvaluationError
+from .module_system import get_module_loader
+
+IMAGE_FORMAT = "lispy-image"
+IMAGE_VERSION = 1
+
+
+class Image:
+    """A restored interpreter image."""
+
+    def __init__(self, env: Environment, module_cache: Dict[str, Any]):
+        self.env = env
+        self.module_cache = module_cache
+
+
+def root_environment(env: Environment) -> Environment:
+    """Return the outermost environment of env's scope chain."""
+    while env.outer is not None:
+        env = env.outer
+    return env
+
+
+def save_image(env: Environment, path: str) -> None:
+    """Write the root environment of env and the module cache to path."""
+    payload = {
+        "format": IMAGE_FORMAT,
+        "version": IMAGE_VERSION,
+        "env": root_environment(env),
+        "module_cache": dict(get_module_loader().cache),
+    }
+    # Pickle into a temporary file beside path and move it into place, so a
+    # value that cannot be serialized leaves an existing image untouched
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".lispy-image-")
+    except OSError as e:
+        raise EvaluationError(f"OSError: Cannot write image '{path}': {e}")
+    try:
+        with os.fdopen(fd, "wb") as image_file:
+            pickle.dump(payload, image_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        _remove_quietly(temp_path)
+        raise EvaluationError(
+            f"ImageError: Cannot save image to '{path}', the environment holds a value that cannot be serialized: {e}"
+        )
+    except OSError as e:
+        _remove_quietly(temp_path)
+        raise EvaluationError(f"OSError: Cannot write image '{path}': {e}")
+    except BaseException:
+        _remove_quietly(temp_path)
+        raise
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def load_image(path: str) -> Image:
+    """Read an image and merge its modules into the module loader's cache."""
+    try:
+        with open(path, "rb") as image_file:
+            payload = pickle.load(image_file)
+    except OSError as e:
+        raise EvaluationError(f"OSError: Cannot read image '{path}': {e}")
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        raise EvaluationError(f"ImageError: '{path}' is not a valid LisPy image: {e}")
+
+    if not isinstance(payload, dict) or payload.get("format") != IMAGE_FORMAT:
+        raise EvaluationError(f"ImageError: '{path}' is not a LisPy image.")
+    if payload.get("version") != IMAGE_VERSION:
+        raise EvaluationError(
+            f"ImageError: '{path}' has image version {payload.get('version')}, expected {IMAGE_VERSION}."
+        )
+
+    get_module_loader().cache.update(payload["module_cache"])
+    return Image(payload["env"], payload["module_cache"])
+
+
+def restore_image_into(env: Environment, path: str) -> None:
+    """
+    Load an image and define its bindings in the root environment of env.
+
+    The image's own root environment is made to share env's bindings, so
+    closures restored from the image see later definitions made in env.
+    """
+    image = load_image(path)
+    target_root = root_environment(env)
+    target_root.store.update(image.env.store)
+    image.env.store = target_root.store
@@ -0,0 +1,167 @@
+"""
+Lazy sequences for LisPy.
+
+A LazySeq is a sequence whose elements are computed only when they are first
+needed and then cached, so it may be infinite. It is realized in chunks of up
+to CHUNK_SIZE elements: realizing the first element of a chunk computes the
+whole chunk, which keeps the per-element cost of a lazy pipeline low.
+
+A LazySeq node starts out holding a thunk, a function of no arguments that
+returns the node's contents: nil, any iterable (a vector, a list, an iterator
+or another LazySeq). Realizing the node calls the thunk once and stores the
+first chunk of the contents plus a LazySeq for everything after it. first
+and rest are O(1) once a node is realized, and rest of a node shares all of
+its cached elements.
+
+LazySeq is not a list subclass: code that needs every element must iterate
+it explicitly, and len() is deliberately not supported because the sequence
+may be infinite.
+"""
+
+from itertools import islice, zip_longest
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+CHUNK_SIZE = 32
+
+
+class LazySeq:
+    """A cached, chunk-realized sequence whose elements are computed on demand."""
+
+    __slots__ = ("_thunk", "_chunk", "_offset", "_more")
+
+    def __init__(self, thunk: Callable[[], Any]):
+        self._thunk = thunk
+        self._chunk: Optional[List[Any]] = None
+        self._offset = 0
+        self._more: Optional["LazySeq"] = None
+
+    @classmethod
+    def _realized(
+        cls, chunk: Optional[List[Any]], offset: int, more: Optional["LazySeq"]
+    ) -> "LazySeq":
+        seq = cls.__new__(cls)
+        seq._thunk = None
+        seq._chunk = chunk
+        seq._offset = offset
+        seq._more = more
+        return seq
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any]) -> "LazySeq":
+        """Return a LazySeq that pulls its elements from items as needed."""
+        iterator = iter(items)
+        return cls(lambda: iterator)
+
+    def _realize(self) -> None:
+        thunk = self._thunk
+        if thunk is None:
+            return
+        contents = thunk()
+        if isinstance(contents, LazySeq):
+            contents._realize()
+            chunk, offset, more = contents._chunk, contents._offset, contents._more
+        elif contents is None:
+            chunk, offset, more = None, 0, None
+        else:
+            iterator = iter(contents)
+            chunk = list(islice(iterator, CHUNK_SIZE))
+            offset = 0
+            if not chunk:
+                chunk, more = None, None
+            elif len(chunk) < CHUNK_SIZE:
+                more = EMPTY_SEQ
+            else:
+                more = LazySeq(lambda: iterator)
+        self._chunk = chunk
+        self._offset = offset
+        self._more = more
+        self._thunk = None
+
+    # --- Sequence operations ---
+
+    def is_empty(self) -> bool:
+        """Realize the first chunk and return True if the sequence has no elements."""
+        self._realize()
+        return self._chunk is None
+
+    def first(self) -> Any:
+        """Return the first element, or None for an empty sequence."""
+        self._realize()
+        if self._chunk is None:
+            return None
+        return self._chunk[self._offset]
+
+    def rest(self) -> "LazySeq":
+        """Return the sequence without its first element (empty if it is empty)."""
+        self._realize()
+        chunk = self._chunk
+        if chunk is None:
+            return EMPTY_SEQ
+        if self._offset + 1 < len(chunk):
+            return self._realized(chunk, self._offset + 1, self._more)
+        return self._more
+
+    def cons(self, item: Any) -> "LazySeq":
+        """Return a sequence with item in front of this (still unrealized) one."""
+        return self._realized([item], 0, self)
+
+    def chunks(self) -> Iterator[List[Any]]:
+        """Yield the sequence one realized chunk at a time."""
+        return _chunks(self)
+
+    # --- Python protocols ---
+
+    def __iter__(self) -> Iterator[Any]:
+        return _elements(self)
+
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazySeq)):
+            return NotImplemented
+        sentinel = object()
+        for a, b in zip_longest(self, other, fillvalue=sentinel):
+            if a is sentinel or b is sentinel or not (a is b or a == b):
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"({' '.join(map(repr, self))})"
+
+
+def _chunks(seq: LazySeq) -> Iterator[List[Any]]:
+    # seq is rebound as we go, so the head is not kept alive by this generator
+    while True:
+        seq._realize()
+        chunk = seq._chunk
+        if chunk is None:
+            return
+        yield chunk[seq._offset :] if seq._offset else chunk
+        seq = seq._more
+
+
+def _elements(seq: LazySeq) -> Iterator[Any]:
+    chunks = _chunks(seq)
+    # Drop this frame's reference to the head, so iterating a sequence the
+    # caller no longer holds (such as the lines of a file) frees each chunk
+    # once it has been consumed
+    del seq
+    for chunk in chunks:
+        yield from chunk
+
+
+EMPTY_SEQ = LazySeq._realized(None, 0, None)
+
+
+def lazy_seq(items: Any) -> LazySeq:
+    """Return items as a LazySeq, reusing it if it already is one."""
+    if isinstance(items, LazySeq):
+        return items
+    return LazySeq.from_iterable(() if items is None else items)
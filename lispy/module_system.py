@@ -1,6 +1,7 @@
 import os
 from typing import Dict, List, Optional, Set
 
+from .constant_pool import ConstantPool
 from .environment import Environment
 from .exceptions import EvaluationError
 from .lexer import tokenize
@@ -19,6 +20,8 @@ class Module:
         self.env = create_global_env()  # Start with built-in functions
         self.exports: Set[str] = set()  # Exported symbol names
         self.loaded = False
+        # Constant pool statistics, if the module was parsed with a pool
+        self.constant_pool_stats: Optional[Dict[str, int]] = None
 
     def add_export(self, symbol_name: str):
         """Add a symbol to the module's exports."""
@@ -47,8 +50,10 @@ class Module:
 class ModuleLoader:
     """Handles loading and caching of LisPy modules."""
 
-    def __init__(self):
+    def __init__(self, use_constant_pool: bool = True):
         self.cache: Dict[str, Module] = {}  # module_name -> Module
+        # Deduplicate each module's immutable literals while parsing it
+        self.use_constant_pool = use_constant_pool
         self.loading: Set[str] = set()  # Track modules currently being loaded
         self.load_paths: List[str] = ["."]  # Default load path
 
@@ -104,8 +109,11 @@ class ModuleLoader:
             # Tokenize and parse
             tokens = tokenize(source_code)
 
-            # Parse all expressions in the file
-            expressions = self._parse_all_expressions(tokens)
+            # Parse all expressions in the file, sharing one constant pool
+            pool = ConstantPool() if self.use_constant_pool else None
+            expressions = self._parse_all_expressions(tokens, pool)
+            if pool is not None:
+                module.constant_pool_stats = pool.stats()
 
             # Set the current module context for export forms
             set_current_module(module, module.env)
@@ -126,8 +134,8 @@ class ModuleLoader:
             # Remove from loading set
             self.loading.discard(module_name)
 
-    def _parse_all_expressions(self, tokens):
-        """Parse all expressions from a list of tokens."""
+    def _parse_all_expressions(self, tokens, pool: Optional[ConstantPool] = None):
+        """Parse all expressions from a list of tokens, through pool if given."""
         expressions = []
         position = 0
 
@@ -137,7 +145,7 @@ class ModuleLoader:
                 tokens, position
             )
             if expr_tokens:
-                expr = parse(expr_tokens)
+                expr = parse(expr_tokens, pool)
                 expressions.append(expr)
             position = new_position
 
@@ -0,0 +1,329 @@
+"""
+Typed numeric arrays for LisPy.
+
+A NumericArray is an immutable, homogeneous array of either 64-bit floats
+(kind "double") or 64-bit signed integers (kind "int"). The elements live in
+one contiguous buffer, so the vectorized operations here (elementwise + and
+*, sum, mean, min, max, dot) run as a single loop in C instead of one LisPy
+call per element.
+
+NumPy is used when it is installed. Otherwise the buffer is an array.array
+and the operations use the C-level builtins (sum, min, max, map with the
+operator module). Both backends give the same results. In particular an
+integer result that does not fit in 64 bits raises OverflowError, and sum
+and dot of integers return exact Python ints. NumPy's int64 arithmetic wraps
+around instead, so its result is only used when a bound on the magnitudes
+shows nothing can overflow; otherwise the operation is done in Python ints.
+
+Arrays are built from any iterable of numbers through array.array, which
+also validates the elements, so converting a vector is one C-level loop.
+to_list() converts back the same way.
+"""
+
+import operator
+from array import array
+from itertools import compress
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+TYPECODES = {"double": "d", "int": "q"}
+Numeric = Union[int, float]
+
+INT64_MAX = 2**63 - 1
+
+
+class _MayOverflow(Exception):
+    """An int64 computation could overflow and must be done in Python ints."""
+
+
+class _Bound:
+    """An upper bound on the absolute values of an integer computation.
+
+    Passed through an operator-style function in place of an array, it
+    bounds every intermediate result and raises _MayOverflow as soon as one
+    could leave the int64 range.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        if value > INT64_MAX:
+            raise _MayOverflow()
+        self.value = value
+
+    def _combine(self, other: Any, op: Callable[[int, int], int]) -> "_Bound":
+        if isinstance(other, float):
+            # Arithmetic with a float is done in floats, which do not wrap
+            return _Bound(0)
+        if not isinstance(other, _Bound):
+            # NumPy cannot hold a constant outside the int64 range either
+            other = _Bound(abs(other))
+        return _Bound(op(self.value, other.value))
+
+    def __add__(self, other: Any) -> "_Bound":
+        return self._combine(other, operator.add)
+
+    def __mul__(self, other: Any) -> "_Bound":
+        return self._combine(other, operator.mul)
+
+    # |a - b| <= |a| + |b|, and the order of the operands does not matter
+    __radd__ = __sub__ = __rsub__ = __add__
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> "_Bound":
+        return _Bound(0)
+
+    def __neg__(self) -> "_Bound":
+        return self
+
+    def _compare(self, other: Any) -> bool:
+        return True
+
+    __rtruediv__ = __truediv__
+    __abs__ = __neg__
+    __lt__ = __le__ = __gt__ = __ge__ = __eq__ = _compare
+
+
+class NumericArray:
+    """An immutable typed array of doubles or 64-bit integers."""
+
+    __slots__ = ("_data", "kind")
+
+    def __init__(self, data: Any, kind: str):
+        # data is an array.array, or a NumPy array when NumPy is installed
+        self._data = data
+        self.kind = kind
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any], kind: str) -> "NumericArray":
+        """Build an array of kind from values.
+
+        Raises TypeError if a value is not a number of that kind, and
+        OverflowError if an integer does not fit in 64 bits.
+        """
+        if isinstance(values, NumericArray):
+            if values.kind == kind:
+                return values
+            values = values.to_list()
+        elif type(values) is not list:
+            # array() reads list subclasses through their list storage, which
+            # the persistent collections leave empty, so always iterate them
+            values = iter(values)
+        buffer = array(TYPECODES[kind], values)
+        if np is not None:
+            return cls(np.frombuffer(buffer, dtype=_dtype(kind)), kind)
+        return cls(buffer, kind)
+
+    def to_list(self) -> List[Numeric]:
+        """Return the elements as a list of Python ints or floats."""
+        return self._data.tolist()
+
+    # --- Vectorized operations ---
+
+    def add(self, other: Union["NumericArray", Numeric]) -> "NumericArray":
+        """Elementwise sum with another array of the same length or a number."""
+        return self._binary(other, operator.add)
+
+    def multiply(self, other: Union["NumericArray", Numeric]) -> "NumericArray":
+        """Elementwise product with another array of the same length or a number."""
+        return self._binary(other, operator.mul)
+
+    def sum(self) -> Numeric:
+        if np is not None:
+            if self.kind == "int" and _magnitude(self._data) * len(self) > INT64_MAX:
+                return sum(self._data.tolist())
+            return self._data.sum().item()
+        return sum(self._data, 0.0 if self.kind == "double" else 0)
+
+    def mean(self) -> float:
+        """Return the arithmetic mean. Raises ValueError if the array is empty."""
+        if not len(self):
+            raise ValueError("mean of an empty array")
+        return self.sum() / len(self)
+
+    def min(self) -> Numeric:
+        """Return the smallest element. Raises ValueError if the array is empty."""
+        if not len(self):
+            raise ValueError("min of an empty array")
+        if np is not None:
+            return self._data.min().item()
+        return min(self._data)
+
+    def max(self) -> Numeric:
+        """Return the largest element. Raises ValueError if the array is empty."""
+        if not len(self):
+            raise ValueError("max of an empty array")
+        if np is not None:
+            return self._data.max().item()
+        return max(self._data)
+
+    def dot(self, other: "NumericArray") -> Numeric:
+        """Return the dot product with an array of the same length."""
+        self._check_length(other)
+        if np is not None:
+            if self.kind == other.kind == "int":
+                bound = _magnitude(self._data) * _magnitude(other._data) * len(self)
+                if bound > INT64_MAX:
+                    return sum(map(operator.mul, self._data.tolist(), other._data.tolist()))
+            return np.dot(self._data, other._data).item()
+        start = 0.0 if "double" in (self.kind, other.kind) else 0
+        return sum(map(operator.mul, self._data, other._data), start)
+
+    def map_vectorized(
+        self, function: Callable[[Any], Any], kind: str
+    ) -> "NumericArray":
+        """Apply function, built from operator-style arithmetic, to every element.
+
+        With NumPy, function is called once with the whole array. Otherwise it
+        is called once per element from a C-level map. kind is the kind of
+        the results.
+        """
+        if np is not None and self._int_overflows(function):
+            return NumericArray.from_values(map(function, self._data.tolist()), kind)
+        if np is not None:
+            with np.errstate(divide="raise", invalid="raise"):
+                result = function(self._data.astype(_dtype(kind), copy=False))
+            if np.ndim(result) == 0:
+                # The function ignored its argument
+                result = np.full(len(self), result, dtype=_dtype(kind))
+            return NumericArray(np.asarray(result, dtype=_dtype(kind)), kind)
+        return NumericArray(array(TYPECODES[kind], map(function, self._data)), kind)
+
+    def mask(self, predicate: Callable[[Any], Any]) -> Sequence[bool]:
+        """Apply predicate, built from operator-style comparisons, to every element.
+
+        Returns a boolean NumPy array with NumPy, otherwise a list of bools.
+        """
+        if np is not None and self._int_overflows(predicate):
+            return list(map(predicate, self._data.tolist()))
+        if np is not None:
+            with np.errstate(divide="raise", invalid="raise"):
+                result = predicate(self._data)
+            if np.ndim(result) == 0:
+                return np.full(len(self), bool(result))
+            return np.asarray(result, dtype=bool)
+        return list(map(predicate, self._data))
+
+    def compress(self, mask: Sequence[Any]) -> "NumericArray":
+        """Return the elements whose entry in mask is true."""
+        if np is not None:
+            return NumericArray(self._data[np.asarray(mask, dtype=bool)], self.kind)
+        return NumericArray(
+            array(TYPECODES[self.kind], compress(self._data, mask)), self.kind
+        )
+
+    def take(self, indices: Sequence[int]) -> "NumericArray":
+        """Return the elements at indices, in that order."""
+        if np is not None:
+            positions = np.asarray(indices, dtype=np.intp)
+            return NumericArray(self._data[positions], self.kind)
+        return NumericArray(
+            array(TYPECODES[self.kind], map(self._data.__getitem__, indices)),
+            self.kind,
+        )
+
+    def argsort(self, descending: bool = False) -> Sequence[int]:
+        """Return the indices that sort the array. Equal elements keep their order."""
+        if np is not None:
+            if not descending:
+                return np.argsort(self._data, kind="stable")
+            # Sorting the reversed array and reversing the result is stable
+            reversed_order = np.argsort(self._data[::-1], kind="stable")
+            return (len(self) - 1 - reversed_order)[::-1]
+        return sorted(range(len(self)), key=self._data.__getitem__, reverse=descending)
+
+    def _binary(
+        self, other: Union["NumericArray", Numeric], op: Callable[[Any, Any], Any]
+    ) -> "NumericArray":
+        if isinstance(other, NumericArray):
+            self._check_length(other)
+            kind = "double" if "double" in (self.kind, other.kind) else "int"
+            other_data = other._data
+            if np is not None:
+                if kind == "int" and _may_overflow(op, self._data, other_data):
+                    values = map(op, self._data.tolist(), other_data.tolist())
+                    return NumericArray.from_values(values, kind)
+                return NumericArray(op(self._data, other_data), kind)
+            return NumericArray(
+                array(TYPECODES[kind], map(op, self._data, other_data)), kind
+            )
+        is_float = self.kind == "double" or isinstance(other, float)
+        kind = "double" if is_float else "int"
+        if np is not None:
+            if kind == "int" and _may_overflow(op, self._data, other):
+                values = [op(value, other) for value in self._data.tolist()]
+                return NumericArray.from_values(values, kind)
+            return NumericArray(
+                np.asarray(op(self._data, other), dtype=_dtype(kind)), kind
+            )
+        return NumericArray(
+            array(TYPECODES[kind], [op(value, other) for value in self._data]), kind
+        )
+
+    def _int_overflows(self, function: Callable[[Any], Any]) -> bool:
+        """Whether function could overflow int64 arithmetic on this array."""
+        if self.kind != "int":
+            return False
+        try:
+            function(_Bound(_magnitude(self._data)))
+        except _MayOverflow:
+            return True
+        return False
+
+    def _check_length(self, other: "NumericArray") -> None:
+        if len(self) != len(other):
+            raise ValueError(
+                f"arrays have different lengths ({len(self)} and {len(other)})"
+            )
+
+    # --- Python protocols ---
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Numeric]:
+        return iter(self.to_list()) if np is not None else iter(self._data)
+
+    def __getitem__(self, index: int) -> Numeric:
+        value = self._data[index]
+        return value.item() if np is not None else value
+
+    def __eq__(self, other):
+        if not isinstance(other, NumericArray):
+            return NotImplemented
+        return self.kind == other.kind and self.to_list() == other.to_list()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"#<{self.kind}-array [{' '.join(map(repr, self))}]>"
+
+
+def _dtype(kind: str) -> Any:
+    return np.float64 if kind == "double" else np.int64
+
+
+def _magnitude(data: Any) -> int:
+    """Return the largest absolute value in a NumPy int64 array, as a Python int."""
+    if not len(data):
+        return 0
+    return max(-int(data.min()), int(data.max()))
+
+
+def _may_overflow(op: Callable[[Any, Any], Any], data: Any, other: Any) -> bool:
+    """Whether op on int64 data and other, an array or an int, could overflow."""
+    try:
+        if isinstance(other, np.ndarray):
+            other = _Bound(_magnitude(other))
+        op(_Bound(_magnitude(data)), other)
+    except _MayOverflow:
+        return True
+    return False
@@ -1,4 +1,8 @@
 # Parser implementation will go here
+from collections import deque
+from typing import Optional
+
+from .constant_pool import ConstantPool
 from .exceptions import ParseError  # Updated import
 from .lexer import TOKEN_RBRACE  # Added LBRACE, RBRACE
 from .lexer import TOKEN_RBRACKET  # Added LBRACKET, RBRACKET
@@ -11,11 +15,15 @@ from .types import (LispyList, LispyMapLiteral,  # Import LispyMapLiteral
 # ... import other token types as needed ...
 
 
-def parse(tokens: list[tuple]):
+def parse(tokens: list[tuple], pool: Optional[ConstantPool] = None):
     """
     Parses a list of tokens into a Lisp expression (AST).
+
+    If pool is given, immutable literals are deduplicated through it, so equal
+    literals parsed with the same pool share one object.
     """
-    _tokens = list(tokens)  # Make a mutable copy
+    # A deque, so consuming a token is O(1) even for very large forms
+    _tokens = deque(tokens)
 
     # Forward declaration for _parse_form, as _parse_list will call it.
     # In Python, functions are objects, so actual definition order matters for availability.
@@ -24,13 +32,16 @@ def parse(tokens: list[tuple]):
 
     def _parse_atom(current_token_type, current_token_value):
         """Parses an atomic token and consumes it."""
-        _tokens.pop(0)  # Consume the atom token
+        _tokens.popleft()  # Consume the atom token
         if current_token_type == TOKEN_NUMBER:
             try:
-                return int(current_token_value)
+                number = int(current_token_value)
             except ValueError:
-                return float(current_token_value)
+                number = float(current_token_value)
+            return pool.number(number) if pool is not None else number
         elif current_token_type == TOKEN_STRING:
+            if pool is not None:
+                return pool.string(current_token_value)
             return current_token_value  # Already a string
         elif current_token_type == TOKEN_BOOLEAN:
             return current_token_value  # Lexer already returns True/False
@@ -39,6 +50,8 @@ def parse(tokens: list[tuple]):
             return current_token_value
         elif current_token_type == TOKEN_SYMBOL:
             # Ensure it's a string (Symbol class might be better later)
+            if pool is not None:
+                return pool.symbol(str(current_token_value))
             return Symbol(str(current_token_value))
         # Should not be reached if _parse_form calls it correctly
         raise ParseError(
@@ -47,11 +60,11 @@ def parse(tokens: list[tuple]):
 
     def _parse_list():
         """Parses a list form '()' , consuming '(' and ')' and all elements."""
-        _tokens.pop(0)  # Consume '('
+        _tokens.popleft()  # Consume '('
         expr_list = []
         while _tokens:
             if _tokens[0][0] == TOKEN_RPAREN:
-                _tokens.pop(0)  # Consume ')'
+                _tokens.popleft()  # Consume ')'
                 return LispyList(expr_list)  # Changed List to LispyList
             else:
                 # Recursively parse inner expression
@@ -61,14 +74,14 @@ def parse(tokens: list[tuple]):
 
     def _parse_vector():
         """Parses a vector form '[]', consuming '[' and ']' and all elements."""
-        _tokens.pop(0)  # Consume '['
+        _tokens.popleft()  # Consume '['
         vector_elements = []
         while _tokens:
             if _tokens[0][0] == TOKEN_RBRACKET:
-                _tokens.pop(0)  # Consume ']'
-                return Vector(
-                    vector_elements
-                )  # Successfully parsed vector, return as Vector type
+                _tokens.popleft()  # Consume ']'
+                vector = Vector(vector_elements)
+                # Successfully parsed vector, return as Vector type
+                return pool.vector(vector) if pool is not None else vector
             else:
                 # Recursively parse inner expression
                 vector_elements.append(_parse_form())  # Call the main _parse_form
@@ -77,12 +90,14 @@ def parse(tokens: list[tuple]):
 
     def _parse_map():
         """Parses a map form '{}', consuming '{' and '}' and all key-value pairs."""
-        _tokens.pop(0)  # Consume '{'
+        _tokens.popleft()  # Consume '{'
         map_data = LispyMapLiteral()  # Use LispyMapLiteral instead of dict
 
         while _tokens:
             if _tokens[0][0] == TOKEN_RBRACE:
-                _tokens.pop(0)  # Consume '}'
+                _tokens.popleft()  # Consume '}'
+                if pool is not None:
+                    return pool.map_literal(map_data)
                 return map_data  # Successfully parsed map
 
             # --- Parse Key ---
@@ -140,7 +155,7 @@ def parse(tokens: list[tuple]):
         elif token_type == TOKEN_LBRACE:  # Handle map literals
             return _parse_map()
         elif token_type == TOKEN_QUOTE:  # Handle ' shorthand for quote
-            _tokens.pop(0)  # Consume the TOKEN_QUOTE token
+            _tokens.popleft()  # Consume the TOKEN_QUOTE token
             if not _tokens:  # Check if there's an expression to quote
                 raise ParseError(
                     "SyntaxError: 'quote' shorthand ' must be followed by an expression."
@@ -160,7 +175,7 @@ def parse(tokens: list[tuple]):
         ):
             return _parse_atom(token_type, token_value)
         else:
-            # _tokens.pop(0) # Do not consume here, error is about current token
+            # _tokens.popleft() # Do not consume here, error is about current token
             raise ParseError(
                 f"Unexpected token type during parsing: {token_type} ('{token_value}')"
             )
@@ -171,7 +186,7 @@ def parse(tokens: list[tuple]):
     parsed_expression = _parse_form()
 
     if _tokens:  # If there are unconsumed tokens after parsing one top-level expression
-        raise ParseError(f"Unexpected tokens at end of input: {_tokens}")
+        raise ParseError(f"Unexpected tokens at end of input: {list(_tokens)}")
 
     return parsed_expression
 
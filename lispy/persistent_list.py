@@ -0,0 +1,188 @@
+"""
+Persistent singly linked list for LisPy.
+
+PersistentList is a chain of immutable cons cells. Each cell holds its first
+element, the rest of the list and the list's length, so first, rest, cons,
+count and empty? are all O(1) and a list shares its tail with every list
+consed onto it. Walking a list with (recur (rest items)) is therefore linear.
+
+PersistentList subclasses LispyList so code that checks for lists, iterates
+them or indexes them keeps working. Indexing walks the chain, so nth is O(n)
+as in other Lisps. Its list storage is always empty and in-place list
+mutation raises a TypeError.
+"""
+
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
+
+from .hashing import hash_sequence, hashes_differ
+from .types import LispyList
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(
+        "PersistentList is immutable; use cons or conj to build a new list."
+    )
+
+
+class PersistentList(LispyList):
+    """An immutable LisPy list made of cons cells that share their tails."""
+
+    __slots__ = ("_first", "_rest", "_count", "_hash")
+
+    def __init__(self, items: Iterable[Any] = ()):
+        super().__init__()
+        items = list(items)
+        self._first = items[0] if items else None
+        self._rest = None
+        self._count = len(items)
+        self._hash = None
+        if items:
+            rest = EMPTY_LIST
+            for item in reversed(items[1:]):
+                rest = rest.cons(item)
+            self._rest = rest
+
+    @classmethod
+    def _cell(cls, first: Any, rest: "PersistentList") -> "PersistentList":
+        cell = cls.__new__(cls)
+        cell._first = first
+        cell._rest = rest
+        cell._count = rest._count + 1
+        cell._hash = None
+        return cell
+
+    # --- Persistent operations ---
+
+    def cons(self, item: Any) -> "PersistentList":
+        """Return a new list with item in front, sharing this list as its tail."""
+        return self._cell(item, self)
+
+    def first(self) -> Any:
+        """Return the first element, or None for the empty list."""
+        return self._first
+
+    def rest(self) -> "PersistentList":
+        """Return the list without its first element (empty for an empty list)."""
+        return self._rest if self._count else self
+
+    # --- Sequence protocol ---
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        cell = self
+        while cell._count:
+            yield cell._first
+            cell = cell._rest
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1 and stop >= self._count:
+                cell = self
+                for _ in range(start):
+                    cell = cell._rest
+                return cell
+            return PersistentList(list(self)[index])
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("list index out of range")
+        if index == 0:
+            return self._first
+        return next(islice(self, index, None))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(list(self))
+
+    def __contains__(self, item: Any) -> bool:
+        return any(element is item or element == item for element in self)
+
+    def index(self, item: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        stop = self._count if stop is None else stop
+        for position, element in enumerate(islice(self, start, stop), start):
+            if element is item or element == item:
+                return position
+        raise ValueError(f"{item!r} is not in list")
+
+    def count(self, item: Any) -> int:
+        return sum(1 for element in self if element is item or element == item)
+
+    # --- Comparison and arithmetic, matching list semantics ---
+
+    def __eq__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        if len(self) != len(other) or hashes_differ(self, other):
+            return False
+        return all(a is b or a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        return list(self) < list(other)
+
+    def __le__(self, other):
+        return list(self) <= list(other)
+
+    def __gt__(self, other):
+        return list(self) > list(other)
+
+    def __ge__(self, other):
+        return list(self) >= list(other)
+
+    def __hash__(self) -> int:
+        # Computed on first use and cached; raises TypeError if an element
+        # is unhashable
+        if self._hash is None:
+            self._hash = hash_sequence(self)
+        return self._hash
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, times):
+        return list(self) * times
+
+    __rmul__ = __mul__
+
+    def copy(self) -> List[Any]:
+        return list(self)
+
+    def __copy__(self) -> "PersistentList":
+        return self
+
+    def __reduce__(self):
+        return (PersistentList, (list(self),))
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+
+def _empty_list() -> PersistentList:
+    empty = PersistentList.__new__(PersistentList)
+    empty._first = None
+    empty._rest = None
+    empty._count = 0
+    empty._hash = None
+    return empty
+
+
+EMPTY_LIST = _empty_list()
+
+
+def persistent_list(items: Iterable[Any]) -> PersistentList:
+    """Return items as a PersistentList, reusing it if it already is one."""
+    if isinstance(items, PersistentList):
+        return items
+    return PersistentList(items)
@@ -0,0 +1,650 @@
+"""
+Persistent hash map with structural sharing for LisPy.
+
+PersistentMap stores its entries in a hash array mapped trie (HAMT). Each
+trie node holds a 32-bit bitmap and a compact array of its occupied slots,
+and each level consumes five bits of the key's hash. Adding, replacing or
+removing a key copies only the nodes on the path to that key, so assoc and
+dissoc are O(log32 n) and every earlier version of the map stays valid.
+Keys whose 32-bit hashes are equal share a collision node.
+
+Maps with up to SMALL_MAP_LIMIT keys skip the trie and copy a small private
+dict instead, much like Clojure's array maps.
+
+Like a dict, a PersistentMap iterates in insertion order: a PersistentVector
+records the order keys were added in, and removed keys leave a tombstone that
+is compacted away once tombstones make up half of the order vector.
+
+PersistentMap subclasses dict so code that checks for maps, looks keys up,
+iterates or calls items() keeps working. Every read goes through the trie.
+The underlying dict storage only holds a private marker entry while the map
+is non-empty, because some C code (the json module's encoder among others)
+checks the raw dict size before calling items(). In-place mutation is not
+supported and raises a TypeError.
+
+TransientMap is the mutable, single-owner counterpart used to build a map in
+a batch. Trie nodes carry the edit token of the transient that created them,
+so a transient copies a node once and then edits it in place; freezing the
+transient with persistent() drops the token, which makes every node it
+created immutable again.
+"""
+
+from collections.abc import ItemsView, KeysView, ValuesView
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from .exceptions import EvaluationError
+from .hashing import hash_mapping, hashes_differ
+from .persistent_vector import PersistentVector, TransientVector
+
+BITS = 5
+MASK = (1 << BITS) - 1
+HASH_BITS = 32
+SMALL_MAP_LIMIT = 32
+
+_NOT_FOUND = object()
+_SUBNODE = object()  # Key slot marker: the value slot holds a child node
+_REMOVED = object()  # Tombstone in the insertion order vector
+_NON_EMPTY = object()  # Marker key kept in the dict storage of non-empty maps
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & 0xFFFFFFFF
+
+
+def _bit(key_hash: int, shift: int) -> int:
+    return 1 << ((key_hash >> shift) & MASK)
+
+
+def _same_key(a: Any, b: Any) -> bool:
+    return a is b or a == b
+
+
+class _BitmapNode:
+    """Trie node holding up to 32 entries, indexed by a bitmap of occupied slots.
+
+    array alternates keys and entries, where an entry is a (position, value)
+    pair and position is the key's index in the map's insertion order. A key
+    of _SUBNODE means the following slot holds a child node covering every
+    key that shares this slot. edit is the token of the transient allowed to
+    modify the node in place, or None for a node shared by persistent maps.
+    """
+
+    __slots__ = ("bitmap", "array", "edit")
+
+    def __init__(self, bitmap: int, array: List[Any], edit: Any = None):
+        self.bitmap = bitmap
+        self.array = array
+        self.edit = edit
+
+    def find(self, shift: int, key_hash: int, key: Any) -> Any:
+        node = self
+        while True:
+            bit = 1 << ((key_hash >> shift) & MASK)
+            if not node.bitmap & bit:
+                return _NOT_FOUND
+            index = 2 * (node.bitmap & (bit - 1)).bit_count()
+            stored_key = node.array[index]
+            if stored_key is _SUBNODE:
+                node = node.array[index + 1]
+                if type(node) is _CollisionNode:
+                    return node.find(shift + BITS, key_hash, key)
+                shift += BITS
+            elif stored_key is key or stored_key == key:
+                return node.array[index + 1]
+            else:
+                return _NOT_FOUND
+
+    def assoc(self, shift: int, key_hash: int, key: Any, value: Any, position: int):
+        """Return (node, added) where added is True if key was not present.
+
+        A new key is stored at the given insertion position; an existing key
+        keeps its position.
+        """
+        bit = 1 << ((key_hash >> shift) & MASK)
+        index = 2 * (self.bitmap & (bit - 1)).bit_count()
+
+        if not self.bitmap & bit:
+            array = self.array[:index]
+            array += (key, (position, value))
+            array += self.array[index:]
+            return _BitmapNode(self.bitmap | bit, array), True
+
+        stored_key = self.array[index]
+        stored = self.array[index + 1]
+        if stored_key is _SUBNODE:
+            child, added = stored.assoc(shift + BITS, key_hash, key, value, position)
+            if child is stored:
+                return self, False
+            return self._with_slot(index, _SUBNODE, child), added
+        if stored_key is key or stored_key == key:
+            if stored[1] is value:
+                return self, False
+            return self._with_slot(index, stored_key, (stored[0], value)), False
+
+        child = _create_node(
+            shift + BITS, stored_key, stored, key_hash, key, (position, value)
+        )
+        return self._with_slot(index, _SUBNODE, child), True
+
+    def assoc_in_place(
+        self, edit: Any, shift: int, key_hash: int, key: Any, value: Any, position: int
+    ):
+        """Like assoc, but modifies nodes owned by the edit token in place."""
+        bit = 1 << ((key_hash >> shift) & MASK)
+        index = 2 * (self.bitmap & (bit - 1)).bit_count()
+
+        if not self.bitmap & bit:
+            node = self._editable(edit)
+            node.array[index:index] = (key, (position, value))
+            node.bitmap |= bit
+            return node, True
+
+        stored_key = self.array[index]
+        stored = self.array[index + 1]
+        if stored_key is _SUBNODE:
+            child, added = stored.assoc_in_place(
+                edit, shift + BITS, key_hash, key, value, position
+            )
+            if child is stored:
+                return self, added
+            node = self._editable(edit)
+            node.array[index + 1] = child
+            return node, added
+        if stored_key is key or stored_key == key:
+            if stored[1] is value:
+                return self, False
+            node = self._editable(edit)
+            node.array[index + 1] = (stored[0], value)
+            return node, False
+
+        child = _create_node(
+            shift + BITS, stored_key, stored, key_hash, key, (position, value)
+        )
+        node = self._editable(edit)
+        node.array[index] = _SUBNODE
+        node.array[index + 1] = child
+        return node, True
+
+    def _editable(self, edit: Any) -> "_BitmapNode":
+        if self.edit is edit:
+            return self
+        return _BitmapNode(self.bitmap, list(self.array), edit)
+
+    def without(self, shift: int, key_hash: int, key: Any):
+        """Return the node without key, None if it became empty."""
+        bit = _bit(key_hash, shift)
+        if not self.bitmap & bit:
+            return self
+        index = 2 * (self.bitmap & (bit - 1)).bit_count()
+        stored_key = self.array[index]
+
+        if stored_key is _SUBNODE:
+            child = self.array[index + 1]
+            new_child = child.without(shift + BITS, key_hash, key)
+            if new_child is child:
+                return self
+            if new_child is not None:
+                return self._with_slot(index, _SUBNODE, new_child)
+        elif not _same_key(stored_key, key):
+            return self
+
+        if self.bitmap == bit:
+            return None
+        array = self.array[:index] + self.array[index + 2 :]
+        return _BitmapNode(self.bitmap ^ bit, array)
+
+    def _with_slot(self, index: int, key: Any, value: Any) -> "_BitmapNode":
+        array = list(self.array)
+        array[index] = key
+        array[index + 1] = value
+        return _BitmapNode(self.bitmap, array)
+
+    def entries(self) -> Iterator[Tuple[Any, Any]]:
+        array = self.array
+        for index in range(0, len(array), 2):
+            if array[index] is _SUBNODE:
+                yield from array[index + 1].entries()
+            else:
+                yield array[index], array[index + 1]
+
+
+class _CollisionNode:
+    """Leaf holding keys whose 32-bit hashes are identical."""
+
+    __slots__ = ("key_hash", "array")
+
+    def __init__(self, key_hash: int, array: List[Any]):
+        self.key_hash = key_hash
+        self.array = array
+
+    def _index_of(self, key: Any) -> int:
+        for index in range(0, len(self.array), 2):
+            if _same_key(self.array[index], key):
+                return index
+        return -1
+
+    def find(self, shift: int, key_hash: int, key: Any) -> Any:
+        index = self._index_of(key)
+        return _NOT_FOUND if index < 0 else self.array[index + 1]
+
+    def assoc(self, shift: int, key_hash: int, key: Any, value: Any, position: int):
+        if key_hash != self.key_hash:
+            # Nest this node one level down and branch on the new hash
+            node = _BitmapNode(_bit(self.key_hash, shift), [_SUBNODE, self])
+            return node.assoc(shift, key_hash, key, value, position)
+        index = self._index_of(key)
+        if index < 0:
+            array = self.array + [key, (position, value)]
+            return _CollisionNode(self.key_hash, array), True
+        stored = self.array[index + 1]
+        if stored[1] is value:
+            return self, False
+        array = list(self.array)
+        array[index + 1] = (stored[0], value)
+        return _CollisionNode(self.key_hash, array), False
+
+    def assoc_in_place(
+        self, edit: Any, shift: int, key_hash: int, key: Any, value: Any, position: int
+    ):
+        # Collisions are rare enough that copying is fine
+        return self.assoc(shift, key_hash, key, value, position)
+
+    def without(self, shift: int, key_hash: int, key: Any):
+        index = self._index_of(key)
+        if index < 0:
+            return self
+        if len(self.array) == 2:
+            return None
+        return _CollisionNode(
+            self.key_hash, self.array[:index] + self.array[index + 2 :]
+        )
+
+    def entries(self) -> Iterator[Tuple[Any, Any]]:
+        array = self.array
+        for index in range(0, len(array), 2):
+            yield array[index], array[index + 1]
+
+
+def _create_node(
+    shift: int, key1: Any, entry1: Tuple, key2_hash: int, key2: Any, entry2: Tuple
+):
+    """Build the smallest subtree holding two different keys."""
+    key1_hash = _hash(key1)
+    if key1_hash == key2_hash or shift >= HASH_BITS:
+        return _CollisionNode(key1_hash, [key1, entry1, key2, entry2])
+    node, _ = _EMPTY_ROOT.assoc(shift, key1_hash, key1, entry1[1], entry1[0])
+    node, _ = node.assoc(shift, key2_hash, key2, entry2[1], entry2[0])
+    return node
+
+
+_EMPTY_ROOT = _BitmapNode(0, [])
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(
+        "PersistentMap is immutable; use assoc, dissoc or merge to build a new map."
+    )
+
+
+class PersistentMap(dict):
+    """An immutable LisPy map that shares structure with its earlier versions.
+
+    Maps with at most SMALL_MAP_LIMIT keys keep their entries in a private
+    dict that is copied on update; copying a small dict is cheaper than a
+    path copy through the trie. Larger maps use the trie, which maps each key
+    to a (position, value) pair, where position is the key's index in the
+    insertion order vector.
+    """
+
+    __slots__ = ("_small", "_root", "_count", "_order", "_removed", "_hash")
+
+    def __init__(self, items: Any = (), **kwargs: Any):
+        super().__init__()
+        small = dict(items, **kwargs)
+        if len(small) <= SMALL_MAP_LIMIT:
+            self._set_small(small)
+        else:
+            self._set_large(small.items())
+
+    def _set_small(self, small: dict) -> None:
+        self._small = small
+        self._root = None
+        self._order = None
+        self._count = len(small)
+        self._removed = 0
+        self._hash = None
+        if small:
+            dict.__setitem__(self, _NON_EMPTY, None)
+
+    def _set_large(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        # Nodes built under a private edit token are filled in place
+        edit = object()
+        root = _EMPTY_ROOT
+        order_keys = []
+        for key, value in items:
+            root, added = root.assoc_in_place(
+                edit, 0, _hash(key), key, value, len(order_keys)
+            )
+            if added:
+                order_keys.append(key)
+        self._small = None
+        self._root = root
+        self._order = PersistentVector(order_keys)
+        self._count = len(order_keys)
+        self._removed = 0
+        self._hash = None
+        dict.__setitem__(self, _NON_EMPTY, None)
+
+    @classmethod
+    def _from_small(cls, small: dict) -> "PersistentMap":
+        result = cls.__new__(cls)
+        result._set_small(small)
+        return result
+
+    @classmethod
+    def _make(
+        cls, root: _BitmapNode, count: int, order: PersistentVector, removed: int
+    ) -> "PersistentMap":
+        result = cls.__new__(cls)
+        result._small = None
+        result._root = root
+        result._count = count
+        result._order = order
+        result._removed = removed
+        result._hash = None
+        dict.__setitem__(result, _NON_EMPTY, None)
+        return result
+
+    # --- Persistent operations ---
+
+    def assoc(self, key: Any, value: Any) -> "PersistentMap":
+        """Return a new map with key associated to value."""
+        small = self._small
+        if small is not None:
+            if key in small:
+                if small[key] is value:
+                    return self
+            elif len(small) >= SMALL_MAP_LIMIT:
+                result = PersistentMap.__new__(PersistentMap)
+                result._set_large(small.items())
+                return result.assoc(key, value)
+            small = small.copy()
+            small[key] = value
+            return self._from_small(small)
+
+        root, added = self._root.assoc(0, _hash(key), key, value, len(self._order))
+        if added:
+            return self._make(
+                root, self._count + 1, self._order.conj(key), self._removed
+            )
+        if root is self._root:
+            return self
+        return self._make(root, self._count, self._order, self._removed)
+
+    def assoc_all(self, items: Iterable[Tuple[Any, Any]]) -> "PersistentMap":
+        """Return a new map with every (key, value) pair associated in order."""
+        small = self._small
+        if small is not None:
+            small = dict(small)
+            small.update(items)
+            if len(small) <= SMALL_MAP_LIMIT:
+                return self._from_small(small)
+            return PersistentMap(small)
+        result = self
+        for key, value in items:
+            result = result.assoc(key, value)
+        return result
+
+    def transient(self) -> "TransientMap":
+        """Return a mutable TransientMap that starts out sharing this map's trie."""
+        return TransientMap(self)
+
+    def dissoc(self, key: Any) -> "PersistentMap":
+        """Return a new map without key."""
+        small = self._small
+        if small is not None:
+            if key not in small:
+                return self
+            small = small.copy()
+            del small[key]
+            return self._from_small(small)
+
+        key_hash = _hash(key)
+        entry = self._root.find(0, key_hash, key)
+        if entry is _NOT_FOUND:
+            return self
+        count = self._count - 1
+        removed = self._removed + 1
+        if count <= SMALL_MAP_LIMIT // 2 or removed * 2 > len(self._order):
+            return PersistentMap(
+                (k, self[k])
+                for k in self._order
+                if k is not _REMOVED and not _same_key(k, key)
+            )
+        root = self._root.without(0, key_hash, key)
+        order = self._order.assoc(entry[0], _REMOVED)
+        return self._make(root, count, order, removed)
+
+    # --- Mapping protocol ---
+
+    def __getitem__(self, key: Any) -> Any:
+        small = self._small
+        if small is not None:
+            return small[key]
+        entry = self._root.find(0, _hash(key), key)
+        if entry is _NOT_FOUND:
+            raise KeyError(key)
+        return entry[1]
+
+    def get(self, key: Any, default: Optional[Any] = None) -> Any:
+        small = self._small
+        if small is not None:
+            return small.get(key, default)
+        entry = self._root.find(0, _hash(key), key)
+        return default if entry is _NOT_FOUND else entry[1]
+
+    def __contains__(self, key: Any) -> bool:
+        small = self._small
+        if small is not None:
+            return key in small
+        return self._root.find(0, _hash(key), key) is not _NOT_FOUND
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._small is not None:
+            return iter(self._small)
+        if not self._removed:
+            return iter(self._order)
+        return (key for key in self._order if key is not _REMOVED)
+
+    def __reversed__(self) -> Iterator[Any]:
+        if self._small is not None:
+            return reversed(self._small)
+        return (key for key in reversed(self._order) if key is not _REMOVED)
+
+    def keys(self) -> KeysView:
+        if self._small is not None:
+            return self._small.keys()
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        if self._small is not None:
+            return self._small.values()
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        if self._small is not None:
+            return self._small.items()
+        return ItemsView(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        if len(self) != len(other) or hashes_differ(self, other):
+            return False
+        for key, value in self.items():
+            other_value = other.get(key, _NOT_FOUND)
+            if other_value is _NOT_FOUND or not (
+                other_value is value or other_value == value
+            ):
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        # Computed on first use and cached; raises TypeError if a key or
+        # value is unhashable
+        if self._hash is None:
+            self._hash = hash_mapping(self)
+        return self._hash
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.assoc_all(other.items())
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = dict(other)
+        result.update(self.items())
+        return result
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "}"
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def __copy__(self) -> "PersistentMap":
+        return self
+
+    def __reduce__(self):
+        return (PersistentMap, (list(self.items()),))
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+class TransientMap:
+    """A mutable, single-owner map for building a PersistentMap in place.
+
+    A small map is copied into a private dict; once it outgrows
+    SMALL_MAP_LIMIT keys it moves into a trie whose nodes carry this
+    transient's edit token. A large source map's trie is shared, and each node
+    on a written path is copied once and then edited in place.
+    """
+
+    __slots__ = ("_small", "_root", "_count", "_order", "_removed", "_edit")
+
+    def __init__(self, source: Any = ()):
+        if not isinstance(source, PersistentMap):
+            source = PersistentMap(source)
+        self._edit = object()
+        if source._small is not None:
+            self._small = dict(source._small)
+            self._root = None
+            self._order = None
+            self._count = 0
+            self._removed = 0
+        else:
+            self._small = None
+            self._root = source._root
+            self._count = source._count
+            self._order = source._order.transient()
+            self._removed = source._removed
+
+    def _ensure_editable(self) -> None:
+        if self._edit is None:
+            raise EvaluationError(
+                "TransientError: Transient used after persistent! call."
+            )
+
+    def _move_to_trie(self) -> None:
+        small = self._small
+        self._small = None
+        self._root = _EMPTY_ROOT
+        self._order = TransientVector()
+        self._count = 0
+        self._removed = 0
+        for key, value in small.items():
+            self.assoc(key, value)
+
+    # --- Transient operations ---
+
+    def assoc(self, key: Any, value: Any) -> "TransientMap":
+        """Associate key with value in place and return this transient."""
+        self._ensure_editable()
+        small = self._small
+        if small is not None:
+            if len(small) < SMALL_MAP_LIMIT or key in small:
+                small[key] = value
+                return self
+            self._move_to_trie()
+
+        self._root, added = self._root.assoc_in_place(
+            self._edit, 0, _hash(key), key, value, len(self._order)
+        )
+        if added:
+            self._order.conj(key)
+            self._count += 1
+        return self
+
+    def persistent(self) -> PersistentMap:
+        """Freeze this transient into a PersistentMap."""
+        self._ensure_editable()
+        self._edit = None
+        if self._small is not None:
+            if not self._small:
+                return EMPTY_MAP
+            return PersistentMap._from_small(self._small)
+        return PersistentMap._make(
+            self._root, self._count, self._order.persistent(), self._removed
+        )
+
+    # --- Read access ---
+
+    def __len__(self) -> int:
+        self._ensure_editable()
+        if self._small is not None:
+            return len(self._small)
+        return self._count
+
+    def get(self, key: Any, default: Optional[Any] = None) -> Any:
+        self._ensure_editable()
+        if self._small is not None:
+            return self._small.get(key, default)
+        entry = self._root.find(0, _hash(key), key)
+        return default if entry is _NOT_FOUND else entry[1]
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _NOT_FOUND) is not _NOT_FOUND
+
+    def __repr__(self) -> str:
+        if self._edit is None:
+            return "#<transient map (frozen)>"
+        return f"#<transient map count={len(self)}>"
+
+
+EMPTY_MAP = PersistentMap()
+
+
+def persistent_map(items: Any) -> PersistentMap:
+    """Return items as a PersistentMap, reusing it if it already is one."""
+    if isinstance(items, PersistentMap):
+        return items
+    return PersistentMap(items)
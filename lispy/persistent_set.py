@@ -0,0 +1,145 @@
+"""
+Persistent hash set for LisPy.
+
+PersistentSet is an immutable set backed by a PersistentMap whose keys are
+the set's elements, the way Clojure builds its hash sets on its hash maps.
+Membership tests are hash lookups, and conj and disj copy only the trie path
+to the element, so both are O(log32 n) and every earlier version of the set
+stays valid.
+
+Elements are hashed with Python hashing, so symbols hash by name and the
+persistent collections hash structurally. Like PersistentMap, a set iterates
+in insertion order, which keeps printing and distinct deterministic.
+
+Sets compare equal to other sets with the same elements, regardless of
+order, and are hashable, so sets can be map keys and members of other sets.
+"""
+
+from typing import Any, Iterable, Iterator
+
+from .hashing import hashes_differ
+from .persistent_map import EMPTY_MAP, PersistentMap
+
+
+class PersistentSet:
+    """An immutable LisPy set that shares structure with its earlier versions."""
+
+    __slots__ = ("_map", "_hash")
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._map = _entries(EMPTY_MAP, items)
+        self._hash = None
+
+    @classmethod
+    def _make(cls, entries: PersistentMap) -> "PersistentSet":
+        result = cls.__new__(cls)
+        result._map = entries
+        result._hash = None
+        return result
+
+    # --- Persistent operations ---
+
+    def conj(self, item: Any) -> "PersistentSet":
+        """Return a set that also contains item."""
+        if item in self._map:
+            return self
+        return self._make(self._map.assoc(item, True))
+
+    def conj_all(self, items: Iterable[Any]) -> "PersistentSet":
+        """Return a set that also contains every item."""
+        entries = _entries(self._map, items)
+        return self if len(entries) == len(self._map) else self._make(entries)
+
+    def disj(self, item: Any) -> "PersistentSet":
+        """Return a set without item."""
+        if item not in self._map:
+            return self
+        return self._make(self._map.dissoc(item))
+
+    def empty(self) -> "PersistentSet":
+        """Return an empty set of the same kind."""
+        return EMPTY_SET
+
+    def union(self, other: "PersistentSet") -> "PersistentSet":
+        """Return the elements of either set, adding the smaller to the larger."""
+        if len(other) > len(self):
+            return other.conj_all(self)
+        return self.conj_all(other)
+
+    def intersection(self, other: "PersistentSet") -> "PersistentSet":
+        """Return the elements of self that are also in other, in self's order."""
+        entries = other._map
+        return self.empty().conj_all(item for item in self if item in entries)
+
+    def difference(self, other: "PersistentSet") -> "PersistentSet":
+        """Return the elements of self that are not in other."""
+        if len(other) < len(self) // 4:
+            # Removing a few elements keeps the rest of the trie shared
+            result = self
+            for item in other:
+                result = result.disj(item)
+            return result
+        entries = other._map
+        return self.empty().conj_all(item for item in self if item not in entries)
+
+    # --- Collection protocol ---
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __bool__(self) -> bool:
+        return bool(self._map)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._map)
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            return item in self._map
+        except TypeError:  # Unhashable values are never members
+            return False
+
+    def __eq__(self, other):
+        if not isinstance(other, PersistentSet):
+            return NotImplemented
+        if len(self) != len(other) or hashes_differ(self, other):
+            return False
+        entries = other._map
+        return all(item in entries for item in self)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        # Computed on first use and cached, independent of insertion order
+        if self._hash is None:
+            self._hash = hash(frozenset(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "#{" + " ".join(map(repr, self)) + "}"
+
+    def __copy__(self) -> "PersistentSet":
+        return self
+
+    def __reduce__(self):
+        return (PersistentSet, (list(self),))
+
+
+def _entries(entries: PersistentMap, items: Iterable[Any]) -> PersistentMap:
+    """Return entries with every item added as a key, built in a transient."""
+    transient = entries.transient()
+    for item in items:
+        transient.assoc(item, True)
+    return transient.persistent()
+
+
+EMPTY_SET = PersistentSet()
+
+
+def persistent_set(items: Iterable[Any]) -> PersistentSet:
+    """Return items as a PersistentSet, reusing it if it already is one."""
+    if isinstance(items, PersistentSet):
+        return items
+    return PersistentSet(items)
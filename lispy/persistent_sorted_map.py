@@ -0,0 +1,399 @@
+"""
+Persistent sorted map for LisPy.
+
+PersistentSortedMap keeps its entries in an AVL tree ordered by a comparator,
+so lookups, assoc and dissoc are O(log n), iteration is in key order, and
+range queries (entries) start at a bound in O(log n) and then walk only the
+entries they return. Like PersistentMap, an update copies only the nodes on
+the path to the key, so every earlier version of the map stays valid.
+
+A comparator is a Python function compare(a, b) that returns a negative
+number, zero or a positive number. Keys are equal when compare returns zero,
+so keys only need to be comparable, not hashable. The default comparator,
+natural_compare, orders numbers and strings with < and keywords by name.
+
+PersistentSortedMap subclasses dict for the same reason PersistentMap does:
+code that checks for maps, looks keys up or calls items() keeps working.
+Every read goes through the tree, and the dict storage only holds a private
+marker entry while the map is non-empty. In-place mutation raises a
+TypeError.
+"""
+
+from collections.abc import ItemsView, KeysView, ValuesView
+from functools import cmp_to_key
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .hashing import hash_mapping, hashes_differ
+from .types import Symbol
+
+Comparator = Callable[[Any, Any], int]
+# A range bound: (key, inclusive)
+Bound = Optional[Tuple[Any, bool]]
+
+_NOT_FOUND = object()
+_NON_EMPTY = object()  # Marker key kept in the dict storage of non-empty maps
+
+
+def natural_compare(a: Any, b: Any) -> int:
+    """Compare a and b with < and >, comparing symbols by name.
+
+    Raises TypeError if the two values cannot be ordered.
+    """
+    if type(a) is Symbol and type(b) is Symbol:
+        a, b = a.name, b.name
+    return (a > b) - (a < b)
+
+
+def reverse_compare(a: Any, b: Any) -> int:
+    """natural_compare with the order reversed."""
+    return natural_compare(b, a)
+
+
+class _TreeNode:
+    """An immutable AVL tree node."""
+
+    __slots__ = ("key", "value", "left", "right", "height")
+
+    def __init__(self, key: Any, value: Any, left: Any, right: Any, height: int):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = height
+
+
+def _height(node: Optional[_TreeNode]) -> int:
+    return node.height if node is not None else 0
+
+
+def _node(key: Any, value: Any, left: Any, right: Any) -> _TreeNode:
+    return _TreeNode(key, value, left, right, max(_height(left), _height(right)) + 1)
+
+
+def _balance(key: Any, value: Any, left: Any, right: Any) -> _TreeNode:
+    """Build a node, rotating once or twice if its subtrees' heights differ by 2."""
+    left_height, right_height = _height(left), _height(right)
+    if left_height > right_height + 1:
+        if _height(left.left) >= _height(left.right):
+            return _node(
+                left.key, left.value, left.left, _node(key, value, left.right, right)
+            )
+        pivot = left.right
+        return _node(
+            pivot.key,
+            pivot.value,
+            _node(left.key, left.value, left.left, pivot.left),
+            _node(key, value, pivot.right, right),
+        )
+    if right_height > left_height + 1:
+        if _height(right.right) >= _height(right.left):
+            return _node(
+                right.key, right.value, _node(key, value, left, right.left), right.right
+            )
+        pivot = right.left
+        return _node(
+            pivot.key,
+            pivot.value,
+            _node(key, value, left, pivot.left),
+            _node(right.key, right.value, pivot.right, right.right),
+        )
+    return _TreeNode(key, value, left, right, max(left_height, right_height) + 1)
+
+
+def _insert(node: Any, key: Any, value: Any, compare: Comparator):
+    """Return (node, added) where added is True if key was not present.
+
+    An existing key keeps the key object already stored.
+    """
+    if node is None:
+        return _TreeNode(key, value, None, None, 1), True
+    order = compare(key, node.key)
+    if order < 0:
+        left, added = _insert(node.left, key, value, compare)
+        if left is node.left:
+            return node, False
+        return _balance(node.key, node.value, left, node.right), added
+    if order > 0:
+        right, added = _insert(node.right, key, value, compare)
+        if right is node.right:
+            return node, False
+        return _balance(node.key, node.value, node.left, right), added
+    if node.value is value:
+        return node, False
+    return _TreeNode(node.key, value, node.left, node.right, node.height), False
+
+
+def _remove(node: Any, key: Any, compare: Comparator) -> Any:
+    """Return node without key, or node itself if key is not present."""
+    if node is None:
+        return None
+    order = compare(key, node.key)
+    if order < 0:
+        left = _remove(node.left, key, compare)
+        if left is node.left:
+            return node
+        return _balance(node.key, node.value, left, node.right)
+    if order > 0:
+        right = _remove(node.right, key, compare)
+        if right is node.right:
+            return node
+        return _balance(node.key, node.value, node.left, right)
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    successor = node.right
+    while successor.left is not None:
+        successor = successor.left
+    return _balance(
+        successor.key, successor.value, node.left, _remove_first(node.right)
+    )
+
+
+def _remove_first(node: _TreeNode) -> Any:
+    if node.left is None:
+        return node.right
+    return _balance(node.key, node.value, _remove_first(node.left), node.right)
+
+
+def _build(entries: List[Tuple[Any, Any]], start: int, end: int) -> Any:
+    """Build a balanced tree from sorted, distinct entries[start:end]."""
+    if start >= end:
+        return None
+    middle = (start + end) // 2
+    key, value = entries[middle]
+    left = _build(entries, start, middle)
+    right = _build(entries, middle + 1, end)
+    return _TreeNode(key, value, left, right, max(_height(left), _height(right)) + 1)
+
+
+def _from_sorted(
+    entries: List[Tuple[Any, Any]], compare: Comparator
+) -> "PersistentSortedMap":
+    """Rebuild a pickled map from its entries, which are already in order.
+
+    No keys are compared, so a comparator that calls a LisPy function is
+    not run while an image is loading and its environment is incomplete.
+    """
+    result = PersistentSortedMap.__new__(PersistentSortedMap)
+    result._set(_build(entries, 0, len(entries)), len(entries), compare)
+    return result
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(
+        "PersistentSortedMap is immutable; use assoc or dissoc to build a new map."
+    )
+
+
+class PersistentSortedMap(dict):
+    """An immutable LisPy map whose keys are kept in comparator order."""
+
+    __slots__ = ("_root", "_count", "_compare", "_hash")
+
+    def __init__(self, items: Any = (), compare: Optional[Comparator] = None):
+        super().__init__()
+        compare = compare or natural_compare
+        if isinstance(items, dict):
+            items = items.items()
+        # Sort once and build a balanced tree instead of inserting one by one.
+        # The sort is stable, so of several equal keys the first one is kept
+        # with the last value, as a dict would.
+        entries: List[Tuple[Any, Any]] = []
+        sorted_items = sorted(items, key=cmp_to_key(lambda a, b: compare(a[0], b[0])))
+        for key, value in sorted_items:
+            if entries and compare(entries[-1][0], key) == 0:
+                entries[-1] = (entries[-1][0], value)
+            else:
+                entries.append((key, value))
+        self._set(_build(entries, 0, len(entries)), len(entries), compare)
+
+    def _set(self, root: Any, count: int, compare: Comparator) -> None:
+        self._root = root
+        self._count = count
+        self._compare = compare
+        self._hash = None
+        if count:
+            dict.__setitem__(self, _NON_EMPTY, None)
+
+    def _make(self, root: Any, count: int) -> "PersistentSortedMap":
+        result = PersistentSortedMap.__new__(PersistentSortedMap)
+        result._set(root, count, self._compare)
+        return result
+
+    @property
+    def comparator(self) -> Comparator:
+        return self._compare
+
+    # --- Persistent operations ---
+
+    def assoc(self, key: Any, value: Any) -> "PersistentSortedMap":
+        """Return a map with key set to value."""
+        root, added = _insert(self._root, key, value, self._compare)
+        if root is self._root:
+            return self
+        return self._make(root, self._count + added)
+
+    def assoc_all(self, items: Iterable[Tuple[Any, Any]]) -> "PersistentSortedMap":
+        """Return a map with every (key, value) pair of items set."""
+        root, count, compare = self._root, self._count, self._compare
+        for key, value in items:
+            root, added = _insert(root, key, value, compare)
+            count += added
+        return self if root is self._root else self._make(root, count)
+
+    def dissoc(self, key: Any) -> "PersistentSortedMap":
+        """Return a map without key."""
+        root = _remove(self._root, key, self._compare)
+        if root is self._root:
+            return self
+        return self._make(root, self._count - 1)
+
+    def empty(self) -> "PersistentSortedMap":
+        """Return an empty map with the same comparator."""
+        return self._make(None, 0)
+
+    def entries(
+        self, lower: Bound = None, upper: Bound = None, reverse: bool = False
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Yield the (key, value) pairs between lower and upper in key order.
+
+        A bound is a (key, inclusive) pair, or None for no bound. With reverse,
+        the pairs are yielded from upper down to lower.
+        """
+        compare = self._compare
+        stack: List[_TreeNode] = []
+        node = self._root
+        if not reverse:
+            # Push the path to the first key at or above lower
+            while node is not None:
+                if lower is None:
+                    order = 1
+                else:
+                    order = compare(node.key, lower[0]) or (1 if lower[1] else -1)
+                if order > 0:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            while stack:
+                node = stack.pop()
+                if upper is not None:
+                    order = compare(node.key, upper[0])
+                    if order > 0 or (order == 0 and not upper[1]):
+                        return
+                yield node.key, node.value
+                node = node.right
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+        else:
+            # Push the path to the last key at or below upper
+            while node is not None:
+                if upper is None:
+                    order = -1
+                else:
+                    order = compare(node.key, upper[0]) or (-1 if upper[1] else 1)
+                if order < 0:
+                    stack.append(node)
+                    node = node.right
+                else:
+                    node = node.left
+            while stack:
+                node = stack.pop()
+                if lower is not None:
+                    order = compare(node.key, lower[0])
+                    if order < 0 or (order == 0 and not lower[1]):
+                        return
+                yield node.key, node.value
+                node = node.left
+                while node is not None:
+                    stack.append(node)
+                    node = node.right
+
+    def _find(self, key: Any) -> Any:
+        compare = self._compare
+        node = self._root
+        while node is not None:
+            order = compare(key, node.key)
+            if order < 0:
+                node = node.left
+            elif order > 0:
+                node = node.right
+            else:
+                return node.value
+        return _NOT_FOUND
+
+    # --- Mapping protocol ---
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._find(key)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Optional[Any] = None) -> Any:
+        value = self._find(key)
+        return default if value is _NOT_FOUND else value
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) is not _NOT_FOUND
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return (key for key, _ in self.entries())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return (key for key, _ in self.entries(reverse=True))
+
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        return ItemsView(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        if len(self) != len(other) or hashes_differ(self, other):
+            return False
+        for key, value in self.entries():
+            other_value = other.get(key, _NOT_FOUND)
+            if other_value is _NOT_FOUND or not (
+                other_value is value or other_value == value
+            ):
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        # Hashes like a PersistentMap with the same entries, since they are equal
+        if self._hash is None:
+            self._hash = hash_mapping(self)
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(f"{k!r}: {v!r}" for k, v in self.entries()) + "}"
+
+    def copy(self) -> dict:
+        return dict(self.entries())
+
+    def __copy__(self) -> "PersistentSortedMap":
+        return self
+
+    def __reduce__(self):
+        return (_from_sorted, (list(self.entries()), self._compare))
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
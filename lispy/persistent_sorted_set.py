@@ -0,0 +1,50 @@
+"""
+Persistent sorted set for LisPy.
+
+PersistentSortedSet is a PersistentSet backed by a PersistentSortedMap
+instead of a hash map, so its elements are kept in comparator order and
+conj, disj and membership are O(log n). Being a PersistentSet, it works
+everywhere a set does (contains?, disj, union, count, into, ...) and
+compares equal to a hash set with the same elements.
+"""
+
+from typing import Any, Iterable, Iterator, Optional
+
+from .persistent_set import PersistentSet
+from .persistent_sorted_map import Bound, Comparator, PersistentSortedMap
+
+
+class PersistentSortedSet(PersistentSet):
+    """An immutable LisPy set whose elements are kept in comparator order."""
+
+    __slots__ = ()
+
+    def __init__(
+        self, items: Iterable[Any] = (), compare: Optional[Comparator] = None
+    ):
+        self._map = PersistentSortedMap(((item, True) for item in items), compare)
+        self._hash = None
+
+    @property
+    def comparator(self) -> Comparator:
+        return self._map.comparator
+
+    def conj_all(self, items: Iterable[Any]) -> "PersistentSortedSet":
+        entries = self._map.assoc_all((item, True) for item in items)
+        return self if entries is self._map else self._make(entries)
+
+    def empty(self) -> "PersistentSortedSet":
+        return self._make(self._map.empty())
+
+    def elements(
+        self, lower: Bound = None, upper: Bound = None, reverse: bool = False
+    ) -> Iterator[Any]:
+        """Yield the elements between lower and upper; see PersistentSortedMap.entries."""
+        return (item for item, _ in self._map.entries(lower, upper, reverse))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._map)
+
+    def __reduce__(self):
+        # The map pickles without comparing its keys; see _from_sorted
+        return (PersistentSortedSet._make, (self._map,))
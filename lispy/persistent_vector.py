@@ -0,0 +1,471 @@
+"""
+Persistent vector with structural sharing for LisPy.
+
+PersistentVector is a 32-way bit-partitioned trie with a tail buffer, the
+same layout Clojure uses for its vectors. Appending (conj) and updating an
+index (assoc) copy only the path from the root to the affected leaf, so both
+are O(log32 n) and every earlier version of the vector stays valid.
+
+The last (up to 32) elements live in a separate tail array. Appends copy only
+the tail until it is full, at which point it is pushed into the trie as a new
+leaf, which makes conj effectively O(1).
+
+PersistentVector subclasses Vector so existing code that checks for vectors,
+iterates them, indexes them or calls len() keeps working. Its list storage is
+always empty: every read goes through the trie. In-place list mutation is not
+supported and raises a TypeError.
+
+TransientVector is the mutable, single-owner counterpart used to build a
+vector in a batch: (transient v) shares v's trie, conj! and assoc! edit nodes
+in place once the transient has copied them, and (persistent! t) freezes the
+result into a PersistentVector in O(1). A transient cannot be used after it
+has been frozen.
+"""
+
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
+
+from .exceptions import EvaluationError
+from .hashing import hash_sequence, hashes_differ
+from .types import Vector
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+def _tail_offset(count: int) -> int:
+    """Index of the first element stored in the tail."""
+    if count < WIDTH:
+        return 0
+    return ((count - 1) >> BITS) << BITS
+
+
+def _new_path(level: int, node: List[Any]) -> List[Any]:
+    """Wrap node in single-child branches until it sits at the given level."""
+    while level > 0:
+        node = [node]
+        level -= BITS
+    return node
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(
+        "PersistentVector is immutable; use conj or assoc to build a new vector."
+    )
+
+
+class PersistentVector(Vector):
+    """An immutable LisPy vector that shares structure with its earlier versions."""
+
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_start", "_hash")
+
+    def __init__(self, items: Iterable[Any] = ()):
+        super().__init__()
+        self._start = 0
+        self._hash = None
+        self._assign_from(list(items))
+
+    @classmethod
+    def _make(
+        cls, count: int, shift: int, root: List[Any], tail: List[Any], start: int = 0
+    ) -> "PersistentVector":
+        vector = cls.__new__(cls)
+        vector._count = count
+        vector._shift = shift
+        vector._root = root
+        vector._tail = tail
+        vector._start = start
+        vector._hash = None
+        return vector
+
+    def _assign_from(self, items: List[Any]) -> None:
+        """Build the trie bottom-up from a list of items."""
+        count = len(items)
+        tail_offset = _tail_offset(count)
+        nodes = [items[i : i + WIDTH] for i in range(0, tail_offset, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [nodes[i : i + WIDTH] for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        self._count = count
+        self._shift = shift
+        self._root = nodes
+        self._tail = items[tail_offset:]
+
+    # --- Trie access ---
+
+    def _leaf_for(self, index: int) -> List[Any]:
+        """Return the leaf array holding the element at a physical index."""
+        if index >= _tail_offset(self._count):
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node
+
+    def _physical_index(self, index: int) -> int:
+        size = self._count - self._start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("vector index out of range")
+        return index + self._start
+
+    def _push_tail(self, level: int, parent: List[Any], tail: List[Any]) -> List[Any]:
+        subindex = ((self._count - 1) >> level) & MASK
+        node = list(parent)
+        if level == BITS:
+            insert = tail
+        elif subindex < len(parent):
+            insert = self._push_tail(level - BITS, parent[subindex], tail)
+        else:
+            insert = _new_path(level - BITS, tail)
+        if subindex < len(node):
+            node[subindex] = insert
+        else:
+            node.append(insert)
+        return node
+
+    def _assoc_in(
+        self, level: int, node: List[Any], index: int, value: Any
+    ) -> List[Any]:
+        node = list(node)
+        if level == 0:
+            node[index & MASK] = value
+        else:
+            subindex = (index >> level) & MASK
+            node[subindex] = self._assoc_in(level - BITS, node[subindex], index, value)
+        return node
+
+    # --- Persistent operations ---
+
+    def conj(self, item: Any) -> "PersistentVector":
+        """Return a new vector with item appended."""
+        count = self._count
+        if count - _tail_offset(count) < WIDTH:
+            return self._make(
+                count + 1, self._shift, self._root, self._tail + [item], self._start
+            )
+
+        shift = self._shift
+        if (count >> BITS) > (1 << shift):
+            root = [self._root, _new_path(shift, self._tail)]
+            shift += BITS
+        else:
+            root = self._push_tail(shift, self._root, self._tail)
+        return self._make(count + 1, shift, root, [item], self._start)
+
+    def conj_all(self, items: Iterable[Any]) -> "PersistentVector":
+        """Return a new vector with every item appended in order."""
+        vector = self
+        for item in items:
+            vector = vector.conj(item)
+        return vector
+
+    def assoc(self, index: int, value: Any) -> "PersistentVector":
+        """Return a new vector with the element at index replaced by value.
+
+        An index equal to the vector's length appends, like conj.
+        """
+        if index == len(self):
+            return self.conj(value)
+        physical = self._physical_index(index)
+        if physical >= _tail_offset(self._count):
+            tail = list(self._tail)
+            tail[physical & MASK] = value
+            return self._make(self._count, self._shift, self._root, tail, self._start)
+        root = self._assoc_in(self._shift, self._root, physical, value)
+        return self._make(self._count, self._shift, root, self._tail, self._start)
+
+    def transient(self) -> "TransientVector":
+        """Return a mutable TransientVector that starts out sharing this trie."""
+        return TransientVector(self)
+
+    def rest(self) -> "PersistentVector":
+        """Return the vector without its first element, sharing the trie."""
+        if len(self) <= 1:
+            return EMPTY_VECTOR
+        return self._make(
+            self._count, self._shift, self._root, self._tail, self._start + 1
+        )
+
+    # --- Sequence protocol ---
+
+    def __len__(self) -> int:
+        return self._count - self._start
+
+    def __bool__(self) -> bool:
+        return self._count > self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and stop >= len(self) and start > 0:
+                if start >= stop:
+                    return EMPTY_VECTOR
+                return self._make(
+                    self._count,
+                    self._shift,
+                    self._root,
+                    self._tail,
+                    self._start + start,
+                )
+            return PersistentVector(self[i] for i in range(start, stop, step))
+        physical = self._physical_index(index)
+        return self._leaf_for(physical)[physical & MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        index = self._start
+        while index < self._count:
+            leaf = self._leaf_for(index)
+            offset = index & MASK
+            yield from islice(leaf, offset, None)
+            index += len(leaf) - offset
+
+    def __reversed__(self) -> Iterator[Any]:
+        for index in range(self._count - 1, self._start - 1, -1):
+            yield self._leaf_for(index)[index & MASK]
+
+    def __contains__(self, item: Any) -> bool:
+        return any(element is item or element == item for element in self)
+
+    def index(self, item: Any, start: int = 0, stop: int = None) -> int:
+        stop = len(self) if stop is None else stop
+        for position, element in enumerate(islice(self, start, stop), start):
+            if element is item or element == item:
+                return position
+        raise ValueError(f"{item!r} is not in vector")
+
+    def count(self, item: Any) -> int:
+        return sum(1 for element in self if element is item or element == item)
+
+    # --- Comparison and arithmetic, matching list semantics ---
+
+    def __eq__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        if len(self) != len(other) or hashes_differ(self, other):
+            return False
+        return all(a is b or a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        return list(self) < list(other)
+
+    def __le__(self, other):
+        return list(self) <= list(other)
+
+    def __gt__(self, other):
+        return list(self) > list(other)
+
+    def __ge__(self, other):
+        return list(self) >= list(other)
+
+    def __hash__(self) -> int:
+        # Computed on first use and cached; raises TypeError if an element
+        # is unhashable
+        if self._hash is None:
+            self._hash = hash_sequence(self)
+        return self._hash
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, times):
+        return list(self) * times
+
+    __rmul__ = __mul__
+
+    def copy(self) -> List[Any]:
+        return list(self)
+
+    def __copy__(self) -> "PersistentVector":
+        return self
+
+    def __reduce__(self):
+        return (PersistentVector, (list(self),))
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+
+class TransientVector:
+    """A mutable, single-owner vector for building a PersistentVector in place.
+
+    The transient starts out sharing the source vector's trie. A node is
+    copied the first time the transient writes to it and is then owned by the
+    transient, so later writes to it happen in place. Ownership is tracked by
+    node identity: owned nodes stay reachable from the trie until the
+    transient is frozen, so their ids cannot be reused.
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_owned", "_editable")
+
+    def __init__(self, vector: Iterable[Any] = ()):
+        if not isinstance(vector, PersistentVector) or vector._start:
+            vector = PersistentVector(vector)
+        self._count = vector._count
+        self._shift = vector._shift
+        self._root = vector._root
+        self._tail = list(vector._tail)
+        self._owned = {id(self._tail)}
+        self._editable = True
+
+    def _ensure_editable(self) -> None:
+        if not self._editable:
+            raise EvaluationError(
+                "TransientError: Transient used after persistent! call."
+            )
+
+    def _own(self, node: List[Any]) -> List[Any]:
+        """Return node if this transient owns it, otherwise an owned copy."""
+        if id(node) in self._owned:
+            return node
+        node = list(node)
+        self._owned.add(id(node))
+        return node
+
+    def _owned_path(self, level: int, node: List[Any]) -> List[Any]:
+        while level > 0:
+            node = [node]
+            self._owned.add(id(node))
+            level -= BITS
+        return node
+
+    def _push_tail(self, level: int, parent: List[Any], tail: List[Any]) -> List[Any]:
+        node = self._own(parent)
+        subindex = ((self._count - 1) >> level) & MASK
+        if level == BITS:
+            insert = tail
+        elif subindex < len(node):
+            insert = self._push_tail(level - BITS, node[subindex], tail)
+        else:
+            insert = self._owned_path(level - BITS, tail)
+        if subindex < len(node):
+            node[subindex] = insert
+        else:
+            node.append(insert)
+        return node
+
+    # --- Transient operations ---
+
+    def conj(self, item: Any) -> "TransientVector":
+        """Append item in place and return this transient."""
+        self._ensure_editable()
+        count = self._count
+        if count - _tail_offset(count) < WIDTH:
+            self._tail.append(item)
+            self._count = count + 1
+            return self
+
+        tail = self._tail
+        shift = self._shift
+        if (count >> BITS) > (1 << shift):
+            self._root = [self._root, self._owned_path(shift, tail)]
+            self._owned.add(id(self._root))
+            self._shift = shift + BITS
+        else:
+            self._root = self._push_tail(shift, self._root, tail)
+        self._tail = [item]
+        self._owned.add(id(self._tail))
+        self._count = count + 1
+        return self
+
+    def conj_all(self, items: Iterable[Any]) -> "TransientVector":
+        """Append every item in order and return this transient.
+
+        Items are copied into the tail a leaf at a time.
+        """
+        self._ensure_editable()
+        iterator = iter(items)
+        while True:
+            tail = self._tail
+            room = WIDTH - len(tail)
+            if room:
+                size = len(tail)
+                tail.extend(islice(iterator, room))
+                self._count += len(tail) - size
+                if len(tail) - size < room:
+                    return self
+            else:
+                for item in islice(iterator, 1):
+                    self.conj(item)
+                    break
+                else:
+                    return self
+
+    def assoc(self, index: int, value: Any) -> "TransientVector":
+        """Replace the element at index in place and return this transient.
+
+        An index equal to the transient's length appends, like conj.
+        """
+        self._ensure_editable()
+        if index == self._count:
+            return self.conj(value)
+        if not 0 <= index < self._count:
+            raise IndexError("vector index out of range")
+        if index >= _tail_offset(self._count):
+            self._tail[index & MASK] = value
+            return self
+        node = self._root = self._own(self._root)
+        level = self._shift
+        while level > 0:
+            subindex = (index >> level) & MASK
+            child = node[subindex] = self._own(node[subindex])
+            node = child
+            level -= BITS
+        node[index & MASK] = value
+        return self
+
+    def persistent(self) -> PersistentVector:
+        """Freeze this transient into a PersistentVector. O(1)."""
+        self._ensure_editable()
+        self._editable = False
+        self._owned = None
+        if not self._count:
+            return EMPTY_VECTOR
+        return PersistentVector._make(self._count, self._shift, self._root, self._tail)
+
+    # --- Read access ---
+
+    def __len__(self) -> int:
+        self._ensure_editable()
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        self._ensure_editable()
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("vector index out of range")
+        if index >= _tail_offset(self._count):
+            return self._tail[index & MASK]
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node[index & MASK]
+
+    def __repr__(self) -> str:
+        state = "" if self._editable else " (frozen)"
+        return f"#<transient vector count={self._count}{state}>"
+
+
+EMPTY_VECTOR = PersistentVector()
+
+
+def persistent_vector(items: Iterable[Any]) -> PersistentVector:
+    """Return items as a PersistentVector, reusing it if it already is one."""
+    if isinstance(items, PersistentVector):
+        return items
+    return PersistentVector(items)
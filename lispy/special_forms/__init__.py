@@ -20,6 +20,7 @@ from .export_form import documentation_export, export_form
 from .fn_form import documentation_fn, handle_fn_form
 from .if_form import documentation_if, handle_if_form
 from .import_form import documentation_import, import_form
+from .lazy_seq_form import documentation_lazy_seq, handle_lazy_seq_form
 from .let_form import documentation_let, handle_let_form
 from .loop_form import documentation_loop, handle_loop_form
 from .or_form import documentation_or, handle_or_form
@@ -30,6 +31,7 @@ from .thread_last import documentation_thread_last, handle_thread_last
 from .throw_form import documentation_throw, handle_throw_form
 from .try_form import documentation_try, handle_try_form
 from .when_form import documentation_when, handle_when_form
+from .with_open_form import documentation_with_open, handle_with_open_form
 
 # A registry for special form handlers (alphabetized by key)
 # Maps the symbol (as a string) to the handler function
@@ -52,6 +54,7 @@ special_form_handlers: Dict[str, Callable[[List[Any], Environment, Callable], An
     "if": handle_if_form,
     "import": import_form,
     "it": it_form_handler,
+    "lazy-seq": handle_lazy_seq_form,
     "let": handle_let_form,
     "loop": handle_loop_form,
     "or": handle_or_form,
@@ -61,6 +64,7 @@ special_form_handlers: Dict[str, Callable[[List[Any], Environment, Callable], An
     "throw": handle_throw_form,
     "try": handle_try_form,
     "when": handle_when_form,
+    "with-open": handle_with_open_form,
 }
 
 # Security configuration for web-safe environments
@@ -108,6 +112,7 @@ def setup_special_form_documentation():
     register_documentation("fn", documentation_fn)
     register_documentation("if", documentation_if)
     register_documentation("import", documentation_import)
+    register_documentation("lazy-seq", documentation_lazy_seq)
     register_documentation("let", documentation_let)
     register_documentation("loop", documentation_loop)
     register_documentation("or", documentation_or)
@@ -116,6 +121,7 @@ def setup_special_form_documentation():
     register_documentation("throw", documentation_throw)
     register_documentation("try", documentation_try)
     register_documentation("when", documentation_when)
+    register_documentation("with-open", documentation_with_open)
 
 
 def get_web_unsafe_special_forms():
@@ -144,6 +150,7 @@ __all__ = [
     "documentation_fn",
     "documentation_if",
     "documentation_import",
+    "documentation_lazy_seq",
     "documentation_let",
     "documentation_loop",
     "documentation_or",
@@ -154,4 +161,5 @@ __all__ = [
     "documentation_throw",
     "documentation_try",
     "documentation_when",
+    "documentation_with_open",
 ]
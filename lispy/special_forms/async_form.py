@@ -47,7 +47,7 @@ class AsyncContext:
             def cleanup():
                 self.pending_promises.discard(promise)
 
-            promise.callbacks.append(cleanup)
+            promise.add_callback(cleanup)
 
     def run_until_complete(self, main_promise: LispyPromise):
         """Run event loop until main operation completes."""
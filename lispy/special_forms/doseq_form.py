@@ -12,6 +12,8 @@ from typing import Any, Callable, List
 
 from ..environment import Environment
 from ..exceptions import EvaluationError
+from ..lazy_seq import LazySeq
+from ..persistent_set import PersistentSet
 from ..types import LispyList, Symbol, Vector
 
 
@@ -33,7 +35,8 @@ Notes:
   - Always returns nil
   - Binding symbol is available in body expressions
   - Creates new scope for binding variable
-  - Collection must be a vector or list
+  - Collection must be a vector, list, set, or lazy sequence
+  - Lazy sequences are realized chunk by chunk as the loop advances
   - Binding vector must have exactly 2 elements
 
 See Also: map, for, let, loop"""
@@ -92,16 +95,19 @@ def handle_doseq_form(
     collection = evaluate_fn(collection_expr, env)
 
     # Validate collection
-    if not isinstance(collection, (Vector, LispyList)):
+    if not isinstance(collection, (Vector, LispyList, LazySeq, PersistentSet)):
         raise EvaluationError(
-            f"TypeError: 'doseq' collection must be a vector or list, got {type(collection)}."
+            f"TypeError: 'doseq' collection must be a vector, list, set, or lazy sequence, got {type(collection)}."
         )
 
     # Create a new environment for the loop
     loop_env = Environment(outer=env)
 
-    # Iterate over collection and execute body for each element
-    for item in collection:
+    # Iterate over collection and execute body for each element, without
+    # keeping the head of a lazy sequence alive while it streams
+    items = iter(collection)
+    del collection
+    for item in items:
         # Bind the current item to the binding symbol
         loop_env.define(binding_symbol.name, item)
 
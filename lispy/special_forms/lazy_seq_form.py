@@ -0,0 +1,78 @@
+"""
+LisPy lazy-seq special form - Build a lazy sequence from a body evaluated on demand.
+
+Usage: (lazy-seq body...)
+
+Examples:
+  (define naturals (fn [n] (lazy-seq (cons n (naturals (+ n 1))))))
+  (take (naturals 0) 3)               ; => (0 1 2)
+"""
+
+from typing import Any, Callable, List
+
+from ..environment import Environment
+from ..exceptions import EvaluationError
+from ..lazy_seq import LazySeq
+from ..types import LispyList, Vector
+
+
+def documentation_lazy_seq():
+    """Returns documentation for the 'lazy-seq' special form."""
+    return """Special Form: lazy-seq
+Arguments: (lazy-seq body-expr1 body-expr2 ...)
+Description: Returns a lazy sequence whose contents are computed by body the first time it is used.
+
+Examples:
+  (define naturals (fn [n] (lazy-seq (cons n (naturals (+ n 1))))))
+  (take (naturals 0) 3)                 ; => (0 1 2)
+  (first (naturals 10))                 ; => 10
+  (lazy-seq [1 2 3])                    ; => (1 2 3)
+  (lazy-seq nil)                        ; => ()
+
+Notes:
+  - Body is not evaluated until the sequence is consumed, and then only once
+  - Body must return nil, a vector, a list or another lazy sequence
+  - cons onto a lazy sequence keeps it lazy, so self-referencing
+    definitions like naturals above can be infinite
+  - Each realization starts a fresh call depth, so such recursion does not
+    hit the recursion limit
+  - first, rest, doseq, reduce, map, filter, take and drop consume lazy
+    sequences directly
+
+See Also: lazy-range, iterate, repeat, take, drop, take-while"""
+
+
+def handle_lazy_seq_form(
+    expression: List[Any], env: Environment, evaluate_fn: Callable
+) -> LazySeq:
+    """Handles the (lazy-seq body...) special form.
+
+    Args:
+        expression: List containing the lazy-seq form:
+            - expression[0]: 'lazy-seq' symbol (already consumed)
+            - expression[1:]: Body expressions, evaluated on first use
+        env: The current environment
+        evaluate_fn: Function to evaluate expressions
+
+    Returns:
+        LazySeq: An unrealized lazy sequence
+    """
+    body_expressions = expression[1:]
+
+    def realize():
+        # Realization happens later, from whoever consumes the sequence, so
+        # calls made by the body start a fresh recursion depth count.
+        body_env = Environment(outer=env)
+        body_env.define("__recursion_depth__", 0)
+        result = None
+        for body_expr in body_expressions:
+            result = evaluate_fn(body_expr, body_env)
+        if result is not None and not isinstance(
+            result, (LazySeq, Vector, LispyList)
+        ):
+            raise EvaluationError(
+                f"TypeError: 'lazy-seq' body must return a sequence or nil, got {type(result)}."
+            )
+        return result
+
+    return LazySeq(realize)
@@ -59,6 +59,8 @@ class LoopFunction:
     This allows recur to target the loop instead of a regular function.
     """
 
+    __slots__ = ("params", "body", "defining_env")
+
     def __init__(self, binding_symbols: List[Symbol], body: List[Any]):
         self.params = binding_symbols  # Match Function interface for recur
         self.body = body
@@ -0,0 +1,109 @@
+"""
+LisPy with-open special form - Scope resources and close them deterministically.
+
+Usage: (with-open [name resource-expr ...] body...)
+
+Examples:
+  (with-open [f (open-file "app.log")]
+    (count (line-seq f)))               ; The file is closed before returning
+"""
+
+from typing import Any, Callable, List
+
+from ..environment import Environment
+from ..exceptions import EvaluationError
+from ..tail_call import TailCall
+from ..types import Symbol
+
+
+def documentation_with_open():
+    """Returns documentation for the 'with-open' special form."""
+    return """Special Form: with-open
+Arguments: (with-open [name1 resource1 name2 resource2 ...] body-expr1 body-expr2 ...)
+Description: Binds each name to its resource like let, evaluates the body, then closes the resources in reverse order, even if the body throws.
+
+Examples:
+  (with-open [f (open-file "app.log")]
+    (count (line-seq f)))                   ; Number of lines in the file
+  (with-open [f (open-file "app.log")]
+    (doseq [line (line-seq f)]
+      (when (re-find line "ERROR") (println line))))
+  (with-open [in (open-file "a.txt") other (open-file "b.txt")]
+    (equal? (first (line-seq in)) (first (line-seq other))))  ; Same header line?
+
+Notes:
+  - Each resource must have a close operation, such as a file from open-file
+  - Bindings are evaluated in order and may refer to earlier ones; if one
+    fails, the resources already opened are closed
+  - Returns the value of the last body expression; a lazy sequence over a
+    resource must be consumed inside the body, not returned from it
+  - recur cannot be used in tail position of the body, since the resources
+    would be closed before the recursion ran
+
+See Also: open-file, line-seq, read-chunks, let, try"""
+
+
+def handle_with_open_form(
+    expression: List[Any], env: Environment, evaluate_fn: Callable
+) -> Any:
+    """Handles the (with-open [name resource ...] body...) special form.
+
+    Evaluates each resource in a new scope, binding it to its name, then
+    evaluates the body and closes every resource opened so far in reverse
+    order, whether or not an error was raised.
+    """
+    if len(expression) < 3:
+        raise EvaluationError(
+            f"SyntaxError: 'with-open' expects at least 2 arguments ([name resource ...] body...), got {len(expression) - 1}."
+        )
+
+    bindings_form = expression[1]
+    if not isinstance(bindings_form, list):
+        raise EvaluationError(
+            f"SyntaxError: 'with-open' first argument must be a vector [name resource ...], got {type(bindings_form)}."
+        )
+    if not bindings_form or len(bindings_form) % 2 != 0:
+        raise EvaluationError(
+            f"SyntaxError: 'with-open' bindings must be name-resource pairs, got {len(bindings_form)} elements."
+        )
+    for symbol_node in bindings_form[::2]:
+        if not isinstance(symbol_node, Symbol):
+            raise EvaluationError(
+                f"SyntaxError: 'with-open' binding must be a symbol, got {type(symbol_node)}."
+            )
+
+    scope = Environment(outer=env)
+    resources = []
+    try:
+        for i in range(0, len(bindings_form), 2):
+            resource = evaluate_fn(bindings_form[i + 1], scope)
+            if not callable(getattr(resource, "close", None)):
+                raise EvaluationError(
+                    f"TypeError: 'with-open' resource {bindings_form[i]} must be closable, got {type(resource)}."
+                )
+            resources.append(resource)
+            scope.define(bindings_form[i].name, resource)
+
+        result = None
+        for body_expr in expression[2:]:
+            result = evaluate_fn(body_expr, scope)
+        if isinstance(result, TailCall):
+            raise EvaluationError(
+                "SyntaxError: 'recur' cannot be used in tail position of 'with-open'."
+            )
+        return result
+    finally:
+        _close_all(resources)
+
+
+def _close_all(resources: List[Any]) -> None:
+    """Close resources in reverse order; every close runs, the first error is raised."""
+    error = None
+    for resource in reversed(resources):
+        try:
+            resource.close()
+        except Exception as e:
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
@@ -0,0 +1,50 @@
+"""
+String builders for LisPy.
+
+Building a large string by repeated concatenation, for example through a
+reduce over the rows of an HTML table, copies the whole accumulated string at
+every step and so takes quadratic time. A StringBuilder instead collects the
+appended pieces in a list and joins them once, when the string is asked for,
+so building a string of total length n is O(n).
+
+The joined string is kept as the builder's only chunk, so asking for it
+repeatedly, or appending after asking, does not join the earlier pieces
+again.
+"""
+
+from typing import Iterable, List
+
+
+class StringBuilder:
+    """A mutable, append-only buffer of string pieces."""
+
+    __slots__ = ("_chunks", "_length")
+
+    def __init__(self, pieces: Iterable[str] = ()):
+        self._chunks: List[str] = list(pieces)
+        self._length = sum(map(len, self._chunks))
+
+    def append(self, piece: str) -> "StringBuilder":
+        self._chunks.append(piece)
+        self._length += len(piece)
+        return self
+
+    def extend(self, pieces: Iterable[str]) -> "StringBuilder":
+        for piece in pieces:
+            self._chunks.append(piece)
+            self._length += len(piece)
+        return self
+
+    def to_string(self) -> str:
+        chunks = self._chunks
+        if len(chunks) == 1:
+            return chunks[0]
+        text = "".join(chunks)
+        self._chunks = [text] if text else []
+        return text
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"#<string-builder length={self._length}>"
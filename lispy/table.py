@@ -0,0 +1,192 @@
+"""
+Columnar tables for LisPy.
+
+A Table stores tabular data one column at a time instead of one map per row.
+A column whose values are all integers is an int NumericArray, one whose
+values are all numbers is a double NumericArray, and any other column is a
+plain Python list. Column names are stored once instead of once per row, and
+numeric columns are contiguous buffers, so filtering, sorting, grouping and
+aggregating work on whole columns (with NumPy when it is installed).
+
+Tables are immutable. Row selection is done by computing the row indices (or
+a boolean mask) once and applying it to every column.
+"""
+
+from itertools import compress
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, Sequence,
+                    Union)
+
+from .numeric_array import NumericArray
+
+Column = Union[NumericArray, List[Any]]
+
+AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+
+def make_column(values: List[Any]) -> Column:
+    """Return values as a typed numeric column if they are all numbers."""
+    value_types = set(map(type, values))
+    if value_types and value_types <= {int}:
+        try:
+            return NumericArray.from_values(values, "int")
+        except OverflowError:
+            return values
+    if value_types and value_types <= {int, float}:
+        return NumericArray.from_values(values, "double")
+    return values
+
+
+class Table:
+    """An immutable table stored as one column per name."""
+
+    __slots__ = ("_columns", "_count")
+
+    def __init__(self, columns: Dict[Any, Column], count: int):
+        self._columns = columns
+        self._count = count
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[Any, Any]]) -> "Table":
+        """Build a table from maps. A key missing from a row gives nil there."""
+        rows = list(rows)
+        names: Dict[Any, None] = {}
+        for row in rows:
+            for name in row:
+                names.setdefault(name)
+        columns = {
+            name: make_column([row.get(name) for row in rows]) for name in names
+        }
+        return cls(columns, len(rows))
+
+    # --- Access ---
+
+    def column_names(self) -> List[Any]:
+        return list(self._columns)
+
+    def has_column(self, name: Any) -> bool:
+        return name in self._columns
+
+    def column(self, name: Any) -> Column:
+        """Return the column called name. Raises KeyError if there is none."""
+        return self._columns[name]
+
+    def rows(self) -> List[Dict[Any, Any]]:
+        """Return the table as a list of dicts, one per row."""
+        names = list(self._columns)
+        if not names:
+            return [{} for _ in range(self._count)]
+        columns = [list(column) for column in self._columns.values()]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    # --- Row and column selection ---
+
+    def select(self, names: Iterable[Any]) -> "Table":
+        """Return a table with only the named columns, in that order."""
+        return Table({name: self._columns[name] for name in names}, self._count)
+
+    def take(self, indices: Sequence[int]) -> "Table":
+        """Return a table of the rows at indices, in that order."""
+        columns = {}
+        for name, column in self._columns.items():
+            if isinstance(column, NumericArray):
+                columns[name] = column.take(indices)
+            else:
+                columns[name] = list(map(column.__getitem__, indices))
+        return Table(columns, len(indices))
+
+    def compress(self, mask: Sequence[Any]) -> "Table":
+        """Return a table of the rows whose entry in mask is true."""
+        columns = {}
+        for name, column in self._columns.items():
+            if isinstance(column, NumericArray):
+                columns[name] = column.compress(mask)
+            else:
+                columns[name] = list(compress(column, mask))
+        return Table(columns, sum(1 for keep in mask if keep))
+
+    def where(self, name: Any, predicate: Callable[[Any], Any]) -> "Table":
+        """Return the rows for which predicate(value of column name) is true.
+
+        predicate is called once per value, in a single pass over the column.
+        """
+        column = self._columns[name]
+        return self.compress([bool(predicate(value)) for value in column])
+
+    def sort_indices(self, name: Any, descending: bool = False) -> Sequence[int]:
+        """Return the row indices ordered by column name. Ties keep their order.
+
+        Raises TypeError if the column's values cannot be compared.
+        """
+        column = self._columns[name]
+        if isinstance(column, NumericArray):
+            return column.argsort(descending)
+        return sorted(range(self._count), key=column.__getitem__, reverse=descending)
+
+    def sort_by(self, name: Any, descending: bool = False) -> "Table":
+        return self.take(self.sort_indices(name, descending))
+
+    def group_indices(self, name: Any) -> Dict[Any, List[int]]:
+        """Map each distinct value of column name to the indices of its rows."""
+        groups: Dict[Any, List[int]] = {}
+        for index, value in enumerate(self._columns[name]):
+            indices = groups.get(value)
+            if indices is None:
+                groups[value] = [index]
+            else:
+                indices.append(index)
+        return groups
+
+    def group_by(self, name: Any) -> Dict[Any, "Table"]:
+        """Map each distinct value of column name to the table of its rows."""
+        return {
+            value: self.take(indices)
+            for value, indices in self.group_indices(name).items()
+        }
+
+    # --- Aggregation ---
+
+    def aggregate(self, operation: str, name: Any = None) -> Any:
+        """Compute one of AGGREGATIONS over column name.
+
+        count needs no column. sum and mean need a numeric column, min and max
+        any comparable one. mean, min and max of no rows are None. Raises
+        KeyError for an unknown column and ValueError for an unknown operation
+        or a non-numeric column.
+        """
+        if operation == "count":
+            return self._count
+        if operation not in AGGREGATIONS:
+            raise ValueError(f"unknown aggregation '{operation}'")
+        column = self._columns[name]
+        if not self._count:
+            return 0 if operation == "sum" else None
+        if isinstance(column, NumericArray):
+            return getattr(column, operation)()
+        if operation in ("sum", "mean"):
+            raise ValueError(f"column {name} is not numeric")
+        return min(column) if operation == "min" else max(column)
+
+    # --- Python protocols ---
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other):
+        if not isinstance(other, Table):
+            return NotImplemented
+        if self._count != other._count or list(self._columns) != list(other._columns):
+            return False
+        return all(
+            list(column) == list(other._columns[name])
+            for name, column in self._columns.items()
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        names = " ".join(map(str, self._columns))
+        return f"#<table rows={self._count} columns=[{names}]>"
@@ -20,6 +20,8 @@ class TailCall:
     and its arguments. The trampoline loop then handles the call iteratively.
     """
 
+    __slots__ = ("function", "args")
+
     def __init__(self, function: Function, args: List[Any]):
         """
         Initialize a tail call.
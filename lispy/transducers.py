@@ -0,0 +1,172 @@
+"""
+Transducers for LisPy.
+
+A transducer transforms a reducing step without knowing where the items come
+from or where the results go. (map f), (filter p), (take n) and (distinct)
+called without a collection return transducers; comp chains them, and
+transduce, into and sequence run a whole chain in a single pass over the
+input with no intermediate collections.
+
+A Reducer is a pair of Python callables: step(acc, item) -> acc, and
+complete(acc) -> result, which runs once at the end so stateful transducers
+can flush. A Transducer wraps a function from Reducer to Reducer. A step can
+return a Reduced to stop the reduction early; the wrapped value becomes the
+result.
+"""
+
+from typing import Any, Callable, Iterable, Iterator
+
+
+class Reduced:
+    """Wraps a reduction result to stop the reduction early."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"#<reduced {self.value!r}>"
+
+
+def ensure_reduced(value: Any) -> Reduced:
+    return value if isinstance(value, Reduced) else Reduced(value)
+
+
+def unreduced(value: Any) -> Any:
+    return value.value if isinstance(value, Reduced) else value
+
+
+class Reducer:
+    """A reducing step plus the completion that runs once at the end."""
+
+    __slots__ = ("step", "complete")
+
+    def __init__(
+        self,
+        step: Callable[[Any, Any], Any],
+        complete: Callable[[Any], Any] = lambda acc: acc,
+    ):
+        self.step = step
+        self.complete = complete
+
+
+class Transducer:
+    """A composable transformation of reducers."""
+
+    __slots__ = ("transform", "name")
+
+    def __init__(self, transform: Callable[[Reducer], Reducer], name: str):
+        self.transform = transform
+        self.name = name
+
+    def apply(self, reducer: Reducer) -> Reducer:
+        return self.transform(reducer)
+
+    def compose(self, inner: "Transducer") -> "Transducer":
+        """Return a transducer whose items pass through self, then inner."""
+        return Transducer(
+            lambda reducer: self.transform(inner.transform(reducer)),
+            f"{self.name} {inner.name}",
+        )
+
+    def __repr__(self) -> str:
+        return f"#<transducer ({self.name})>"
+
+
+IDENTITY = Transducer(lambda reducer: reducer, "identity")
+
+
+def mapping(function: Callable[[Any], Any]) -> Transducer:
+    """Transducer that replaces each item with function(item)."""
+
+    def transform(reducer: Reducer) -> Reducer:
+        step = reducer.step
+        return Reducer(lambda acc, item: step(acc, function(item)), reducer.complete)
+
+    return Transducer(transform, "map")
+
+
+def filtering(predicate: Callable[[Any], bool]) -> Transducer:
+    """Transducer that keeps the items for which predicate returns True."""
+
+    def transform(reducer: Reducer) -> Reducer:
+        step = reducer.step
+        return Reducer(
+            lambda acc, item: step(acc, item) if predicate(item) else acc,
+            reducer.complete,
+        )
+
+    return Transducer(transform, "filter")
+
+
+def taking(count: int) -> Transducer:
+    """Transducer that passes on the first count items, then stops."""
+
+    def transform(reducer: Reducer) -> Reducer:
+        remaining = count
+
+        def step(acc: Any, item: Any) -> Any:
+            nonlocal remaining
+            if remaining <= 0:
+                return ensure_reduced(acc)
+            remaining -= 1
+            acc = reducer.step(acc, item)
+            return ensure_reduced(acc) if remaining <= 0 else acc
+
+        return Reducer(step, reducer.complete)
+
+    return Transducer(transform, "take")
+
+
+def distincting(key: Callable[[Any], Any]) -> Transducer:
+    """Transducer that drops items whose key(item) it has already seen."""
+
+    def transform(reducer: Reducer) -> Reducer:
+        seen = set()
+        step = reducer.step
+
+        def distinct_step(acc: Any, item: Any) -> Any:
+            item_key = key(item)
+            if item_key in seen:
+                return acc
+            seen.add(item_key)
+            return step(acc, item)
+
+        return Reducer(distinct_step, reducer.complete)
+
+    return Transducer(transform, "distinct")
+
+
+def transduce(
+    transducer: Transducer, reducer: Reducer, init: Any, items: Iterable[Any]
+) -> Any:
+    """Reduce items through transducer into reducer, starting from init."""
+    reducer = transducer.apply(reducer)
+    step = reducer.step
+    acc = init
+    for item in items:
+        acc = step(acc, item)
+        if isinstance(acc, Reduced):
+            acc = acc.value
+            break
+    return reducer.complete(acc)
+
+
+def transduced(transducer: Transducer, items: Iterable[Any]) -> Iterator[Any]:
+    """Yield the outputs of transducer over items, consuming items as needed."""
+    buffer = []
+
+    def collect(acc: Any, item: Any) -> Any:
+        buffer.append(item)
+        return acc
+
+    reducer = transducer.apply(Reducer(collect))
+    for item in items:
+        result = reducer.step(None, item)
+        yield from buffer
+        buffer.clear()
+        if isinstance(result, Reduced):
+            break
+    reducer.complete(None)
+    yield from buffer
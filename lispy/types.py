@@ -3,10 +3,14 @@
 import threading
 from typing import Any, Callable, List, Optional
 
+from .hashing import hash_sequence
+
 
 class Symbol:
     """Represents a Lisp symbol."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -35,11 +39,11 @@ class Vector(list):
         # Provide a Lisp-like representation for vectors
         return f"[{' '.join(map(repr, self))}]"
 
-    # No need to override __eq__ or __hash__ if list's behavior is fine
-    # and vectors are mutable like lists. If they need to be hashable for some reason
-    # (e.g., to be keys in LisPy maps, though not typical for vectors),
-    # then __hash__ and __eq__ would need careful consideration, likely making them immutable.
-    # For now, assume they are mutable sequences like Python lists.
+    def __hash__(self):
+        # Vectors are values in LisPy, so they can be map keys and set members.
+        # The storage is a mutable list, so the hash is recomputed each time;
+        # PersistentVector caches it.
+        return hash_sequence(self)
 
 
 class LispyMapLiteral(dict):
@@ -59,18 +63,22 @@ class LispyList(list):
         # Provide a Lisp-like representation for lists
         return f"({' '.join(map(repr, self))})"
 
-    # Similar to Vector, assuming mutable sequence behavior from Python lists.
-    # If lists needed to be hashable, immutability would be a consideration.
+    def __hash__(self):
+        # Hashable like Vector; PersistentList caches the hash
+        return hash_sequence(self)
 
 
 class LispyPromise:
     """Represents an asynchronous operation in LisPy."""
 
+    __slots__ = ("state", "value", "error", "_callbacks")
+
     def __init__(self, executor_fn: Optional[Callable[[], Any]] = None):
         self.state = "pending"  # pending, resolved, rejected
         self.value = None
         self.error = None
-        self.callbacks: List[Callable[[], None]] = []
+        # Created on the first add_callback, so settled promises never need one
+        self._callbacks: Optional[List[Callable[[], None]]] = None
 
         if executor_fn:
             try:
@@ -103,15 +111,21 @@ class LispyPromise:
             self.error = error
             self._notify_callbacks()
 
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Register callback to run once the promise settles."""
+        if self._callbacks is None:
+            self._callbacks = []
+        self._callbacks.append(callback)
+
     def _notify_callbacks(self) -> None:
         """Notify all registered callbacks."""
-        for callback in self.callbacks:
+        callbacks, self._callbacks = self._callbacks, None
+        for callback in callbacks or ():
             try:
                 callback()
             except Exception as e:
                 # Log error but don't let callback failures break the promise
                 print(f"Promise callback error: {e}")
-        self.callbacks = []
 
     def then(self, callback: Callable[[Any], Any]) -> "LispyPromise":
         """Chain a callback to be executed when promise resolves."""
@@ -132,7 +146,7 @@ class LispyPromise:
             return self._create_rejected_promise(self.error)
         else:
             new_promise = LispyPromise()
-            self.callbacks.append(lambda: self._handle_then(callback, new_promise))
+            self.add_callback(lambda: self._handle_then(callback, new_promise))
             return new_promise
 
     def _handle_then(
@@ -165,9 +179,7 @@ class LispyPromise:
             return self._create_resolved_promise(self.value)
         else:
             new_promise = LispyPromise()
-            self.callbacks.append(
-                lambda: self._handle_catch(error_callback, new_promise)
-            )
+            self.add_callback(lambda: self._handle_catch(error_callback, new_promise))
             return new_promise
 
     def _handle_catch(
@@ -1,5 +1,7 @@
 # lispy_project/lispy/utils.py
 
+import re
+
 from lispy.evaluator import evaluate
 from lispy.lexer import tokenize
 from lispy.parser import parse
@@ -66,6 +68,9 @@ def format_lispy_value_for_display(value):
             val_str = format_lispy_value_for_display(v)
             items.append(f"{key_str} {val_str}")
         return "{" + " ".join(items) + "}"
+    elif isinstance(value, re.Pattern):
+        # Compiled patterns from re-pattern
+        return f'#"{value.pattern}"'
     else:
         # Fallback to Python's str() for any other types
         return str(value)
@@ -3,7 +3,7 @@ Web application container for LisPy Web Framework.
 Combines routing, middleware, and request handling.
 """
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Union
 
 from lispy.exceptions import EvaluationError
 from lispy.types import Symbol
@@ -52,7 +52,7 @@ class WebApp:
         method: str,
         path: str,
         headers,
-        body: str = "",
+        body: Union[str, bytes] = "",
         client_address=None,
         env=None,
     ):
@@ -63,7 +63,7 @@ class WebApp:
             method: HTTP method
             path: Request path
             headers: HTTP headers
-            body: Request body
+            body: Request body, as raw bytes or decoded text
             client_address: Client IP address
             env: LisPy environment for function execution
 
@@ -141,8 +141,7 @@ class WebApp:
         """
         # Check if it's a LisPy user-defined function
         from lispy.closure import Function
-        from lispy.environment import Environment
-        from lispy.evaluator import evaluate
+        from lispy.evaluator import make_caller
 
         if isinstance(handler, Function):
             # User-defined LisPy function
@@ -151,22 +150,13 @@ class WebApp:
                     f"Route handler function must take 1 argument (request), got {len(handler.params)}"
                 )
 
-            # Create execution environment with access to global functions through env parameter
             if env and hasattr(env, "store"):
                 # Use the provided environment (which has global functions) as the outer scope
-                call_env = Environment(outer=env)
+                call = make_caller(handler, env, arity=1, outer=env)
             else:
                 # Fallback to the original defining environment
-                call_env = Environment(outer=handler.defining_env)
-
-            call_env.define(handler.params[0].name, request)
-
-            # Execute function body
-            result = None
-            for expr in handler.body:
-                result = evaluate(expr, call_env)
-
-            return result
+                call = make_caller(handler, handler.defining_env, arity=1)
+            return call(request)
 
         elif callable(handler):
             # Built-in function - call with args list
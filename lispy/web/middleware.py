@@ -10,7 +10,7 @@ from lispy.exceptions import EvaluationError
 from lispy.types import Symbol
 
 
-@dataclass
+@dataclass(slots=True)
 class Middleware:
     """Represents a middleware function with its type."""
 
@@ -143,38 +143,26 @@ class MiddlewareChain:
         """
         # Check if it's a LisPy user-defined function
         from lispy.closure import Function
-        from lispy.environment import Environment
-        from lispy.evaluator import evaluate
+        from lispy.evaluator import make_caller
 
         if isinstance(handler, Function):
-            # User-defined LisPy function
-            call_env = Environment(outer=handler.defining_env)
-
-            # Bind parameters based on middleware type
+            # User-defined LisPy function, called in its defining environment
             if response is not None:
                 # After middleware: (fn [request response] ...)
                 if len(handler.params) != 2:
                     raise EvaluationError(
                         f"After middleware function must take 2 arguments (request response), got {len(handler.params)}"
                     )
-
-                call_env.define(handler.params[0].name, request)
-                call_env.define(handler.params[1].name, response)
+                return make_caller(handler, handler.defining_env, arity=2)(
+                    request, response
+                )
             else:
                 # Before middleware: (fn [request] ...)
                 if len(handler.params) != 1:
                     raise EvaluationError(
                         f"Before middleware function must take 1 argument (request), got {len(handler.params)}"
                     )
-
-                call_env.define(handler.params[0].name, request)
-
-            # Execute function body
-            result = None
-            for expr in handler.body:
-                result = evaluate(expr, call_env)
-
-            return result
+                return make_caller(handler, handler.defining_env, arity=1)(request)
 
         elif callable(handler):
             # Built-in function - call with args list
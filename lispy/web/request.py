@@ -5,8 +5,9 @@ Converts HTTP requests into LisPy data structures with keyword keys.
 
 import json
 import urllib.parse
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
+from lispy.byte_buffer import ByteBuffer
 from lispy.types import Symbol
 
 
@@ -108,7 +109,7 @@ def parse_request(
     method: str,
     path: str,
     headers,
-    body: str = "",
+    body: Union[str, bytes] = "",
     route_pattern: str = "",
     client_address=None,
 ) -> Dict[Symbol, Any]:
@@ -119,7 +120,7 @@ def parse_request(
         method: HTTP method (GET, POST, etc.)
         path: Request path including query string
         headers: HTTP headers
-        body: Request body
+        body: Request body, as raw bytes or already decoded text
         route_pattern: Matched route pattern for parameter extraction
         client_address: Client IP address tuple
 
@@ -130,6 +131,7 @@ def parse_request(
          :query-params {:page "1"}
          :headers {:content-type "application/json"}
          :body "{\"name\": \"Alice\"}"
+         :body-bytes #<bytes length=17>
          :json {:name "Alice"}
          :params {:id "123"}
          :remote-addr "127.0.0.1"}
@@ -139,6 +141,16 @@ def parse_request(
     clean_path = parsed_url.path
     query_string = parsed_url.query
 
+    # Keep the raw bytes; :body is the UTF-8 text, or nil if it is not UTF-8
+    if isinstance(body, bytes):
+        body_bytes = ByteBuffer(body)
+        try:
+            body = body.decode("utf-8")
+        except UnicodeDecodeError:
+            body = None
+    else:
+        body_bytes = ByteBuffer(body.encode("utf-8"))
+
     # Parse components
     query_params = parse_query_string(query_string)
     parsed_headers = parse_headers(headers)
@@ -158,6 +170,7 @@ def parse_request(
         Symbol(":query-params"): query_params,
         Symbol(":headers"): parsed_headers,
         Symbol(":body"): body,
+        Symbol(":body-bytes"): body_bytes,
         Symbol(":params"): path_params,
         Symbol(":remote-addr"): remote_addr,
     }
@@ -6,6 +6,8 @@ Converts LisPy response data structures into HTTP responses.
 import json
 from typing import Any, Dict, Tuple
 
+from lispy.functions.json.utils import encode as encode_json
+from lispy.string_builder import StringBuilder
 from lispy.types import Symbol
 
 DEFAULT_HEADERS = {
@@ -83,7 +85,8 @@ def serialize_response_body(body: Any, content_type: str) -> str:
 
     if "application/json" in content_type:
         try:
-            return json.dumps(body, indent=2)
+            # LisPy maps and vectors are converted as they are encoded
+            return encode_json(body, indent=2)
         except (TypeError, ValueError):
             # Fallback to string representation
             return str(body)
@@ -110,6 +113,9 @@ def format_response(
     status_code = response_data.get(Symbol(":status"), 200)
     response_headers = response_data.get(Symbol(":headers"), {})
     body = response_data.get(Symbol(":body"), "")
+    if isinstance(body, StringBuilder):
+        # Pages rendered with sb-append! are joined once, here
+        body = body.to_string()
 
     # Validate status code
     if not isinstance(status_code, int) or not (100 <= status_code <= 599):
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     """Represents a single route with method, pattern, and handler."""
 
@@ -66,11 +66,11 @@ class LispyHTTPHandler(http.server.BaseHTTPRequestHandler):
             headers = dict(self.headers)
 
             # Read request body
-            body = ""
+            body = b""
             if method in ["POST", "PUT", "PATCH", "DELETE"]:
                 content_length = int(headers.get("Content-Length", "0"))
                 if content_length > 0:
-                    body = self.rfile.read(content_length).decode("utf-8")
+                    body = self.rfile.read(content_length)
 
             # Process request through WebApp
             status_code, response_headers, response_body = self.web_app.handle_request(
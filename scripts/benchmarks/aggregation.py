@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one-pass aggregation builtins
+
+Builds synthetic HTTP log records (a vector of maps) and compares the
+reduce-with-assoc idiom, which builds a new map per record, with the
+one-pass builtins:
+
+  - requests per status, reduce with assoc versus count-by
+  - records per status, reduce with assoc and conj versus group-by
+  - status frequencies, reduce with assoc over a vector of statuses
+    versus frequencies
+
+Usage:
+    python scripts/benchmarks/aggregation.py
+    python scripts/benchmarks/aggregation.py --rows 200000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.persistent_map import persistent_map
+from lispy.persistent_vector import persistent_vector
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+STATUSES = [200, 200, 200, 201, 204, 301, 304, 400, 404, 500, 503]
+PATHS = ["/", "/login", "/api/items", "/api/orders", "/static/app.js"]
+
+COUNT_BY_REDUCE = """
+(reduce logs
+        (fn [counts row]
+          (assoc counts (get row ':status)
+                 (+ (get counts (get row ':status) 0) 1)))
+        {})
+"""
+
+COUNT_BY_BUILTIN = "(count-by logs ':status)"
+
+GROUP_BY_REDUCE = """
+(reduce logs
+        (fn [groups row]
+          (assoc groups (get row ':status)
+                 (conj (get groups (get row ':status) (vector)) row)))
+        {})
+"""
+
+GROUP_BY_BUILTIN = "(group-by logs ':status)"
+
+FREQUENCIES_REDUCE = """
+(reduce statuses
+        (fn [counts s] (assoc counts s (+ (get counts s 0) 1)))
+        {})
+"""
+
+FREQUENCIES_BUILTIN = "(frequencies statuses)"
+
+
+def make_rows(count: int):
+    rng = random.Random(42)
+    status, size, path = Symbol(":status"), Symbol(":bytes"), Symbol(":path")
+    return [
+        {
+            status: rng.choice(STATUSES),
+            size: rng.randrange(0, 50_000),
+            path: rng.choice(PATHS),
+        }
+        for _ in range(count)
+    ]
+
+
+def time_lispy(code: str, env, repeat: int) -> float:
+    """Run code repeat times and return the best time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_lispy_string(code, env)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy aggregation builtins")
+    parser.add_argument("--rows", type=int, default=50_000, help="Number of records")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    env = create_global_env()
+    env.define("logs", persistent_vector([persistent_map(row) for row in rows]))
+    env.define(
+        "statuses", persistent_vector([row[Symbol(":status")] for row in rows])
+    )
+
+    print(f"Records: {args.rows:,}")
+    for name, reduce_code, builtin_code in (
+        ("count-by", COUNT_BY_REDUCE, COUNT_BY_BUILTIN),
+        ("group-by", GROUP_BY_REDUCE, GROUP_BY_BUILTIN),
+        ("frequencies", FREQUENCIES_REDUCE, FREQUENCIES_BUILTIN),
+    ):
+        reduce_seconds = time_lispy(reduce_code, env, args.repeat)
+        builtin_seconds = time_lispy(builtin_code, env, args.repeat)
+        print(
+            f"  {name + ':':<13} reduce {reduce_seconds:8.3f}s"
+            f"  builtin {builtin_seconds:8.3f}s"
+            f"  ({reduce_seconds / builtin_seconds:,.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: random-access lookups in a large index file
+
+Writes an index of fixed-width records to a temporary file, then looks up a
+handful of records by number two ways and reports the time and the peak
+memory (measured with tracemalloc) of each:
+
+  - slurp the whole file, split it into lines, then take the nth line
+  - mmap-file, slice out the record's bytes, then decode only those
+
+Usage:
+    python scripts/benchmarks/byte_buffers.py
+    python scripts/benchmarks/byte_buffers.py --records 2000000 --lookups 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.types import Vector
+from lispy.utils import run_lispy_string
+
+RECORD_WIDTH = 32
+
+PROGRAMS = {
+    "slurp+split": """
+(let [records (split (slurp path) "\\n")]
+  (to-vector (map ids (fn [i] (nth records i)))))
+""",
+    "mmap-file": """
+(with-open [index (mmap-file path)]
+  (to-vector
+    (map ids (fn [i] (decode (slice index (* i width) (+ (* i width) (- width 1))))))))
+""",
+}
+
+
+def write_index(path: str, count: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(f"{i:010d} user-{i * 7919 % 1_000_003:<15d}\n")
+
+
+def measure(code: str, env):
+    """Run code once; return (result, seconds, peak bytes allocated)."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = run_lispy_string(code, env)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy byte buffers")
+    parser.add_argument("--records", type=int, default=500_000, help="Records in the index")
+    parser.add_argument("--lookups", type=int, default=20, help="Records to look up")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "users.idx")
+        write_index(path, args.records)
+        rng = random.Random(42)
+        env = create_global_env()
+        env.define("path", path)
+        env.define("width", RECORD_WIDTH)
+        env.define("ids", Vector(rng.sample(range(args.records), args.lookups)))
+
+        size = os.path.getsize(path)
+        print(f"Records: {args.records:,} ({size / 2**20:.1f} MiB), lookups: {args.lookups}")
+        expected = None
+        for name, source in PROGRAMS.items():
+            result, seconds, peak = measure(source, env)
+            result = list(result)
+            if expected is None:
+                expected = result
+            assert result == expected, f"{name} returned different records"
+            print(f"  {name + ':':<13} {seconds:8.3f}s  peak {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Constant Pools
+
+Writes a synthetic data module (a large vector of metric records that repeat
+the same strings, keywords, floats and small maps) and loads it with the
+module loader twice, with and without the constant pool:
+
+  - memory held by the parsed and evaluated module (measured with tracemalloc)
+  - load time
+  - what the pool merged, from the module's constant_pool_stats
+
+Usage:
+    python scripts/benchmarks/constant_pool.py
+    python scripts/benchmarks/constant_pool.py --records 100000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.evaluator import evaluate
+from lispy.module_system import ModuleLoader
+
+HOSTS = ["web-1", "web-2", "db-1", "cache-1"]
+METRICS = ["cpu", "memory", "disk", "latency"]
+UNITS = ['{:unit "%" :scale 1.0}', '{:unit "ms" :scale 0.001}', '{:unit "B" :scale 1.0}']
+THRESHOLDS = ["[0.5 0.75 0.9]", "[0.25 0.5 1.0]"]
+
+
+def write_data_module(directory: Path, records: int) -> None:
+    rng = random.Random(42)
+    lines = ["(define records ["]
+    for _ in range(records):
+        lines.append(
+            f'  {{:host "{rng.choice(HOSTS)}" :metric "{rng.choice(METRICS)}"'
+            f" :format {rng.choice(UNITS)} :thresholds {rng.choice(THRESHOLDS)}"
+            f" :weight {rng.choice([0.5, 1.5, 2.5])}}}"
+        )
+    lines.append("])")
+    lines.append("(export records)")
+    (directory / "metrics.lpy").write_text("\n".join(lines), encoding="utf-8")
+
+
+def load(directory: Path, use_constant_pool: bool):
+    """Load the data module with a fresh loader and return the module."""
+    loader = ModuleLoader(use_constant_pool=use_constant_pool)
+    loader.add_load_path(str(directory))
+    return loader.load_module("metrics", evaluate)
+
+
+def measure(directory: Path, use_constant_pool: bool, repeat: int):
+    """Return (module, bytes held after loading, best load time in seconds)."""
+    tracemalloc.start()
+    module = load(directory, use_constant_pool)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load(directory, use_constant_pool)
+        best = min(best, time.perf_counter() - started)
+    return module, held, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy constant pools")
+    parser.add_argument(
+        "--records", type=int, default=20_000, help="Records in the data module"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        write_data_module(directory, args.records)
+        plain, plain_bytes, plain_seconds = measure(directory, False, args.repeat)
+        pooled, pooled_bytes, pooled_seconds = measure(directory, True, args.repeat)
+
+    stats = pooled.constant_pool_stats
+    print(f"Records: {args.records:,}")
+    print(f"  memory  without pool {plain_bytes / 2**20:8.1f} MiB")
+    print(
+        f"          with pool    {pooled_bytes / 2**20:8.1f} MiB"
+        f"  ({plain_bytes / pooled_bytes:.1f}x smaller)"
+    )
+    print(f"  load    without pool {plain_seconds:8.3f}s")
+    print(f"          with pool    {pooled_seconds:8.3f}s")
+    print(
+        f"  pool    {stats['literals']:,} literals, {stats['unique']:,} unique,"
+        f" {stats['duplicates']:,} duplicates,"
+        f" ~{stats['bytes_saved'] / 2**20:.1f} MiB of duplicates dropped"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: reading and writing CSV
+
+Writes a synthetic CSV export to a temporary file, then sums one of its
+columns several ways and reports rows per second and the peak memory
+(measured with tracemalloc) of each:
+
+  - slurp the file, split it on newlines, then split each line on commas
+  - csv-read into vectors of strings
+  - csv-read into maps, with the amount column parsed as a float
+
+and finally copies the file with csv-write streaming the rows of csv-read.
+
+Usage:
+    python scripts/benchmarks/csv_streaming.py
+    python scripts/benchmarks/csv_streaming.py --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+REGIONS = ["north", "south", "east", "west"]
+
+PROGRAMS = {
+    "slurp+split": """
+(reduce (rest (split (slurp path) "\\n"))
+        (fn [total line]
+          (if (empty? line) total (+ total (to-float (nth (split line ",") 3)))))
+        0.0)
+""",
+    "csv-read vectors": """
+(with-open [f (open-file path)]
+  (reduce (rest (csv-read f))
+          (fn [total row] (+ total (to-float (nth row 3))))
+          0.0))
+""",
+    "csv-read maps": """
+(with-open [f (open-file path)]
+  (reduce (csv-read f {:header true :types {:amount ':float}})
+          (fn [total row] (+ total (get row ':amount)))
+          0.0))
+""",
+    "csv-write copy": """
+(with-open [f (open-file path)]
+  (csv-write out (csv-read f {:header true})))
+""",
+}
+
+
+def write_csv(path: str, count: int) -> None:
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("id,customer,region,amount\n")
+        for i in range(count):
+            f.write(
+                f"{i},customer-{rng.randrange(10_000)},{rng.choice(REGIONS)},"
+                f"{rng.randrange(100, 100_000) / 100}\n"
+            )
+
+
+def measure(code: str, env):
+    """Run code twice; return (result, seconds, peak bytes allocated).
+
+    tracemalloc slows allocation-heavy code severalfold, so the time comes
+    from an untraced run and the peak from a second, traced one.
+    """
+    started = time.perf_counter()
+    result = run_lispy_string(code, env)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    run_lispy_string(code, env)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy CSV reading and writing")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows in the file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "sales.csv")
+        write_csv(path, args.rows)
+        env = create_global_env()
+        env.define("path", path)
+        env.define("out", os.path.join(temp_dir, "copy.csv"))
+
+        size = os.path.getsize(path)
+        print(f"Rows: {args.rows:,} ({size / 2**20:.1f} MiB)")
+        for name, source in PROGRAMS.items():
+            result, seconds, peak = measure(source, env)
+            print(
+                f"  {name + ':':<18} {args.rows / seconds:>10,.0f} rows/s"
+                f"  peak {peak / 2**20:8.1f} MiB  ({result:,.2f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
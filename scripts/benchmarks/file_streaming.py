@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming a file line by line
+
+Writes a synthetic access log to a temporary file, then counts its 5xx lines
+two ways and reports the time and the peak memory (measured with
+tracemalloc) of each:
+
+  - slurp the whole file, split it on newlines, then filter the vector
+  - with-open, line-seq and reduce, which hold one chunk of lines at a time
+
+Usage:
+    python scripts/benchmarks/file_streaming.py
+    python scripts/benchmarks/file_streaming.py --lines 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+STATUSES = [200, 200, 200, 201, 204, 301, 304, 400, 404, 500, 503]
+PATHS = ["/", "/login", "/api/items", "/api/orders", "/static/app.js"]
+
+PROGRAMS = {
+    "slurp+split": """
+(count (filter (split (slurp path) "\\n")
+               (fn [line] (re-find line " 5\\\\d\\\\d "))))
+""",
+    "line-seq": """
+(with-open [f (open-file path)]
+  (reduce (line-seq f)
+          (fn [n line] (if (re-find line " 5\\\\d\\\\d ") (+ n 1) n))
+          0))
+""",
+}
+
+
+def write_log(path: str, count: int) -> None:
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(count):
+            f.write(
+                f"GET {rng.choice(PATHS)} {rng.choice(STATUSES)} {rng.randrange(0, 50_000)}\n"
+            )
+
+
+def measure(code: str, env):
+    """Run code once; return (result, seconds, peak bytes allocated)."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = run_lispy_string(code, env)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy file streaming")
+    parser.add_argument("--lines", type=int, default=200_000, help="Lines in the log")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "access.log")
+        write_log(path, args.lines)
+        env = create_global_env()
+        env.define("path", path)
+
+        size = os.path.getsize(path)
+        print(f"Lines: {args.lines:,} ({size / 2**20:.1f} MiB)")
+        for name, source in PROGRAMS.items():
+            result, seconds, peak = measure(source, env)
+            print(
+                f"  {name + ':':<13} {result:>8,} matches {seconds:8.3f}s"
+                f"  peak {peak / 2**20:8.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
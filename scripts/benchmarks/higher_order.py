@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: higher-order builtins
+
+Times each builtin that calls back into a LisPy function once per item,
+passing it a user-defined fn so every call goes through the evaluator's
+caller (make_caller). Each line reports the time per call of the fn.
+
+throttle and route handlers are called from Python, the way a timer or the
+web server would call them.
+
+Usage:
+    python scripts/benchmarks/higher_order.py
+    python scripts/benchmarks/higher_order.py --items 50000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+from lispy.web.app import WebApp
+
+# name -> (program, calls of the fn per item)
+PROGRAMS = {
+    "map": ("(map xs (fn [x] (+ x 1)))", 1),
+    "filter": ("(filter xs (fn [x] (> x 0)))", 1),
+    "reduce": ("(reduce xs (fn [acc x] (+ acc x)) 0)", 1),
+    "every?": ("(every? xs (fn [x] (>= x 0)))", 1),
+    "some": ("(some xs (fn [x] (< x 0)))", 1),
+    "sort-by": ("(sort-by xs (fn [x] (- x)))", 1),
+    "take-while": ("(count (take-while xs (fn [x] (>= x 0))))", 1),
+    "transduce": ("(transduce xs (map (fn [x] (* x 2))) +)", 1),
+    "async-map": ("(await (async-map xs (fn [x] (+ x 1))))", 1),
+    "async-filter": ("(await (async-filter xs (fn [x] (> x 0))))", 1),
+}
+
+
+def best_time(run, repeat: int) -> float:
+    """Return the best run time of run() in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def report(name: str, calls: int, seconds: float) -> None:
+    print(
+        f"  {name:14} {calls:>8,} calls {seconds * 1000:10.1f}ms"
+        f" {seconds / calls * 1e6:8.2f}us/call"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy higher-order builtins")
+    parser.add_argument("--items", type=int, default=20_000, help="Items per run")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    env = create_global_env()
+    env.define("xs", PersistentVector(range(args.items)))
+    shuffled = list(range(args.items))
+    random.Random(42).shuffle(shuffled)
+    env.define("shuffled", PersistentVector(shuffled))
+
+    print(f"Items: {args.items:,}")
+    for name, (source, calls_per_item) in PROGRAMS.items():
+        seconds = best_time(lambda: run_lispy_string(source, env), args.repeat)
+        report(name, args.items * calls_per_item, seconds)
+
+    # sort calls its comparison fn about n log n times; count the calls
+    calls = [0]
+    env.define("tick", lambda fn_args, fn_env: calls.__setitem__(0, calls[0] + 1))
+    run_lispy_string("(sort shuffled (fn [a b] (tick) (- b a)))", env)
+    seconds = best_time(
+        lambda: run_lispy_string("(sort shuffled (fn [a b] (- b a)))", env),
+        args.repeat,
+    )
+    report("sort", calls[0], seconds)
+
+    # throttle with a rate of 0 runs the fn on every call
+    throttled = run_lispy_string("(throttle (fn [x] (+ x 1)) 0)", env)
+    items = [[i] for i in range(args.items)]
+
+    def call_throttled():
+        for item in items:
+            throttled(item, env)
+
+    report("throttle", args.items, best_time(call_throttled, args.repeat))
+
+    app = WebApp()
+    handler = run_lispy_string("(fn [request] {:status 200 :body \"ok\"})", env)
+
+    def call_route_handler():
+        for _ in range(args.items):
+            app._execute_route_handler(handler, {}, env)
+
+    report("route handler", args.items, best_time(call_route_handler, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
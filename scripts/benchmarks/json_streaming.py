@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: encoding and streaming JSON
+
+Builds a vector of record maps, then reports the time and the peak memory
+(measured with tracemalloc) of:
+
+  - json-encode of the whole vector to one string
+  - json-write of the vector straight to a file
+  - ndjson-write of the records, one line each
+  - ndjson-read of that file back, summing one field
+
+Peaks are measured beyond the data itself, which is built beforehand.
+
+Usage:
+    python scripts/benchmarks/json_streaming.py
+    python scripts/benchmarks/json_streaming.py --records 500000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+BUILD = """
+(to-vector (map (range n)
+                (fn [i] {:id i :name (format "user-{}" i) :active true
+                         :tags [':a ':b] :score (* i 0.5)})))
+"""
+
+PROGRAMS = {
+    "json-encode": "(count (json-encode records))",
+    "json-write": "(json-write path records)",
+    "ndjson-write": "(ndjson-write path records)",
+    "ndjson-read": """
+(with-open [f (open-file path)]
+  (reduce (ndjson-read f) (fn [total r] (+ total (get r ':id))) 0))
+""",
+}
+
+
+def measure(code: str, env):
+    """Run code twice; return (result, seconds, peak bytes allocated).
+
+    tracemalloc slows allocation-heavy code severalfold, so the time comes
+    from an untraced run and the peak from a second, traced one.
+    """
+    started = time.perf_counter()
+    result = run_lispy_string(code, env)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    run_lispy_string(code, env)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy JSON streaming")
+    parser.add_argument("--records", type=int, default=100_000, help="Records to encode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = create_global_env()
+        env.define("n", args.records)
+        env.define("records", run_lispy_string(BUILD, env))
+
+        print(f"Records: {args.records:,}")
+        for name, source in PROGRAMS.items():
+            env.define("path", os.path.join(temp_dir, "out.json" if name == "json-write" else "out.ndjson"))
+            result, seconds, peak = measure(source, env)
+            print(
+                f"  {name + ':':<14} {args.records / seconds:>10,.0f} records/s"
+                f"  peak {peak / 2**20:8.1f} MiB  ({result})"
+            )
+
+
+if __name__ == "__main__":
+    main()
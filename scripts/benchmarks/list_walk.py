@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Walking a List with first/rest
+
+Builds a list of integers and sums it with the idiomatic loop/recur walk:
+
+    (loop [xs items total 0]
+      (if (empty? xs)
+        total
+        (recur (rest xs) (+ total (first xs)))))
+
+rest and cons share cons cells, so the walk should take time proportional to
+the length of the list. The walk is timed on a list built with cons in a loop
+and on a plain list such as a quoted literal, where the first rest converts
+the list to cons cells once.
+
+Usage:
+    python scripts/benchmarks/list_walk.py
+    python scripts/benchmarks/list_walk.py --size 200000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.types import LispyList
+from lispy.utils import run_lispy_string
+
+BUILD_WITH_CONS = """
+(define build-list
+  (fn [n]
+    (loop [i n acc (list)]
+      (if (= i 0)
+        acc
+        (recur (- i 1) (cons (- i 1) acc))))))
+"""
+
+WALK_LIST = """
+(define walk-list
+  (fn [items]
+    (loop [xs items total 0]
+      (if (empty? xs)
+        total
+        (recur (rest xs) (+ total (first xs)))))))
+"""
+
+
+def time_lispy(code: str, env, repeat: int):
+    """Run code repeat times and return (best seconds, last result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run_lispy_string(code, env)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark walking a LisPy list")
+    parser.add_argument(
+        "--size", type=int, default=100_000, help="Number of list elements"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    env = create_global_env()
+    run_lispy_string(BUILD_WITH_CONS, env)
+    run_lispy_string(WALK_LIST, env)
+    expected = args.size * (args.size - 1) // 2
+
+    build_seconds, items = time_lispy(f"(build-list {args.size})", env, args.repeat)
+    env.define("cons-built", items)
+    env.define("plain-list", LispyList(range(args.size)))
+
+    print(f"List size: {args.size:,}")
+    print(f"  build with cons:      {build_seconds:8.3f}s")
+    for name in ("cons-built", "plain-list"):
+        seconds, total = time_lispy(f"(walk-list {name})", env, args.repeat)
+        if total != expected:
+            raise SystemExit(f"Unexpected sum for {name}: {total} != {expected}")
+        rate = args.size / seconds
+        print(f"  walk {name + ':':<16} {seconds:8.3f}s  ({rate:,.0f} elements/s)")
+
+
+if __name__ == "__main__":
+    main()
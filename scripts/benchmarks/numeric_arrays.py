@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Typed Numeric Arrays
+
+Compares aggregating and transforming numbers held in a vector with the
+generic builtins against the same work on a double-array:
+
+    (reduce values + 0)               vs  (vsum values-array)
+    (map values (fn [x] (* x 1.5)))   vs  (vmap values-array (fn [x] (* x 1.5)))
+    (reduce (map ...) + 0) of squares vs  (dot values-array values-array)
+
+Reports which backend is in use (NumPy or the array module).
+
+Usage:
+    python scripts/benchmarks/numeric_arrays.py
+    python scripts/benchmarks/numeric_arrays.py --size 1000000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy import numeric_array
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+CASES = [
+    ("sum", "(reduce values + 0)", "(vsum values-array)"),
+    (
+        "scale",
+        "(map values (fn [x] (* x 1.5)))",
+        "(vmap values-array (fn [x] (* x 1.5)))",
+    ),
+    (
+        "sum of squares",
+        "(reduce (map values (fn [x] (* x x))) + 0)",
+        "(dot values-array values-array)",
+    ),
+]
+
+
+def time_lispy(code: str, env, repeat: int) -> float:
+    """Run code repeat times and return the best time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_lispy_string(code, env)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy numeric arrays")
+    parser.add_argument(
+        "--size", type=int, default=200_000, help="Number of array elements"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    env = create_global_env()
+    run_lispy_string(f"(define values (range 0 {args.size} 1))", env)
+    convert_seconds = time_lispy("(double-array values)", env, args.repeat)
+    run_lispy_string("(define values-array (double-array values))", env)
+
+    backend = "numpy" if numeric_array.np is not None else "array module"
+    print(f"Elements: {args.size:,}  backend: {backend}")
+    print(f"  vector -> double-array:  {convert_seconds:8.3f}s")
+    for name, generic, vectorized in CASES:
+        generic_seconds = time_lispy(generic, env, args.repeat)
+        vectorized_seconds = time_lispy(vectorized, env, args.repeat)
+        speedup = generic_seconds / vectorized_seconds
+        print(
+            f"  {name + ':':<16} generic {generic_seconds:8.3f}s"
+            f"  array {vectorized_seconds:8.3f}s  ({speedup:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
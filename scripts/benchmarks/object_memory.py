@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Runtime Object Memory
+
+Measures the memory held per runtime object with tracemalloc:
+
+  - per closure: a Function created by evaluating (fn [x y] (+ x y))
+  - per promise: a LispyPromise that is resolved right away
+  - per parsed node: the atoms, symbols and lists parsed from a source file
+  - per tail call and per symbol, the smallest objects the evaluator creates
+
+Run it on two checkouts to compare object layouts.
+
+Usage:
+    python scripts/benchmarks/object_memory.py
+    python scripts/benchmarks/object_memory.py --count 200000
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.evaluator import evaluate
+from lispy.functions import create_global_env
+from lispy.lexer import tokenize
+from lispy.parser import parse
+from lispy.tail_call import TailCall
+from lispy.types import LispyList, LispyPromise, Symbol
+
+PROGRAM = """
+(define (fib n)
+  (if (< n 2)
+      n
+      (+ (fib (- n 1)) (fib (- n 2)))))
+"""
+
+
+def measure_memory(build):
+    """Return (result, bytes allocated and still held by building it)."""
+    tracemalloc.start()
+    result = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held
+
+
+def count_nodes(expression) -> int:
+    if isinstance(expression, list):
+        return 1 + sum(count_nodes(item) for item in expression)
+    return 1
+
+
+def make_closures(count: int):
+    env = create_global_env()
+    expression = parse(tokenize("(fn [x y] (+ x y))"))
+    return [evaluate(expression, env) for _ in range(count)]
+
+
+def make_promises(count: int):
+    promises = []
+    for index in range(count):
+        promise = LispyPromise()
+        promise.resolve(index)
+        promises.append(promise)
+    return promises
+
+
+def make_trees(count: int):
+    tokens = tokenize(PROGRAM)
+    return [parse(tokens) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy object memory")
+    parser.add_argument(
+        "--count", type=int, default=100_000, help="Objects built per measurement"
+    )
+    args = parser.parse_args()
+    count = args.count
+
+    tree_count = max(1, count // 20)
+    trees, trees_bytes = measure_memory(lambda: make_trees(tree_count))
+    nodes = sum(count_nodes(tree) for tree in trees)
+
+    _, closures_bytes = measure_memory(lambda: make_closures(count))
+    _, promises_bytes = measure_memory(lambda: make_promises(count))
+    _, tail_calls_bytes = measure_memory(
+        lambda: [TailCall(None, LispyList()) for _ in range(count)]
+    )
+    _, symbols_bytes = measure_memory(
+        lambda: [Symbol(str(index)) for index in range(count)]
+    )
+    measurements = [
+        ("closure", count, closures_bytes),
+        ("promise", count, promises_bytes),
+        ("parsed node", nodes, trees_bytes),
+        ("tail call", count, tail_calls_bytes),
+        ("symbol", count, symbols_bytes),
+    ]
+
+    print(f"Objects: {count:,} (parsed nodes: {nodes:,})")
+    for name, objects, held in measurements:
+        print(f"  {name + ':':<13} {held / objects:8.1f} bytes each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: regex builtins
+
+Parses the status code out of synthetic access-log lines three ways:
+
+  - split on spaces and take a field (the only option before the regex
+    builtins)
+  - re-find with a pattern string, compiled once through the LRU cache
+  - re-find with a pattern precompiled by re-pattern
+
+and counts the 5xx lines of one large log with re-seq.
+
+Usage:
+    python scripts/benchmarks/regex.py
+    python scripts/benchmarks/regex.py --lines 100000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+STATUSES = [200, 200, 200, 201, 204, 301, 304, 400, 404, 500, 503]
+PATHS = ["/", "/login", "/api/items", "/api/orders", "/static/app.js"]
+
+PROGRAMS = {
+    "split": '(map lines (fn [line] (nth (split line " ") 2)))',
+    "re-find string": '(map lines (fn [line] (nth (re-find line "^\\\\S+ \\\\S+ (\\\\d{3})") 1)))',
+    "re-find pattern": "(map lines (fn [line] (nth (re-find line status-re) 1)))",
+    "re-seq 5xx": '(count (to-vector (re-seq log "(?m)^\\\\S+ \\\\S+ 5\\\\d\\\\d ")))',
+}
+
+
+def make_lines(count: int):
+    rng = random.Random(42)
+    return [
+        f"GET {rng.choice(PATHS)} {rng.choice(STATUSES)} {rng.randrange(0, 50_000)}"
+        for _ in range(count)
+    ]
+
+
+def time_lispy(code: str, env, repeat: int) -> float:
+    """Run code repeat times and return the best time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_lispy_string(code, env)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy regex builtins")
+    parser.add_argument("--lines", type=int, default=20_000, help="Number of log lines")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    lines = make_lines(args.lines)
+    env = create_global_env()
+    env.define("lines", PersistentVector(lines))
+    env.define("log", "\n".join(lines) + "\n")
+    run_lispy_string('(define status-re (re-pattern "^\\\\S+ \\\\S+ (\\\\d{3})"))', env)
+
+    print(f"Lines: {args.lines:,}")
+    for name, source in PROGRAMS.items():
+        seconds = time_lispy(source, env, args.repeat)
+        print(
+            f"  {name + ':':<17} {seconds:8.3f}s"
+            f"  {seconds / args.lines * 1e6:8.2f}us/line"
+        )
+
+
+if __name__ == "__main__":
+    main()
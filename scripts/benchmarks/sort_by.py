@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sort-by
+
+Sorts a vector of records by one field three ways:
+
+  - sort with a comparison function, which calls LisPy O(n log n) times
+  - sort-by with a key function, which calls LisPy once per record
+  - sort-by with a keyword, which never calls LisPy
+
+The comparison-function sort is run on a smaller prefix of the records (see
+--compare-records), since it is far slower.
+
+Usage:
+    python scripts/benchmarks/sort_by.py
+    python scripts/benchmarks/sort_by.py --records 100000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.persistent_map import PersistentMap
+from lispy.persistent_vector import PersistentVector
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+PROGRAMS = {
+    "sort + comparison fn": (
+        "(sort few (fn [a b] (- (get a ':latency) (get b ':latency))))"
+    ),
+    "sort-by key fn": "(sort-by records (fn [r] (get r ':latency)))",
+    "sort-by keyword": "(sort-by records ':latency)",
+    "sort-by keyword >": "(sort-by records ':latency >)",
+}
+
+
+def best_time(source: str, env, repeat: int):
+    """Return (result, best run time in seconds) of source in env."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run_lispy_string(source, env)
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy sort-by")
+    parser.add_argument("--records", type=int, default=100_000, help="Records to sort")
+    parser.add_argument(
+        "--compare-records",
+        type=int,
+        default=10_000,
+        help="Records sorted with a comparison function",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    latency, host = Symbol(":latency"), Symbol(":host")
+    records = PersistentVector(
+        PersistentMap({latency: rng.randrange(10_000), host: f"web-{i % 8}"})
+        for i in range(args.records)
+    )
+    env = create_global_env()
+    env.define("records", records)
+    env.define("few", PersistentVector(records[: args.compare_records]))
+
+    print(f"Records: {args.records:,}")
+    for name, source in PROGRAMS.items():
+        result, seconds = best_time(source, env, args.repeat)
+        values = [record[latency] for record in result]
+        assert values == sorted(values, reverse=source.endswith(">)"))
+        count = len(result)
+        print(
+            f"  {name:22} {count:>8,} records {seconds * 1000:10.1f}ms"
+            f" {seconds / count * 1e6:8.2f}us/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Sorted Collections
+
+Simulates a scheduler that keeps job times in order while jobs arrive one at
+a time, and compares two LisPy programs:
+
+  - a vector that is re-sorted with sort after every insert
+  - a sorted-set that each job is conj'ed onto
+
+and then the cost of a range query ("jobs due in the next window") with
+subseq against filtering the whole vector.
+
+Usage:
+    python scripts/benchmarks/sorted_collections.py
+    python scripts/benchmarks/sorted_collections.py --jobs 5000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+RESORT_PROGRAM = """
+(reduce times (fn [acc t] (sort (conj acc t))) [])
+"""
+
+SORTED_SET_PROGRAM = """
+(reduce times (fn [acc t] (conj acc t)) (sorted-set))
+"""
+
+FILTER_QUERY = "(count (filter schedule (fn [t] (and (>= t start) (< t end)))))"
+
+SUBSEQ_QUERY = "(count (subseq schedule >= start < end))"
+
+
+def best_time(source: str, env, repeat: int):
+    """Return (result, best run time in seconds) of source in env."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run_lispy_string(source, env)
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy sorted collections")
+    parser.add_argument("--jobs", type=int, default=2_000, help="Jobs to schedule")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    times = rng.sample(range(args.jobs * 100), args.jobs)
+    env = create_global_env()
+    env.define("times", run_lispy_string(f"(vector {' '.join(map(str, times))})", env))
+
+    resorted, resort_seconds = best_time(RESORT_PROGRAM, env, args.repeat)
+    scheduled, sorted_seconds = best_time(SORTED_SET_PROGRAM, env, args.repeat)
+    assert list(resorted) == list(scheduled) == sorted(times)
+
+    start = args.jobs * 50
+    env.define("start", start)
+    env.define("end", start + 1_000)
+    env.define("schedule", resorted)
+    filtered, filter_seconds = best_time(FILTER_QUERY, env, args.repeat * 10)
+    env.define("schedule", scheduled)
+    ranged, subseq_seconds = best_time(SUBSEQ_QUERY, env, args.repeat * 10)
+    assert filtered == ranged
+
+    print(f"Jobs: {args.jobs:,}")
+    print(f"  inserts  vector + sort  {resort_seconds:8.3f}s")
+    print(
+        f"           sorted-set     {sorted_seconds:8.3f}s"
+        f"  ({resort_seconds / sorted_seconds:.1f}x faster)"
+    )
+    print(f"  window   filter         {filter_seconds * 1000:8.3f}ms ({filtered} jobs)")
+    print(
+        f"           subseq         {subseq_seconds * 1000:8.3f}ms"
+        f"  ({filter_seconds / subseq_seconds:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
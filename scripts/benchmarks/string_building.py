@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: building large strings
+
+Renders an HTML table of synthetic rows three ways:
+
+  - a reduce with append, which copies the whole page at every row
+  - a reduce with sb-append! on a string builder, joined once by sb->str
+  - str-join over the rendered rows, with format filling a cached template
+
+The append version is quadratic in the number of rows; the other two are
+linear, so the gap widens as --rows grows.
+
+Usage:
+    python scripts/benchmarks/string_building.py
+    python scripts/benchmarks/string_building.py --rows 20000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.persistent_map import persistent_map
+from lispy.persistent_vector import persistent_vector
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+PATHS = ["/", "/login", "/api/items", "/api/orders", "/static/app.js"]
+
+PROGRAMS = {
+    "append": """
+(reduce rows
+        (fn [page row]
+          (append page "<tr><td>" (get row ':path) "</td><td>"
+                  (to-str (get row ':bytes)) "</td></tr>"))
+        "")
+""",
+    "sb-append!": """
+(sb->str
+  (reduce rows
+          (fn [sb row]
+            (sb-append! sb "<tr><td>" (get row ':path) "</td><td>"
+                        (get row ':bytes) "</td></tr>"))
+          (string-builder)))
+""",
+    "str-join+format": """
+(str-join (map rows (fn [row]
+                      (format "<tr><td>{}</td><td>{}</td></tr>"
+                              (get row ':path) (get row ':bytes)))))
+""",
+}
+
+
+def make_rows(count: int):
+    rng = random.Random(42)
+    path, size = Symbol(":path"), Symbol(":bytes")
+    return persistent_vector(
+        [
+            persistent_map({path: rng.choice(PATHS), size: rng.randrange(0, 50_000)})
+            for _ in range(count)
+        ]
+    )
+
+
+def time_lispy(code: str, env, repeat: int) -> float:
+    """Run code repeat times and return the best time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_lispy_string(code, env)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy string building")
+    parser.add_argument("--rows", type=int, default=5_000, help="Rows in the page")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    env = create_global_env()
+    env.define("rows", make_rows(args.rows))
+
+    print(f"Rows: {args.rows:,}")
+    for name, source in PROGRAMS.items():
+        seconds = time_lispy(source, env, args.repeat)
+        print(f"  {name + ':':<17} {seconds:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Columnar Tables
+
+Builds synthetic HTTP log records and compares a vector of maps with a
+columnar table:
+
+  - memory held by the records (measured with tracemalloc)
+  - bytes per status code, as a reduce with assoc over the vector of maps
+    versus (aggregate (group-by table ':status) ...)
+  - the 5xx rows, as filter over the maps versus where on the table
+
+Usage:
+    python scripts/benchmarks/tables.py
+    python scripts/benchmarks/tables.py --rows 200000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions import create_global_env
+from lispy.persistent_map import persistent_map
+from lispy.persistent_vector import persistent_vector
+from lispy.table import Table
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+STATUSES = [200, 200, 200, 201, 204, 301, 304, 400, 404, 500, 503]
+PATHS = ["/", "/login", "/api/items", "/api/orders", "/static/app.js"]
+
+BYTES_BY_STATUS_MAPS = """
+(reduce logs
+        (fn [totals row]
+          (assoc totals (get row ':status)
+                 (+ (get totals (get row ':status) 0) (get row ':bytes))))
+        {})
+"""
+
+BYTES_BY_STATUS_TABLE = "(aggregate (group-by log-table ':status) {:bytes [:sum :bytes]})"
+
+ERRORS_MAPS = "(filter logs (fn [row] (>= (get row ':status) 500)))"
+
+ERRORS_TABLE = "(where log-table ':status (fn [s] (>= s 500)))"
+
+
+def make_rows(count: int):
+    rng = random.Random(42)
+    status, size, path, latency = (
+        Symbol(":status"),
+        Symbol(":bytes"),
+        Symbol(":path"),
+        Symbol(":latency"),
+    )
+    return [
+        {
+            status: rng.choice(STATUSES),
+            size: rng.randrange(0, 50_000),
+            path: rng.choice(PATHS),
+            latency: rng.random() * 2.0,
+        }
+        for _ in range(count)
+    ]
+
+
+def measure_memory(build):
+    """Return (result, bytes allocated and still held by building it)."""
+    tracemalloc.start()
+    result = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held
+
+
+def time_lispy(code: str, env, repeat: int) -> float:
+    """Run code repeat times and return the best time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_lispy_string(code, env)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LisPy columnar tables")
+    parser.add_argument("--rows", type=int, default=50_000, help="Number of records")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    logs, maps_bytes = measure_memory(
+        lambda: persistent_vector([persistent_map(row) for row in rows])
+    )
+    table, table_bytes = measure_memory(lambda: Table.from_rows(rows))
+
+    env = create_global_env()
+    env.define("logs", logs)
+    env.define("log-table", table)
+
+    print(f"Records: {args.rows:,}")
+    print(f"  memory  vector of maps {maps_bytes / 2**20:8.1f} MiB")
+    print(
+        f"          table          {table_bytes / 2**20:8.1f} MiB"
+        f"  ({maps_bytes / table_bytes:.1f}x smaller)"
+    )
+    for name, maps_code, table_code in (
+        ("bytes by status", BYTES_BY_STATUS_MAPS, BYTES_BY_STATUS_TABLE),
+        ("5xx rows", ERRORS_MAPS, ERRORS_TABLE),
+    ):
+        maps_seconds = time_lispy(maps_code, env, args.repeat)
+        table_seconds = time_lispy(table_code, env, args.repeat)
+        print(
+            f"  {name + ':':<16} maps {maps_seconds:8.3f}s"
+            f"  table {table_seconds:8.3f}s  ({maps_seconds / table_seconds:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -56,9 +56,12 @@ class DocumentationScanner:
         # Import the documentation registry to get documentation functions
         try:
             # Get all available function symbols from the global environment
-            from lispy.functions import global_env
+            from lispy.functions import global_env, load_all_builtins
             from lispy.functions.doc import DOCUMENTATION_REGISTRY
 
+            # Built-ins load lazily; documentation needs all of them registered
+            load_all_builtins()
+
             # Get all function names from the environment
             function_symbols = []
             for symbol in global_env.store.keys():
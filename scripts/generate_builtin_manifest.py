@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Generate the LisPy Built-in Manifest
+
+Discovers every built-in function and writes lispy/functions/builtin_manifest.py,
+which maps LisPy names to the modules that define them. Environments use the
+manifest to import built-in packages lazily on first lookup.
+
+Run this after adding, renaming or removing a built-in function.
+
+Usage:
+    python scripts/generate_builtin_manifest.py
+    python scripts/generate_builtin_manifest.py --check    # Fail if out of date
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lispy.functions.function_registry import build_builtin_manifest
+
+MANIFEST_PATH = PROJECT_ROOT / "lispy" / "functions" / "builtin_manifest.py"
+
+MANIFEST_HEADER = '''"""
+Generated manifest of LisPy built-in functions.
+
+Maps each built-in name to the module that defines it, so environments can
+import built-in packages lazily. Do not edit by hand; regenerate with:
+
+    python scripts/generate_builtin_manifest.py
+"""
+
+'''
+
+
+def render_manifest(modules, web_unsafe) -> str:
+    """Render the manifest module source, quoting strings the way black does."""
+    lines = [MANIFEST_HEADER, "BUILTIN_MODULES = {\n"]
+    for name, module in modules.items():
+        lines.append(f"    {json.dumps(name)}: {json.dumps(module)},\n")
+    lines.append("}\n\nWEB_UNSAFE_BUILTINS = {\n")
+    for name, reason in web_unsafe.items():
+        lines.append(f"    {json.dumps(name)}: {json.dumps(reason)},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate the built-in manifest")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the manifest on disk is out of date",
+    )
+    args = parser.parse_args()
+
+    source = render_manifest(*build_builtin_manifest())
+
+    if args.check:
+        current = MANIFEST_PATH.read_text(encoding="utf-8")
+        if current != source:
+            print(f"{MANIFEST_PATH} is out of date; run {Path(__file__).name}")
+            return 1
+        print("Built-in manifest is up to date")
+        return 0
+
+    MANIFEST_PATH.write_text(source, encoding="utf-8")
+    print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
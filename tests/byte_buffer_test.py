@@ -0,0 +1,70 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.byte_buffer import ByteBuffer
+
+
+class ByteBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_slice_shares_source(self):
+        source = b"hello world"
+        buffer = ByteBuffer(source)
+        world = buffer.slice(6)
+        self.assertIs(world._source, source)
+        self.assertEqual(world.to_bytes(), b"world")
+        self.assertEqual(world.slice(1, -1).to_bytes(), b"orl")
+        self.assertEqual(buffer.slice(-5, 100).to_bytes(), b"world")
+        self.assertEqual(len(buffer.slice(8, 2)), 0)
+
+    def test_byte_at_and_index_of(self):
+        buffer = ByteBuffer(b"xxa,b,c").slice(2)
+        self.assertEqual(buffer.byte_at(0), ord("a"))
+        self.assertEqual(buffer.byte_at(-1), ord("c"))
+        with self.assertRaises(IndexError):
+            buffer.byte_at(5)
+        self.assertEqual(buffer.index_of(b","), 1)
+        self.assertEqual(buffer.index_of(b",", 2), 3)
+        self.assertEqual(buffer.index_of(b"x"), -1)
+        self.assertEqual(buffer.slice(0, 2).index_of(b"b"), -1)
+
+    def test_equality_and_hash(self):
+        a = ByteBuffer(b"--abc").slice(2)
+        b = ByteBuffer(b"abc")
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, ByteBuffer(b"abd"))
+        self.assertEqual(list(a), [97, 98, 99])
+        self.assertEqual(repr(a), "#<bytes length=3>")
+
+    def test_from_file(self):
+        path = self.write("data.bin", b"header:payload")
+        buffer = ByteBuffer.from_file(path)
+        payload = buffer.slice(buffer.index_of(b":") + 1)
+        self.assertEqual(payload.decode(), "payload")
+        self.assertFalse(payload.closed)
+        buffer.close()
+        self.assertTrue(buffer.closed)
+        self.assertTrue(payload.closed)
+
+    def test_from_empty_file(self):
+        buffer = ByteBuffer.from_file(self.write("empty.bin", b""))
+        self.assertEqual(len(buffer), 0)
+        buffer.close()
+        self.assertFalse(buffer.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from lispy.constant_pool import ConstantPool
+from lispy.persistent_map import PersistentMap
+from lispy.types import LispyMapLiteral, Symbol, Vector
+
+
+class ConstantPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = ConstantPool()
+
+    def test_strings_are_shared(self):
+        first = self.pool.string("".join(["status", "-code"]))
+        second = self.pool.string("".join(["status", "-code"]))
+        self.assertIs(first, second)
+
+    def test_floats_are_shared_but_zero_signs_kept_apart(self):
+        self.assertIs(self.pool.number(float("1.5")), self.pool.number(float("1.5")))
+        self.assertEqual(str(self.pool.number(-0.0)), "-0.0")
+        self.assertEqual(str(self.pool.number(0.0)), "0.0")
+
+    def test_symbols_are_shared(self):
+        self.assertIs(self.pool.symbol(":status"), self.pool.symbol(":status"))
+
+    def test_vector_of_constants_is_shared(self):
+        keyword = self.pool.symbol(":k")
+        first = self.pool.vector(Vector([1, "a", keyword]))
+        second = self.pool.vector(Vector([1, "a", keyword]))
+        self.assertIs(first, second)
+
+    def test_vector_with_symbol_is_not_shared(self):
+        first = self.pool.vector(Vector([Symbol("x")]))
+        second = self.pool.vector(Vector([Symbol("x")]))
+        self.assertIsNot(first, second)
+
+    def test_nested_pooled_vectors_are_shared(self):
+        inner = self.pool.vector(Vector([1, 2]))
+        first = self.pool.vector(Vector([inner, inner]))
+        second = self.pool.vector(Vector([self.pool.vector(Vector([1, 2])), inner]))
+        self.assertIs(first, second)
+
+    def test_constant_map_literal_becomes_persistent_map(self):
+        literal = LispyMapLiteral({Symbol(":a"): 1})
+        first = self.pool.map_literal(literal)
+        second = self.pool.map_literal(LispyMapLiteral({Symbol(":a"): 1}))
+        self.assertIsInstance(first, PersistentMap)
+        self.assertIs(first, second)
+        self.assertEqual(first, {Symbol(":a"): 1})
+
+    def test_map_literal_needing_evaluation_is_unchanged(self):
+        literal = LispyMapLiteral({Symbol(":a"): Symbol(":b")})
+        self.assertIs(self.pool.map_literal(literal), literal)
+
+    def test_stats(self):
+        self.pool.string("a")
+        self.pool.string("a")
+        self.pool.number(2.5)
+        stats = self.pool.stats()
+        self.assertEqual(stats["literals"], 3)
+        self.assertEqual(stats["unique"], 2)
+        self.assertEqual(stats["duplicates"], 1)
+        self.assertGreater(stats["bytes_saved"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
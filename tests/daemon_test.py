@@ -0,0 +1,174 @@
+import io
+import os
+import signal
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from lispy import daemon
+
+
+@unittest.skipUnless(daemon.daemon_supported(), "requires Unix sockets and fork")
+class DaemonTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "lispy.sock")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _start_server(self, run_script):
+        server = daemon.LispyDaemonServer(self.socket_path, run_script)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _run(self, script="script.lpy", args=()):
+        stdout, stderr = io.BytesIO(), io.BytesIO()
+        exit_code = daemon.run_via_daemon(
+            script, args, self.socket_path, stdout=stdout, stderr=stderr
+        )
+        return exit_code, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+    def test_streams_output_and_exit_code(self):
+        def run_script(script_path, script_args):
+            print("hello", " ".join(script_args))
+            print("warning", file=__import__("sys").stderr)
+            return 3
+
+        self._start_server(run_script)
+        exit_code, stdout, stderr = self._run(args=["a", "b"])
+        self.assertEqual(exit_code, 3)
+        self.assertEqual(stdout, "hello a b\n")
+        self.assertEqual(stderr, "warning\n")
+
+    def test_each_request_runs_in_isolated_process(self):
+        state = {"runs": 0}
+
+        def run_script(script_path, script_args):
+            state["runs"] += 1
+            print(state["runs"])
+            return 0
+
+        self._start_server(run_script)
+        self.assertEqual(self._run()[1], "1\n")
+        self.assertEqual(self._run()[1], "1\n")
+        self.assertEqual(state["runs"], 0)
+
+    def test_script_errors_are_reported(self):
+        def run_script(script_path, script_args):
+            raise RuntimeError("broken")
+
+        self._start_server(run_script)
+        exit_code, _, stderr = self._run()
+        self.assertEqual(exit_code, daemon.EXIT_FAILURE)
+        self.assertIn("broken", stderr)
+
+    def test_missing_daemon(self):
+        exit_code, _, stderr = self._run()
+        self.assertEqual(exit_code, daemon.EXIT_DAEMON_UNAVAILABLE)
+        self.assertIn("No LisPy daemon", stderr)
+
+    def test_frame_round_trip(self):
+        stream = io.BytesIO()
+        daemon.write_frame(stream, daemon.FRAME_STDOUT, b"data")
+        stream.seek(0)
+        self.assertEqual(daemon.read_frame(stream), (daemon.FRAME_STDOUT, b"data"))
+        self.assertIsNone(daemon.read_frame(stream))
+
+    def test_socket_is_private(self):
+        self._start_server(lambda script_path, script_args: 0)
+        mode = stat.S_IMODE(os.stat(self.socket_path).st_mode)
+        self.assertEqual(mode, 0o600)
+
+    def test_creates_private_socket_directory(self):
+        directory = os.path.join(self.temp_dir.name, "run")
+        self.socket_path = os.path.join(directory, "lispy.sock")
+        self._start_server(lambda script_path, script_args: 0)
+        self.assertEqual(stat.S_IMODE(os.stat(directory).st_mode) & 0o077, 0)
+        self.assertEqual(self._run()[0], 0)
+
+    def test_refuses_shared_socket_directory(self):
+        os.chmod(self.temp_dir.name, 0o777)
+        with self.assertRaisesRegex(OSError, "writable by other users"):
+            daemon.LispyDaemonServer(self.socket_path, lambda script_path, script_args: 0)
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_client_refuses_socket_of_another_user(self):
+        self._start_server(lambda script_path, script_args: 0)
+        with mock.patch.object(daemon, "_user_id", return_value=os.getuid() + 1):
+            exit_code, _, stderr = self._run()
+        self.assertEqual(exit_code, daemon.EXIT_DAEMON_UNAVAILABLE)
+        self.assertIn("owned by another user", stderr)
+
+    def test_default_socket_path(self):
+        with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.temp_dir.name}):
+            os.environ.pop(daemon.SOCKET_ENV_VAR, None)
+            self.assertEqual(
+                daemon.default_socket_path(),
+                os.path.join(self.temp_dir.name, "lispy-daemon.sock"),
+            )
+            del os.environ["XDG_RUNTIME_DIR"]
+            path = daemon.default_socket_path()
+            self.assertEqual(
+                os.path.dirname(path),
+                os.path.join(tempfile.gettempdir(), f"lispy-daemon-{os.getuid()}"),
+            )
+            os.environ[daemon.SOCKET_ENV_VAR] = self.socket_path
+            self.assertEqual(daemon.default_socket_path(), self.socket_path)
+
+
+@unittest.skipUnless(daemon.daemon_supported(), "requires Unix sockets and fork")
+class DaemonEndToEndTest(unittest.TestCase):
+    """Runs real scripts through bin/lispy_interpreter.py --daemon and the client."""
+
+    BIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bin")
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.socket_path = os.path.join(self.temp_dir.name, "lispy.sock")
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(self.BIN, "lispy_interpreter.py"), "--daemon", "--socket", self.socket_path],
+            stderr=subprocess.DEVNULL,
+        )
+        self.addCleanup(server.wait, timeout=10)
+        self.addCleanup(server.send_signal, signal.SIGTERM)
+        deadline = time.monotonic() + 30
+        while not os.path.exists(self.socket_path):
+            if server.poll() is not None or time.monotonic() > deadline:
+                self.fail("The LisPy daemon did not start")
+            time.sleep(0.05)
+
+    def _client(self, source, *args):
+        script = os.path.join(self.temp_dir.name, "script.lpy")
+        with open(script, "w", encoding="utf-8") as f:
+            f.write(source)
+        return subprocess.run(
+            [sys.executable, os.path.join(self.BIN, "lispy_client.py"), "--socket", self.socket_path, script, *args],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+    def test_runs_script(self):
+        result = self._client('(println "sum" (+ 1 2))\n(println (first *command-line-args*))\n', "hello")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "sum 3\nhello\n")
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+
+    def test_reports_script_errors(self):
+        result = self._client("(undefined-fn 1)\n")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Unbound symbol: undefined-fn", result.stdout + result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 import unittest
 
 from lispy.environment import Environment
-from lispy.evaluator import evaluate
+from lispy.evaluator import evaluate, make_caller
 from lispy.exceptions import EvaluationError
 from lispy.functions import global_env
 from lispy.types import Symbol
+from lispy.utils import run_lispy_string
 
 # We might need to parse some simple expressions to feed the evaluator
 # from lispy.parser import parse # If needed for more complex test cases later
@@ -127,6 +128,50 @@ class EvaluatorTest(unittest.TestCase):
         expr = [Symbol("+"), 5, 5]
         self.assertEqual(evaluate(expr, local_env), 10)
 
+    def test_make_caller_user_function(self):
+        add = run_lispy_string("(fn [a b] (+ a b))", self.env)
+        call = make_caller(add, self.env, arity=2)
+        self.assertEqual(call(1, 2), 3)
+        self.assertEqual(call(10, 20), 30)
+
+    def test_make_caller_checks_arity_once(self):
+        inc = run_lispy_string("(fn [x] (+ x 1))", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "ArityError: Function '<fn>' expects 1 arguments, got 2."
+        ):
+            make_caller(inc, self.env, arity=2)
+
+    def test_make_caller_without_arity_checks_each_call(self):
+        inc = run_lispy_string("(fn [x] (+ x 1))", self.env)
+        call = make_caller(inc, self.env)
+        self.assertEqual(call(1), 2)
+        with self.assertRaisesRegex(EvaluationError, "expects 1 arguments, got 0"):
+            call()
+
+    def test_make_caller_multi_expression_body(self):
+        fn = run_lispy_string("(fn [x] (+ x 1) (* x 2))", self.env)
+        self.assertEqual(make_caller(fn, self.env, arity=1)(5), 10)
+
+    def test_make_caller_supports_recur(self):
+        count_down = run_lispy_string(
+            "(fn [n acc] (if (<= n 0) acc (recur (- n 1) (+ acc n))))", self.env
+        )
+        self.assertEqual(make_caller(count_down, self.env, arity=2)(1000, 0), 500500)
+
+    def test_make_caller_builtin(self):
+        call = make_caller(global_env.lookup("+"), self.env, arity=2)
+        self.assertEqual(call(2, 3), 5)
+
+    def test_make_caller_outer_environment(self):
+        get_y = run_lispy_string("(fn [x] (+ x y))", self.env)
+        outer = Environment(outer=global_env)
+        outer.define("y", 100)
+        self.assertEqual(make_caller(get_y, self.env, arity=1, outer=outer)(1), 101)
+
+    def test_make_caller_non_procedure(self):
+        with self.assertRaisesRegex(EvaluationError, "is not a function"):
+            make_caller(42, self.env)
+
 
 if __name__ == "__main__":
     unittest.main()
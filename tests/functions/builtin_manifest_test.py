@@ -0,0 +1,69 @@
+import unittest
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env, create_web_safe_env
+from lispy.functions.builtin_manifest import (BUILTIN_MODULES,
+                                              WEB_UNSAFE_BUILTINS)
+from lispy.functions.function_registry import (FunctionRegistry,
+                                               build_builtin_manifest)
+from lispy.utils import run_lispy_string
+
+
+class BuiltinManifestTest(unittest.TestCase):
+    """Test the generated manifest and lazy built-in resolution."""
+
+    def test_manifest_matches_discovered_functions(self):
+        """The checked-in manifest must be regenerated when built-ins change."""
+        modules, web_unsafe = build_builtin_manifest()
+        self.assertEqual(
+            BUILTIN_MODULES,
+            modules,
+            "Run scripts/generate_builtin_manifest.py to update the manifest",
+        )
+        self.assertEqual(WEB_UNSAFE_BUILTINS, web_unsafe)
+
+    def test_global_env_lists_builtins_before_lookup(self):
+        env = create_global_env()
+        self.assertIn("http-get", env.store)
+        self.assertIn("json-encode", env.store.keys())
+
+    def test_builtin_resolves_on_first_lookup(self):
+        env = create_global_env()
+        self.assertEqual(run_lispy_string("(abs -4)", env), 4)
+        self.assertTrue(callable(env.store["abs"]))
+
+    def test_define_overrides_pending_builtin(self):
+        env = create_global_env()
+        run_lispy_string("(define abs 42)", env)
+        self.assertEqual(run_lispy_string("abs", env), 42)
+
+    def test_deleted_builtin_is_unbound(self):
+        env = create_global_env()
+        del env.store["slurp"]
+        self.assertNotIn("slurp", env.store)
+        with self.assertRaises(EvaluationError):
+            env.lookup("slurp")
+
+    def test_web_safe_env_excludes_pending_builtins(self):
+        env = create_web_safe_env()
+        self.assertNotIn("spit", env.store)
+        self.assertIn("map", env.store)
+
+    def test_registry_with_custom_manifest(self):
+        registry = FunctionRegistry(manifest={"abs": "lispy.functions.math.abs"})
+        env = Environment()
+        registry.install_lazy_builtins(env)
+        self.assertEqual(list(env.store.keys()), ["abs"])
+        self.assertEqual(env.lookup("abs")([-3], env), 3)
+        with self.assertRaises(EvaluationError):
+            env.lookup("map")
+
+    def test_doc_loads_documentation_lazily(self):
+        env = create_global_env()
+        result = run_lispy_string("(doc 'http-delete)", env)
+        self.assertIn("http-delete", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
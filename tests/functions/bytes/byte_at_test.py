@@ -0,0 +1,29 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ByteAtFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_byte_at(self):
+        self.assertEqual(run_lispy_string('(byte-at (bytes "A") 0)', self.env), 65)
+        self.assertEqual(run_lispy_string("(byte-at (bytes [1 2 3]) -1)", self.env), 3)
+        self.assertEqual(run_lispy_string("(byte-at (slice (bytes [1 2 3]) 1) 0)", self.env), 2)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string("(byte-at (bytes [1]))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Index 3 is out of bounds for bytes of length 3"):
+            run_lispy_string("(byte-at (bytes [1 2 3]) 3)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'byte-at' must be bytes"):
+            run_lispy_string("(byte-at [1 2] 0)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Second argument to 'byte-at' must be an integer"):
+            run_lispy_string('(byte-at (bytes [1]) "0")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
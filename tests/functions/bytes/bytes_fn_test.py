@@ -0,0 +1,41 @@
+import unittest
+
+from lispy.byte_buffer import ByteBuffer
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class BytesFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_from_string(self):
+        result = run_lispy_string('(bytes "héllo")', self.env)
+        self.assertIsInstance(result, ByteBuffer)
+        self.assertEqual(result.to_bytes(), "héllo".encode("utf-8"))
+        self.assertEqual(run_lispy_string('(count (bytes "héllo"))', self.env), 6)
+
+    def test_from_vector_and_list(self):
+        self.assertEqual(run_lispy_string("(bytes [0 255 16])", self.env).to_bytes(), b"\x00\xff\x10")
+        self.assertEqual(run_lispy_string("(bytes (list 104 105))", self.env).to_bytes(), b"hi")
+        self.assertEqual(run_lispy_string("(bytes [])", self.env).to_bytes(), b"")
+
+    def test_bytes_of_bytes(self):
+        buffer = run_lispy_string('(bytes "x")', self.env)
+        self.env.define("b", buffer)
+        self.assertIs(run_lispy_string("(bytes b)", self.env), buffer)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(bytes)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "integers from 0 to 255"):
+            run_lispy_string("(bytes [1 256])", self.env)
+        with self.assertRaisesRegex(EvaluationError, "integers from 0 to 255"):
+            run_lispy_string('(bytes ["a"])', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string, vector or list"):
+            run_lispy_string("(bytes 42)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
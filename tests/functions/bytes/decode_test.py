@@ -0,0 +1,29 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class DecodeFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_decode(self):
+        self.assertEqual(run_lispy_string("(decode (bytes [104 105]))", self.env), "hi")
+        self.assertEqual(run_lispy_string('(decode (bytes "héllo"))', self.env), "héllo")
+        self.assertEqual(run_lispy_string('(decode (bytes [233]) "latin-1")', self.env), "é")
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 or 2 arguments, got 0"):
+            run_lispy_string("(decode)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "UnicodeError: Cannot decode bytes as utf-8"):
+            run_lispy_string("(decode (bytes [233]))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Unknown encoding 'nope'"):
+            run_lispy_string('(decode (bytes [104]) "nope")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'decode' must be bytes"):
+            run_lispy_string('(decode "hi")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
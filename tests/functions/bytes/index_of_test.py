@@ -0,0 +1,38 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class IndexOfFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.env.define("data", run_lispy_string('(bytes "a,b,c")', self.env))
+
+    def test_string_needle(self):
+        self.assertEqual(run_lispy_string('(index-of data ",")', self.env), 1)
+        self.assertEqual(run_lispy_string('(index-of data "," 2)', self.env), 3)
+        self.assertIsNone(run_lispy_string('(index-of data "z")', self.env))
+
+    def test_byte_and_bytes_needles(self):
+        self.assertEqual(run_lispy_string("(index-of data 99)", self.env), 4)
+        self.assertEqual(run_lispy_string('(index-of data (bytes "b,"))', self.env), 2)
+
+    def test_offsets_are_relative_to_slice(self):
+        self.assertEqual(run_lispy_string('(index-of (slice data 2) ",")', self.env), 1)
+        self.assertIsNone(run_lispy_string('(index-of (slice data 0 3) "c")', self.env))
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 or 3 arguments, got 1"):
+            run_lispy_string("(index-of data)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'index-of' must be bytes"):
+            run_lispy_string('(index-of "a,b" ",")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "byte value 0-255"):
+            run_lispy_string("(index-of data 300)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Third argument to 'index-of' must be an integer"):
+            run_lispy_string('(index-of data "," "2")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
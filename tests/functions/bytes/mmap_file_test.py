@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class MmapFileFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "records.bin")
+        with open(self.path, "wb") as f:
+            f.write(b"".join(f"record-{i:03d}\n".encode() for i in range(100)))
+        self.env.define("path", self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_random_access(self):
+        result = run_lispy_string(
+            "(with-open [data (mmap-file path)] (decode (slice data (* 42 11) (+ (* 42 11) 10))))",
+            self.env,
+        )
+        self.assertEqual(result, "record-042")
+        self.assertEqual(run_lispy_string("(with-open [data (mmap-file path)] (count data))", self.env), 1100)
+
+    def test_search(self):
+        result = run_lispy_string(
+            '(with-open [data (mmap-file path)] (index-of data "record-099"))', self.env
+        )
+        self.assertEqual(result, 99 * 11)
+
+    def test_empty_file(self):
+        empty = os.path.join(self.temp_dir, "empty.bin")
+        open(empty, "wb").close()
+        self.env.define("empty", empty)
+        self.assertEqual(run_lispy_string("(with-open [data (mmap-file empty)] (count data))", self.env), 0)
+
+    def test_read_after_close(self):
+        with self.assertRaisesRegex(EvaluationError, "closed; use them inside with-open"):
+            run_lispy_string("(decode (with-open [data (mmap-file path)] (slice data 0 6)))", self.env)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(mmap-file)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string"):
+            run_lispy_string("(mmap-file 42)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "FileNotFoundError"):
+            run_lispy_string('(mmap-file "/nonexistent/file.bin")', self.env)
+        self.env.define("dir", self.temp_dir)
+        with self.assertRaisesRegex(EvaluationError, "is not a regular file"):
+            run_lispy_string("(mmap-file dir)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class SliceFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.env.define("data", run_lispy_string('(bytes "hello world")', self.env))
+
+    def test_slice(self):
+        self.assertEqual(run_lispy_string("(decode (slice data 6))", self.env), "world")
+        self.assertEqual(run_lispy_string("(decode (slice data 0 5))", self.env), "hello")
+        self.assertEqual(run_lispy_string("(decode (slice (slice data 6) 1 3))", self.env), "or")
+
+    def test_negative_and_clamped_offsets(self):
+        self.assertEqual(run_lispy_string("(decode (slice data -5))", self.env), "world")
+        self.assertEqual(run_lispy_string("(count (slice data 5 100))", self.env), 6)
+        self.assertEqual(run_lispy_string("(count (slice data 8 2))", self.env), 0)
+
+    def test_slice_shares_memory(self):
+        result = run_lispy_string("(slice data 6)", self.env)
+        self.assertIs(result._source, run_lispy_string("data", self.env)._source)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 or 3 arguments, got 1"):
+            run_lispy_string("(slice data)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'slice' must be bytes"):
+            run_lispy_string('(slice "hello" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Second argument to 'slice' must be an integer"):
+            run_lispy_string("(slice data 1.5)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Third argument to 'slice' must be an integer"):
+            run_lispy_string("(slice data 1 nil)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@ import unittest
 
 from lispy.exceptions import EvaluationError
 from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import PersistentVector
 from lispy.types import LispyList, Vector
 from lispy.utils import run_lispy_string
 
@@ -115,7 +117,7 @@ class ConjFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'conj' expects a list, vector, or nil as the first argument, got <class 'dict'>.",
+            "TypeError: 'conj' expects a list, vector, set, or nil as the first argument, got <class 'lispy.persistent_map.PersistentMap'>.",
         )
 
     def test_conj_string_collection(self):
@@ -125,9 +127,41 @@ class ConjFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'conj' expects a list, vector, or nil as the first argument, got <class 'str'>.",
+            "TypeError: 'conj' expects a list, vector, set, or nil as the first argument, got <class 'str'>.",
         )
 
+    def test_conj_vector_returns_persistent_vector(self):
+        """Test conj on a vector returns a PersistentVector that is still a Vector."""
+        result = run_lispy_string("(conj [1 2] 3)", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertIsInstance(result, Vector)
+        self.assertEqual(result, Vector([1, 2, 3]))
+
+    def test_conj_vector_in_loop(self):
+        """Test building a large vector with conj inside loop/recur."""
+        lispy_code = """
+        (loop [i 0 acc []]
+          (if (< i 2000)
+            (recur (+ i 1) (conj acc i))
+            acc))
+        """
+        result = run_lispy_string(lispy_code, self.env)
+        self.assertEqual(list(result), list(range(2000)))
+
+    def test_conj_vector_earlier_versions_unchanged(self):
+        """Test conj leaves earlier versions of a persistent vector intact."""
+        run_lispy_string("(define v1 (conj [] 1))", self.env)
+        run_lispy_string("(define v2 (conj v1 2))", self.env)
+        run_lispy_string("(define v3 (conj v1 3))", self.env)
+        self.assertEqual(run_lispy_string("v1", self.env), Vector([1]))
+        self.assertEqual(run_lispy_string("v2", self.env), Vector([1, 2]))
+        self.assertEqual(run_lispy_string("v3", self.env), Vector([1, 3]))
+
+    def test_conj_set(self):
+        """Test conj adds to a set, ignoring elements already present."""
+        result = run_lispy_string("(conj (hash-set 1 2) 2 3)", self.env)
+        self.assertEqual(result, PersistentSet([1, 2, 3]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class CountByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_count_by_function(self):
+        result = run_lispy_string("(count-by [1 2 3 4 5] (fn [x] (% x 2)))", self.env)
+        self.assertEqual(result, {1: 3, 0: 2})
+        self.assertEqual(list(result), [1, 0])
+
+    def test_count_by_keyword(self):
+        result = run_lispy_string(
+            "(count-by (vector {:status 200} {:status 404} {:status 200}) ':status)",
+            self.env,
+        )
+        self.assertEqual(result, {200: 2, 404: 1})
+
+    def test_count_by_nil(self):
+        self.assertEqual(run_lispy_string("(count-by nil count)", self.env), {})
+
+    def test_count_by_keyword_needs_maps(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: 'count-by' with a keyword key expects maps"
+        ):
+            run_lispy_string("(count-by [1 2] ':status)", self.env)
+
+    def test_count_by_wrong_arity_function(self):
+        with self.assertRaisesRegex(EvaluationError, "ArityError"):
+            run_lispy_string("(count-by [1 2] (fn [a b] a))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
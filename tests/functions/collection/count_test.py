@@ -59,6 +59,12 @@ class CountFnTest(unittest.TestCase):
             "TypeError: 'count' expects a list, vector, map, string, or nil. Got bool",
         )
 
+    def test_count_lazy_sequence(self):
+        self.assertEqual(run_lispy_string("(count (lazy-range 70))", self.env), 70)
+
+    def test_count_numeric_array(self):
+        self.assertEqual(run_lispy_string("(count (double-array 5))", self.env), 5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_list import PersistentList
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+
+class DistinctByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_distinct_by_vector(self):
+        result = run_lispy_string(
+            "(distinct-by [1 -1 2 -2 3] (fn [x] (abs x)))", self.env
+        )
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [1, 2, 3])
+
+    def test_distinct_by_list(self):
+        result = run_lispy_string(
+            "(distinct-by '(\"apple\" \"avocado\" \"banana\") first)", self.env
+        )
+        self.assertIsInstance(result, PersistentList)
+        self.assertEqual(result, ["apple", "banana"])
+
+    def test_distinct_by_keyword(self):
+        result = run_lispy_string(
+            "(distinct-by (vector {:path \"/\" :n 1} {:path \"/\" :n 2}) ':path)",
+            self.env,
+        )
+        self.assertEqual(len(result), 1)
+
+    def test_distinct_by_set(self):
+        result = run_lispy_string(
+            "(distinct-by (hash-set 1 -1 2) (fn [x] (abs x)))", self.env
+        )
+        self.assertIsInstance(result, PersistentSet)
+        self.assertEqual(len(result), 2)
+
+    def test_distinct_by_lazy_infinite(self):
+        result = run_lispy_string(
+            "(take (distinct-by (lazy-range) (fn [x] (- x (% x 10)))) 3)", self.env
+        )
+        self.assertEqual(list(result), [0, 10, 20])
+        self.assertIsInstance(
+            run_lispy_string("(distinct-by (lazy-range) (fn [x] x))", self.env),
+            LazySeq,
+        )
+
+    def test_distinct_by_nil(self):
+        self.assertIsNone(run_lispy_string("(distinct-by nil count)", self.env))
+
+    def test_distinct_by_invalid_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'distinct-by' must be"
+        ):
+            run_lispy_string("(distinct-by 5 count)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_list import PersistentList
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+
+class DistinctFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_distinct_vector(self):
+        result = run_lispy_string("(distinct [3 1 3 2 1])", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [3, 1, 2])
+
+    def test_distinct_list(self):
+        result = run_lispy_string("(distinct '(1 1 2))", self.env)
+        self.assertIsInstance(result, PersistentList)
+        self.assertEqual(result, [1, 2])
+
+    def test_distinct_compares_collections_by_value(self):
+        self.assertEqual(
+            run_lispy_string("(distinct (vector [1 2] (vector 1 2) [2]))", self.env),
+            [[1, 2], [2]],
+        )
+
+    def test_distinct_lazy_infinite(self):
+        result = run_lispy_string(
+            "(distinct (map (lazy-range) (fn [x] (% x 3))))", self.env
+        )
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(
+            list(run_lispy_string("(take (distinct (lazy-range)) 3)", self.env)),
+            [0, 1, 2],
+        )
+
+    def test_distinct_transducer(self):
+        self.assertEqual(
+            run_lispy_string("(into [] (distinct) [3 3 1 3])", self.env), [3, 1]
+        )
+
+    def test_distinct_nil(self):
+        self.assertIsNone(run_lispy_string("(distinct nil)", self.env))
+
+    def test_distinct_invalid_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Argument to 'distinct' must be a vector"
+        ):
+            run_lispy_string('(distinct "abc")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -202,7 +202,7 @@ class EveryQFnTest(unittest.TestCase):
             run_lispy_string("(every? {:a 1 :b 2} is-number?)", self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'every?' must be a list or vector, got <class 'dict'>.",
+            "TypeError: First argument to 'every?' must be a list or vector, got <class 'lispy.persistent_map.PersistentMap'>.",
         )
 
     def test_every_q_functional_composition(self):
@@ -2,6 +2,7 @@ import unittest
 
 from lispy.exceptions import ArityError, EvaluationError
 from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
 from lispy.types import LispyList, Vector
 from lispy.utils import run_lispy_string
 
@@ -103,12 +104,12 @@ class FilterFnTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(filter)", self.env)
         self.assertEqual(
-            str(cm.exception), "SyntaxError: 'filter' expects 2 arguments, got 0."
+            str(cm.exception), "SyntaxError: 'filter' expects 1 or 2 arguments, got 0."
         )
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(filter [])", self.env)
         self.assertEqual(
-            str(cm.exception), "SyntaxError: 'filter' expects 2 arguments, got 1."
+            str(cm.exception), "TypeError: 'filter' with one argument expects a procedure to build a transducer, got <class 'lispy.types.Vector'>."
         )
 
     def test_filter_too_many_args(self):
@@ -116,7 +117,7 @@ class FilterFnTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(filter [] odd? 'extra)", self.env)
         self.assertEqual(
-            str(cm.exception), "SyntaxError: 'filter' expects 2 arguments, got 3."
+            str(cm.exception), "SyntaxError: 'filter' expects 1 or 2 arguments, got 3."
         )
 
     def test_filter_collection_not_list_or_vector(self):
@@ -125,13 +126,13 @@ class FilterFnTest(unittest.TestCase):
             run_lispy_string('(filter "abc" odd?)', self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'filter' must be a list or vector, got <class 'str'>.",
+            "TypeError: First argument to 'filter' must be a list, vector, set, or lazy sequence, got <class 'str'>.",
         )
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(filter 123 odd?)", self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'filter' must be a list or vector, got <class 'int'>.",
+            "TypeError: First argument to 'filter' must be a list, vector, set, or lazy sequence, got <class 'int'>.",
         )
 
     def test_filter_predicate_not_callable(self):
@@ -172,6 +173,20 @@ class FilterFnTest(unittest.TestCase):
         self.assertIsInstance(result_list, LispyList)
         self.assertEqual(result_list, LispyList([2, 4]))
 
+    def test_filter_lazy_sequence_is_lazy(self):
+        """Test filter over an infinite lazy sequence."""
+        result = run_lispy_string(
+            "(take (filter (lazy-range) (fn [x] (= (% x 3) 0))) 3)", self.env
+        )
+        self.assertEqual(list(result), [0, 3, 6])
+
+    def test_filter_set(self):
+        """Test filter on a set returns a set."""
+        result = run_lispy_string(
+            "(filter (hash-set 1 2 3 4) (fn [x] (> x 2)))", self.env
+        )
+        self.assertEqual(result, PersistentSet([3, 4]))
+
 
 if __name__ == "__main__":
     unittest.main()
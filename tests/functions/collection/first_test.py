@@ -98,7 +98,7 @@ class FirstFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'first' expects a list, vector, string, or nil, got <class 'int'>.",
+            "TypeError: 'first' expects a list, vector, lazy sequence, set, sorted map, string, or nil, got <class 'int'>.",
         )
 
     def test_first_map_type(self):
@@ -108,9 +108,24 @@ class FirstFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'first' expects a list, vector, string, or nil, got <class 'dict'>.",
+            "TypeError: 'first' expects a list, vector, lazy sequence, set, sorted map, string, or nil, got <class 'lispy.persistent_map.PersistentMap'>.",
         )
 
+    def test_first_lazy_sequence(self):
+        """Test first of an infinite lazy sequence realizes only a chunk."""
+        result = run_lispy_string("(first (lazy-range))", self.env)
+        self.assertEqual(result, 0)
+
+    def test_first_sorted_collections(self):
+        """Test first of a sorted set or map is its least element or entry."""
+        self.assertEqual(run_lispy_string("(first (sorted-set 3 1 2))", self.env), 1)
+        self.assertEqual(run_lispy_string("(first (sorted-set-by > 3 1 2))", self.env), 3)
+        self.assertIsNone(run_lispy_string("(first (sorted-set))", self.env))
+        self.assertEqual(run_lispy_string("(first (hash-set 5))", self.env), 5)
+        entry = run_lispy_string("(first (sorted-map 2 \"b\" 1 \"a\"))", self.env)
+        self.assertEqual(list(entry), [1, "a"])
+        self.assertIsNone(run_lispy_string("(first (sorted-map))", self.env))
+
 
 if __name__ == "__main__":
     unittest.main()
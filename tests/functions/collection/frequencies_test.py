@@ -0,0 +1,55 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_map import PersistentMap
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class FrequenciesFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_frequencies_keywords(self):
+        result = run_lispy_string("(frequencies [:a :b :a :c :a])", self.env)
+        self.assertIsInstance(result, PersistentMap)
+        self.assertEqual(result, {Symbol(":a"): 3, Symbol(":b"): 1, Symbol(":c"): 1})
+        self.assertEqual(list(result), [Symbol(":a"), Symbol(":b"), Symbol(":c")])
+
+    def test_frequencies_compares_collections_by_value(self):
+        result = run_lispy_string(
+            "(frequencies (vector [1 2] (vector 1 2) [3]))", self.env
+        )
+        self.assertEqual(
+            [(list(k), n) for k, n in result.items()], [([1, 2], 2), ([3], 1)]
+        )
+
+    def test_frequencies_lazy_and_set(self):
+        self.assertEqual(
+            run_lispy_string("(frequencies (take (lazy-range) 3))", self.env),
+            {0: 1, 1: 1, 2: 1},
+        )
+        self.assertEqual(
+            run_lispy_string("(frequencies (hash-set 1 2))", self.env), {1: 1, 2: 1}
+        )
+
+    def test_frequencies_empty_and_nil(self):
+        self.assertEqual(run_lispy_string("(frequencies [])", self.env), {})
+        self.assertEqual(run_lispy_string("(frequencies nil)", self.env), {})
+
+    def test_frequencies_invalid_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'frequencies' must be"
+        ):
+            run_lispy_string('(frequencies "abc")', self.env)
+
+    def test_frequencies_wrong_arg_count(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "SyntaxError: 'frequencies' expects 1 argument, got 2."
+        ):
+            run_lispy_string("(frequencies [1] [2])", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
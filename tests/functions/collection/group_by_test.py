@@ -0,0 +1,64 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.table import Table
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class GroupByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_group_by_table(self):
+        groups = run_lispy_string("(group-by logs ':status)", self.env)
+        self.assertEqual(list(groups), [200, 404])
+        self.assertIsInstance(groups[200], Table)
+        self.assertEqual(groups[200].column(Symbol(":bytes")).to_list(), [512, 2048])
+
+    def test_group_by_text_column(self):
+        groups = run_lispy_string("(group-by logs ':path)", self.env)
+        self.assertEqual(len(groups["/"]), 2)
+
+    def test_group_by_unknown_column(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'group-by' got unknown column"):
+            run_lispy_string("(group-by logs ':nope)", self.env)
+
+    def test_group_by_function(self):
+        groups = run_lispy_string("(group-by [1 2 3 4 5] (fn [x] (% x 2)))", self.env)
+        self.assertEqual(groups, {1: [1, 3, 5], 0: [2, 4]})
+        self.assertEqual(list(groups), [1, 0])
+
+    def test_group_by_keyword_on_maps(self):
+        run_lispy_string(
+            "(define rows (vector {:status 200 :n 1} {:status 404 :n 2} {:status 200 :n 3}))",
+            self.env,
+        )
+        groups = run_lispy_string("(group-by rows ':status)", self.env)
+        self.assertEqual([row[Symbol(":n")] for row in groups[200]], [1, 3])
+        self.assertEqual(len(groups[404]), 1)
+
+    def test_group_by_lazy_and_nil(self):
+        groups = run_lispy_string(
+            "(group-by (take (lazy-range) 4) (fn [x] (< x 2)))", self.env
+        )
+        self.assertEqual(groups, {True: [0, 1], False: [2, 3]})
+        self.assertEqual(run_lispy_string("(group-by nil count)", self.env), {})
+
+    def test_group_by_invalid_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'group-by' must be a vector"
+        ):
+            run_lispy_string("(group-by 5 count)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
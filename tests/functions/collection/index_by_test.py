@@ -0,0 +1,33 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class IndexByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_index_by_keyword(self):
+        result = run_lispy_string(
+            '(index-by (vector {:id 1 :name "a"} {:id 2 :name "b"}) \':id)', self.env
+        )
+        self.assertEqual(result[1][Symbol(":name")], "a")
+        self.assertEqual(result[2][Symbol(":name")], "b")
+
+    def test_index_by_last_item_wins(self):
+        result = run_lispy_string('(index-by ["apple" "kiwi" "plum"] count)', self.env)
+        self.assertEqual(result, {5: "apple", 4: "plum"})
+        self.assertEqual(list(result), [5, 4])
+
+    def test_index_by_unhashable_key(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Keys in 'index-by' must be"
+        ):
+            run_lispy_string("(index-by [1 2] (fn [x] (promise (fn [] x))))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
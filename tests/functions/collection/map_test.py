@@ -67,7 +67,7 @@ class MapFnTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
-            str(cm.exception), "SyntaxError: 'map' expects 2 arguments, got 1."
+            str(cm.exception), "TypeError: 'map' with one argument expects a procedure to build a transducer, got <class 'lispy.types.Vector'>."
         )
 
     def test_map_incorrect_arg_count_too_many(self):
@@ -76,7 +76,7 @@ class MapFnTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
-            str(cm.exception), "SyntaxError: 'map' expects 2 arguments, got 3."
+            str(cm.exception), "SyntaxError: 'map' expects 1 or 2 arguments, got 3."
         )
 
     def test_map_first_arg_not_vector(self):
@@ -86,7 +86,7 @@ class MapFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'map' must be a vector, got <class 'int'>.",
+            "TypeError: First argument to 'map' must be a vector or lazy sequence, got <class 'int'>.",
         )
 
     def test_map_second_arg_not_procedure(self):
@@ -106,7 +106,7 @@ class MapFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'map' must be a vector, got <class 'lispy.types.LispyList'>.",
+            "TypeError: First argument to 'map' must be a vector or lazy sequence, got <class 'lispy.types.LispyList'>.",
         )
 
     def test_map_proc_arity_zero(self):
@@ -152,6 +152,20 @@ class MapFnTest(unittest.TestCase):
         # Should filter to [2 3 5] then double to [4 6 10]
         self.assertEqual(result, Vector([4, 6, 10]))
 
+    def test_map_lazy_sequence_is_lazy(self):
+        """Test map over a lazy sequence returns a lazy sequence."""
+        result = run_lispy_string("(take (map (lazy-range) (fn [x] (* x 10))) 3)", self.env)
+        self.assertEqual(list(result), [0, 10, 20])
+
+    def test_map_procedure_with_recur(self):
+        """Test that recur inside the mapped fn loops that fn, not the caller."""
+        run_lispy_string(
+            "(define sum-to (fn (n) (map (vector n) (fn (k) (if (<= k 0) 0 (recur (- k 1)))))))",
+            self.env,
+        )
+        result = run_lispy_string("(sum-to 5)", self.env)
+        self.assertEqual(result, Vector([0]))
+
 
 if __name__ == "__main__":
     unittest.main()
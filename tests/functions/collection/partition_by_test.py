@@ -0,0 +1,51 @@
+import unittest
+from itertools import islice
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class PartitionByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_partition_by_identity(self):
+        self.assertEqual(
+            run_lispy_string("(partition-by [1 1 2 3 3 1] (fn [x] x))", self.env),
+            [[1, 1], [2], [3, 3], [1]],
+        )
+
+    def test_partition_by_key(self):
+        self.assertEqual(
+            run_lispy_string("(partition-by [1 3 4 6 7] (fn [x] (% x 2)))", self.env),
+            [[1, 3], [4, 6], [7]],
+        )
+
+    def test_partition_by_calls_key_once_per_item(self):
+        calls = []
+        self.env.define("tick", lambda args, env: calls.append(args))
+        run_lispy_string("(partition-by [1 2 3 4] (fn [x] (tick x) (> x 2)))", self.env)
+        self.assertEqual(calls, [[1], [2], [3], [4]])
+
+    def test_partition_by_lazy(self):
+        result = run_lispy_string(
+            "(partition-by (lazy-range) (fn [x] (< (% x 6) 3)))", self.env
+        )
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(list(islice(result, 2)), [[0, 1, 2], [3, 4, 5]])
+
+    def test_partition_by_empty(self):
+        self.assertEqual(run_lispy_string("(partition-by [] count)", self.env), [])
+
+    def test_partition_by_invalid_key(self):
+        with self.assertRaisesRegex(
+            EvaluationError,
+            "TypeError: Second argument to 'partition-by' must be a procedure",
+        ):
+            run_lispy_string("(partition-by [1 2] 5)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
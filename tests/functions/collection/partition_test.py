@@ -0,0 +1,71 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+
+class PartitionFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_partition_drops_short_chunk(self):
+        result = run_lispy_string("(partition [1 2 3 4 5 6 7] 3)", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertIsInstance(result[0], PersistentVector)
+        self.assertEqual(result, [[1, 2, 3], [4, 5, 6]])
+
+    def test_partition_with_step(self):
+        self.assertEqual(
+            run_lispy_string("(partition [1 2 3 4 5] 2 1)", self.env),
+            [[1, 2], [2, 3], [3, 4], [4, 5]],
+        )
+        self.assertEqual(
+            run_lispy_string("(partition [1 2 3 4 5] 2 3)", self.env),
+            [[1, 2], [4, 5]],
+        )
+
+    def test_partition_with_pad(self):
+        self.assertEqual(
+            run_lispy_string("(partition [1 2 3 4 5 6 7] 3 3 [0 0])", self.env),
+            [[1, 2, 3], [4, 5, 6], [7, 0, 0]],
+        )
+        self.assertEqual(
+            run_lispy_string("(partition [1 2 3 4] 3 3 nil)", self.env),
+            [[1, 2, 3], [4]],
+        )
+
+    def test_partition_lazy_infinite(self):
+        result = run_lispy_string("(partition (lazy-range) 2)", self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(
+            list(run_lispy_string("(take (partition (lazy-range) 2) 2)", self.env)),
+            [[0, 1], [2, 3]],
+        )
+
+    def test_partition_nil(self):
+        self.assertEqual(run_lispy_string("(partition nil 2)", self.env), [])
+
+    def test_partition_invalid_size(self):
+        with self.assertRaisesRegex(
+            EvaluationError,
+            "TypeError: Second argument to 'partition' must be a positive integer",
+        ):
+            run_lispy_string("(partition [1 2] 0)", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError,
+            "TypeError: Third argument to 'partition' must be a positive integer",
+        ):
+            run_lispy_string("(partition [1 2] 1 -1)", self.env)
+
+    def test_partition_wrong_arg_count(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "SyntaxError: 'partition' expects 2 to 4 arguments, got 1."
+        ):
+            run_lispy_string("(partition [1 2])", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
+import weakref
 
 from lispy.exceptions import ArityError, EvaluationError
 from lispy.functions import create_global_env
+from lispy.lazy_seq import CHUNK_SIZE, LazySeq
 from lispy.types import LispyList
 from lispy.utils import run_lispy_string
 
@@ -150,13 +152,13 @@ class ReduceFnTest(unittest.TestCase):
             run_lispy_string('(reduce "abc" + 0)', self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'reduce' must be a list or vector, got <class 'str'>.",
+            "TypeError: First argument to 'reduce' must be a list, vector, lazy sequence, set, or sorted map, got <class 'str'>.",
         )
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(reduce 123 + 0)", self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'reduce' must be a list or vector, got <class 'int'>.",
+            "TypeError: First argument to 'reduce' must be a list, vector, lazy sequence, set, or sorted map, got <class 'int'>.",
         )
 
     def test_reduce_procedure_not_callable(self):
@@ -210,6 +212,48 @@ class ReduceFnTest(unittest.TestCase):
         result3 = run_lispy_string("(-> [1 2 3] (reduce sum-of-doubles 0))", self.env)
         self.assertEqual(result3, 12)
 
+    def test_reduce_lazy_sequence(self):
+        """Test reduce consumes a lazy sequence directly."""
+        self.assertEqual(run_lispy_string("(reduce (lazy-range 100) + 0)", self.env), 4950)
+        self.assertEqual(run_lispy_string("(reduce (take (lazy-range 1 10) 3) *)", self.env), 6)
+
+    def test_reduce_does_not_keep_the_head(self):
+        """Test items already reduced from a lazy sequence can be freed."""
+        class Item:
+            pass
+
+        refs = []
+
+        def tracked_items():
+            for _ in range(4 * CHUNK_SIZE):
+                item = Item()
+                refs.append(weakref.ref(item))
+                yield item
+
+        self.env.define("items", lambda args, env: LazySeq.from_iterable(tracked_items()))
+        freed = []
+        self.env.define(
+            "step",
+            lambda args, env: freed.append(refs[0]() is None) or args[0] + 1,
+        )
+        self.assertEqual(run_lispy_string("(reduce (items) step 0)", self.env), 4 * CHUNK_SIZE)
+        self.assertTrue(freed[-1])
+
+    def test_reduce_stops_on_reduced(self):
+        """Test returning (reduced value) ends the reduction with value."""
+        lispy_code = "(reduce (lazy-range) (fn [acc x] (if (> x 3) (reduced acc) (+ acc x))) 0)"
+        self.assertEqual(run_lispy_string(lispy_code, self.env), 6)
+
+    def test_reduce_sorted_collections(self):
+        """Test sets and sorted maps are reduced, the sorted ones in order."""
+        result = run_lispy_string("(reduce (sorted-set 3 1 2) (fn [acc x] (conj acc x)) [])", self.env)
+        self.assertEqual(list(result), [1, 2, 3])
+        self.assertEqual(run_lispy_string("(reduce (hash-set 1 2 3) +)", self.env), 6)
+        result = run_lispy_string(
+            "(reduce (sorted-map 2 \"b\" 1 \"a\") (fn [acc e] (conj acc (first e))) [])", self.env
+        )
+        self.assertEqual(list(result), [1, 2])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -59,7 +59,7 @@ class RestFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'rest' expects a list, vector, or nil, got <class 'dict'>.",
+            "TypeError: 'rest' expects a list, vector, lazy sequence, set, sorted map, or nil, got <class 'lispy.persistent_map.PersistentMap'>.",
         )
 
     def test_rest_too_many_args(self):
@@ -87,9 +87,43 @@ class RestFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'rest' expects a list, vector, or nil, got <class 'str'>.",
+            "TypeError: 'rest' expects a list, vector, lazy sequence, set, sorted map, or nil, got <class 'str'>.",
         )
 
+    def test_rest_persistent_vector(self):
+        """Test rest on a vector built with conj."""
+        run_lispy_string("(define v (conj [1 2] 3 4))", self.env)
+        self.assertEqual(run_lispy_string("(rest v)", self.env), Vector([2, 3, 4]))
+        self.assertEqual(run_lispy_string("(rest (rest (rest v)))", self.env), Vector([4]))
+        self.assertEqual(run_lispy_string("(rest (conj [] 1))", self.env), Vector([]))
+        self.assertEqual(run_lispy_string("(conj (rest v) 5)", self.env), Vector([2, 3, 4, 5]))
+
+    def test_rest_walk_shares_cons_cells(self):
+        """Test walking a long list with rest and recur."""
+        run_lispy_string("(define items (cons 0 (list 1 2 3)))", self.env)
+        self.assertIs(
+            run_lispy_string("(rest items)", self.env),
+            run_lispy_string("(rest items)", self.env),
+        )
+        self.env.define("long-list", LispyList(range(5000)))
+        result = run_lispy_string(
+            "(loop [xs long-list total 0] (if (empty? xs) total (recur (rest xs) (+ total (first xs)))))",
+            self.env,
+        )
+        self.assertEqual(result, sum(range(5000)))
+
+    def test_rest_lazy_sequence(self):
+        """Test rest of a lazy sequence is lazy."""
+        result = run_lispy_string("(first (rest (rest (lazy-range))))", self.env)
+        self.assertEqual(result, 2)
+
+    def test_rest_sorted_collections(self):
+        """Test rest of a sorted set or map is the other elements, in order."""
+        self.assertEqual(list(run_lispy_string("(rest (sorted-set 3 1 2))", self.env)), [2, 3])
+        self.assertEqual(list(run_lispy_string("(rest (sorted-set))", self.env)), [])
+        entries = run_lispy_string("(rest (sorted-map 2 \"b\" 1 \"a\" 3 \"c\"))", self.env)
+        self.assertEqual([list(entry) for entry in entries], [[2, "b"], [3, "c"]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -186,7 +186,7 @@ class SomeFnTest(unittest.TestCase):
             run_lispy_string("(some {:a 1 :b 2} is-number?)", self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'some' must be a list or vector, got <class 'dict'>.",
+            "TypeError: First argument to 'some' must be a list or vector, got <class 'lispy.persistent_map.PersistentMap'>.",
         )
 
     def test_some_functional_composition(self):
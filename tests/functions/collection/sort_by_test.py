@@ -0,0 +1,104 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import LispyList, Symbol, Vector
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class SortByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_sort_by_table(self):
+        table = run_lispy_string("(sort-by logs ':bytes)", self.env)
+        self.assertEqual(table.column(Symbol(":bytes")).to_list(), [0, 512, 2048])
+        self.assertEqual(table.column(Symbol(":path")), ["/x", "/", "/"])
+
+    def test_sort_by_table_descending(self):
+        table = run_lispy_string("(sort-by logs ':bytes >)", self.env)
+        self.assertEqual(table.column(Symbol(":bytes")).to_list(), [2048, 512, 0])
+        table = run_lispy_string("(sort-by logs ':status >)", self.env)
+        self.assertEqual(table.column(Symbol(":bytes")).to_list(), [0, 512, 2048])
+
+    def test_sort_by_text_column(self):
+        table = run_lispy_string("(sort-by logs ':path <)", self.env)
+        self.assertEqual(table.column(Symbol(":path")), ["/", "/", "/x"])
+
+    def test_sort_by_table_invalid_comparator(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: Third argument to 'sort-by' on a table must be < or >"):
+            run_lispy_string("(sort-by logs ':bytes (fn [a b] (< a b)))", self.env)
+
+    def test_sort_by_key_function(self):
+        result = run_lispy_string('(sort-by ["ccc" "a" "bb"] count)', self.env)
+        self.assertIsInstance(result, Vector)
+        self.assertEqual(result, ["a", "bb", "ccc"])
+
+    def test_sort_by_calls_key_once_per_element(self):
+        calls = []
+
+        def key(args, env):
+            calls.append(args[0])
+            return -args[0]
+
+        self.env.define("negate", key)
+        result = run_lispy_string("(sort-by [3 1 4 1 5 9 2 6] negate)", self.env)
+        self.assertEqual(result, [9, 6, 5, 4, 3, 2, 1, 1])
+        self.assertEqual(sorted(calls), [1, 1, 2, 3, 4, 5, 6, 9])
+
+    def test_sort_by_keyword_is_stable(self):
+        result = run_lispy_string(
+            "(sort-by (vector {:age 40 :n 1} {:age 30 :n 2} {:age 40 :n 3}) ':age)",
+            self.env,
+        )
+        self.assertEqual([row[Symbol(":n")] for row in result], [2, 1, 3])
+
+    def test_sort_by_descending_is_stable(self):
+        result = run_lispy_string(
+            "(sort-by (vector {:age 40 :n 1} {:age 30 :n 2} {:age 40 :n 3}) ':age >)",
+            self.env,
+        )
+        self.assertEqual([row[Symbol(":n")] for row in result], [1, 3, 2])
+
+    def test_sort_by_custom_comparator(self):
+        result = run_lispy_string(
+            "(sort-by [3 -1 2] (fn [x] (abs x)) (fn [a b] (- b a)))", self.env
+        )
+        self.assertEqual(result, [3, 2, -1])
+
+    def test_sort_by_list_and_nil(self):
+        result = run_lispy_string("(sort-by '(3 1 2) (fn [x] x))", self.env)
+        self.assertIsInstance(result, LispyList)
+        self.assertEqual(list(result), [1, 2, 3])
+        self.assertEqual(run_lispy_string("(sort-by nil (fn [x] x))", self.env), [])
+
+    def test_sort_by_keyword_keys(self):
+        result = run_lispy_string("(sort-by (vector ':b ':a) (fn [x] x))", self.env)
+        self.assertEqual(result, [Symbol(":a"), Symbol(":b")])
+
+    def test_sort_by_unorderable_keys(self):
+        with self.assertRaisesRegex(EvaluationError, "'sort-by' cannot order keys"):
+            run_lispy_string('(sort-by [1 "a"] (fn [x] x))', self.env)
+
+    def test_sort_by_invalid_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'sort-by' must be a vector"
+        ):
+            run_lispy_string('(sort-by "abc" (fn [x] x))', self.env)
+
+    def test_sort_by_invalid_key(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "Second argument to 'sort-by' must be a procedure"
+        ):
+            run_lispy_string("(sort-by [1 2] 5)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -179,6 +179,19 @@ class SortFnTest(unittest.TestCase):
         self.assertIsInstance(result, Vector)
         self.assertEqual(result, Vector([1, 2, 3, 4, 5]))
 
+    def test_sort_with_builtin_comparison_is_stable_and_native(self):
+        """Test sort with > sorts natively, keeping equal elements in order."""
+        result = run_lispy_string("(sort [1 2.0 3 2 1.0] >)", self.env)
+        self.assertEqual(
+            [(type(x), x) for x in result],
+            [(int, 3), (float, 2.0), (int, 2), (int, 1), (float, 1.0)],
+        )
+
+    def test_sort_with_builtin_comparison_reports_invalid_values(self):
+        """Test sort with < still reports values the builtin cannot compare."""
+        with self.assertRaisesRegex(EvaluationError, "to '<' must be a number"):
+            run_lispy_string('(sort [1 "a"] <)', self.env)
+
     def test_sort_custom_comparison_zero_return(self):
         """Test sort with custom comparison that returns zero (equal values)."""
         # Comparison function that considers all values equal
@@ -0,0 +1 @@
+# Image function tests
@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol, Vector
+from lispy.utils import run_lispy_string
+
+
+class LoadImageFunctionTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "test.img").replace("\\", "/")
+        source_env = create_global_env()
+        run_lispy_string("(define data [1 2 3])", source_env)
+        run_lispy_string("(define config {:port 8080 :tags [1 2]})", source_env)
+        run_lispy_string("(define offset 10)", source_env)
+        run_lispy_string("(define add-offset (fn [x] (+ x offset)))", source_env)
+        run_lispy_string(
+            "(define make-adder (fn [n] (fn [x] (+ x n))))", source_env
+        )
+        run_lispy_string("(define add-five (make-adder 5))", source_env)
+        run_lispy_string(f'(save-image "{self.image_path}")', source_env)
+        self.env = create_global_env()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _load(self):
+        return run_lispy_string(f'(load-image "{self.image_path}")', self.env)
+
+    def test_load_image_restores_values(self):
+        self.assertIsNone(self._load())
+        self.assertEqual(run_lispy_string("data", self.env), Vector([1, 2, 3]))
+        config = run_lispy_string("config", self.env)
+        self.assertEqual(config[Symbol(":port")], 8080)
+        self.assertEqual(config[Symbol(":tags")], Vector([1, 2]))
+
+    def test_load_image_restores_functions_and_closures(self):
+        self._load()
+        self.assertEqual(run_lispy_string("(add-offset 1)", self.env), 11)
+        self.assertEqual(run_lispy_string("(add-five 1)", self.env), 6)
+        self.assertEqual(run_lispy_string("(map data add-five)", self.env), Vector([6, 7, 8]))
+
+    def test_restored_functions_see_later_definitions(self):
+        self._load()
+        run_lispy_string("(define offset 100)", self.env)
+        self.assertEqual(run_lispy_string("(add-offset 1)", self.env), 101)
+
+    def test_builtins_still_available_after_load(self):
+        self._load()
+        self.assertEqual(run_lispy_string("(count data)", self.env), 3)
+
+    def test_load_image_missing_file(self):
+        with self.assertRaisesRegex(EvaluationError, "Cannot read image"):
+            run_lispy_string('(load-image "/no/such/image.img")', self.env)
+
+    def test_load_image_invalid_file(self):
+        bad_path = os.path.join(self.temp_dir, "bad.img")
+        with open(bad_path, "w", encoding="utf-8") as f:
+            f.write("not an image")
+        with self.assertRaisesRegex(EvaluationError, "ImageError"):
+            run_lispy_string(
+                f'(load-image "{bad_path.replace(chr(92), "/")}")', self.env
+            )
+
+    def test_load_image_wrong_arg_count(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument"):
+            run_lispy_string("(load-image)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
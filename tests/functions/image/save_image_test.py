@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class SaveImageFunctionTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "test.img").replace("\\", "/")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_image_writes_file(self):
+        run_lispy_string("(define answer 42)", self.env)
+        result = run_lispy_string(f'(save-image "{self.image_path}")', self.env)
+        self.assertIsNone(result)
+        self.assertTrue(os.path.isfile(self.image_path))
+
+    def test_save_image_from_inside_function_saves_globals(self):
+        run_lispy_string("(define answer 42)", self.env)
+        run_lispy_string(
+            f'(define save (fn [] (save-image "{self.image_path}")))', self.env
+        )
+        run_lispy_string("(save)", self.env)
+
+        other_env = create_global_env()
+        run_lispy_string(f'(load-image "{self.image_path}")', other_env)
+        self.assertEqual(run_lispy_string("answer", other_env), 42)
+
+    def test_save_image_unserializable_value(self):
+        self.env.define("handle", lambda: None)
+        with self.assertRaisesRegex(EvaluationError, "cannot be serialized"):
+            run_lispy_string(f'(save-image "{self.image_path}")', self.env)
+
+    def test_save_image_wrong_arg_count(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument"):
+            run_lispy_string("(save-image)", self.env)
+
+    def test_save_image_non_string_filename(self):
+        with self.assertRaisesRegex(EvaluationError, "must be a string"):
+            run_lispy_string("(save-image 42)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class CsvReadFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.env.define(
+            "path",
+            self.write(
+                "users.csv",
+                'name,age,admin\nada,36,true\n"turing, alan",41,false\n\n"grace ""amazing""",,TRUE\n',
+            ),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, text):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def read(self, options=""):
+        return run_lispy_string(
+            f"(with-open [f (open-file path)] (to-vector (csv-read f {options})))", self.env
+        )
+
+    def test_vector_rows(self):
+        rows = [list(row) for row in self.read()]
+        self.assertEqual(
+            rows,
+            [
+                ["name", "age", "admin"],
+                ["ada", "36", "true"],
+                ["turing, alan", "41", "false"],
+                ['grace "amazing"', "", "TRUE"],
+            ],
+        )
+
+    def test_header_maps_with_types(self):
+        rows = self.read("{:header true :types {:age ':int :admin ':bool}}")
+        self.assertEqual(
+            [dict(row) for row in rows],
+            [
+                {Symbol(":name"): "ada", Symbol(":age"): 36, Symbol(":admin"): True},
+                {Symbol(":name"): "turing, alan", Symbol(":age"): 41, Symbol(":admin"): False},
+                {Symbol(":name"): 'grace "amazing"', Symbol(":age"): None, Symbol(":admin"): True},
+            ],
+        )
+
+    def test_columns_and_function_types(self):
+        rows = self.read('{:header true :columns [:who :years :flag] :types {:years (fn [s] (* 2 (to-int s)))}}')
+        self.assertEqual(rows[0][Symbol(":who")], "ada")
+        self.assertEqual(rows[0][Symbol(":years")], 72)
+
+    def test_vector_rows_typed_by_index(self):
+        self.env.define("path", self.write("nums.tsv", "1\t2.5\n3\t4\n"))
+        rows = self.read("{:delimiter \"\\t\" :types {0 ':int 1 ':float}}")
+        self.assertEqual([list(row) for row in rows], [[1, 2.5], [3, 4.0]])
+
+    def test_streams_lazily(self):
+        self.env.define("path", self.write("many.csv", "".join(f"{i}\n" for i in range(1000))))
+        result = run_lispy_string(
+            "(with-open [f (open-file path)] (first (csv-read f {:types {0 ':int}})))", self.env
+        )
+        self.assertEqual(list(result), [0])
+        total = run_lispy_string(
+            "(with-open [f (open-file path)] (reduce (csv-read f {:types {0 ':int}}) (fn [n row] (+ n (first row))) 0))",
+            self.env,
+        )
+        self.assertEqual(total, sum(range(1000)))
+
+    def test_parse_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "cannot parse 'ada' in column :name on line 2"):
+            self.read("{:header true :types {:name ':int}}")
+        with self.assertRaisesRegex(EvaluationError, "unknown column :email"):
+            self.read("{:header true :types {:email ':int}}")
+        with self.assertRaisesRegex(EvaluationError, "must be :int, :float, :bool, :str or a function"):
+            self.read("{:header true :types {:age ':date}}")
+        self.env.define("path", self.write("ragged.csv", "a,b\n1,2,3\n"))
+        with self.assertRaisesRegex(EvaluationError, "found 3 fields on line 2, expected 2"):
+            self.read("{:header true}")
+
+    def test_argument_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 or 2 arguments, got 0"):
+            run_lispy_string("(csv-read)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a file from open-file"):
+            run_lispy_string("(csv-read path)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Unknown option :heading"):
+            self.read("{:heading true}")
+        with self.assertRaisesRegex(EvaluationError, "one-character string"):
+            self.read('{:delimiter ";;"}')
+        with self.assertRaisesRegex(EvaluationError, "must be a map of options"):
+            self.read("[:header]")
+
+    def test_read_after_close(self):
+        with self.assertRaisesRegex(EvaluationError, "read after it was closed"):
+            run_lispy_string("(to-vector (with-open [f (open-file path)] (csv-read f)))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class CsvWriteFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "out.csv")
+        self.env.define("path", self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def written(self):
+        with open(self.path, encoding="utf-8", newline="") as f:
+            return f.read()
+
+    def test_map_rows(self):
+        count = run_lispy_string(
+            '(csv-write path [{:name "ada" :age 36} {:name "turing, alan" :age nil}])', self.env
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(self.written(), 'name,age\r\nada,36\r\n"turing, alan",\r\n')
+
+    def test_map_rows_with_columns(self):
+        run_lispy_string(
+            '(csv-write path [{:a 1 :b 2 :c 3} {:c 6}] {:columns [:c :a] :delimiter ";"})', self.env
+        )
+        self.assertEqual(self.written(), "c;a\r\n3;1\r\n6;\r\n")
+
+    def test_vector_rows(self):
+        run_lispy_string('(csv-write path [[1 "say \\"hi\\""] [true 2.5]])', self.env)
+        self.assertEqual(self.written(), '1,"say ""hi"""\r\ntrue,2.5\r\n')
+        run_lispy_string('(csv-write path [[1 2]] {:columns ["x" "y"]})', self.env)
+        self.assertEqual(self.written(), "x,y\r\n1,2\r\n")
+        run_lispy_string("(csv-write path [{:x 1}] {:header false})", self.env)
+        self.assertEqual(self.written(), "1\r\n")
+
+    def test_empty_rows(self):
+        self.assertEqual(run_lispy_string("(csv-write path [])", self.env), 0)
+        self.assertEqual(self.written(), "")
+        run_lispy_string("(csv-write path nil {:columns [:a :b]})", self.env)
+        self.assertEqual(self.written(), "a,b\r\n")
+
+    def test_round_trip_from_csv_read(self):
+        source = os.path.join(self.temp_dir, "in.csv")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write('id,note\n1,"multi\nline"\n2,plain\n')
+        self.env.define("source", source)
+        count = run_lispy_string(
+            "(with-open [in (open-file source)] (csv-write path (csv-read in {:header true})))",
+            self.env,
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(self.written(), 'id,note\r\n1,"multi\nline"\r\n2,plain\r\n')
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 or 3 arguments, got 1"):
+            run_lispy_string("(csv-write path)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'csv-write' must be a string"):
+            run_lispy_string("(csv-write 1 [])", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a vector, list"):
+            run_lispy_string('(csv-write path "rows")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Row 2 passed to 'csv-write' must be a map"):
+            run_lispy_string("(csv-write path [{:a 1} [1]])", self.env)
+        self.env.define("dir", self.temp_dir)
+        with self.assertRaisesRegex(EvaluationError, "is not a regular file"):
+            run_lispy_string("(csv-write dir [[1]])", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import itertools
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class LineSeqFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _define_file(self, content, name="log.txt"):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        self.env.define("path", path)
+        return path
+
+    def test_line_seq_strips_line_endings(self):
+        self._define_file("one\ntwo\r\nthree")
+        result = run_lispy_string("(with-open [f (open-file path)] (to-vector (line-seq f)))", self.env)
+        self.assertEqual(list(result), ["one", "two", "three"])
+        self._define_file("")
+        result = run_lispy_string("(with-open [f (open-file path)] (to-vector (line-seq f)))", self.env)
+        self.assertEqual(list(result), [])
+
+    def test_line_seq_is_lazy(self):
+        path = self._define_file("".join(f"line {i}\n" for i in range(10_000)))
+        file = run_lispy_string("(open-file path)", self.env)
+        try:
+            self.env.define("f", file)
+            lines = run_lispy_string("(line-seq f)", self.env)
+            self.assertIsInstance(lines, LazySeq)
+            self.assertEqual(list(itertools.islice(lines, 2)), ["line 0", "line 1"])
+            self.assertLess(file.buffer.tell(), os.path.getsize(path))
+        finally:
+            file.close()
+
+    def test_line_seq_in_pipelines(self):
+        self._define_file("".join(f"GET /x {500 if i % 10 == 0 else 200}\n" for i in range(100)))
+        self.assertEqual(
+            run_lispy_string(
+                "(with-open [f (open-file path)] (reduce (line-seq f) (fn [n line] (if (re-find line \" 500\") (+ n 1) n)) 0))",
+                self.env,
+            ),
+            10,
+        )
+        result = run_lispy_string(
+            "(with-open [f (open-file path)] (transduce (line-seq f) (comp (filter (fn [line] (re-find line \" 500\"))) (take 2)) conj []))",
+            self.env,
+        )
+        self.assertEqual(list(result), ["GET /x 500", "GET /x 500"])
+
+    def test_line_seq_after_close(self):
+        self._define_file("".join(f"{i}\n" for i in range(100)))
+        run_lispy_string("(define leaked (with-open [f (open-file path)] (line-seq f)))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "IOError: .* was read after it was closed"):
+            run_lispy_string("(first leaked)", self.env)
+
+    def test_line_seq_of_closed_file(self):
+        self._define_file("a\nb\n")
+        run_lispy_string("(define closed (with-open [f (open-file path)] f))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "IOError: .* was read after it was closed"):
+            run_lispy_string("(first (line-seq closed))", self.env)
+
+    def test_line_seq_decode_error(self):
+        path = os.path.join(self.temp_dir, "bad.txt")
+        with open(path, "wb") as f:
+            f.write(b"ok\n\xff\xfe\n")
+        self.env.define("path", path)
+        with self.assertRaisesRegex(EvaluationError, "UnicodeError: Cannot decode file"):
+            run_lispy_string("(with-open [f (open-file path)] (to-vector (line-seq f)))", self.env)
+
+    def test_line_seq_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(line-seq)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a file from open-file"):
+            run_lispy_string('(line-seq "log.txt")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
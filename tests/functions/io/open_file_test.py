@@ -0,0 +1,52 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env, create_web_safe_env
+from lispy.utils import run_lispy_string
+
+
+class OpenFileFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "log.txt")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("one\ntwo\n")
+        self.env.define("path", self.path)
+        self.env.define("temp-dir", self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_open_file_returns_open_text_file(self):
+        file = run_lispy_string("(open-file path)", self.env)
+        try:
+            self.assertIsInstance(file, io.TextIOBase)
+            self.assertFalse(file.closed)
+            self.assertEqual(file.read(), "one\ntwo\n")
+        finally:
+            file.close()
+
+    def test_open_file_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(open-file)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string"):
+            run_lispy_string("(open-file 42)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "FileNotFoundError: File .* does not exist"):
+            run_lispy_string('(open-file (format "{}/missing.txt" temp-dir))', self.env)
+        with self.assertRaisesRegex(EvaluationError, "FileError: .* is not a regular file"):
+            run_lispy_string("(open-file temp-dir)", self.env)
+
+    def test_open_file_is_not_web_safe(self):
+        env = create_web_safe_env()
+        env.define("path", self.path)
+        with self.assertRaises(EvaluationError):
+            run_lispy_string("(open-file path)", env)
+
+
+if __name__ == "__main__":
+    unittest.main()
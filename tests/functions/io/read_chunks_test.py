@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ReadChunksFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.temp_dir, "data.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("abcdefghij")
+        self.env.define("path", path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_read_chunks(self):
+        result = run_lispy_string("(with-open [f (open-file path)] (to-vector (read-chunks f 4)))", self.env)
+        self.assertEqual(list(result), ["abcd", "efgh", "ij"])
+        total = run_lispy_string(
+            "(with-open [f (open-file path)] (reduce (read-chunks f 3) (fn [n chunk] (+ n (count chunk))) 0))",
+            self.env,
+        )
+        self.assertEqual(total, 10)
+
+    def test_read_chunks_of_closed_file(self):
+        run_lispy_string("(define closed (with-open [f (open-file path)] f))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "IOError: .* was read after it was closed"):
+            run_lispy_string("(first (read-chunks closed 4))", self.env)
+
+    def test_read_chunks_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string("(with-open [f (open-file path)] (read-chunks f))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "positive integer"):
+            run_lispy_string("(with-open [f (open-file path)] (read-chunks f 0))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a file from open-file"):
+            run_lispy_string("(read-chunks nil 4)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
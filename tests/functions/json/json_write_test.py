@@ -0,0 +1,46 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class JsonWriteFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "out.json")
+        self.env.define("path", self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def written(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_writes_json(self):
+        result = run_lispy_string('(json-write path {:name "ada" :tags [:a "b"] :score nil})', self.env)
+        self.assertIsNone(result)
+        self.assertEqual(self.written(), '{"name": "ada", "tags": ["a", "b"], "score": null}')
+
+    def test_writes_lazy_sequence_as_array(self):
+        run_lispy_string("(json-write path (map (range 1000) (fn [n] {:n n})))", self.env)
+        self.assertEqual(json.loads(self.written()), [{"n": n} for n in range(1000)])
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string("(json-write path)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string"):
+            run_lispy_string("(json-write 1 {})", self.env)
+        self.env.define("dir", self.temp_dir)
+        with self.assertRaisesRegex(EvaluationError, "is not a regular file"):
+            run_lispy_string("(json-write dir {})", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
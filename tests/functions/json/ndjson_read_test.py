@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class NdjsonReadFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.env.define(
+            "path",
+            self.write(
+                "events.ndjson",
+                '{"level": "info", "n": 1}\n\n{"level": "error", "tags": ["a"]}\n[1, 2]\n',
+            ),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, text):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_reads_records(self):
+        records = run_lispy_string("(with-open [f (open-file path)] (to-vector (ndjson-read f)))", self.env)
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0][Symbol(":level")], "info")
+        self.assertEqual(list(records[1][Symbol(":tags")]), ["a"])
+        self.assertEqual(list(records[2]), [1, 2])
+
+    def test_streams_lazily(self):
+        self.env.define("path", self.write("many.ndjson", "".join(f'{{"n": {n}}}\n' for n in range(1000))))
+        total = run_lispy_string(
+            "(with-open [f (open-file path)] (reduce (ndjson-read f) (fn [sum r] (+ sum (get r ':n))) 0))",
+            self.env,
+        )
+        self.assertEqual(total, sum(range(1000)))
+
+    def test_round_trip_with_ndjson_write(self):
+        out = os.path.join(self.temp_dir, "copy.ndjson")
+        self.env.define("out", out)
+        count = run_lispy_string("(with-open [f (open-file path)] (ndjson-write out (ndjson-read f)))", self.env)
+        self.assertEqual(count, 3)
+        with open(out, encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"level": "info", "n": 1}\n{"level": "error", "tags": ["a"]}\n[1, 2]\n')
+
+    def test_invalid_line(self):
+        self.env.define("path", self.write("bad.ndjson", '{"ok": 1}\n{oops\n'))
+        with self.assertRaisesRegex(EvaluationError, "Invalid JSON on line 2"):
+            run_lispy_string("(with-open [f (open-file path)] (to-vector (ndjson-read f)))", self.env)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(ndjson-read)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a file from open-file"):
+            run_lispy_string("(ndjson-read path)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "read after it was closed"):
+            run_lispy_string("(to-vector (with-open [f (open-file path)] (ndjson-read f)))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
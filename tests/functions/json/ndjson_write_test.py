@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class NdjsonWriteFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "out.ndjson")
+        self.env.define("path", self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def written(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_writes_one_record_per_line(self):
+        count = run_lispy_string('(ndjson-write path [{:name "ada"} [1 2] "line\\nbreak" nil])', self.env)
+        self.assertEqual(count, 4)
+        self.assertEqual(self.written(), '{"name": "ada"}\n[1, 2]\n"line\\nbreak"\nnull\n')
+
+    def test_streams_lazy_sequence(self):
+        count = run_lispy_string("(ndjson-write path (map (range 500) (fn [n] {:n n})))", self.env)
+        self.assertEqual(count, 500)
+        self.assertEqual(self.written().splitlines()[-1], '{"n": 499}')
+
+    def test_empty(self):
+        self.assertEqual(run_lispy_string("(ndjson-write path nil)", self.env), 0)
+        self.assertEqual(self.written(), "")
+
+    def test_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string("(ndjson-write path)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string"):
+            run_lispy_string("(ndjson-write nil [])", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a vector, list"):
+            run_lispy_string("(ndjson-write path {:a 1})", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
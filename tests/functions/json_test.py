@@ -1,8 +1,10 @@
+import json
 import unittest
 
 from lispy.exceptions import LisPyError
 from lispy.functions import create_global_env
-from lispy.types import LispyList, Symbol, Vector
+from lispy.functions.json.utils import encode, iter_encode
+from lispy.types import Symbol, Vector
 from lispy.utils import run_lispy_string
 
 
@@ -199,9 +201,8 @@ class TestJSONFunctions(unittest.TestCase):
         self.assertIsInstance(encoded_result, str)
 
         # Then decode it back
-        decoded_result = run_lispy_string(
-            f'(json-decode "{encoded_result.replace('"', '\\"')}")', self.env
-        )
+        escaped = encoded_result.replace('"', '\\"')
+        decoded_result = run_lispy_string(f'(json-decode "{escaped}")', self.env)
 
         # Should have the same structure (though vectors might not be identical objects)
         self.assertEqual(decoded_result[Symbol(":name")], "Alice")
@@ -244,6 +245,23 @@ class TestJSONFunctions(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(len(result), 0)
 
+    def test_json_encode_lazy_sequences_and_sets(self):
+        """Test that lazy sequences and sets encode as arrays."""
+        result = run_lispy_string("(json-encode {:squares (map (range 4) (fn [n] (* n n)))})", self.env)
+        self.assertEqual(result, '{"squares": [0, 1, 4, 9]}')
+
+        result = run_lispy_string("(json-encode (hash-set 7))", self.env)
+        self.assertEqual(result, "[7]")
+
+    def test_json_encode_matches_json_dumps(self):
+        """Test that encoding while converting gives json.dumps output."""
+        data = {"name": "Zoë \"Z\"", "tags": ["a", None, True], "score": 1.5, "nested": {"n": [[], {}]}}
+        decoded = run_lispy_string(f"(json-decode {json.dumps(json.dumps(data))})", self.env)
+        self.env.define("data", decoded)
+        self.assertEqual(run_lispy_string("(json-encode data)", self.env), json.dumps(data))
+        self.assertEqual(encode(decoded, indent=2), json.dumps(data, indent=2))
+        self.assertEqual("".join(iter_encode(decoded)), json.dumps(data))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -68,6 +68,12 @@ class CdrFnTest(unittest.TestCase):
         ):
             run_lispy_string("(cdr mylist mylist)", self.env)
 
+    def test_cdr_shares_tail(self):
+        """Test cdr returns the shared tail of a consed list."""
+        run_lispy_string("(define tail (list 2 3))", self.env)
+        result = run_lispy_string("(cdr (cons 1 tail))", self.env)
+        self.assertIs(result, run_lispy_string("tail", self.env))
+
 
 if __name__ == "__main__":
     unittest.main()
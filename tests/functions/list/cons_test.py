@@ -3,6 +3,7 @@ import unittest
 
 from lispy.exceptions import EvaluationError
 from lispy.functions import create_global_env
+from lispy.persistent_list import PersistentList
 from lispy.utils import run_lispy_string
 
 
@@ -61,6 +62,26 @@ class ConsFnTest(unittest.TestCase):
         ):
             run_lispy_string("(cons)", self.env)
 
+    def test_cons_shares_the_original_list(self):
+        """Test cons returns a list whose rest is the original list."""
+        run_lispy_string("(define tail (list 2 3))", self.env)
+        result = run_lispy_string("(cons 1 tail)", self.env)
+        self.assertIsInstance(result, PersistentList)
+        self.assertIs(result.rest(), run_lispy_string("tail", self.env))
+
+    def test_cons_result_works_with_list_builtins(self):
+        """Test first, rest, count and empty? on a consed list."""
+        run_lispy_string("(define xs (cons 1 (cons 2 '())))", self.env)
+        self.assertEqual(run_lispy_string("(first xs)", self.env), 1)
+        self.assertEqual(run_lispy_string("(first (rest xs))", self.env), 2)
+        self.assertEqual(run_lispy_string("(count xs)", self.env), 2)
+        self.assertTrue(run_lispy_string("(empty? (rest (rest xs)))", self.env))
+        self.assertTrue(run_lispy_string("(equal? xs '(1 2))", self.env))
+
+    def test_cons_onto_lazy_sequence(self):
+        result = run_lispy_string("(take (cons -1 (lazy-range)) 3)", self.env)
+        self.assertEqual(list(result), [-1, 0, 1])
+
 
 if __name__ == "__main__":
     unittest.main()
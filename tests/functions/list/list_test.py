@@ -2,6 +2,7 @@
 import unittest
 
 from lispy.functions import create_global_env
+from lispy.persistent_list import PersistentList
 from lispy.types import LispyList, Symbol
 from lispy.utils import run_lispy_string
 
@@ -51,6 +52,12 @@ class ListFunctionTest(unittest.TestCase):
         self.assertIsInstance(result, LispyList)
         self.assertEqual(result, LispyList([None, True, False]))
 
+    def test_list_returns_persistent_list(self):
+        """Test (list 1 2 3) returns a PersistentList."""
+        result = run_lispy_string("(list 1 2 3)", self.env)
+        self.assertIsInstance(result, PersistentList)
+        self.assertEqual(result, [1, 2, 3])
+
 
 if __name__ == "__main__":
     unittest.main()
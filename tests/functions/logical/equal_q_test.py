@@ -295,6 +295,15 @@ class EqualQTest(unittest.TestCase):
         )
         self.assertEqual(result, "same")
 
+    def test_equal_persistent_and_literal_vectors(self):
+        """Test vectors built with conj equal vector literals."""
+        result = run_lispy_string("(equal? (conj [1 2] 3) [1 2 3])", self.env)
+        self.assertEqual(result, True)
+        result = run_lispy_string("(equal? [[1 2]] (conj [] (conj [1] 2)))", self.env)
+        self.assertEqual(result, True)
+        result = run_lispy_string("(equal? (conj [1 2] 3) [1 2 4])", self.env)
+        self.assertEqual(result, False)
+
 
 if __name__ == "__main__":
     unittest.main()
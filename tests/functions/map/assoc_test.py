@@ -2,7 +2,8 @@ import unittest
 
 from lispy.exceptions import EvaluationError
 from lispy.functions import create_global_env
-from lispy.types import Symbol
+from lispy.persistent_map import PersistentMap
+from lispy.types import Symbol, Vector
 from lispy.utils import run_lispy_string
 
 
@@ -100,7 +101,7 @@ class AssocFnTest(unittest.TestCase):
             run_lispy_string(lispy_code, self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: First argument to 'assoc' must be a map or nil, got <class 'lispy.types.LispyList'>.",
+            "TypeError: First argument to 'assoc' must be a map, vector, or nil, got <class 'lispy.types.LispyList'>.",
         )
 
     def test_assoc_numeric_key(self):
@@ -126,13 +127,65 @@ class AssocFnTest(unittest.TestCase):
 
     def test_assoc_invalid_key_type(self):
         """Test assoc with unsupported key type raises error."""
-        # Test with a list as key (not supported)
-        lispy_code = '(assoc {} (list 1 2) "value")'
+        # Test with a function as key (not supported)
+        lispy_code = '(assoc {} (fn [x] x) "value")'
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string(lispy_code, self.env)
         self.assertIn("TypeError", str(cm.exception))
         self.assertIn("Map keys in 'assoc' must be", str(cm.exception))
 
+    def test_assoc_collection_keys(self):
+        """Test vectors, lists and maps can be map keys."""
+        result = run_lispy_string(
+            "(assoc {} [1 2] ':vector (list 3 4) ':list {:a 1} ':map)", self.env
+        )
+        self.assertEqual(result[Vector([1, 2])], Symbol(":vector"))
+        self.assertEqual(result[Vector([3, 4])], Symbol(":list"))
+        self.assertEqual(result[PersistentMap({Symbol(":a"): 1})], Symbol(":map"))
+
+    def test_assoc_key_with_unhashable_element(self):
+        """Test a collection key holding an unhashable value is rejected."""
+        self.env.define("mutable", {"a": 1})
+        with self.assertRaises(EvaluationError) as cm:
+            run_lispy_string("(assoc {} (vector mutable) 1)", self.env)
+        self.assertIn("Map keys in 'assoc' must be", str(cm.exception))
+
+    def test_assoc_vector_index(self):
+        """Test (assoc [1 2 3] 1 :x) replaces the element at index 1."""
+        result = run_lispy_string("(assoc [1 2 3] 1 ':x)", self.env)
+        self.assertEqual(result, Vector([1, Symbol(":x"), 3]))
+
+    def test_assoc_vector_append_at_length(self):
+        """Test (assoc [1 2] 2 3) appends."""
+        result = run_lispy_string("(assoc [1 2] 2 3 0 0)", self.env)
+        self.assertEqual(result, Vector([0, 2, 3]))
+
+    def test_assoc_vector_original_unchanged(self):
+        """Test assoc on a vector does not modify the original."""
+        run_lispy_string("(define v [1 2 3])", self.env)
+        run_lispy_string("(assoc v 0 10)", self.env)
+        self.assertEqual(run_lispy_string("v", self.env), Vector([1, 2, 3]))
+
+    def test_assoc_vector_index_out_of_bounds(self):
+        """Test assoc on a vector with an index past the end."""
+        with self.assertRaisesRegex(EvaluationError, "IndexError: 5 out of bounds"):
+            run_lispy_string("(assoc [1 2] 5 3)", self.env)
+
+    def test_assoc_vector_non_integer_index(self):
+        """Test assoc on a vector with a non-integer index."""
+        with self.assertRaisesRegex(EvaluationError, "must be an integer"):
+            run_lispy_string("(assoc [1 2] ':a 3)", self.env)
+
+    def test_assoc_threaded_through_large_map(self):
+        """Test repeated assoc on a large map keeps every version intact."""
+        run_lispy_string("(define m0 (reduce (range 200) (fn [m i] (assoc m i (* i i))) {}))", self.env)
+        run_lispy_string("(define m1 (assoc m0 5 'five 500 'new))", self.env)
+        self.assertEqual(run_lispy_string("(get m0 5)", self.env), 25)
+        self.assertEqual(run_lispy_string("(get m1 5)", self.env), Symbol("five"))
+        self.assertEqual(run_lispy_string("(count m0)", self.env), 200)
+        self.assertEqual(run_lispy_string("(count m1)", self.env), 201)
+        self.assertEqual(run_lispy_string("(json-encode (dissoc m1 500))", self.env)[:16], '{"0": 0, "1": 1,')
+
 
 if __name__ == "__main__":
     unittest.main()
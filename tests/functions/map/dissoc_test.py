@@ -103,8 +103,8 @@ class DissocFnTest(unittest.TestCase):
 
     def test_dissoc_invalid_key_type(self):
         """Test dissoc with unsupported key type raises error."""
-        # Test with a list as key (not supported)
-        lispy_code = '(dissoc {"name" "Alice"} (list 1 2))'
+        # Test with a function as key (not supported)
+        lispy_code = '(dissoc {"name" "Alice"} (fn [x] x))'
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string(lispy_code, self.env)
         self.assertIn("TypeError", str(cm.exception))
@@ -119,12 +119,21 @@ class GetFnTest(unittest.TestCase):
 
     def test_get_map_invalid_key_type(self):
         """Test get with unsupported key type raises error."""
-        # Test with a list as key (not supported)
+        # Test with a function as key (not supported)
         with self.assertRaises(EvaluationError) as cm:
-            run_lispy_string('(get {"name" "Alice"} (list 1 2))', self.env)
+            run_lispy_string('(get {"name" "Alice"} (fn [x] x))', self.env)
         self.assertIn("TypeError", str(cm.exception))
         self.assertIn("Map key must be", str(cm.exception))
 
+    def test_get_map_collection_key(self):
+        """Test (get m key) finds collection keys by value."""
+        self.env.define("m", run_lispy_string("(assoc {} [1 2] ':pair)", self.env))
+        self.assertEqual(run_lispy_string("(get m [1 2])", self.env), Symbol(":pair"))
+        self.assertEqual(
+            run_lispy_string("(get m (vector 1 2))", self.env), Symbol(":pair")
+        )
+        self.assertIsNone(run_lispy_string("(get m [2 1])", self.env))
+
     # Mixed data type tests
     def test_get_vector_mixed_types(self):
         """Test get with vectors containing mixed data types."""
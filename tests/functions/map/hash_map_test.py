@@ -75,8 +75,8 @@ class HashMapFnTest(unittest.TestCase):
 
     def test_hash_map_fn_invalid_key_type(self):
         """Test hash-map with unsupported key type raises error."""
-        # Test with a list as key (not supported)
-        lispy_code = '(hash-map (list 1 2) "value")'
+        # Test with a function as key (not supported)
+        lispy_code = '(hash-map (fn [x] x) "value")'
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string(lispy_code, self.env)
         self.assertIn("TypeError", str(cm.exception))
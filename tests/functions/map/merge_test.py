@@ -170,6 +170,16 @@ class MergeFnTest(unittest.TestCase):
         expected = {Symbol(":base"): 1, Symbol(":extra"): 2}
         self.assertEqual(result, expected)
 
+    def test_merge_large_maps_shares_first_map(self):
+        """Test merging into a large map leaves the original unchanged."""
+        run_lispy_string("(define big (reduce (range 100) (fn [m i] (assoc m i i)) {}))", self.env)
+        result = run_lispy_string("(merge big {:extra 1} {0 \"zero\"})", self.env)
+        self.assertEqual(len(result), 101)
+        self.assertEqual(result[0], "zero")
+        self.assertEqual(result[Symbol(":extra")], 1)
+        self.assertEqual(run_lispy_string("(get big 0)", self.env), 0)
+        self.assertEqual(run_lispy_string("(count big)", self.env), 100)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class DotFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_dot(self):
+        self.assertEqual(run_lispy_string("(dot (int-array [1 2 3]) (int-array [4 5 6]))", self.env), 32)
+        self.assertEqual(run_lispy_string("(dot (double-array [0.5 1]) (int-array [2 3]))", self.env), 4.0)
+
+    def test_dot_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'dot' failed: arrays have different lengths"):
+            run_lispy_string("(dot (int-array [1]) (int-array [1 2]))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: Second argument to 'dot' must be a numeric array"):
+            run_lispy_string("(dot (int-array [1]) 2)", self.env)
+
+    def test_dot_beyond_64_bits(self):
+        result = run_lispy_string("(dot (int-array [4611686018427387904 1]) (int-array [4 1]))", self.env)
+        self.assertEqual(result, 2**64 + 1)
+
+
+class DotFnFallbackTest(DotFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
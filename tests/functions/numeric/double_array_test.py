@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.numeric_array import NumericArray
+from lispy.utils import run_lispy_string
+
+
+class DoubleArrayFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_double_array_from_vector(self):
+        result = run_lispy_string("(double-array [1 2.5 3])", self.env)
+        self.assertIsInstance(result, NumericArray)
+        self.assertEqual(result.kind, "double")
+        self.assertEqual(result.to_list(), [1.0, 2.5, 3.0])
+
+    def test_double_array_from_sequences(self):
+        self.assertEqual(run_lispy_string("(double-array '(1 2))", self.env).to_list(), [1.0, 2.0])
+        result = run_lispy_string("(double-array (take (lazy-range) 3))", self.env)
+        self.assertEqual(result.to_list(), [0.0, 1.0, 2.0])
+        self.assertEqual(run_lispy_string("(double-array (range 0 4 1))", self.env).to_list(), [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(len(run_lispy_string("(double-array nil)", self.env)), 0)
+
+    def test_double_array_of_size(self):
+        self.assertEqual(run_lispy_string("(double-array 3)", self.env).to_list(), [0.0, 0.0, 0.0])
+
+    def test_double_array_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: 'double-array' expects a collection of numbers"):
+            run_lispy_string('(double-array [1 "a"])', self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: 'double-array' expects a size or a vector"):
+            run_lispy_string('(double-array "abc")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "ValueError: Size passed to 'double-array' must be non-negative"):
+            run_lispy_string("(double-array -1)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "SyntaxError: 'double-array' expects 1 argument"):
+            run_lispy_string("(double-array)", self.env)
+
+
+class DoubleArrayFnFallbackTest(DoubleArrayFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
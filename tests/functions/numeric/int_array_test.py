@@ -0,0 +1,43 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class IntArrayFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_int_array_from_vector(self):
+        result = run_lispy_string("(int-array [1 2 3])", self.env)
+        self.assertEqual(result.kind, "int")
+        self.assertEqual(result.to_list(), [1, 2, 3])
+
+    def test_int_array_of_size(self):
+        self.assertEqual(run_lispy_string("(int-array 2)", self.env).to_list(), [0, 0])
+
+    def test_int_array_from_double_array(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: 'int-array' expects a collection of integers"):
+            run_lispy_string("(int-array (double-array [1.5]))", self.env)
+
+    def test_int_array_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: 'int-array' expects a collection of integers"):
+            run_lispy_string("(int-array [1.5])", self.env)
+        with self.assertRaisesRegex(EvaluationError, "OverflowError: Value passed to 'int-array'"):
+            run_lispy_string("(int-array [100000000000000000000])", self.env)
+
+
+class IntArrayFnFallbackTest(IntArrayFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+
+class ToVectorFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_to_vector_from_array(self):
+        result = run_lispy_string("(to-vector (int-array [1 2 3]))", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [1, 2, 3])
+
+    def test_to_vector_from_sequences(self):
+        self.assertEqual(run_lispy_string("(to-vector '(1 2))", self.env), [1, 2])
+        self.assertEqual(run_lispy_string("(to-vector (take (lazy-range) 3))", self.env), [0, 1, 2])
+        self.assertEqual(run_lispy_string("(to-vector nil)", self.env), [])
+
+    def test_to_vector_invalid(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: 'to-vector' expects a numeric array"):
+            run_lispy_string("(to-vector 5)", self.env)
+
+
+class ToVectorFnFallbackTest(ToVectorFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
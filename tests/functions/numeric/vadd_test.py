@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class VAddFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vadd_arrays(self):
+        result = run_lispy_string("(v+ (int-array [1 2 3]) (int-array [10 20 30]))", self.env)
+        self.assertEqual(result.kind, "int")
+        self.assertEqual(result.to_list(), [11, 22, 33])
+
+    def test_vadd_mixed_kinds(self):
+        result = run_lispy_string("(v+ (int-array [1 2]) (double-array [0.5 0.5]))", self.env)
+        self.assertEqual(result.kind, "double")
+        self.assertEqual(result.to_list(), [1.5, 2.5])
+
+    def test_vadd_scalar(self):
+        self.assertEqual(run_lispy_string("(v+ (int-array [1 2]) 1)", self.env).to_list(), [2, 3])
+        self.assertEqual(run_lispy_string("(v+ 1 (int-array [1 2]))", self.env).to_list(), [2, 3])
+        result = run_lispy_string("(v+ (int-array [1]) 0.5)", self.env)
+        self.assertEqual(result.kind, "double")
+
+    def test_vadd_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'v\\+' failed: arrays have different lengths"):
+            run_lispy_string("(v+ (int-array [1]) (int-array [1 2]))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: First argument to 'v\\+' must be a numeric array"):
+            run_lispy_string("(v+ [1 2] 1)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: Second argument to 'v\\+' must be a numeric array or a number"):
+            run_lispy_string("(v+ (int-array [1]) [1])", self.env)
+
+    def test_vadd_overflow(self):
+        with self.assertRaisesRegex(EvaluationError, "OverflowError: Result of 'v\\+'"):
+            run_lispy_string("(v+ (int-array [9223372036854775807]) 1)", self.env)
+        result = run_lispy_string("(v+ (int-array [9223372036854775807]) (int-array [-1]))", self.env)
+        self.assertEqual(result.to_list(), [9223372036854775806])
+
+
+class VAddFnFallbackTest(VAddFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.functions.numeric.arithmetic import compile_arithmetic
+from lispy.utils import run_lispy_string
+
+
+class VMapFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vmap_arithmetic(self):
+        result = run_lispy_string("(vmap (int-array [1 2 3]) (fn [x] (+ (* x x) 1)))", self.env)
+        self.assertEqual(result.kind, "int")
+        self.assertEqual(result.to_list(), [2, 5, 10])
+
+    def test_vmap_division_gives_doubles(self):
+        result = run_lispy_string("(vmap (int-array [1 2]) (fn [x] (/ x 2)))", self.env)
+        self.assertEqual(result.kind, "double")
+        self.assertEqual(result.to_list(), [0.5, 1.0])
+
+    def test_vmap_free_variable_and_unary(self):
+        run_lispy_string("(define scale 10)", self.env)
+        result = run_lispy_string("(vmap (double-array [1 -2]) (fn [x] (abs (- (* x scale)))))", self.env)
+        self.assertEqual(result.to_list(), [10.0, 20.0])
+
+    def test_vmap_constant_function(self):
+        self.assertEqual(run_lispy_string("(vmap (int-array [1 2]) (fn [x] 7))", self.env).to_list(), [7, 7])
+
+    def test_vmap_general_function(self):
+        result = run_lispy_string("(vmap (int-array [1 -2]) (fn [x] (if (> x 0) x 0.5)))", self.env)
+        self.assertEqual(result.kind, "double")
+        self.assertEqual(result.to_list(), [1.0, 0.5])
+
+    def test_vmap_compiles_only_arithmetic(self):
+        compiled = run_lispy_string("(fn [x] (- (* 2 x) 1))", self.env)
+        self.assertIsNotNone(compile_arithmetic(compiled, False))
+        for code in ("(fn [x] (if (> x 0) x 0))", "(fn [x y] (+ x y))", "(fn [x] (+ x unknown))"):
+            self.assertIsNone(compile_arithmetic(run_lispy_string(code, self.env), False))
+
+    def test_vmap_respects_shadowed_operators(self):
+        run_lispy_string("(define + (fn [a b] (* a b)))", self.env)
+        result = run_lispy_string("(vmap (int-array [2 3]) (fn [x] (+ x 10)))", self.env)
+        self.assertEqual(result.to_list(), [20, 30])
+
+    def test_vmap_division_by_zero(self):
+        with self.assertRaisesRegex(EvaluationError, "ZeroDivisionError"):
+            run_lispy_string("(vmap (int-array [1 0]) (fn [x] (/ 1 x)))", self.env)
+
+    def test_vmap_non_numeric_result(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: Function passed to 'vmap' must return numbers"):
+            run_lispy_string('(vmap (int-array [1]) (fn [x] "s"))', self.env)
+
+    def test_vmap_overflow(self):
+        with self.assertRaisesRegex(EvaluationError, "OverflowError: Result of 'vmap'"):
+            run_lispy_string("(vmap (int-array [4294967296]) (fn [x] (* x x)))", self.env)
+        # Only the result has to fit, as with Python ints
+        result = run_lispy_string("(vmap (int-array [4294967296]) (fn [x] (- (* x x) (* x x) 1)))", self.env)
+        self.assertEqual(result.to_list(), [-1])
+        result = run_lispy_string("(vmap (int-array [4294967296]) (fn [x] (/ (* x x) 2)))", self.env)
+        self.assertEqual(result.to_list(), [2.0**63])
+
+
+class VMapFnFallbackTest(VMapFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class VMaxFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vmax(self):
+        self.assertEqual(run_lispy_string("(vmax (int-array [3 1 2]))", self.env), 3)
+        self.assertEqual(run_lispy_string("(vmax (double-array [2.5 -1]))", self.env), 2.5)
+
+    def test_vmax_empty(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'vmax' failed: max of an empty array"):
+            run_lispy_string("(vmax (int-array []))", self.env)
+
+
+class VMaxFnFallbackTest(VMaxFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
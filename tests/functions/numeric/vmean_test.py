@@ -0,0 +1,32 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class VMeanFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vmean(self):
+        self.assertEqual(run_lispy_string("(vmean (int-array [1 2 3 4]))", self.env), 2.5)
+
+    def test_vmean_empty(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'vmean' failed: mean of an empty array"):
+            run_lispy_string("(vmean (double-array []))", self.env)
+
+
+class VMeanFnFallbackTest(VMeanFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class VMinFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vmin(self):
+        self.assertEqual(run_lispy_string("(vmin (int-array [3 1 2]))", self.env), 1)
+        self.assertEqual(run_lispy_string("(vmin (double-array [2.5 -1]))", self.env), -1.0)
+
+    def test_vmin_empty(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'vmin' failed: min of an empty array"):
+            run_lispy_string("(vmin (int-array []))", self.env)
+
+
+class VMinFnFallbackTest(VMinFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
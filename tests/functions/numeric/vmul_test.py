@@ -0,0 +1,37 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class VMulFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vmul_arrays(self):
+        result = run_lispy_string("(v* (int-array [1 2 3]) (int-array [4 5 6]))", self.env)
+        self.assertEqual(result.to_list(), [4, 10, 18])
+
+    def test_vmul_scalar(self):
+        result = run_lispy_string("(v* (double-array [1 2]) 10)", self.env)
+        self.assertEqual(result.to_list(), [10.0, 20.0])
+
+    def test_vmul_overflow(self):
+        with self.assertRaisesRegex(EvaluationError, "OverflowError: Result of 'v\\*'"):
+            run_lispy_string("(v* (int-array [4611686018427387904]) 4)", self.env)
+
+
+class VMulFnFallbackTest(VMulFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class VSumFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_vsum(self):
+        self.assertEqual(run_lispy_string("(vsum (int-array [1 2 3]))", self.env), 6)
+        self.assertEqual(run_lispy_string("(vsum (double-array [0.5 0.25]))", self.env), 0.75)
+        self.assertEqual(run_lispy_string("(vsum (int-array (range 0 100 1)))", self.env), 4950)
+
+    def test_vsum_empty(self):
+        self.assertEqual(run_lispy_string("(vsum (int-array []))", self.env), 0)
+
+    def test_vsum_requires_array(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: First argument to 'vsum' must be a numeric array"):
+            run_lispy_string("(vsum [1 2])", self.env)
+
+    def test_vsum_beyond_64_bits(self):
+        result = run_lispy_string("(vsum (int-array [9223372036854775807 9223372036854775807]))", self.env)
+        self.assertEqual(result, 2 * (2**63 - 1))
+
+
+class VSumFnFallbackTest(VSumFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import time
 import unittest
+from unittest import mock
 
 from lispy.closure import Function
 from lispy.environment import Environment
@@ -69,14 +70,12 @@ class TestPromiseThen(unittest.TestCase):
             return value * value
 
         # Replace the promise's then method temporarily for this test
-        original_then = promise_obj.then
+        # (promises are slotted, so the method is patched on the class)
+        def mock_then(promise, callback):
+            return resolve([mock_lispy_callback(promise.value)], self.env)
 
-        def mock_then(callback):
-            return resolve([mock_lispy_callback(promise_obj.value)], self.env)
-
-        promise_obj.then = mock_then
-
-        result = promise_then([promise_obj, lispy_fn], self.env)
+        with mock.patch.object(LispyPromise, "then", mock_then):
+            result = promise_then([promise_obj, lispy_fn], self.env)
         self.assertEqual(result.state, "resolved")
         self.assertEqual(result.value, 25)
 
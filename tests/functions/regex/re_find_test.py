@@ -0,0 +1,36 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ReFindFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_re_find_text(self):
+        self.assertEqual(run_lispy_string('(re-find "took 35ms" "\\\\d+")', self.env), "35")
+        self.assertIsNone(run_lispy_string('(re-find "no digits" "\\\\d+")', self.env))
+
+    def test_re_find_groups(self):
+        result = run_lispy_string('(re-find "took 35ms" "(\\\\d+)(ms|s)")', self.env)
+        self.assertEqual(list(result), ["35ms", "35", "ms"])
+        result = run_lispy_string('(re-find "x" "(x)(y)?")', self.env)
+        self.assertEqual(list(result), ["x", "x", None])
+
+    def test_re_find_with_pattern(self):
+        run_lispy_string('(define p (re-pattern "[A-Z]+"))', self.env)
+        self.assertEqual(run_lispy_string('(re-find "level=WARN msg" p)', self.env), "WARN")
+
+    def test_re_find_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string('(re-find "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 're-find' must be a string"):
+            run_lispy_string('(re-find 1 "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Second argument to 're-find' must be a string or pattern"):
+            run_lispy_string('(re-find "a" 1)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
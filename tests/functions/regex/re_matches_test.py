@@ -0,0 +1,29 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ReMatchesFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_re_matches_whole_string(self):
+        self.assertEqual(run_lispy_string('(re-matches "2024" "\\\\d+")', self.env), "2024")
+        self.assertIsNone(run_lispy_string('(re-matches "2024-01" "\\\\d+")', self.env))
+        self.assertIsNone(run_lispy_string('(re-matches "x2024" "\\\\d+")', self.env))
+
+    def test_re_matches_groups(self):
+        result = run_lispy_string('(re-matches "2024-01-31" "(\\\\d+)-(\\\\d+)-(\\\\d+)")', self.env)
+        self.assertEqual(list(result), ["2024-01-31", "2024", "01", "31"])
+
+    def test_re_matches_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 3"):
+            run_lispy_string('(re-matches "a" "a" "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Invalid regular expression"):
+            run_lispy_string('(re-matches "a" "(")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
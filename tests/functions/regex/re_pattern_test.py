@@ -0,0 +1,45 @@
+import re
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.functions.regex.utils import _compile, compile_pattern
+from lispy.utils import format_lispy_value_for_display, run_lispy_string
+
+
+class RePatternFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_re_pattern_compiles(self):
+        pattern = run_lispy_string('(re-pattern "\\\\d+")', self.env)
+        self.assertIsInstance(pattern, re.Pattern)
+        self.assertEqual(pattern.pattern, "\\d+")
+        self.assertEqual(format_lispy_value_for_display(pattern), '#"\\d+"')
+
+    def test_re_pattern_of_pattern_is_identity(self):
+        run_lispy_string('(define p (re-pattern "a+"))', self.env)
+        self.assertIs(
+            run_lispy_string("(re-pattern p)", self.env),
+            run_lispy_string("p", self.env),
+        )
+
+    def test_pattern_strings_are_compiled_once(self):
+        source = "cache-test-[0-9]+"
+        first = compile_pattern(source, "re-find", "Second")
+        hits = _compile.cache_info().hits
+        self.assertIs(compile_pattern(source, "re-find", "Second"), first)
+        self.assertEqual(_compile.cache_info().hits, hits + 1)
+        self.assertIsNotNone(_compile.cache_info().maxsize)
+
+    def test_re_pattern_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(re-pattern)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string or pattern"):
+            run_lispy_string("(re-pattern 42)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "ValueError: Invalid regular expression"):
+            run_lispy_string('(re-pattern "[a-z")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
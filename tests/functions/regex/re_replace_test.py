@@ -0,0 +1,44 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ReReplaceFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_re_replace_string(self):
+        self.assertEqual(run_lispy_string('(re-replace "a1b22" "\\\\d+" "#")', self.env), "a#b#")
+        self.assertEqual(
+            run_lispy_string('(re-replace "2024-01-31" "(\\\\d+)-(\\\\d+)-(\\\\d+)" "\\\\3/\\\\2/\\\\1")', self.env),
+            "31/01/2024",
+        )
+
+    def test_re_replace_function(self):
+        result = run_lispy_string(
+            '(re-replace "a1b22" "\\\\d+" (fn [m] (to-str (* 2 (to-int m)))))', self.env
+        )
+        self.assertEqual(result, "a2b44")
+        result = run_lispy_string(
+            '(re-replace "k=v" "(\\\\w)=(\\\\w)" (fn [m] (join (vector (nth m 2) (nth m 1)) "=")))',
+            self.env,
+        )
+        self.assertEqual(result, "v=k")
+
+    def test_re_replace_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 3 arguments, got 2"):
+            run_lispy_string('(re-replace "a" "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Third argument to 're-replace' must be a procedure"):
+            run_lispy_string('(re-replace "a" "a" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must return a string"):
+            run_lispy_string('(re-replace "a" "a" (fn [m] 1))', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Invalid replacement"):
+            run_lispy_string('(re-replace "a" "a" "\\\\9")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "ArityError"):
+            run_lispy_string('(re-replace "a" "a" (fn [a b] a))', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import itertools
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class ReSeqFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_re_seq_matches(self):
+        result = run_lispy_string('(re-seq "a1 b22 c333" "\\\\d+")', self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(list(result), ["1", "22", "333"])
+        self.assertEqual(list(run_lispy_string('(re-seq "abc" "\\\\d")', self.env)), [])
+
+    def test_re_seq_groups(self):
+        result = run_lispy_string('(re-seq "a=1 b=2" "(\\\\w)=(\\\\d)")', self.env)
+        self.assertEqual([list(m) for m in result], [["a=1", "a", "1"], ["b=2", "b", "2"]])
+
+    def test_re_seq_is_lazy(self):
+        self.env.define("big", "x1 " * 100_000)
+        result = run_lispy_string('(re-seq big "\\\\d")', self.env)
+        self.assertEqual(list(itertools.islice(result, 3)), ["1", "1", "1"])
+        self.assertEqual(run_lispy_string('(first (re-seq big "x\\\\d"))', self.env), "x1")
+
+    def test_re_seq_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string('(re-seq "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 're-seq' must be a string"):
+            run_lispy_string('(re-seq nil "a")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
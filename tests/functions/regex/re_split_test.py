@@ -0,0 +1,34 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ReSplitFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_re_split(self):
+        self.assertEqual(list(run_lispy_string('(re-split "a, b,c" ",\\\\s*")', self.env)), ["a", "b", "c"])
+        self.assertEqual(
+            list(run_lispy_string('(re-split "GET  /index   200" "\\\\s+")', self.env)),
+            ["GET", "/index", "200"],
+        )
+        self.assertEqual(list(run_lispy_string('(re-split "abc" ",")', self.env)), ["abc"])
+
+    def test_re_split_keeps_groups(self):
+        self.assertEqual(
+            list(run_lispy_string('(re-split "1+2-3" "([+-])")', self.env)),
+            ["1", "+", "2", "-", "3"],
+        )
+
+    def test_re_split_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string('(re-split "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 're-split' must be a string"):
+            run_lispy_string('(re-split (vector) ",")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
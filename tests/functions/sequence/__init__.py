@@ -0,0 +1 @@
+# Sequence function tests
@@ -0,0 +1,31 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class DropFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_drop_from_vector(self):
+        self.assertEqual(list(run_lispy_string("(drop [1 2 3 4] 2)", self.env)), [3, 4])
+
+    def test_drop_from_infinite_sequence(self):
+        result = run_lispy_string("(take (drop (lazy-range) 10) 3)", self.env)
+        self.assertEqual(list(result), [10, 11, 12])
+
+    def test_drop_more_than_available(self):
+        self.assertEqual(list(run_lispy_string("(drop [1 2] 5)", self.env)), [])
+
+    def test_drop_zero(self):
+        self.assertEqual(list(run_lispy_string("(drop '(1 2) 0)", self.env)), [1, 2])
+
+    def test_drop_invalid_count(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError"):
+            run_lispy_string('(drop [1 2] "1")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class IterateFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_iterate_doubles(self):
+        result = run_lispy_string("(take (iterate (fn [x] (* x 2)) 1) 5)", self.env)
+        self.assertEqual(list(result), [1, 2, 4, 8, 16])
+
+    def test_iterate_with_builtin(self):
+        result = run_lispy_string("(take (iterate abs -3) 2)", self.env)
+        self.assertEqual(list(result), [-3, 3])
+
+    def test_iterate_arity_of_procedure(self):
+        with self.assertRaisesRegex(EvaluationError, "ArityError"):
+            run_lispy_string("(iterate (fn [a b] a) 1)", self.env)
+
+    def test_iterate_requires_procedure(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'iterate' must be a procedure"
+        ):
+            run_lispy_string("(iterate 1 1)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
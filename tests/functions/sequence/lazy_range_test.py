@@ -0,0 +1,47 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class LazyRangeFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_lazy_range_is_lazy(self):
+        result = run_lispy_string("(lazy-range 5)", self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(list(result), [0, 1, 2, 3, 4])
+
+    def test_lazy_range_start_end_step(self):
+        self.assertEqual(list(run_lispy_string("(lazy-range 2 5)", self.env)), [2, 3, 4])
+        self.assertEqual(
+            list(run_lispy_string("(lazy-range 10 0 -3)", self.env)), [10, 7, 4, 1]
+        )
+
+    def test_infinite_lazy_range(self):
+        result = run_lispy_string("(take (lazy-range) 3)", self.env)
+        self.assertEqual(list(result), [0, 1, 2])
+
+    def test_pipeline_over_large_range_stops_early(self):
+        lispy_code = """
+        (first (filter (map (lazy-range 100000000) (fn [x] (* x x)))
+                       (fn [x] (> x 50))))
+        """
+        self.assertEqual(run_lispy_string(lispy_code, self.env), 64)
+
+    def test_lazy_range_zero_step(self):
+        with self.assertRaisesRegex(EvaluationError, "step argument must not be zero"):
+            run_lispy_string("(lazy-range 0 5 0)", self.env)
+
+    def test_lazy_range_invalid_argument(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Argument 1 to 'lazy-range' must be an integer"
+        ):
+            run_lispy_string('(lazy-range "5")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class RepeatFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_repeat_n_times(self):
+        self.assertEqual(list(run_lispy_string('(repeat 3 "x")', self.env)), ["x"] * 3)
+
+    def test_repeat_forever(self):
+        self.assertEqual(list(run_lispy_string("(take (repeat 0) 4)", self.env)), [0] * 4)
+
+    def test_repeat_negative_count(self):
+        self.assertEqual(list(run_lispy_string("(repeat -1 0)", self.env)), [])
+
+    def test_repeat_invalid_count(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError"):
+            run_lispy_string('(repeat "3" 0)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
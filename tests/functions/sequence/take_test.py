@@ -0,0 +1,55 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class TakeFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_take_from_vector(self):
+        result = run_lispy_string("(take [1 2 3 4] 2)", self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(list(result), [1, 2])
+
+    def test_take_more_than_available(self):
+        self.assertEqual(list(run_lispy_string("(take '(1 2) 5)", self.env)), [1, 2])
+
+    def test_take_zero_and_nil(self):
+        self.assertEqual(list(run_lispy_string("(take [1 2] 0)", self.env)), [])
+        self.assertEqual(list(run_lispy_string("(take nil 3)", self.env)), [])
+
+    def test_take_only_realizes_what_it_needs(self):
+        run_lispy_string("(define calls (transient []))", self.env)
+        lispy_code = """
+        (first (take (map (lazy-range 1000) (fn [x] (conj! calls x) x)) 1))
+        """
+        self.assertEqual(run_lispy_string(lispy_code, self.env), 0)
+        self.assertLessEqual(run_lispy_string("(count calls)", self.env), 32)
+
+    def test_take_transducer(self):
+        result = run_lispy_string("(into [] (take 3) (lazy-range))", self.env)
+        self.assertEqual(result, [0, 1, 2])
+
+    def test_take_invalid_count(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Second argument to 'take' must be an integer"
+        ):
+            run_lispy_string("(take [1 2] 1.5)", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Argument to 'take' must be an integer"
+        ):
+            run_lispy_string("(take [1 2])", self.env)
+
+    def test_take_invalid_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'take' must be a lazy sequence"
+        ):
+            run_lispy_string("(take \"abc\" 2)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class TakeWhileFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_take_while_vector(self):
+        result = run_lispy_string("(take-while [1 2 3 10 4] (fn [x] (< x 5)))", self.env)
+        self.assertEqual(list(result), [1, 2, 3])
+
+    def test_take_while_infinite(self):
+        lispy_code = "(take-while (iterate (fn [x] (* x 2)) 1) (fn [x] (< x 100)))"
+        result = run_lispy_string(lispy_code, self.env)
+        self.assertEqual(list(result), [1, 2, 4, 8, 16, 32, 64])
+
+    def test_zero_is_truthy(self):
+        result = run_lispy_string("(take-while [0 0 nil 0] (fn [x] x))", self.env)
+        self.assertEqual(list(result), [0, 0])
+
+    def test_take_while_requires_procedure(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Second argument to 'take-while' must be a procedure"
+        ):
+            run_lispy_string("(take-while [1] 1)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class ContainsQFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_set_membership(self):
+        self.assertTrue(run_lispy_string("(contains? (hash-set 1 2) 2)", self.env))
+        self.assertFalse(run_lispy_string("(contains? (hash-set 1 2) 3)", self.env))
+
+    def test_collection_member(self):
+        self.assertTrue(
+            run_lispy_string("(contains? (hash-set [1 2]) (vector 1 2))", self.env)
+        )
+
+    def test_map_key(self):
+        self.assertTrue(run_lispy_string("(contains? {:a nil} ':a)", self.env))
+        self.assertFalse(run_lispy_string("(contains? {:a 1} ':b)", self.env))
+
+    def test_nil(self):
+        self.assertFalse(run_lispy_string("(contains? nil 1)", self.env))
+
+    def test_unhashable_item_is_not_a_member(self):
+        self.assertFalse(
+            run_lispy_string("(contains? (hash-set 1) (fn [x] x))", self.env)
+        )
+
+    def test_vector_is_rejected(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'contains\\?' must be a set"
+        ):
+            run_lispy_string("(contains? [1 2] 1)", self.env)
+
+    def test_arity(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string("(contains? (hash-set))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
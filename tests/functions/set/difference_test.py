@@ -0,0 +1,35 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
+from lispy.utils import run_lispy_string
+
+
+class DifferenceFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_difference(self):
+        self.assertEqual(
+            run_lispy_string(
+                "(difference (hash-set 1 2 3) (hash-set 1) (hash-set 3))", self.env
+            ),
+            PersistentSet([2]),
+        )
+
+    def test_difference_of_one_set(self):
+        self.assertEqual(
+            run_lispy_string("(difference (hash-set 1 2))", self.env),
+            PersistentSet([1, 2]),
+        )
+
+    def test_requires_sets(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'difference' must be a set"
+        ):
+            run_lispy_string("(difference [1] (hash-set 1))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
+from lispy.utils import run_lispy_string
+
+
+class DisjFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_disj(self):
+        self.assertEqual(
+            run_lispy_string("(disj (hash-set 1 2 3) 1 3 5)", self.env),
+            PersistentSet([2]),
+        )
+
+    def test_disj_nil(self):
+        self.assertEqual(run_lispy_string("(disj nil 1)", self.env), PersistentSet())
+
+    def test_disj_requires_set(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'disj' must be a set or nil"
+        ):
+            run_lispy_string("(disj [1 2] 1)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import PersistentVector
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class HashSetFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_hash_set(self):
+        result = run_lispy_string("(hash-set 1 2 1 3)", self.env)
+        self.assertIsInstance(result, PersistentSet)
+        self.assertEqual(list(result), [1, 2, 3])
+
+    def test_empty_hash_set(self):
+        self.assertEqual(run_lispy_string("(hash-set)", self.env), PersistentSet())
+
+    def test_collection_elements_are_compared_by_value(self):
+        result = run_lispy_string("(hash-set [1 2] (vector 1 2) ':a)", self.env)
+        self.assertEqual(list(result), [PersistentVector([1, 2]), Symbol(":a")])
+
+    def test_unhashable_element(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Set elements in 'hash-set' must be"
+        ):
+            run_lispy_string("(hash-set (fn [x] x))", self.env)
+
+    def test_count_empty_and_into(self):
+        run_lispy_string("(define s (hash-set 1 2 2))", self.env)
+        self.assertEqual(run_lispy_string("(count s)", self.env), 2)
+        self.assertFalse(run_lispy_string("(empty? s)", self.env))
+        self.assertTrue(run_lispy_string("(empty? (hash-set))", self.env))
+        self.assertEqual(run_lispy_string("(into [] s)", self.env), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
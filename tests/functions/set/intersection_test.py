@@ -0,0 +1,34 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
+from lispy.utils import run_lispy_string
+
+
+class IntersectionFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_intersection(self):
+        self.assertEqual(
+            run_lispy_string(
+                "(intersection (hash-set 1 2 3 4) (hash-set 2 3) (hash-set 3 2 9))",
+                self.env,
+            ),
+            PersistentSet([2, 3]),
+        )
+
+    def test_disjoint_sets(self):
+        self.assertEqual(
+            run_lispy_string("(intersection (hash-set 1) (hash-set 2))", self.env),
+            PersistentSet(),
+        )
+
+    def test_requires_an_argument(self):
+        with self.assertRaisesRegex(EvaluationError, "expects at least 1 argument"):
+            run_lispy_string("(intersection)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
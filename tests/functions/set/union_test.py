@@ -0,0 +1,30 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_set import PersistentSet
+from lispy.utils import run_lispy_string
+
+
+class UnionFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_union(self):
+        self.assertEqual(
+            run_lispy_string("(union (hash-set 1 2) (hash-set 2 3) nil)", self.env),
+            PersistentSet([1, 2, 3]),
+        )
+
+    def test_union_of_nothing(self):
+        self.assertEqual(run_lispy_string("(union)", self.env), PersistentSet())
+
+    def test_union_requires_sets(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Argument 2 to 'union' must be a set or nil"
+        ):
+            run_lispy_string("(union (hash-set 1) [2])", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class RsubseqFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string("(define s (sorted-set 1 5 10 15 20))", self.env)
+
+    def _items(self, source):
+        return list(run_lispy_string(source, self.env))
+
+    def test_one_bound(self):
+        self.assertEqual(self._items("(rsubseq s < 15)"), [10, 5, 1])
+        self.assertEqual(self._items("(rsubseq s >= 15)"), [20, 15])
+
+    def test_two_bounds(self):
+        self.assertEqual(
+            self._items("(rsubseq s >= 5 <= 15)"), [15, 10, 5]
+        )
+
+    def test_previous_key(self):
+        self.assertEqual(run_lispy_string("(first (rsubseq s <= 12))", self.env), 10)
+
+    def test_sorted_map_entries(self):
+        result = run_lispy_string(
+            "(rsubseq (sorted-map 1 ':a 2 ':b 3 ':c) > 1)", self.env
+        )
+        self.assertEqual(list(result), [[3, Symbol(":c")], [2, Symbol(":b")]])
+
+    def test_requires_sorted_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "First argument to 'rsubseq' must be a sorted map"
+        ):
+            run_lispy_string("(rsubseq [1 2] > 0)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
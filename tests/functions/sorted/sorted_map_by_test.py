@@ -0,0 +1,49 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_sorted_map import reverse_compare
+from lispy.utils import run_lispy_string
+
+
+class SortedMapByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_builtin_comparator_uses_natural_order(self):
+        result = run_lispy_string("(sorted-map-by > 1 ':a 3 ':c 2 ':b)", self.env)
+        self.assertEqual(list(result), [3, 2, 1])
+        self.assertIs(result.comparator, reverse_compare)
+
+    def test_numeric_comparator(self):
+        result = run_lispy_string(
+            '(sorted-map-by (fn [a b] (- (count a) (count b))) "ccc" 3 "a" 1 "bb" 2)',
+            self.env,
+        )
+        self.assertEqual(list(result), ["a", "bb", "ccc"])
+
+    def test_boolean_comparator_treats_neither_before_as_equal(self):
+        result = run_lispy_string(
+            "(sorted-map-by (fn [a b] (< (abs a) (abs b))) 2 ':x -2 ':y 1 ':z)",
+            self.env,
+        )
+        self.assertEqual(len(result), 2)
+        self.assertEqual(list(result), [1, 2])
+
+    def test_requires_a_procedure(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "First argument to 'sorted-map-by' must be a procedure"
+        ):
+            run_lispy_string("(sorted-map-by 1 2 3)", self.env)
+
+    def test_comparator_must_return_number_or_boolean(self):
+        with self.assertRaisesRegex(EvaluationError, "must return a number or boolean"):
+            run_lispy_string('(sorted-map-by (fn [a b] "x") 1 1 2 2)', self.env)
+
+    def test_requires_an_argument(self):
+        with self.assertRaisesRegex(EvaluationError, "expects at least 1 argument"):
+            run_lispy_string("(sorted-map-by)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
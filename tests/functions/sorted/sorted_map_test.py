@@ -0,0 +1,65 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_sorted_map import PersistentSortedMap
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class SortedMapFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def _items(self, source):
+        return list(run_lispy_string(source, self.env))
+
+    def test_sorted_map(self):
+        result = run_lispy_string('(sorted-map 3 "c" 1 "a" 2 "b")', self.env)
+        self.assertIsInstance(result, PersistentSortedMap)
+        self.assertEqual(list(result.items()), [(1, "a"), (2, "b"), (3, "c")])
+
+    def test_keyword_keys(self):
+        result = run_lispy_string("(sorted-map ':b 2 ':a 1)", self.env)
+        self.assertEqual(list(result), [Symbol(":a"), Symbol(":b")])
+
+    def test_map_functions_keep_order(self):
+        run_lispy_string('(define m (sorted-map 3 "c" 1 "a"))', self.env)
+        self.assertEqual(
+            self._items('(assoc m 2 "b" 0 "z")'), [0, 1, 2, 3]
+        )
+        self.assertEqual(self._items("(dissoc m 1)"), [3])
+        self.assertEqual(
+            self._items('(merge m {2 "b"})'), [1, 2, 3]
+        )
+        self.assertEqual(
+            self._items('(into m [[2 "b"]])'), [1, 2, 3]
+        )
+        self.assertIsInstance(
+            run_lispy_string("(dissoc m 1)", self.env), PersistentSortedMap
+        )
+        self.assertEqual(run_lispy_string("(get m 3)", self.env), "c")
+        self.assertTrue(run_lispy_string("(contains? m 1)", self.env))
+        self.assertEqual(run_lispy_string("(count m)", self.env), 2)
+        self.assertEqual(self._items("(keys m)"), [1, 3])
+
+    def test_equal_to_hash_map(self):
+        self.assertTrue(
+            run_lispy_string(
+                "(equal? (sorted-map 2 1 1 2) (hash-map 1 2 2 1))", self.env
+            )
+        )
+
+    def test_odd_arguments(self):
+        with self.assertRaisesRegex(EvaluationError, "even number of key/value"):
+            run_lispy_string("(sorted-map 1)", self.env)
+
+    def test_incomparable_keys(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Keys of 'sorted-map' must be comparable"
+        ):
+            run_lispy_string('(sorted-map 1 1 "a" 2)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
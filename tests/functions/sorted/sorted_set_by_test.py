@@ -0,0 +1,34 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class SortedSetByFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def _items(self, source):
+        return list(run_lispy_string(source, self.env))
+
+    def test_descending(self):
+        result = run_lispy_string("(sorted-set-by > 1 3 2)", self.env)
+        self.assertEqual(list(result), [3, 2, 1])
+        self.assertEqual(self._items("(conj (sorted-set-by >= 1) 5)"), [5, 1])
+
+    def test_user_comparator(self):
+        result = run_lispy_string(
+            "(sorted-set-by (fn [a b] (< (abs a) (abs b))) -3 1 2)", self.env
+        )
+        self.assertEqual(list(result), [1, 2, -3])
+
+    def test_requires_a_procedure(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "First argument to 'sorted-set-by' must be a procedure"
+        ):
+            run_lispy_string("(sorted-set-by [1] 2)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
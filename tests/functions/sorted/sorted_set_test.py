@@ -0,0 +1,47 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_sorted_set import PersistentSortedSet
+from lispy.utils import run_lispy_string
+
+
+class SortedSetFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def _items(self, source):
+        return list(run_lispy_string(source, self.env))
+
+    def test_sorted_set(self):
+        result = run_lispy_string("(sorted-set 3 1 2 1)", self.env)
+        self.assertIsInstance(result, PersistentSortedSet)
+        self.assertEqual(list(result), [1, 2, 3])
+
+    def test_set_functions_keep_order(self):
+        run_lispy_string("(define s (sorted-set 5 1))", self.env)
+        self.assertEqual(self._items("(conj s 3)"), [1, 3, 5])
+        self.assertEqual(self._items("(disj s 1)"), [5])
+        self.assertEqual(
+            self._items("(into s [4 2])"), [1, 2, 4, 5]
+        )
+        self.assertEqual(
+            self._items("(filter s (fn [x] (> x 1)))"), [5]
+        )
+        self.assertTrue(run_lispy_string("(contains? s 5)", self.env))
+        self.assertTrue(run_lispy_string("(is-set? s)", self.env))
+
+    def test_equal_to_hash_set(self):
+        self.assertTrue(
+            run_lispy_string("(equal? (sorted-set 2 1) (hash-set 1 2))", self.env)
+        )
+
+    def test_incomparable_elements(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Elements of 'sorted-set' must be comparable"
+        ):
+            run_lispy_string('(sorted-set 1 "a")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class SubseqFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string("(define s (sorted-set 1 5 10 15 20))", self.env)
+
+    def _items(self, source):
+        return list(run_lispy_string(source, self.env))
+
+    def test_one_bound(self):
+        result = run_lispy_string("(subseq s > 5)", self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(list(result), [10, 15, 20])
+        self.assertEqual(self._items("(subseq s >= 5)"), [5, 10, 15, 20])
+        self.assertEqual(self._items("(subseq s < 10)"), [1, 5])
+        self.assertEqual(self._items("(subseq s <= 10)"), [1, 5, 10])
+
+    def test_two_bounds(self):
+        self.assertEqual(self._items("(subseq s >= 5 < 15)"), [5, 10])
+        self.assertEqual(self._items("(subseq s > 5 <= 15)"), [10, 15])
+        self.assertEqual(self._items("(subseq s > 12 < 14)"), [])
+
+    def test_next_key(self):
+        self.assertEqual(run_lispy_string("(first (subseq s > 12))", self.env), 15)
+
+    def test_sorted_map_entries(self):
+        result = run_lispy_string(
+            "(subseq (sorted-map 1 ':a 2 ':b 3 ':c) >= 2)", self.env
+        )
+        self.assertEqual(list(result), [[2, Symbol(":b")], [3, Symbol(":c")]])
+
+    def test_tests_follow_collection_order(self):
+        result = run_lispy_string("(subseq (sorted-set-by > 1 2 3 4) > 2)", self.env)
+        self.assertEqual(list(result), [1])
+
+    def test_invalid_test(self):
+        with self.assertRaisesRegex(EvaluationError, "must be <, <=, > or >="):
+            run_lispy_string("(subseq s = 5)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Start test passed to 'subseq'"):
+            run_lispy_string("(subseq s < 5 < 10)", self.env)
+
+    def test_requires_sorted_collection(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "must be a sorted map or sorted set"
+        ):
+            run_lispy_string("(subseq (hash-set 1) > 0)", self.env)
+
+    def test_arity(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 3 or 5 arguments, got 2"):
+            run_lispy_string("(subseq s >)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
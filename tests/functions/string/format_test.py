@@ -0,0 +1,51 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.functions.string.format import parse_template
+from lispy.utils import run_lispy_string
+
+
+class FormatFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_format_automatic_fields(self):
+        self.assertEqual(run_lispy_string('(format "{} scored {}" "ada" 42)', self.env), "ada scored 42")
+        self.assertEqual(run_lispy_string('(format "{} {} {}" nil true [1 2])', self.env), "nil true [1 2]")
+        self.assertEqual(run_lispy_string('(format "plain")', self.env), "plain")
+
+    def test_format_numbered_fields(self):
+        self.assertEqual(run_lispy_string('(format "{1}/{0}/{1}" "a" "b")', self.env), "b/a/b")
+
+    def test_format_specs(self):
+        self.assertEqual(run_lispy_string('(format "{:.2f}ms" 3.14159)', self.env), "3.14ms")
+        self.assertEqual(run_lispy_string('(format "[{:>5}]" 42)', self.env), "[   42]")
+        self.assertEqual(run_lispy_string('(format "[{:<5}]" nil)', self.env), "[nil  ]")
+        self.assertEqual(run_lispy_string('(format "{{x}} {}" 1)', self.env), "{x} 1")
+
+    def test_format_template_is_parsed_once(self):
+        run_lispy_string('(format "cache {} test" 1)', self.env)
+        hits = parse_template.cache_info().hits
+        self.assertEqual(run_lispy_string('(format "cache {} test" 2)', self.env), "cache 2 test")
+        self.assertEqual(parse_template.cache_info().hits, hits + 1)
+
+    def test_format_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects at least 1 argument, got 0"):
+            run_lispy_string("(format)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'format' must be a string"):
+            run_lispy_string("(format 1)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "needs 2 values, got 1"):
+            run_lispy_string('(format "{} {}" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Invalid template"):
+            run_lispy_string('(format "{" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "cannot mix"):
+            run_lispy_string('(format "{} {0}" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be empty or a number"):
+            run_lispy_string('(format "{name}" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "could not format"):
+            run_lispy_string('(format "{:d}" 1.5)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class SbAppendBangFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_sb_append_in_place(self):
+        run_lispy_string('(define sb (string-builder "a"))', self.env)
+        result = run_lispy_string('(sb-append! sb "b" 1 nil)', self.env)
+        self.assertIs(result, run_lispy_string("sb", self.env))
+        self.assertEqual(run_lispy_string("(sb->str sb)", self.env), "ab1nil")
+        run_lispy_string("(sb-append! sb)", self.env)
+        self.assertEqual(run_lispy_string("(sb->str sb)", self.env), "ab1nil")
+
+    def test_sb_append_in_reduce(self):
+        result = run_lispy_string(
+            '(sb->str (reduce (vector "x" "y") (fn [sb item] (sb-append! sb "<" item ">")) (string-builder)))',
+            self.env,
+        )
+        self.assertEqual(result, "<x><y>")
+
+    def test_sb_append_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects at least 1 argument, got 0"):
+            run_lispy_string("(sb-append!)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string builder"):
+            run_lispy_string('(sb-append! "a" "b")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class SbToStrFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_sb_to_str(self):
+        self.assertEqual(run_lispy_string("(sb->str (string-builder))", self.env), "")
+        run_lispy_string('(define sb (string-builder "a" "b"))', self.env)
+        self.assertEqual(run_lispy_string("(sb->str sb)", self.env), "ab")
+        run_lispy_string('(sb-append! sb "c")', self.env)
+        self.assertEqual(run_lispy_string("(sb->str sb)", self.env), "abc")
+
+    def test_sb_to_str_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(sb->str)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string builder"):
+            run_lispy_string('(sb->str "a")', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class StrJoinFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_str_join_with_separator(self):
+        self.assertEqual(run_lispy_string('(str-join ["a" "b" "c"] ", ")', self.env), "a, b, c")
+        self.assertEqual(run_lispy_string("(str-join (vector 1 nil true))", self.env), "1niltrue")
+
+    def test_str_join_lazy_and_nil(self):
+        self.assertEqual(run_lispy_string('(str-join (take (lazy-range) 5) "-")', self.env), "0-1-2-3-4")
+        self.assertEqual(run_lispy_string('(str-join nil ",")', self.env), "")
+
+    def test_str_join_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 or 2 arguments, got 0"):
+            run_lispy_string("(str-join)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'str-join' must be a vector"):
+            run_lispy_string('(str-join "abc" ",")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "Second argument to 'str-join' must be a string"):
+            run_lispy_string('(str-join ["a"] 1)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class StrPadFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_str_pad_start(self):
+        self.assertEqual(run_lispy_string("(str-pad 42 6)", self.env), "    42")
+        self.assertEqual(run_lispy_string('(str-pad 42 6 "0")', self.env), "000042")
+        self.assertEqual(run_lispy_string('(str-pad "too long" 3)', self.env), "too long")
+
+    def test_str_pad_end(self):
+        self.assertEqual(run_lispy_string('(str-pad "name" 8 "." \':end)', self.env), "name....")
+        self.assertEqual(run_lispy_string('(str-pad nil 5 " " \':start)', self.env), "  nil")
+
+    def test_str_pad_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 to 4 arguments, got 1"):
+            run_lispy_string("(str-pad 1)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "Second argument to 'str-pad' must be an integer"):
+            run_lispy_string('(str-pad "a" "5")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "single character"):
+            run_lispy_string('(str-pad "a" 5 "ab")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "':start or ':end"):
+            run_lispy_string('(str-pad "a" 5 " " \':left)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class StrRepeatFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_str_repeat(self):
+        self.assertEqual(run_lispy_string('(str-repeat "ab" 3)', self.env), "ababab")
+        self.assertEqual(run_lispy_string('(str-repeat "x" 0)', self.env), "")
+
+    def test_str_repeat_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 arguments, got 1"):
+            run_lispy_string('(str-repeat "x")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "First argument to 'str-repeat' must be a string"):
+            run_lispy_string("(str-repeat 1 2)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "non-negative integer"):
+            run_lispy_string('(str-repeat "x" -1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "non-negative integer"):
+            run_lispy_string('(str-repeat "x" 1.5)', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
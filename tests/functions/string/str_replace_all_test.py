@@ -0,0 +1,39 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class StrReplaceAllFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_str_replace_all_literal(self):
+        self.assertEqual(run_lispy_string('(str-replace-all "a-b-c" "-" "+")', self.env), "a+b+c")
+        self.assertEqual(run_lispy_string('(str-replace-all "a.b" "." "")', self.env), "ab")
+
+    def test_str_replace_all_map(self):
+        result = run_lispy_string(
+            '(str-replace-all "<a & b>" {"<" "&lt;" ">" "&gt;" "&" "&amp;"})', self.env
+        )
+        self.assertEqual(result, "&lt;a &amp; b&gt;")
+        # One pass: replaced text is not replaced again
+        self.assertEqual(run_lispy_string('(str-replace-all "ab" {"a" "b" "b" "a"})', self.env), "ba")
+        # The longest key wins
+        self.assertEqual(run_lispy_string('(str-replace-all "a && b" {"&" "+" "&&" "and"})', self.env), "a and b")
+        self.assertEqual(run_lispy_string('(str-replace-all "abc" {})', self.env), "abc")
+
+    def test_str_replace_all_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 2 or 3 arguments, got 1"):
+            run_lispy_string('(str-replace-all "a")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must not be empty"):
+            run_lispy_string('(str-replace-all "a" "" "b")', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be a string or map"):
+            run_lispy_string('(str-replace-all "a" 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must map non-empty strings to strings"):
+            run_lispy_string('(str-replace-all "a" {"a" 1})', self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from lispy.functions import create_global_env
+from lispy.string_builder import StringBuilder
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+from lispy.web.response import format_response
+
+
+class StringBuilderFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_string_builder_empty(self):
+        builder = run_lispy_string("(string-builder)", self.env)
+        self.assertIsInstance(builder, StringBuilder)
+        self.assertEqual(builder.to_string(), "")
+
+    def test_string_builder_converts_values(self):
+        builder = run_lispy_string('(string-builder "n=" 1 nil true)', self.env)
+        self.assertEqual(builder.to_string(), "n=1niltrue")
+
+    def test_string_builder_as_response_body(self):
+        builder = run_lispy_string('(string-builder "<h1>" "Hi" "</h1>")', self.env)
+        status, headers, body = format_response({Symbol(":body"): builder})
+        self.assertEqual(body, "<h1>Hi</h1>")
+        self.assertEqual(headers["Content-Type"], "text/html; charset=utf-8")
+        self.assertEqual(headers["Content-Length"], "11")
+
+
+if __name__ == "__main__":
+    unittest.main()
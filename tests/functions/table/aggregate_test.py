@@ -0,0 +1,46 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class AggregateFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_aggregate_table(self):
+        result = run_lispy_string("(aggregate logs {:requests [:count] :total [:sum :bytes] :top [:max :bytes]})", self.env)
+        self.assertEqual(result, {Symbol(":requests"): 3, Symbol(":total"): 2560, Symbol(":top"): 2048})
+
+    def test_aggregate_groups(self):
+        result = run_lispy_string("(aggregate (group-by logs ':status) {:n [:count] :avg [:mean :bytes]})", self.env)
+        self.assertEqual(
+            result,
+            {200: {Symbol(":n"): 2, Symbol(":avg"): 1280.0}, 404: {Symbol(":n"): 1, Symbol(":avg"): 0.0}},
+        )
+
+    def test_aggregate_text_column(self):
+        self.assertEqual(run_lispy_string("(aggregate logs {:p [:min :path]})", self.env), {Symbol(":p"): "/"})
+        with self.assertRaisesRegex(EvaluationError, "column :path is not numeric"):
+            run_lispy_string("(aggregate logs {:p [:sum :path]})", self.env)
+
+    def test_aggregate_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: Unknown aggregation :median"):
+            run_lispy_string("(aggregate logs {:m [:median :bytes]})", self.env)
+        with self.assertRaisesRegex(EvaluationError, "SyntaxError: Aggregation :m with :sum needs a column"):
+            run_lispy_string("(aggregate logs {:m [:sum]})", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: First argument to 'aggregate' must be a table"):
+            run_lispy_string("(aggregate [1 2] {:n [:count]})", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class SelectFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_select(self):
+        table = run_lispy_string("(select logs [:path :status])", self.env)
+        self.assertEqual(table.column_names(), [Symbol(":path"), Symbol(":status")])
+        self.assertEqual(len(table), 3)
+
+    def test_select_unknown_column(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'select' got unknown column :nope"):
+            run_lispy_string("(select logs [:nope])", self.env)
+
+    def test_select_requires_table(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: First argument to 'select' must be a table"):
+            run_lispy_string("(select [] [:a])", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
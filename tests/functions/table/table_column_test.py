@@ -0,0 +1,34 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.numeric_array import NumericArray
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class TableColumnFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_numeric_column(self):
+        result = run_lispy_string("(table-column logs ':bytes)", self.env)
+        self.assertIsInstance(result, NumericArray)
+        self.assertEqual(run_lispy_string("(vsum (table-column logs ':bytes))", self.env), 2560)
+
+    def test_text_column(self):
+        self.assertEqual(run_lispy_string("(table-column logs ':path)", self.env), ["/", "/x", "/"])
+
+    def test_unknown_column(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'table-column' got unknown column :nope"):
+            run_lispy_string("(table-column logs ':nope)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.table import Table
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class TableFromMapsFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_table_from_maps(self):
+        table = run_lispy_string("logs", self.env)
+        self.assertIsInstance(table, Table)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(run_lispy_string("(count logs)", self.env), 3)
+        self.assertEqual(table.column(Symbol(":bytes")).kind, "int")
+
+    def test_table_from_maps_missing_keys(self):
+        table = run_lispy_string("(table-from-maps [{:a 1} {:b 2}])", self.env)
+        self.assertEqual(table.column(Symbol(":a")), [1, None])
+
+    def test_table_from_maps_empty(self):
+        self.assertEqual(len(run_lispy_string("(table-from-maps [])", self.env)), 0)
+        self.assertEqual(len(run_lispy_string("(table-from-maps nil)", self.env)), 0)
+
+    def test_table_from_maps_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "TypeError: Row 1 passed to 'table-from-maps' must be a map"):
+            run_lispy_string("(table-from-maps [{:a 1} 2])", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: First argument to 'table-from-maps'"):
+            run_lispy_string("(table-from-maps 5)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
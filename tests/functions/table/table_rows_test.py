@@ -0,0 +1,31 @@
+import unittest
+
+from lispy.functions import create_global_env
+from lispy.persistent_vector import PersistentVector
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class TableRowsFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_table_rows(self):
+        result = run_lispy_string("(table-rows (select logs [:status]))", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [{Symbol(":status"): 200}, {Symbol(":status"): 404}, {Symbol(":status"): 200}])
+
+    def test_table_rows_round_trip(self):
+        result = run_lispy_string("(get (first (table-rows logs)) ':path)", self.env)
+        self.assertEqual(result, "/")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.functions.numeric.arithmetic import compile_predicate
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+LOGS = """
+(define logs (table-from-maps [{:status 200 :bytes 512 :path "/"}
+                               {:status 404 :bytes 0 :path "/x"}
+                               {:status 200 :bytes 2048 :path "/"}]))
+"""
+
+
+class WhereFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        run_lispy_string(LOGS, self.env)
+
+    def test_where_numeric_column(self):
+        table = run_lispy_string("(where logs ':status (fn [s] (>= s 400)))", self.env)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.column(Symbol(":path")), ["/x"])
+
+    def test_where_predicate_is_compiled(self):
+        predicate = run_lispy_string("(fn [s] (> (* s 2) limit))", self.env)
+        run_lispy_string("(define limit 500)", self.env)
+        self.assertIsNotNone(compile_predicate(predicate, False))
+        run_lispy_string("(define limit 1000)", self.env)
+        table = run_lispy_string("(where logs ':bytes (fn [b] (> (* b 2) limit)))", self.env)
+        self.assertEqual(table.column(Symbol(":bytes")).to_list(), [512, 2048])
+
+    def test_where_general_predicate(self):
+        table = run_lispy_string('(where logs \':path (fn [p] (= (count p) 2)))', self.env)
+        self.assertEqual(table.column(Symbol(":status")).to_list(), [404])
+        table = run_lispy_string("(where logs ':status (fn [s] (if (= s 200) 0 nil)))", self.env)
+        self.assertEqual(len(table), 2)
+
+    def test_where_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "ValueError: 'where' got unknown column"):
+            run_lispy_string("(where logs ':nope (fn [x] x))", self.env)
+        with self.assertRaisesRegex(EvaluationError, "SyntaxError: 'where' expects 3 arguments"):
+            run_lispy_string("(where logs ':status)", self.env)
+
+    def test_where_large_products(self):
+        run_lispy_string("(define big (table-from-maps [{:n 4294967296} {:n 3}]))", self.env)
+        table = run_lispy_string("(where big ':n (fn [n] (> (* n n) 100)))", self.env)
+        self.assertEqual(table.column(Symbol(":n")).to_list(), [4294967296])
+
+
+class WhereFnFallbackTest(WhereFnTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == "__main__":
+    unittest.main()
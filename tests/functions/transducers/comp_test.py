@@ -0,0 +1,33 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.transducers import Transducer
+from lispy.utils import run_lispy_string
+
+
+class CompFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_comp_transducers(self):
+        result = run_lispy_string("(comp (map (fn [x] x)) (take 2))", self.env)
+        self.assertIsInstance(result, Transducer)
+
+    def test_comp_functions_right_to_left(self):
+        lispy_code = "((comp (fn [x] (* x 2)) (fn [x] (+ x 1))) 5)"
+        self.assertEqual(run_lispy_string(lispy_code, self.env), 12)
+        self.assertEqual(run_lispy_string("((comp abs -) 3 10)", self.env), 7)
+
+    def test_comp_no_arguments(self):
+        self.assertEqual(run_lispy_string("(into [] (comp) [1 2])", self.env), [1, 2])
+
+    def test_comp_mixed_arguments(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Argument 2 to 'comp' must be a procedure"
+        ):
+            run_lispy_string("(comp abs (take 1))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_list import PersistentList
+from lispy.persistent_map import PersistentMap
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_vector import PersistentVector
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class IntoFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_into_vector(self):
+        result = run_lispy_string("(into [1] [2 3])", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [1, 2, 3])
+
+    def test_into_does_not_modify_target(self):
+        run_lispy_string("(define v [1])", self.env)
+        run_lispy_string("(into v [2 3])", self.env)
+        self.assertEqual(run_lispy_string("v", self.env), [1])
+
+    def test_into_with_transducer(self):
+        lispy_code = "(into [] (comp (filter (fn [x] (> x 1))) (map (fn [x] (* x 10)))) [1 2 3])"
+        self.assertEqual(run_lispy_string(lispy_code, self.env), [20, 30])
+        self.assertEqual(run_lispy_string("(into [] (take 3) (lazy-range))", self.env), [0, 1, 2])
+
+    def test_into_map(self):
+        result = run_lispy_string("(into {:z 0} [[:a 1] [:b 2]])", self.env)
+        self.assertIsInstance(result, PersistentMap)
+        self.assertEqual(result, {Symbol(":z"): 0, Symbol(":a"): 1, Symbol(":b"): 2})
+        result = run_lispy_string("(into {} {:a 1})", self.env)
+        self.assertEqual(result, {Symbol(":a"): 1})
+
+    def test_into_list_prepends(self):
+        result = run_lispy_string("(into '() [1 2 3])", self.env)
+        self.assertIsInstance(result, PersistentList)
+        self.assertEqual(result, [3, 2, 1])
+        self.assertEqual(run_lispy_string("(into nil [1 2])", self.env), [2, 1])
+
+    def test_into_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "SyntaxError: 'into' expects 2 or 3 arguments"):
+            run_lispy_string("(into [])", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'into' must be a vector, map, set, list, or nil"
+        ):
+            run_lispy_string("(into 5 [1])", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TypeError: 'into' a map expects \\[key value\\] pairs"):
+            run_lispy_string("(into {} [1 2])", self.env)
+
+    def test_into_set(self):
+        result = run_lispy_string("(into (hash-set 1) [1 2 2 3])", self.env)
+        self.assertEqual(result, PersistentSet([1, 2, 3]))
+        result = run_lispy_string("(into [] (hash-set 1 2))", self.env)
+        self.assertEqual(result, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
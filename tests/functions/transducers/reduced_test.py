@@ -0,0 +1,24 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.transducers import Reduced
+from lispy.utils import run_lispy_string
+
+
+class ReducedFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_reduced_wraps_value(self):
+        result = run_lispy_string("(reduced 5)", self.env)
+        self.assertIsInstance(result, Reduced)
+        self.assertEqual(result.value, 5)
+
+    def test_reduced_arity(self):
+        with self.assertRaisesRegex(EvaluationError, "SyntaxError: 'reduced' expects 1 argument"):
+            run_lispy_string("(reduced)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
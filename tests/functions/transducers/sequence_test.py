@@ -0,0 +1,34 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class SequenceFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_sequence_vector(self):
+        result = run_lispy_string("(sequence [1 2 3] (map (fn [x] (* x 2))))", self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(list(result), [2, 4, 6])
+
+    def test_sequence_infinite(self):
+        lispy_code = "(take (sequence (lazy-range) (filter (fn [x] (> x 5)))) 2)"
+        self.assertEqual(list(run_lispy_string(lispy_code, self.env)), [6, 7])
+
+    def test_sequence_with_take_transducer(self):
+        result = run_lispy_string("(sequence (lazy-range) (take 3))", self.env)
+        self.assertEqual(list(result), [0, 1, 2])
+
+    def test_sequence_invalid_transducer(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Second argument to 'sequence' must be a transducer"
+        ):
+            run_lispy_string("(sequence [1] 5)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class TransduceFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_transduce_map_filter(self):
+        lispy_code = """
+        (transduce [1 2 3 4]
+                   (comp (map (fn [x] (* x x))) (filter (fn [x] (> x 4))))
+                   + 0)
+        """
+        self.assertEqual(run_lispy_string(lispy_code, self.env), 25)
+
+    def test_transduce_without_init_calls_function(self):
+        self.assertEqual(run_lispy_string("(transduce [1 2 3] (map (fn [x] x)) +)", self.env), 6)
+        self.assertEqual(run_lispy_string("(transduce [1 2 3] (map (fn [x] x)) *)", self.env), 6)
+
+    def test_transduce_take_on_infinite_sequence(self):
+        self.assertEqual(run_lispy_string("(transduce (lazy-range) (take 5) + 0)", self.env), 10)
+
+    def test_transduce_reduced(self):
+        lispy_code = """
+        (transduce (lazy-range) (map (fn [x] (* x 2)))
+                   (fn [acc x] (if (> x 6) (reduced acc) (+ acc x))) 0)
+        """
+        self.assertEqual(run_lispy_string(lispy_code, self.env), 12)
+
+    def test_transduce_nil(self):
+        self.assertEqual(run_lispy_string("(transduce nil (take 2) + 0)", self.env), 0)
+
+    def test_transduce_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "SyntaxError: 'transduce' expects 3 or 4 arguments"):
+            run_lispy_string("(transduce [1] (take 1))", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: Second argument to 'transduce' must be a transducer"
+        ):
+            run_lispy_string("(transduce [1] + + 0)", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'transduce' must be a lazy sequence"
+        ):
+            run_lispy_string("(transduce 5 (take 1) + 0)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+# Transient function tests
@@ -0,0 +1,64 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_map import PersistentMap
+from lispy.types import Symbol
+from lispy.utils import run_lispy_string
+
+
+class AssocBangFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_assoc_bang_on_map(self):
+        result = run_lispy_string(
+            "(persistent! (assoc! (transient {:a 1}) ':a 10 ':b 2))", self.env
+        )
+        self.assertIsInstance(result, PersistentMap)
+        self.assertEqual(result, {Symbol(":a"): 10, Symbol(":b"): 2})
+
+    def test_assoc_bang_on_vector(self):
+        result = run_lispy_string(
+            "(persistent! (assoc! (transient [1 2 3]) 1 ':x 3 4))", self.env
+        )
+        self.assertEqual(result, [1, Symbol(":x"), 3, 4])
+
+    def test_assoc_bang_builds_large_map(self):
+        lispy_code = """
+        (loop [t (transient {}) i 0]
+          (if (= i 200)
+            (persistent! t)
+            (recur (assoc! t i (* i i)) (+ i 1))))
+        """
+        result = run_lispy_string(lispy_code, self.env)
+        self.assertEqual(result, {i: i * i for i in range(200)})
+
+    def test_assoc_bang_vector_index_out_of_bounds(self):
+        with self.assertRaisesRegex(
+            EvaluationError,
+            "IndexError: 5 out of bounds for 'assoc!' on vector of size 2.",
+        ):
+            run_lispy_string("(assoc! (transient [1 2]) 5 0)", self.env)
+
+    def test_assoc_bang_after_persistent(self):
+        run_lispy_string("(define t (transient {}))", self.env)
+        run_lispy_string("(persistent! t)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TransientError"):
+            run_lispy_string("(assoc! t ':a 1)", self.env)
+
+    def test_assoc_bang_requires_transient(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: First argument to 'assoc!' must be a transient"
+        ):
+            run_lispy_string("(assoc! {} ':a 1)", self.env)
+
+    def test_assoc_bang_odd_arguments(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "SyntaxError: 'assoc!' requires an even number"
+        ):
+            run_lispy_string("(assoc! (transient {}) ':a 1 ':b)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+
+class ConjBangFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_conj_bang_appends(self):
+        result = run_lispy_string("(persistent! (conj! (transient [1]) 2 3))", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [1, 2, 3])
+
+    def test_conj_bang_in_loop(self):
+        lispy_code = """
+        (loop [t (transient []) i 0]
+          (if (= i 100)
+            (persistent! t)
+            (recur (conj! t i) (+ i 1))))
+        """
+        result = run_lispy_string(lispy_code, self.env)
+        self.assertEqual(result, list(range(100)))
+
+    def test_conj_bang_after_persistent(self):
+        run_lispy_string("(define t (transient []))", self.env)
+        run_lispy_string("(persistent! t)", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "TransientError: Transient used after persistent! call."
+        ):
+            run_lispy_string("(conj! t 1)", self.env)
+
+    def test_conj_bang_requires_transient_vector(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: 'conj!' expects a transient vector"
+        ):
+            run_lispy_string("(conj! [1 2] 3)", self.env)
+
+    def test_conj_bang_arity(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "SyntaxError: 'conj!' expects at least 2 arguments"
+        ):
+            run_lispy_string("(conj! (transient []))", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
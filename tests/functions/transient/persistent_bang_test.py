@@ -0,0 +1,38 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_map import PersistentMap
+from lispy.persistent_vector import PersistentVector
+from lispy.utils import run_lispy_string
+
+
+class PersistentBangFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_persistent_bang_vector(self):
+        result = run_lispy_string("(persistent! (transient [1 2]))", self.env)
+        self.assertIsInstance(result, PersistentVector)
+        self.assertEqual(result, [1, 2])
+
+    def test_persistent_bang_map(self):
+        result = run_lispy_string("(persistent! (transient {}))", self.env)
+        self.assertIsInstance(result, PersistentMap)
+        self.assertEqual(result, {})
+
+    def test_persistent_bang_twice(self):
+        run_lispy_string("(define t (transient [1]))", self.env)
+        run_lispy_string("(persistent! t)", self.env)
+        with self.assertRaisesRegex(EvaluationError, "TransientError"):
+            run_lispy_string("(persistent! t)", self.env)
+
+    def test_persistent_bang_requires_transient(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: 'persistent!' expects a transient vector or map"
+        ):
+            run_lispy_string("(persistent! [1 2])", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.persistent_map import TransientMap
+from lispy.persistent_vector import TransientVector
+from lispy.utils import run_lispy_string
+
+
+class TransientFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_transient_of_vector(self):
+        result = run_lispy_string("(transient [1 2 3])", self.env)
+        self.assertIsInstance(result, TransientVector)
+        self.assertEqual(len(result), 3)
+
+    def test_transient_of_map(self):
+        result = run_lispy_string("(transient {:a 1})", self.env)
+        self.assertIsInstance(result, TransientMap)
+
+    def test_count_of_transient(self):
+        result = run_lispy_string("(count (conj! (transient [1]) 2 3))", self.env)
+        self.assertEqual(result, 3)
+
+    def test_original_is_unchanged(self):
+        run_lispy_string("(define v [1 2 3])", self.env)
+        run_lispy_string("(persistent! (assoc! (conj! (transient v) 4) 0 ':x))", self.env)
+        self.assertEqual(run_lispy_string("v", self.env), [1, 2, 3])
+
+    def test_transient_invalid_type(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: 'transient' expects a vector or map"
+        ):
+            run_lispy_string("(transient '(1 2))", self.env)
+
+    def test_transient_arity(self):
+        with self.assertRaisesRegex(
+            EvaluationError, "SyntaxError: 'transient' expects 1 argument, got 0."
+        ):
+            run_lispy_string("(transient)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class IsSetQFnTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_set(self):
+        self.assertTrue(run_lispy_string("(is-set? (hash-set 1))", self.env))
+        self.assertTrue(run_lispy_string("(is-set? (hash-set))", self.env))
+
+    def test_not_a_set(self):
+        self.assertFalse(run_lispy_string("(is-set? [1])", self.env))
+        self.assertFalse(run_lispy_string("(is-set? {:a 1})", self.env))
+        self.assertFalse(run_lispy_string("(is-set? nil)", self.env))
+
+    def test_arity(self):
+        with self.assertRaisesRegex(EvaluationError, "expects 1 argument, got 0"):
+            run_lispy_string("(is-set?)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -138,6 +138,19 @@ class TestWebIntegration(unittest.TestCase):
         self.assertIn("message", body)
         self.assertIn("Hello World", body)
 
+    def test_response_formatting_from_map_literal(self):
+        """Test formatting a response built from LisPy map literals."""
+        response_data = run_lispy_string(
+            '(assoc {:status 200 :body {"message" "Hello" "items" [1 2]}} \':headers {:x-id "7"})',
+            self.env,
+        )
+
+        status, headers, body = format_response(response_data)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["X-Id"], "7")
+        self.assertEqual(json.loads(body), {"message": "Hello", "items": [1, 2]})
+
     def test_response_auto_content_type(self):
         """Test automatic content type detection."""
         # Test HTML detection
@@ -219,6 +232,37 @@ class TestWebIntegration(unittest.TestCase):
         response_data = json.loads(body_response)
         self.assertEqual(response_data["echoed"]["message"], "Hello from client")
 
+    def test_app_request_handling_with_binary_body(self):
+        """Test that a raw request body is available as bytes."""
+        code = """
+        (let [app (web-app)]
+          (route app "POST" "/upload"
+                 (fn [request]
+                   (let [data (get request ':body-bytes)]
+                     {:status 200
+                      :headers {:content-type "application/json"}
+                      :body (json-encode {:size (count data)
+                                          :first (byte-at data 0)
+                                          :text (get request ':body)})})))
+          app)
+        """
+        app = run_lispy_string(code, self.env)
+
+        status, response_headers, body_response = app.handle_request(
+            method="POST",
+            path="/upload",
+            headers={"Content-Type": "application/octet-stream"},
+            body=b"\xff\x00\x10",
+            client_address=("127.0.0.1", 12345),
+            env=self.env,
+        )
+
+        self.assertEqual(status, 200)
+        response_data = json.loads(body_response)
+        self.assertEqual(response_data["size"], 3)
+        self.assertEqual(response_data["first"], 255)
+        self.assertIsNone(response_data["text"])
+
     def test_app_request_handling_with_params(self):
         """Test request handling with URL parameters."""
         code = """
@@ -170,6 +170,15 @@ class WebSafeEnvironmentTest(unittest.TestCase):
             "slurp",
             "spit",
             "read-line",
+            "open-file",
+            "line-seq",
+            "read-chunks",
+            "csv-read",
+            "csv-write",
+            "json-write",
+            "ndjson-read",
+            "ndjson-write",
+            "mmap-file",
             "http-delete",
             "http-get",
             "http-post",
@@ -180,6 +189,8 @@ class WebSafeEnvironmentTest(unittest.TestCase):
             "middleware",
             "start-server",
             "stop-server",
+            "save-image",
+            "load-image",
         }
         actual_unsafe = set(unsafe_functions.keys())
 
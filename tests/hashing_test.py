@@ -0,0 +1,62 @@
+import unittest
+
+from lispy.functions import create_global_env
+from lispy.functions.logical.equal_q import _are_equal
+from lispy.persistent_list import PersistentList
+from lispy.persistent_map import PersistentMap
+from lispy.persistent_vector import PersistentVector
+from lispy.types import Symbol, Vector
+from lispy.utils import run_lispy_string
+
+
+class StructuralHashTest(unittest.TestCase):
+    def test_equal_collections_hash_equal(self):
+        self.assertEqual(hash(PersistentVector([1, 2])), hash(Vector([1, 2])))
+        self.assertEqual(hash(PersistentVector([1, 2])), hash(PersistentList([1, 2])))
+        self.assertEqual(
+            hash(PersistentMap({"a": 1, "b": 2})), hash(PersistentMap({"b": 2, "a": 1}))
+        )
+        self.assertEqual(hash(PersistentVector([1])), hash(PersistentVector([1.0])))
+
+    def test_large_map_hash_matches_small_map_hash(self):
+        items = [(index, index * 2) for index in range(100)]
+        self.assertEqual(
+            hash(PersistentMap(items)), hash(PersistentMap(reversed(items)))
+        )
+
+    def test_hash_is_cached(self):
+        vector = PersistentVector(range(100))
+        self.assertIsNone(vector._hash)
+        value = hash(vector)
+        self.assertEqual(vector._hash, value)
+        self.assertIsNone(vector.conj(100)._hash)
+
+    def test_unhashable_element_raises(self):
+        with self.assertRaises(TypeError):
+            hash(PersistentVector([{"a": 1}]))
+
+    def test_nested_collections_as_dict_keys(self):
+        key = PersistentVector([PersistentMap({Symbol(":x"): 1}), PersistentList([2])])
+        table = {key: "found"}
+        self.assertEqual(
+            table[PersistentVector([PersistentMap({Symbol(":x"): 1}), Vector([2])])],
+            "found",
+        )
+
+    def test_different_cached_hashes_short_circuit_equality(self):
+        first = PersistentVector(range(1000))
+        second = PersistentVector(list(range(999)) + [-1])
+        hash(first), hash(second)
+        self.assertNotEqual(first, second)
+        self.assertFalse(_are_equal(first, second))
+
+    def test_equal_q_with_cached_hashes(self):
+        env = create_global_env()
+        env.define("a", PersistentMap({Symbol(":k"): PersistentVector([1, 2])}))
+        env.define("b", PersistentMap({Symbol(":k"): PersistentVector([1, 2])}))
+        hash(env.lookup("a")), hash(env.lookup("b"))
+        self.assertTrue(run_lispy_string("(equal? a b)", env))
+
+
+if __name__ == "__main__":
+    unittest.main()
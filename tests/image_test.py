@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from lispy.environment import Environment
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.image import (load_image, restore_image_into, root_environment,
+                         save_image)
+from lispy.lazy_seq import LazySeq
+from lispy.module_system import get_module_loader
+from lispy.utils import run_lispy_string
+
+
+class ImageTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_path = os.path.join(self.temp_dir, "app.img")
+        self.env = create_global_env()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_root_environment(self):
+        inner = Environment(outer=Environment(outer=self.env))
+        self.assertIs(root_environment(inner), self.env)
+
+    def test_save_and_load_round_trip(self):
+        run_lispy_string("(define square (fn [x] (* x x)))", self.env)
+        save_image(self.env, self.image_path)
+
+        image = load_image(self.image_path)
+        self.assertEqual(run_lispy_string("(square 7)", image.env), 49)
+
+    def test_save_and_load_custom_ordered_collections(self):
+        run_lispy_string("(define by-length (fn [a b] (< (count a) (count b))))", self.env)
+        run_lispy_string('(define words (sorted-set-by by-length "ccc" "a" "bb"))', self.env)
+        run_lispy_string('(define scores (sorted-map-by (fn [a b] (- b a)) 1 "low" 3 "high"))', self.env)
+        save_image(self.env, self.image_path)
+
+        image = load_image(self.image_path)
+        result = run_lispy_string('(conj words "dddd" "")', image.env)
+        self.assertEqual(list(result), ["", "a", "bb", "ccc", "dddd"])
+        result = run_lispy_string('(first (assoc scores 2 "mid"))', image.env)
+        self.assertEqual(list(result), [3, "high"])
+        self.assertEqual(len(run_lispy_string('(assoc scores 2 "mid")', image.env)), 3)
+
+    def test_saving_from_nested_environment_saves_root(self):
+        run_lispy_string("(define answer 42)", self.env)
+        save_image(Environment(outer=self.env), self.image_path)
+
+        image = load_image(self.image_path)
+        self.assertEqual(image.env.lookup("answer"), 42)
+
+    def test_restore_image_into_shares_bindings(self):
+        run_lispy_string("(define base 1)", self.env)
+        run_lispy_string("(define add-base (fn [x] (+ x base)))", self.env)
+        save_image(self.env, self.image_path)
+
+        target = create_global_env()
+        restore_image_into(target, self.image_path)
+        run_lispy_string("(define base 10)", target)
+        self.assertEqual(run_lispy_string("(add-base 1)", target), 11)
+
+    def test_load_image_merges_module_cache(self):
+        loader = get_module_loader()
+        loader.cache["image-test-module"] = "cached"
+        try:
+            save_image(self.env, self.image_path)
+            del loader.cache["image-test-module"]
+            image = load_image(self.image_path)
+            self.assertEqual(loader.cache["image-test-module"], "cached")
+            self.assertIn("image-test-module", image.module_cache)
+        finally:
+            loader.cache.pop("image-test-module", None)
+
+    def test_failed_save_keeps_existing_image(self):
+        run_lispy_string("(define answer 42)", self.env)
+        save_image(self.env, self.image_path)
+        self.env.define("pending", LazySeq.from_iterable(iter(range(10))))
+        with self.assertRaisesRegex(EvaluationError, "cannot be serialized"):
+            save_image(self.env, self.image_path)
+
+        self.assertEqual(os.listdir(self.temp_dir), ["app.img"])
+        restored = load_image(self.image_path)
+        self.assertEqual(restored.env.lookup("answer"), 42)
+
+    def test_load_rejects_other_pickles(self):
+        import pickle
+
+        with open(self.image_path, "wb") as f:
+            pickle.dump({"format": "something-else"}, f)
+        with self.assertRaisesRegex(EvaluationError, "is not a LisPy image"):
+            load_image(self.image_path)
+
+    def test_load_rejects_other_versions(self):
+        import pickle
+
+        with open(self.image_path, "wb") as f:
+            pickle.dump({"format": "lispy-image", "version": 999}, f)
+        with self.assertRaisesRegex(EvaluationError, "image version 999"):
+            load_image(self.image_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
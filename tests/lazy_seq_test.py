@@ -0,0 +1,98 @@
+import itertools
+import unittest
+import weakref
+
+from lispy.lazy_seq import CHUNK_SIZE, EMPTY_SEQ, LazySeq, lazy_seq
+
+
+class CountingIterable:
+    """Iterable that records how many items have been pulled from it."""
+
+    def __init__(self, items):
+        self.items = items
+        self.pulled = 0
+
+    def __iter__(self):
+        for item in self.items:
+            self.pulled += 1
+            yield item
+
+
+class Item:
+    """A weakly referenceable element, to observe when elements are freed."""
+
+
+def tracked_items(count, refs):
+    for _ in range(count):
+        item = Item()
+        refs.append(weakref.ref(item))
+        yield item
+
+
+class LazySeqTest(unittest.TestCase):
+    def test_realizes_one_chunk_at_a_time(self):
+        source = CountingIterable(itertools.count())
+        seq = LazySeq.from_iterable(source)
+        self.assertEqual(source.pulled, 0)
+        self.assertEqual(seq.first(), 0)
+        self.assertEqual(source.pulled, CHUNK_SIZE)
+        rest = seq
+        for _ in range(CHUNK_SIZE):
+            rest = rest.rest()
+        self.assertEqual(source.pulled, CHUNK_SIZE)
+        self.assertEqual(rest.first(), CHUNK_SIZE)
+        self.assertEqual(source.pulled, 2 * CHUNK_SIZE)
+
+    def test_elements_are_cached(self):
+        calls = []
+
+        def thunk():
+            calls.append(1)
+            return [1, 2, 3]
+
+        seq = LazySeq(thunk)
+        self.assertEqual(list(seq), [1, 2, 3])
+        self.assertEqual(list(seq), [1, 2, 3])
+        self.assertEqual(len(calls), 1)
+
+    def test_rest_and_first(self):
+        seq = lazy_seq(range(70))
+        self.assertEqual(seq.rest().first(), 1)
+        self.assertEqual(list(seq.rest()), list(range(1, 70)))
+        self.assertIs(EMPTY_SEQ.rest(), EMPTY_SEQ)
+        self.assertIsNone(EMPTY_SEQ.first())
+
+    def test_thunk_returning_sequences(self):
+        self.assertEqual(list(LazySeq(lambda: None)), [])
+        self.assertEqual(list(LazySeq(lambda: lazy_seq([1, 2]))), [1, 2])
+        self.assertTrue(LazySeq(lambda: []).is_empty())
+
+    def test_cons_does_not_realize(self):
+        calls = []
+        tail = LazySeq(lambda: calls.append(1) or [2, 3])
+        seq = tail.cons(1)
+        self.assertEqual(seq.first(), 1)
+        self.assertEqual(calls, [])
+        self.assertEqual(list(seq), [1, 2, 3])
+
+    def test_equality_and_repr(self):
+        self.assertEqual(lazy_seq([1, 2]), [1, 2])
+        self.assertNotEqual(lazy_seq([1, 2]), [1, 2, 3])
+        self.assertEqual(lazy_seq([1]), lazy_seq([1]))
+        self.assertEqual(repr(lazy_seq([1, 2])), "(1 2)")
+
+    def test_chunks(self):
+        chunks = list(lazy_seq(range(70)).chunks())
+        self.assertEqual([len(chunk) for chunk in chunks], [32, 32, 6])
+
+    def test_iteration_does_not_keep_the_head(self):
+        refs = []
+        iterator = iter(LazySeq.from_iterable(tracked_items(4 * CHUNK_SIZE, refs)))
+        for _ in range(3 * CHUNK_SIZE):
+            next(iterator)
+        self.assertIsNone(refs[0]())
+        self.assertIsNotNone(refs[-1]())
+
+
+if __name__ == "__main__":
+    unittest.main()
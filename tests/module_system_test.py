@@ -112,6 +112,35 @@ class ModuleSystemTest(unittest.TestCase):
         # Should be the same instance
         self.assertIs(module1, module2)
 
+    def test_module_constant_pool_stats(self):
+        """Test that repeated literals in a module share one object."""
+        content = """
+        (define rows [{:unit "ms" :value 1.5} {:unit "ms" :value 1.5}])
+        (export rows)
+        """
+        self.create_test_module("pooled", content)
+
+        module = self.loader.load_module("pooled", evaluate)
+
+        rows = module.env.lookup("rows")
+        self.assertIs(rows[0], rows[1])
+        self.assertGreater(module.constant_pool_stats["duplicates"], 0)
+        self.assertGreater(module.constant_pool_stats["bytes_saved"], 0)
+
+    def test_module_without_constant_pool(self):
+        """Test that the constant pool can be turned off."""
+        self.create_test_module("unpooled", "(define rows [[1.5] [1.5]])")
+        self.loader.use_constant_pool = False
+        try:
+            module = self.loader.load_module("unpooled", evaluate)
+        finally:
+            self.loader.use_constant_pool = True
+
+        rows = module.env.lookup("rows")
+        self.assertEqual(rows[0], rows[1])
+        self.assertIsNot(rows[0], rows[1])
+        self.assertIsNone(module.constant_pool_stats)
+
     def test_circular_dependency_detection(self):
         """Test detection of circular dependencies."""
         # Create modules with circular dependency
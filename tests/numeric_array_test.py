@@ -0,0 +1,112 @@
+import unittest
+from unittest import mock
+
+from lispy.numeric_array import NumericArray
+from lispy.persistent_vector import PersistentVector
+
+
+class NumericArrayTest(unittest.TestCase):
+    def test_from_values(self):
+        doubles = NumericArray.from_values([1, 2.5], "double")
+        self.assertEqual(doubles.kind, "double")
+        self.assertEqual(doubles.to_list(), [1.0, 2.5])
+        ints = NumericArray.from_values(iter([1, 2]), "int")
+        self.assertEqual(ints.to_list(), [1, 2])
+
+    def test_from_persistent_vector(self):
+        # array() must not read the (empty) list storage of a PersistentVector
+        vector = PersistentVector(range(100))
+        self.assertEqual(NumericArray.from_values(vector, "int").to_list(), list(range(100)))
+
+    def test_from_values_rejects_bad_elements(self):
+        with self.assertRaises(TypeError):
+            NumericArray.from_values([1.5], "int")
+        with self.assertRaises(TypeError):
+            NumericArray.from_values(["a"], "double")
+        with self.assertRaises(OverflowError):
+            NumericArray.from_values([2**64], "int")
+
+    def test_from_values_converts_kind(self):
+        ints = NumericArray.from_values([1, 2], "int")
+        self.assertIs(NumericArray.from_values(ints, "int"), ints)
+        self.assertEqual(NumericArray.from_values(ints, "double").to_list(), [1.0, 2.0])
+
+    def test_elementwise(self):
+        a = NumericArray.from_values([1, 2, 3], "int")
+        b = NumericArray.from_values([0.5, 0.5, 0.5], "double")
+        self.assertEqual(a.add(a), NumericArray.from_values([2, 4, 6], "int"))
+        self.assertEqual(a.add(b).kind, "double")
+        self.assertEqual(a.multiply(2).to_list(), [2, 4, 6])
+        self.assertEqual(a.multiply(0.5).kind, "double")
+        with self.assertRaises(ValueError):
+            a.add(NumericArray.from_values([1], "int"))
+
+    def test_aggregates(self):
+        a = NumericArray.from_values([3, 1, 2], "int")
+        self.assertEqual(a.sum(), 6)
+        self.assertEqual(a.mean(), 2.0)
+        self.assertEqual(a.min(), 1)
+        self.assertEqual(a.max(), 3)
+        self.assertEqual(a.dot(a), 14)
+        self.assertIsInstance(NumericArray.from_values([], "double").sum(), float)
+
+    def test_aggregates_of_empty_array(self):
+        empty = NumericArray.from_values([], "int")
+        self.assertEqual(empty.sum(), 0)
+        for method in (empty.mean, empty.min, empty.max):
+            with self.assertRaises(ValueError):
+                method()
+
+    def test_int_overflow(self):
+        # Both backends raise for results outside 64 bits and sum exactly
+        big = NumericArray.from_values([2**62, 2**62], "int")
+        with self.assertRaises(OverflowError):
+            big.add(big)
+        with self.assertRaises(OverflowError):
+            big.multiply(2)
+        with self.assertRaises(OverflowError):
+            big.map_vectorized(lambda x: x * x, "int")
+        self.assertEqual(big.multiply(-2).to_list(), [-(2**63), -(2**63)])
+        self.assertEqual(big.sum(), 2**63)
+        self.assertEqual(big.dot(big), 2**125)
+        self.assertEqual(NumericArray.from_values([0], "int").multiply(2**70).to_list(), [0])
+        self.assertEqual(list(big.mask(lambda x: x * x > 0)), [True, True])
+
+    def test_map_vectorized(self):
+        a = NumericArray.from_values([1, 2], "int")
+        result = a.map_vectorized(lambda x: x * 0.5, "double")
+        self.assertEqual(result, NumericArray.from_values([0.5, 1.0], "double"))
+
+    def test_row_selection(self):
+        a = NumericArray.from_values([5, 3, 9, 3], "int")
+        self.assertEqual(a.take([2, 0]).to_list(), [9, 5])
+        self.assertEqual(a.compress([True, False, True, False]).to_list(), [5, 9])
+        self.assertEqual(list(a.mask(lambda x: x > 4)), [True, False, True, False])
+
+    def test_argsort_is_stable(self):
+        a = NumericArray.from_values([5, 3, 9, 3], "int")
+        self.assertEqual(list(a.argsort()), [1, 3, 0, 2])
+        self.assertEqual(list(a.argsort(descending=True)), [2, 0, 1, 3])
+
+    def test_protocols(self):
+        a = NumericArray.from_values([1, 2], "int")
+        self.assertEqual(len(a), 2)
+        self.assertEqual(list(a), [1, 2])
+        self.assertEqual(a[1], 2)
+        self.assertNotEqual(a, NumericArray.from_values([1, 2], "double"))
+        self.assertEqual(repr(a), "#<int-array [1 2]>")
+        with self.assertRaises(TypeError):
+            hash(a)
+
+
+class NumericArrayFallbackTest(NumericArrayTest):
+    """The same tests on the array.array backend used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch("lispy.numeric_array.np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,14 @@
 import unittest
 
+from lispy.constant_pool import ConstantPool
 from lispy.exceptions import ParseError
 from lispy.lexer import (TOKEN_BOOLEAN, TOKEN_LBRACE, TOKEN_LBRACKET,
                          TOKEN_LPAREN, TOKEN_NIL, TOKEN_NUMBER, TOKEN_QUOTE,
                          TOKEN_RBRACE, TOKEN_RBRACKET, TOKEN_RPAREN,
-                         TOKEN_STRING, TOKEN_SYMBOL)
+                         TOKEN_STRING, TOKEN_SYMBOL, tokenize)
 from lispy.parser import parse
-from lispy.types import Symbol
+from lispy.persistent_map import PersistentMap
+from lispy.types import LispyMapLiteral, Symbol
 
 
 class ParserTest(unittest.TestCase):
@@ -365,8 +367,6 @@ class ParserTest(unittest.TestCase):
     # --- Integration Tests for Comma Support ---
     def test_parse_vector_with_commas_integration(self):
         """Integration test: lexer + parser with comma-separated vectors."""
-        from lispy.lexer import tokenize
-
         source_code = "[1, 2, 3]"
         tokens = tokenize(source_code)
         result = parse(tokens)
@@ -374,8 +374,6 @@ class ParserTest(unittest.TestCase):
 
     def test_parse_map_with_commas_integration(self):
         """Integration test: lexer + parser with comma-separated maps."""
-        from lispy.lexer import tokenize
-
         source_code = "{:a 1, :b 2}"
         tokens = tokenize(source_code)
         result = parse(tokens)
@@ -384,8 +382,6 @@ class ParserTest(unittest.TestCase):
 
     def test_parse_nested_structures_with_commas_integration(self):
         """Integration test: lexer + parser with comma-separated nested structures."""
-        from lispy.lexer import tokenize
-
         source_code = "{:data [1, 2, 3], :nested {:x 10, :y 20}}"
         tokens = tokenize(source_code)
         result = parse(tokens)
@@ -396,5 +392,33 @@ class ParserTest(unittest.TestCase):
         self.assertEqual(result, expected_map)
 
 
+class ParserConstantPoolTest(unittest.TestCase):
+    def parse_pooled(self, source):
+        return parse(tokenize(source), ConstantPool())
+
+    def test_pooled_parse_equals_unpooled_parse(self):
+        source = '(define rows [[1 2.5 "x"] {:a 1 :b [:c]} {:a (+ 1 2)} (f x)])'
+        self.assertEqual(self.parse_pooled(source), parse(tokenize(source)))
+
+    def test_equal_vectors_are_shared(self):
+        result = self.parse_pooled('[[1 "a" :k] [1 "a" :k] [x 1] [x 1]]')
+        self.assertIs(result[0], result[1])
+        self.assertIsNot(result[2], result[3])  # Contain a symbol, so code
+
+    def test_constant_map_literal_is_prebuilt(self):
+        result = self.parse_pooled("[{:a 1} {:a 1} {:a x} {:a :b}]")
+        self.assertIsInstance(result[0], PersistentMap)
+        self.assertIs(result[0], result[1])
+        self.assertIsInstance(result[2], LispyMapLiteral)
+        self.assertIsInstance(result[3], LispyMapLiteral)
+
+    def test_different_types_are_not_merged(self):
+        result = self.parse_pooled("[[1] [1.0] [true] [0.0] [-0.0]]")
+        self.assertEqual(len({id(vector) for vector in result}), 5)
+        self.assertIs(type(result[0][0]), int)
+        self.assertIs(type(result[1][0]), float)
+        self.assertIs(type(result[2][0]), bool)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+import copy
+import json
+import pickle
+import unittest
+
+from lispy.persistent_list import EMPTY_LIST, PersistentList, persistent_list
+from lispy.types import LispyList
+
+
+class PersistentListTest(unittest.TestCase):
+    def test_build_from_items(self):
+        for size in (0, 1, 2, 100):
+            result = PersistentList(range(size))
+            self.assertEqual(len(result), size)
+            self.assertEqual(list(result), list(range(size)))
+
+    def test_cons_shares_tail(self):
+        tail = PersistentList([2, 3])
+        result = tail.cons(1)
+        self.assertEqual(result, [1, 2, 3])
+        self.assertIs(result.rest(), tail)
+        self.assertEqual(tail, [2, 3])
+
+    def test_first_and_rest(self):
+        result = PersistentList([1, 2, 3])
+        self.assertEqual(result.first(), 1)
+        self.assertEqual(result.rest(), [2, 3])
+        self.assertEqual(result.rest().rest().rest(), [])
+        self.assertIs(EMPTY_LIST.rest(), EMPTY_LIST)
+        self.assertIsNone(EMPTY_LIST.first())
+
+    def test_long_chains(self):
+        result = EMPTY_LIST
+        for i in range(100000):
+            result = result.cons(i)
+        self.assertEqual(len(result), 100000)
+        self.assertEqual(sum(result), sum(range(100000)))
+        self.assertEqual(pickle.loads(pickle.dumps(result))[0], 99999)
+
+    def test_indexing_and_slicing(self):
+        result = PersistentList([10, 20, 30])
+        self.assertEqual(result[0], 10)
+        self.assertEqual(result[2], 30)
+        self.assertEqual(result[-1], 30)
+        self.assertIs(result[1:], result.rest())
+        self.assertEqual(result[::-1], [30, 20, 10])
+        with self.assertRaises(IndexError):
+            result[3]
+
+    def test_is_a_lispy_list_and_compares_like_one(self):
+        result = PersistentList([1, 2])
+        self.assertIsInstance(result, LispyList)
+        self.assertEqual(result, LispyList([1, 2]))
+        self.assertEqual(LispyList([1, 2]), result)
+        self.assertNotEqual(result, [1])
+        self.assertEqual(repr(result), "(1 2)")
+
+    def test_python_sequence_protocols(self):
+        result = PersistentList(["a", "b"])
+        self.assertIn("b", result)
+        self.assertEqual(list(reversed(result)), ["b", "a"])
+        self.assertEqual("".join(result), "ab")
+        self.assertEqual(json.dumps(result), '["a", "b"]')
+        self.assertEqual(result + ["c"], ["a", "b", "c"])
+        self.assertEqual(copy.deepcopy(result), result)
+        self.assertFalse(EMPTY_LIST)
+
+    def test_mutation_is_rejected(self):
+        with self.assertRaises(TypeError):
+            PersistentList([1]).append(2)
+
+    def test_persistent_list_helper(self):
+        result = PersistentList([1])
+        self.assertIs(persistent_list(result), result)
+        self.assertEqual(persistent_list(LispyList([1, 2])), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import copy
+import json
+import pickle
+import random
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.persistent_map import (EMPTY_MAP, SMALL_MAP_LIMIT, PersistentMap,
+                                  TransientMap, persistent_map)
+from lispy.types import Symbol
+
+
+class CollidingKey:
+    """Key whose hash always collides with other CollidingKeys."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+
+class PersistentMapTest(unittest.TestCase):
+    def test_small_and_large_maps_behave_like_dicts(self):
+        for size in (0, 1, SMALL_MAP_LIMIT, SMALL_MAP_LIMIT + 1, 5000):
+            expected = {f"k{i}": i for i in range(size)}
+            result = PersistentMap(expected)
+            self.assertEqual(len(result), size)
+            self.assertEqual(list(result.items()), list(expected.items()))
+            self.assertEqual(result, expected)
+            for key in list(expected)[:50]:
+                self.assertEqual(result[key], expected[key])
+
+    def test_assoc_and_dissoc_match_dict_semantics(self):
+        rng = random.Random(7)
+        expected = {}
+        result = EMPTY_MAP
+        snapshots = []
+        for step in range(20000):
+            key = rng.randrange(2000)
+            if rng.random() < 0.3:
+                expected.pop(key, None)
+                result = result.dissoc(key)
+            else:
+                expected[key] = step
+                result = result.assoc(key, step)
+            if step % 2000 == 0:
+                snapshots.append((result, dict(expected)))
+        self.assertEqual(list(result.items()), list(expected.items()))
+        for snapshot, snapshot_expected in snapshots:
+            self.assertEqual(list(snapshot.items()), list(snapshot_expected.items()))
+
+    def test_earlier_versions_are_unchanged(self):
+        base = PersistentMap((i, i) for i in range(100))
+        updated = base.assoc(5, "five").dissoc(6).assoc("new", 1)
+        self.assertEqual(base[5], 5)
+        self.assertIn(6, base)
+        self.assertNotIn("new", base)
+        self.assertEqual(updated[5], "five")
+        self.assertNotIn(6, updated)
+
+    def test_updating_keeps_insertion_order(self):
+        result = PersistentMap((i, i) for i in range(50)).assoc(0, "first")
+        self.assertEqual(list(result)[:2], [0, 1])
+        self.assertEqual(list(result.dissoc(0).assoc(0, 0))[-1], 0)
+
+    def test_assoc_same_value_returns_same_map(self):
+        value = object()
+        result = PersistentMap((i, i) for i in range(100)).assoc("x", value)
+        self.assertIs(result.assoc("x", value), result)
+
+    def test_hash_collisions(self):
+        keys = [CollidingKey(i) for i in range(40)]
+        result = EMPTY_MAP
+        for i, key in enumerate(keys):
+            result = result.assoc(key, i)
+        result = result.assoc(42, "int")
+        for i, key in enumerate(keys):
+            self.assertEqual(result[key], i)
+        self.assertEqual(result[42], "int")
+        for key in keys[:30]:
+            result = result.dissoc(key)
+        self.assertEqual(len(result), 11)
+        self.assertEqual(result[keys[35]], 35)
+
+    def test_missing_keys(self):
+        result = PersistentMap((i, i) for i in range(100))
+        with self.assertRaises(KeyError):
+            result["missing"]
+        self.assertIsNone(result.get("missing"))
+        self.assertEqual(result.get("missing", 0), 0)
+        self.assertIs(result.dissoc("missing"), result)
+
+    def test_dict_interop(self):
+        for size in (3, 100):
+            data = {f"k{i}": [i] for i in range(size)}
+            result = PersistentMap(data)
+            self.assertIsInstance(result, dict)
+            self.assertEqual(dict(result), data)
+            self.assertEqual({**result}, data)
+            self.assertEqual(json.loads(json.dumps(result)), data)
+            self.assertEqual(json.loads(json.dumps(result, indent=2)), data)
+            self.assertEqual(json.loads(json.dumps({"nested": result})), {"nested": data})
+        self.assertEqual(json.dumps(EMPTY_MAP), "{}")
+        self.assertEqual(json.dumps(PersistentMap(a=1).dissoc("a")), "{}")
+
+    def test_symbol_keys(self):
+        result = PersistentMap({Symbol(":a"): 1}).assoc(Symbol(":b"), 2)
+        self.assertEqual(result, {Symbol(":a"): 1, Symbol(":b"): 2})
+
+    def test_pickle_and_copy(self):
+        result = PersistentMap((i, str(i)) for i in range(100))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+        self.assertEqual(copy.deepcopy(result), result)
+        self.assertEqual(result.copy(), result)
+
+    def test_mutation_is_rejected(self):
+        result = PersistentMap(a=1)
+        with self.assertRaises(TypeError):
+            result["b"] = 2
+        with self.assertRaises(TypeError):
+            result.update({"b": 2})
+
+    def test_persistent_map_helper(self):
+        result = PersistentMap(a=1)
+        self.assertIs(persistent_map(result), result)
+        self.assertEqual(persistent_map({"a": 1}), result)
+
+
+class TransientMapTest(unittest.TestCase):
+    def test_growing_past_small_limit(self):
+        transient = EMPTY_MAP.transient()
+        for i in range(SMALL_MAP_LIMIT * 10):
+            transient.assoc(i, str(i))
+        result = transient.persistent()
+        expected = {i: str(i) for i in range(SMALL_MAP_LIMIT * 10)}
+        self.assertEqual(dict(result), expected)
+        self.assertEqual(list(result), list(range(SMALL_MAP_LIMIT * 10)))
+
+    def test_matches_dict_semantics_and_leaves_source_unchanged(self):
+        rng = random.Random(7)
+        for size in (0, 5, SMALL_MAP_LIMIT, 500):
+            source = PersistentMap((i, i) for i in range(size))
+            transient = source.transient()
+            expected = dict(source)
+            for step in range(1000):
+                key = rng.randrange(800)
+                transient.assoc(key, -step)
+                expected[key] = -step
+            self.assertEqual(len(transient), len(expected))
+            result = transient.persistent()
+            self.assertEqual(dict(result), expected)
+            self.assertEqual(list(result), list(expected))
+            self.assertEqual(dict(source), {i: i for i in range(size)})
+
+    def test_hash_collisions(self):
+        transient = PersistentMap((i, i) for i in range(100)).transient()
+        transient.assoc(CollidingKey("a"), 1).assoc(CollidingKey("b"), 2)
+        result = transient.persistent()
+        self.assertEqual(result[CollidingKey("a")], 1)
+        self.assertEqual(result[CollidingKey("b")], 2)
+
+    def test_frozen_result_is_persistent(self):
+        result = TransientMap((i, i) for i in range(100)).persistent()
+        updated = result.assoc(1, "one")
+        self.assertEqual(result[1], 1)
+        self.assertEqual(updated[1], "one")
+
+    def test_read_access(self):
+        transient = TransientMap({"a": 1})
+        self.assertEqual(transient["a"], 1)
+        self.assertIn("a", transient)
+        self.assertIsNone(transient.get("b"))
+        with self.assertRaises(KeyError):
+            transient["b"]
+
+    def test_use_after_persistent_is_rejected(self):
+        transient = EMPTY_MAP.transient()
+        transient.persistent()
+        for use in (
+            lambda: transient.assoc("a", 1),
+            lambda: transient.get("a"),
+            transient.persistent,
+        ):
+            with self.assertRaises(EvaluationError):
+                use()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import pickle
+import unittest
+
+from lispy.persistent_set import EMPTY_SET, PersistentSet, persistent_set
+from lispy.persistent_vector import PersistentVector
+from lispy.types import Symbol
+
+
+class PersistentSetTest(unittest.TestCase):
+    def test_duplicates_are_kept_once_in_insertion_order(self):
+        result = PersistentSet([3, 1, 3, 2, 1])
+        self.assertEqual(list(result), [3, 1, 2])
+        self.assertEqual(len(result), 3)
+
+    def test_conj_and_disj_leave_original_unchanged(self):
+        original = PersistentSet([1, 2])
+        added = original.conj(3)
+        removed = original.disj(1)
+        self.assertEqual(list(original), [1, 2])
+        self.assertEqual(list(added), [1, 2, 3])
+        self.assertEqual(list(removed), [2])
+
+    def test_conj_existing_and_disj_missing_return_same_set(self):
+        original = PersistentSet([1, 2])
+        self.assertIs(original.conj(1), original)
+        self.assertIs(original.disj(5), original)
+        self.assertIs(original.conj_all([2, 1]), original)
+
+    def test_large_set(self):
+        numbers = PersistentSet(range(10_000))
+        self.assertEqual(len(numbers), 10_000)
+        self.assertIn(9_999, numbers)
+        self.assertNotIn(10_000, numbers)
+        self.assertEqual(len(numbers.disj(5)), 9_999)
+
+    def test_set_algebra(self):
+        first, second = PersistentSet([1, 2, 3]), PersistentSet([2, 3, 4])
+        self.assertEqual(first.union(second), PersistentSet([1, 2, 3, 4]))
+        self.assertEqual(first.intersection(second), PersistentSet([2, 3]))
+        self.assertEqual(first.difference(second), PersistentSet([1]))
+        self.assertEqual(
+            PersistentSet(range(100)).difference(PersistentSet([5])),
+            PersistentSet(i for i in range(100) if i != 5),
+        )
+
+    def test_equality_and_hash_ignore_order(self):
+        first, second = PersistentSet([1, 2, 3]), PersistentSet([3, 2, 1])
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, PersistentSet([1, 2]))
+        self.assertNotEqual(first, [1, 2, 3])
+
+    def test_structural_elements(self):
+        result = PersistentSet([PersistentVector([1, 2]), Symbol(":a")])
+        self.assertIn(PersistentVector([1, 2]), result)
+        self.assertIn(Symbol(":a"), result)
+        self.assertNotIn({"unhashable": 1}, result)
+
+    def test_repr(self):
+        self.assertEqual(repr(PersistentSet([1, Symbol(":a")])), "#{1 Symbol(':a')}")
+        self.assertEqual(repr(EMPTY_SET), "#{}")
+
+    def test_persistent_set_reuses_set(self):
+        original = PersistentSet([1])
+        self.assertIs(persistent_set(original), original)
+
+    def test_pickle_round_trip(self):
+        original = PersistentSet([1, "a"])
+        self.assertEqual(pickle.loads(pickle.dumps(original)), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import pickle
+import random
+import unittest
+
+from lispy.persistent_map import PersistentMap
+from lispy.persistent_set import PersistentSet
+from lispy.persistent_sorted_map import (PersistentSortedMap, natural_compare,
+                                         reverse_compare)
+from lispy.persistent_sorted_set import PersistentSortedSet
+from lispy.types import Symbol
+
+
+def _depth(node):
+    if node is None:
+        return 0
+    return 1 + max(_depth(node.left), _depth(node.right))
+
+
+class PersistentSortedMapTest(unittest.TestCase):
+    def test_keys_are_in_order(self):
+        result = PersistentSortedMap({3: "c", 1: "a", 2: "b"})
+        self.assertEqual(list(result), [1, 2, 3])
+        self.assertEqual(list(result.values()), ["a", "b", "c"])
+        self.assertEqual(list(reversed(result)), [3, 2, 1])
+
+    def test_duplicate_keys_keep_last_value(self):
+        result = PersistentSortedMap([(1, "a"), (2, "b"), (1, "c")])
+        self.assertEqual(list(result.items()), [(1, "c"), (2, "b")])
+
+    def test_random_updates_match_dict_and_stay_balanced(self):
+        rng = random.Random(7)
+        keys = rng.sample(range(10_000), 3_000)
+        result = PersistentSortedMap()
+        expected = {}
+        for key in keys:
+            result = result.assoc(key, key * 2)
+            expected[key] = key * 2
+        for key in keys[:1_500]:
+            result = result.dissoc(key)
+            del expected[key]
+        self.assertEqual(list(result), sorted(expected))
+        self.assertEqual(len(result), len(expected))
+        self.assertTrue(all(result[key] == value for key, value in expected.items()))
+        # An AVL tree is at most about 1.44 log2(n) deep
+        self.assertLessEqual(_depth(result._root), 16)
+
+    def test_updates_leave_earlier_versions_unchanged(self):
+        original = PersistentSortedMap({1: "a", 2: "b"})
+        added = original.assoc(0, "z")
+        removed = original.dissoc(1)
+        self.assertEqual(list(original.items()), [(1, "a"), (2, "b")])
+        self.assertEqual(list(added), [0, 1, 2])
+        self.assertEqual(list(removed), [2])
+
+    def test_no_op_updates_return_same_map(self):
+        original = PersistentSortedMap({1: "a"})
+        self.assertIs(original.dissoc(5), original)
+        self.assertIs(original.assoc(1, "a"), original)
+
+    def test_entries_range(self):
+        result = PersistentSortedMap((key, None) for key in range(0, 100, 10))
+
+        def keys(*args, **kwargs):
+            return [key for key, _ in result.entries(*args, **kwargs)]
+
+        self.assertEqual(keys((30, True), (60, False)), [30, 40, 50])
+        self.assertEqual(keys((30, False), (60, True)), [40, 50, 60])
+        self.assertEqual(keys((35, True)), [40, 50, 60, 70, 80, 90])
+        self.assertEqual(keys(None, (20, True)), [0, 10, 20])
+        self.assertEqual(keys((30, True), (60, True), reverse=True), [60, 50, 40, 30])
+        self.assertEqual(keys(None, (25, False), reverse=True), [20, 10, 0])
+        self.assertEqual(keys((95, True)), [])
+
+    def test_custom_comparator(self):
+        result = PersistentSortedMap({1: "a", 3: "c", 2: "b"}, reverse_compare)
+        self.assertEqual(list(result), [3, 2, 1])
+        self.assertEqual(list(result.assoc(4, "d")), [4, 3, 2, 1])
+        self.assertIs(result.empty().comparator, reverse_compare)
+
+    def test_keywords_compare_by_name(self):
+        self.assertLess(natural_compare(Symbol(":a"), Symbol(":b")), 0)
+        result = PersistentSortedMap({Symbol(":b"): 2, Symbol(":a"): 1})
+        self.assertEqual(list(result), [Symbol(":a"), Symbol(":b")])
+
+    def test_incomparable_keys_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            PersistentSortedMap({1: "a", "b": 2})
+
+    def test_equal_and_hash_like_hash_map(self):
+        result = PersistentSortedMap({2: "b", 1: "a"})
+        self.assertEqual(result, PersistentMap({1: "a", 2: "b"}))
+        self.assertEqual(hash(result), hash(PersistentMap({1: "a", 2: "b"})))
+        self.assertNotEqual(result, {1: "a"})
+
+    def test_immutable(self):
+        result = PersistentSortedMap({1: "a"})
+        with self.assertRaises(TypeError):
+            result[2] = "b"
+
+    def test_pickle_round_trip(self):
+        original = PersistentSortedMap({1: "a", 2: "b"}, reverse_compare)
+        restored = pickle.loads(pickle.dumps(original))
+        self.assertEqual(list(restored.items()), [(2, "b"), (1, "a")])
+
+
+class PersistentSortedSetTest(unittest.TestCase):
+    def test_elements_are_in_order(self):
+        result = PersistentSortedSet([5, 1, 3, 1])
+        self.assertEqual(list(result), [1, 3, 5])
+        self.assertEqual(list(result.conj(2)), [1, 2, 3, 5])
+        self.assertEqual(list(result.disj(3)), [1, 5])
+        self.assertEqual(list(reversed(result)), [5, 3, 1])
+
+    def test_is_a_set(self):
+        result = PersistentSortedSet([3, 1, 2])
+        self.assertIsInstance(result, PersistentSet)
+        self.assertIn(2, result)
+        self.assertEqual(result, PersistentSet([1, 2, 3]))
+        self.assertEqual(hash(result), hash(PersistentSet([1, 2, 3])))
+
+    def test_set_algebra_keeps_sorted_sets(self):
+        result = PersistentSortedSet([3, 1, 2])
+        other = PersistentSet([2, 3, 4])
+        self.assertIsInstance(result.intersection(other), PersistentSortedSet)
+        self.assertEqual(list(result.difference(other)), [1])
+        self.assertEqual(list(result.union(PersistentSet([0]))), [0, 1, 2, 3])
+
+    def test_elements_range(self):
+        result = PersistentSortedSet(range(10))
+        self.assertEqual(list(result.elements((3, True), (6, False))), [3, 4, 5])
+        self.assertEqual(
+            list(result.elements(None, (2, True), reverse=True)), [2, 1, 0]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import copy
+import json
+import pickle
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.persistent_vector import (EMPTY_VECTOR, PersistentVector,
+                                     TransientVector, persistent_vector)
+from lispy.types import Vector
+
+# Sizes around the tail and trie level boundaries (32, 32 * 32, 32 * 32 * 32)
+BOUNDARY_SIZES = [0, 1, 31, 32, 33, 64, 1023, 1024, 1025, 1056, 1057, 32768, 32769, 33000]
+
+
+class PersistentVectorTest(unittest.TestCase):
+    def test_build_from_items(self):
+        for size in BOUNDARY_SIZES:
+            vector = PersistentVector(range(size))
+            self.assertEqual(len(vector), size)
+            self.assertEqual(list(vector), list(range(size)))
+
+    def test_conj_across_boundaries(self):
+        vector = EMPTY_VECTOR
+        for i in range(33000):
+            vector = vector.conj(i)
+            if i + 1 in BOUNDARY_SIZES:
+                self.assertEqual(list(vector), list(range(i + 1)))
+        for i in (0, 31, 32, 1023, 1024, 32767, 32768, 32999):
+            self.assertEqual(vector[i], i)
+
+    def test_conj_after_bulk_build(self):
+        for size in BOUNDARY_SIZES:
+            vector = PersistentVector(range(size)).conj("x")
+            self.assertEqual(list(vector), list(range(size)) + ["x"])
+
+    def test_earlier_versions_are_unchanged(self):
+        base = PersistentVector(range(100))
+        appended = base.conj(100)
+        updated = base.assoc(5, "five")
+        self.assertEqual(list(base), list(range(100)))
+        self.assertEqual(appended[100], 100)
+        self.assertEqual(updated[5], "five")
+        self.assertEqual(base[5], 5)
+
+    def test_assoc_in_trie_and_tail(self):
+        expected = list(range(2000))
+        vector = PersistentVector(expected)
+        for index in (0, 31, 32, 1023, 1024, 1999):
+            vector = vector.assoc(index, -index)
+            expected[index] = -index
+        self.assertEqual(list(vector), expected)
+
+    def test_assoc_at_length_appends(self):
+        self.assertEqual(PersistentVector([1, 2]).assoc(2, 3), [1, 2, 3])
+
+    def test_assoc_out_of_range(self):
+        with self.assertRaises(IndexError):
+            PersistentVector([1, 2]).assoc(3, 0)
+
+    def test_rest_shares_structure(self):
+        vector = PersistentVector(range(100))
+        rest = vector.rest().rest()
+        self.assertIs(rest._root, vector._root)
+        self.assertEqual(list(rest), list(range(2, 100)))
+        self.assertEqual(rest[0], 2)
+        self.assertEqual(rest[-1], 99)
+        self.assertEqual(rest.conj(100)[-1], 100)
+        self.assertEqual(rest.assoc(0, "a")[0], "a")
+        self.assertEqual(PersistentVector([1]).rest(), [])
+
+    def test_indexing_and_slicing(self):
+        vector = PersistentVector(range(100))
+        self.assertEqual(vector[-1], 99)
+        self.assertEqual(vector[10:13], [10, 11, 12])
+        self.assertEqual(vector[1:], list(range(1, 100)))
+        self.assertEqual(vector[::-1][:2], [99, 98])
+        with self.assertRaises(IndexError):
+            vector[100]
+
+    def test_is_a_vector_and_compares_like_one(self):
+        vector = PersistentVector([1, 2, 3])
+        self.assertIsInstance(vector, Vector)
+        self.assertEqual(vector, Vector([1, 2, 3]))
+        self.assertEqual(Vector([1, 2, 3]), vector)
+        self.assertEqual([1, 2, 3], vector)
+        self.assertNotEqual(vector, [1, 2])
+        self.assertEqual(repr(vector), "[1 2 3]")
+
+    def test_python_sequence_protocols(self):
+        vector = PersistentVector(["a", "b", "c"])
+        self.assertIn("b", vector)
+        self.assertEqual(list(reversed(vector)), ["c", "b", "a"])
+        self.assertEqual(",".join(vector), "a,b,c")
+        self.assertEqual(["z"] + vector, ["z", "a", "b", "c"])
+        self.assertEqual(vector + ["d"], ["a", "b", "c", "d"])
+        self.assertEqual(json.dumps(vector), '["a", "b", "c"]')
+        self.assertEqual(vector.index("c"), 2)
+        first, *others = vector
+        self.assertEqual((first, others), ("a", ["b", "c"]))
+        self.assertFalse(EMPTY_VECTOR)
+
+    def test_pickle_and_copy(self):
+        vector = PersistentVector(range(50)).rest()
+        self.assertEqual(pickle.loads(pickle.dumps(vector)), vector)
+        self.assertEqual(copy.deepcopy(vector), vector)
+
+    def test_mutation_is_rejected(self):
+        vector = PersistentVector([1, 2])
+        with self.assertRaises(TypeError):
+            vector.append(3)
+        with self.assertRaises(TypeError):
+            vector[0] = 5
+
+    def test_persistent_vector_helper(self):
+        vector = PersistentVector([1])
+        self.assertIs(persistent_vector(vector), vector)
+        self.assertEqual(persistent_vector(Vector([1, 2])), [1, 2])
+
+
+class TransientVectorTest(unittest.TestCase):
+    def test_conj_across_boundaries(self):
+        for size in BOUNDARY_SIZES:
+            transient = EMPTY_VECTOR.transient()
+            for i in range(size):
+                transient.conj(i)
+            self.assertEqual(list(transient.persistent()), list(range(size)))
+
+    def test_assoc_in_trie_and_tail(self):
+        source = PersistentVector(range(1100))
+        transient = source.transient()
+        for index in (0, 31, 32, 1023, 1024, 1099):
+            transient.assoc(index, -index)
+        transient.assoc(1100, "end")
+        result = transient.persistent()
+        expected = list(range(1100)) + ["end"]
+        for index in (0, 31, 32, 1023, 1024, 1099):
+            expected[index] = -index
+        self.assertEqual(list(result), expected)
+        self.assertEqual(list(source), list(range(1100)))
+
+    def test_source_vector_is_unchanged(self):
+        source = PersistentVector(range(2000))
+        transient = source.transient()
+        transient.assoc(5, "x").conj("y")
+        transient.persistent()
+        self.assertEqual(source[5], 5)
+        self.assertEqual(len(source), 2000)
+
+    def test_rest_view_is_copied(self):
+        transient = PersistentVector(range(40)).rest().transient()
+        transient.conj(40)
+        self.assertEqual(list(transient.persistent()), list(range(1, 41)))
+
+    def test_read_access(self):
+        transient = TransientVector([1, 2, 3])
+        self.assertEqual(len(transient), 3)
+        self.assertEqual(transient[0], 1)
+        self.assertEqual(transient[-1], 3)
+        with self.assertRaises(IndexError):
+            transient[3]
+
+    def test_use_after_persistent_is_rejected(self):
+        transient = EMPTY_VECTOR.transient()
+        transient.persistent()
+        for use in (
+            lambda: transient.conj(1),
+            lambda: transient.assoc(0, 1),
+            lambda: len(transient),
+            transient.persistent,
+        ):
+            with self.assertRaises(EvaluationError):
+                use()
+
+
+if __name__ == "__main__":
+    unittest.main()
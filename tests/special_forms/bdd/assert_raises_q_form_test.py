@@ -133,7 +133,7 @@ class TestAssertRaisesQForm(unittest.TestCase):
             run_lispy_string('(assert-raises? (list "error") (/ 1 0))', self.env)
         self.assertEqual(
             str(cm.exception),
-            "TypeError: 'assert-raises?' expects its first argument (expected-message) to be a string, but it evaluated to type LispyList.",
+            "TypeError: 'assert-raises?' expects its first argument (expected-message) to be a string, but it evaluated to type PersistentList.",
         )
 
     def test_assert_raises_q_error_in_expected_message_evaluation(self):
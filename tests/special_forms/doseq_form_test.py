@@ -23,6 +23,11 @@ class DoseqFormTest(unittest.TestCase):
         result = run_lispy_string("(doseq [x '(1 2 3)] x)", self.env)
         self.assertIsNone(result)
 
+    def test_doseq_set(self):
+        """Test doseq over a set."""
+        result = run_lispy_string("(doseq [x (hash-set 1 2 3)] x)", self.env)
+        self.assertIsNone(result)
+
     def test_doseq_empty_collection(self):
         """Test doseq with empty collection."""
         result = run_lispy_string("(doseq [x []] x)", self.env)
@@ -158,7 +163,7 @@ class DoseqFormTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(doseq [x 123] (+ 1 2))", self.env)
         self.assertIn(
-            "TypeError: 'doseq' collection must be a vector or list", str(cm.exception)
+            "TypeError: 'doseq' collection must be a vector, list, set, or lazy sequence", str(cm.exception)
         )
 
     def test_doseq_collection_not_vector_or_list_string(self):
@@ -166,7 +171,7 @@ class DoseqFormTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string('(doseq [x "hello"] (+ 1 2))', self.env)
         self.assertIn(
-            "TypeError: 'doseq' collection must be a vector or list", str(cm.exception)
+            "TypeError: 'doseq' collection must be a vector, list, set, or lazy sequence", str(cm.exception)
         )
 
     def test_doseq_collection_not_vector_or_list_map(self):
@@ -174,7 +179,7 @@ class DoseqFormTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(doseq [x {:a 1}] (+ 1 2))", self.env)
         self.assertIn(
-            "TypeError: 'doseq' collection must be a vector or list", str(cm.exception)
+            "TypeError: 'doseq' collection must be a vector, list, set, or lazy sequence", str(cm.exception)
         )
 
     def test_doseq_collection_not_vector_or_list_nil(self):
@@ -182,7 +187,7 @@ class DoseqFormTest(unittest.TestCase):
         with self.assertRaises(EvaluationError) as cm:
             run_lispy_string("(doseq [x nil] (+ 1 2))", self.env)
         self.assertIn(
-            "TypeError: 'doseq' collection must be a vector or list", str(cm.exception)
+            "TypeError: 'doseq' collection must be a vector, list, set, or lazy sequence", str(cm.exception)
         )
 
     def test_doseq_collection_expression_error(self):
@@ -235,6 +240,12 @@ class DoseqFormTest(unittest.TestCase):
         result = run_lispy_string("(doseq [x (vector 5 10 15)] (/ x 5))", self.env)
         self.assertIsNone(result)
 
+    def test_doseq_lazy_sequence(self):
+        """Test doseq over a lazy sequence."""
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            run_lispy_string("(doseq [x (take (lazy-range) 3)] (println x))", self.env)
+        self.assertEqual(mock_stdout.getvalue(), "0\n1\n2\n")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from lispy.exceptions import EvaluationError
+from lispy.functions import create_global_env
+from lispy.lazy_seq import LazySeq
+from lispy.utils import run_lispy_string
+
+
+class LazySeqFormTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+
+    def test_body_is_not_evaluated_until_used(self):
+        run_lispy_string("(define calls (transient []))", self.env)
+        result = run_lispy_string("(lazy-seq (conj! calls 1) [1 2])", self.env)
+        self.assertIsInstance(result, LazySeq)
+        self.assertEqual(run_lispy_string("(count calls)", self.env), 0)
+        self.assertEqual(list(result), [1, 2])
+        self.assertEqual(list(result), [1, 2])
+        self.assertEqual(run_lispy_string("(count calls)", self.env), 1)
+
+    def test_self_referencing_infinite_sequence(self):
+        run_lispy_string(
+            "(define naturals (fn [n] (lazy-seq (cons n (naturals (+ n 1))))))",
+            self.env,
+        )
+        self.assertEqual(list(run_lispy_string("(take (naturals 0) 3)", self.env)), [0, 1, 2])
+        # Deeper than the recursion limit for ordinary calls
+        self.assertEqual(
+            run_lispy_string("(first (drop (naturals 0) 500))", self.env), 500
+        )
+
+    def test_nil_body_is_empty(self):
+        self.assertTrue(run_lispy_string("(empty? (lazy-seq nil))", self.env))
+        self.assertTrue(run_lispy_string("(empty? (lazy-seq))", self.env))
+
+    def test_body_must_return_sequence(self):
+        result = run_lispy_string("(lazy-seq 42)", self.env)
+        with self.assertRaisesRegex(
+            EvaluationError, "TypeError: 'lazy-seq' body must return a sequence or nil"
+        ):
+            list(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
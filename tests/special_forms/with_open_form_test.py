@@ -0,0 +1,78 @@
+import unittest
+
+from lispy.exceptions import EvaluationError, UserThrownError
+from lispy.functions import create_global_env
+from lispy.utils import run_lispy_string
+
+
+class Resource:
+    """A closable stand-in for a file that records the order of closes."""
+
+    def __init__(self, name, log, fail_on_close=False):
+        self.name = name
+        self.log = log
+        self.fail_on_close = fail_on_close
+
+    def close(self):
+        self.log.append(self.name)
+        if self.fail_on_close:
+            raise RuntimeError(f"close failed: {self.name}")
+
+
+class WithOpenFormTest(unittest.TestCase):
+    def setUp(self):
+        self.env = create_global_env()
+        self.closed = []
+        self.env.define("resource", lambda args, env: Resource(args[0], self.closed, *args[1:]))
+
+    def test_with_open_returns_body_value_and_closes(self):
+        result = run_lispy_string('(with-open [r (resource "a")] (println "") 42)', self.env)
+        self.assertEqual(result, 42)
+        self.assertEqual(self.closed, ["a"])
+
+    def test_with_open_closes_in_reverse_order(self):
+        run_lispy_string('(with-open [a (resource "a") b (resource "b")] nil)', self.env)
+        self.assertEqual(self.closed, ["b", "a"])
+
+    def test_with_open_closes_on_error(self):
+        with self.assertRaises(UserThrownError):
+            run_lispy_string('(with-open [a (resource "a") b (resource "b")] (throw "boom"))', self.env)
+        self.assertEqual(self.closed, ["b", "a"])
+
+    def test_with_open_closes_opened_resources_when_a_binding_fails(self):
+        with self.assertRaises(EvaluationError):
+            run_lispy_string('(with-open [a (resource "a") b (car 1)] nil)', self.env)
+        self.assertEqual(self.closed, ["a"])
+
+    def test_with_open_runs_every_close(self):
+        with self.assertRaisesRegex(RuntimeError, "close failed: b"):
+            run_lispy_string('(with-open [a (resource "a") b (resource "b" true)] nil)', self.env)
+        self.assertEqual(self.closed, ["b", "a"])
+
+    def test_with_open_bindings_see_earlier_bindings(self):
+        result = run_lispy_string('(with-open [a (resource "a") b (resource (to-str (count "xy")))] 1)', self.env)
+        self.assertEqual(result, 1)
+        self.assertEqual(self.closed, ["2", "a"])
+
+    def test_with_open_rejects_recur_in_tail_position(self):
+        run_lispy_string(
+            '(define f (fn [n] (with-open [r (resource "r")] (if (> n 0) (recur (- n 1)) n))))',
+            self.env,
+        )
+        with self.assertRaisesRegex(EvaluationError, "'recur' cannot be used in tail position of 'with-open'"):
+            run_lispy_string("(f 2)", self.env)
+        self.assertEqual(self.closed, ["r"])
+
+    def test_with_open_syntax_errors(self):
+        with self.assertRaisesRegex(EvaluationError, "expects at least 2 arguments"):
+            run_lispy_string('(with-open [r (resource "a")])', self.env)
+        with self.assertRaisesRegex(EvaluationError, "name-resource pairs"):
+            run_lispy_string('(with-open [r] 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "binding must be a symbol"):
+            run_lispy_string('(with-open ["r" (resource "a")] 1)', self.env)
+        with self.assertRaisesRegex(EvaluationError, "must be closable"):
+            run_lispy_string("(with-open [r 42] 1)", self.env)
+
+
+if __name__ == "__main__":
+    unittest.main()
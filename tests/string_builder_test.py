@@ -0,0 +1,30 @@
+import unittest
+
+from lispy.string_builder import StringBuilder
+
+
+class StringBuilderTest(unittest.TestCase):
+    def test_append_and_to_string(self):
+        builder = StringBuilder(["<ul>"])
+        self.assertIs(builder.append("<li>a</li>"), builder)
+        builder.extend(["<li>b</li>", "</ul>"])
+        self.assertEqual(builder.to_string(), "<ul><li>a</li><li>b</li></ul>")
+        self.assertEqual(len(builder), 29)
+
+    def test_to_string_joins_once(self):
+        builder = StringBuilder(["a", "b", "c"])
+        text = builder.to_string()
+        self.assertIs(builder.to_string(), text)
+        builder.append("d")
+        self.assertEqual(builder.to_string(), "abcd")
+
+    def test_empty(self):
+        builder = StringBuilder()
+        self.assertEqual(builder.to_string(), "")
+        self.assertEqual(builder.to_string(), "")
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(repr(builder), "#<string-builder length=0>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from lispy.numeric_array import NumericArray
+from lispy.table import Table, make_column
+
+
+class MakeColumnTest(unittest.TestCase):
+    def test_typed_columns(self):
+        self.assertEqual(make_column([1, 2]).kind, "int")
+        self.assertEqual(make_column([1, 2.5]).kind, "double")
+        self.assertEqual(make_column(["a", 1]), ["a", 1])
+        self.assertEqual(make_column([1, None]), [1, None])
+        self.assertEqual(make_column([True, False]), [True, False])
+        self.assertEqual(make_column([]), [])
+
+    def test_huge_integers_stay_plain(self):
+        self.assertEqual(make_column([2**70]), [2**70])
+
+
+class TableTest(unittest.TestCase):
+    def setUp(self):
+        self.table = Table.from_rows(
+            [
+                {"status": 200, "bytes": 10, "path": "/"},
+                {"status": 404, "bytes": 0, "path": "/x"},
+                {"status": 200, "bytes": 30},
+            ]
+        )
+
+    def test_from_rows(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.column_names(), ["status", "bytes", "path"])
+        self.assertIsInstance(self.table.column("bytes"), NumericArray)
+        self.assertEqual(self.table.column("path"), ["/", "/x", None])
+
+    def test_rows(self):
+        self.assertEqual(
+            self.table.select(["bytes"]).rows(), [{"bytes": 10}, {"bytes": 0}, {"bytes": 30}]
+        )
+        self.assertEqual(self.table.select([]).rows(), [{}, {}, {}])
+
+    def test_take_and_compress(self):
+        self.assertEqual(self.table.take([2, 0]).column("bytes").to_list(), [30, 10])
+        filtered = self.table.compress([False, True, True])
+        self.assertEqual(len(filtered), 2)
+        self.assertEqual(filtered.column("path"), ["/x", None])
+
+    def test_where(self):
+        result = self.table.where("path", lambda path: path is not None)
+        self.assertEqual(result.column("status").to_list(), [200, 404])
+
+    def test_sort_by(self):
+        self.assertEqual(self.table.sort_by("bytes").column("bytes").to_list(), [0, 10, 30])
+        descending = self.table.sort_by("status", descending=True)
+        self.assertEqual(descending.column("bytes").to_list(), [0, 10, 30])
+
+    def test_group_by(self):
+        groups = self.table.group_by("status")
+        self.assertEqual(list(groups), [200, 404])
+        self.assertEqual(groups[200].column("bytes").to_list(), [10, 30])
+
+    def test_aggregate(self):
+        self.assertEqual(self.table.aggregate("count"), 3)
+        self.assertEqual(self.table.aggregate("sum", "bytes"), 40)
+        self.assertEqual(self.table.aggregate("max", "status"), 404)
+        with self.assertRaises(ValueError):
+            self.table.aggregate("sum", "path")
+        with self.assertRaises(ValueError):
+            self.table.aggregate("median", "bytes")
+
+    def test_aggregate_empty(self):
+        empty = self.table.compress([False, False, False])
+        self.assertEqual(empty.aggregate("sum", "bytes"), 0)
+        self.assertIsNone(empty.aggregate("mean", "bytes"))
+
+    def test_equality_and_repr(self):
+        self.assertEqual(self.table, self.table.take([0, 1, 2]))
+        self.assertNotEqual(self.table, self.table.take([0]))
+        self.assertEqual(repr(self.table), "#<table rows=3 columns=[status bytes path]>")
+
+
+if __name__ == "__main__":
+    unittest.main()
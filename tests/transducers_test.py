@@ -0,0 +1,69 @@
+import unittest
+
+from lispy.transducers import (IDENTITY, Reduced, Reducer, filtering, mapping,
+                               taking, transduce, transduced)
+
+
+def append(acc, item):
+    acc.append(item)
+    return acc
+
+
+class TransducerTest(unittest.TestCase):
+    def test_mapping_and_filtering(self):
+        xform = mapping(lambda x: x * 10).compose(filtering(lambda x: x > 10))
+        self.assertEqual(transduce(xform, Reducer(append), [], [1, 2, 3]), [20, 30])
+
+    def test_composition_order(self):
+        # Items pass through the outer transducer first
+        xform = filtering(lambda x: x > 1).compose(mapping(lambda x: x * 10))
+        self.assertEqual(transduce(xform, Reducer(append), [], [1, 2, 3]), [20, 30])
+
+    def test_identity(self):
+        self.assertEqual(transduce(IDENTITY, Reducer(append), [], (1, 2)), [1, 2])
+
+    def test_taking_stops_infinite_input(self):
+        def naturals():
+            n = 0
+            while True:
+                yield n
+                n += 1
+
+        result = transduce(taking(3), Reducer(append), [], naturals())
+        self.assertEqual(result, [0, 1, 2])
+
+    def test_taking_zero(self):
+        self.assertEqual(transduce(taking(0), Reducer(append), [], [1, 2]), [])
+
+    def test_reduced_from_step(self):
+        reducer = Reducer(lambda acc, x: Reduced(acc) if x > 2 else acc + x)
+        self.assertEqual(transduce(IDENTITY, reducer, 0, [1, 2, 3, 4]), 3)
+
+    def test_complete_runs_once(self):
+        reducer = Reducer(append, lambda acc: tuple(acc))
+        self.assertEqual(transduce(taking(2), reducer, [], [1, 2, 3]), (1, 2))
+
+    def test_transducer_is_reusable(self):
+        xform = taking(2)
+        self.assertEqual(transduce(xform, Reducer(append), [], [1, 2, 3]), [1, 2])
+        self.assertEqual(transduce(xform, Reducer(append), [], [4, 5, 6]), [4, 5])
+
+    def test_transduced_is_lazy(self):
+        seen = []
+
+        def source():
+            for n in range(100):
+                seen.append(n)
+                yield n
+
+        outputs = transduced(mapping(lambda x: x + 1), source())
+        self.assertEqual(next(outputs), 1)
+        self.assertEqual(seen, [0])
+
+    def test_transduced_with_take(self):
+        xform = filtering(lambda x: x % 2 == 0).compose(taking(2))
+        self.assertEqual(list(transduced(xform, iter(range(10)))), [0, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from lispy.closure import Function
+from lispy.environment import Environment
+from lispy.tail_call import TailCall
+from lispy.types import LispyPromise, Symbol
+
+
+class SlotsTest(unittest.TestCase):
+    def test_runtime_objects_have_no_instance_dict(self):
+        function = Function([Symbol("x")], [Symbol("x")], Environment())
+        for value in (Symbol("x"), function, TailCall(function, []), LispyPromise()):
+            self.assertFalse(hasattr(value, "__dict__"), type(value).__name__)
+
+
+class LispyPromiseCallbackTest(unittest.TestCase):
+    def test_no_callback_list_until_one_is_added(self):
+        promise = LispyPromise()
+        promise.resolve(1)
+        self.assertIsNone(promise._callbacks)
+
+    def test_callbacks_run_once_on_settle(self):
+        promise = LispyPromise()
+        calls = []
+        promise.add_callback(lambda: calls.append(promise.value))
+        promise.resolve(42)
+        promise.resolve(43)
+        self.assertEqual(calls, [42])
+        self.assertIsNone(promise._callbacks)
+
+    def test_then_on_pending_promise(self):
+        promise = LispyPromise()
+        chained = promise.then(lambda value: value + 1)
+        promise.resolve(1)
+        self.assertEqual(chained.state, "resolved")
+        self.assertEqual(chained.value, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()